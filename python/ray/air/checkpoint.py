@@ -4,14 +4,27 @@ import logging
 import os
 import platform
 import shutil
+import stat
 import tarfile
 import tempfile
 import traceback
 import uuid
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+import numpy as np
 
 import ray
 from ray import cloudpickle as pickle
@@ -57,6 +70,74 @@ class _CheckpointMetadata:
     checkpoint_state: Dict[str, Any]
 
 
+@dataclass
+class _CheckpointFileBuffers:
+    """The contents of a directory checkpoint, with a separate buffer per file.
+
+    The buffers are uint8 numpy arrays, so when Ray serializes them with pickle
+    protocol 5, each one is stored out-of-band in the object store. They are
+    copied straight from the memory-mapped files into the object store, and are
+    deserialized as views of the object store memory without copies on the same
+    node. Other picklers store them in-band.
+
+    Symbolic links are kept as links rather than replaced by the files and
+    directories they point to, like in the archives of ``to_bytes()``.
+
+    Attributes:
+        dirs: Relative paths of the directories, including empty ones.
+        files: Relative paths of the files mapping to their mode and contents.
+        links: Relative paths of the symbolic links mapping to their targets.
+    """
+
+    dirs: List[str]
+    files: Dict[str, Tuple[int, np.ndarray]]
+    links: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_directory(cls, path: str) -> "_CheckpointFileBuffers":
+        dirs = []
+        files = {}
+        links = {}
+        for root, dir_names, file_names in os.walk(path):
+            rel_root = os.path.relpath(root, path)
+            for name in dir_names:
+                dir_path = os.path.join(root, name)
+                if os.path.islink(dir_path):
+                    # os.walk doesn't descend into links to directories.
+                    links[os.path.join(rel_root, name)] = os.readlink(dir_path)
+                else:
+                    dirs.append(os.path.join(rel_root, name))
+            for name in file_names:
+                file_path = os.path.join(root, name)
+                if os.path.islink(file_path):
+                    links[os.path.join(rel_root, name)] = os.readlink(file_path)
+                    continue
+                mode = os.stat(file_path).st_mode
+                if os.path.getsize(file_path) == 0:
+                    # Empty files can't be memory-mapped.
+                    data = np.empty(0, dtype=np.uint8)
+                else:
+                    # Pickle a plain array view, since numpy only pickles base
+                    # arrays out-of-band.
+                    data = np.asarray(np.memmap(file_path, dtype=np.uint8, mode="r"))
+                files[os.path.join(rel_root, name)] = mode, data
+        return cls(dirs=dirs, files=files, links=links)
+
+    def to_directory(self, path: str) -> None:
+        for dir in self.dirs:
+            os.makedirs(os.path.join(path, dir), exist_ok=True)
+        for name, (mode, data) in self.files.items():
+            file_path = os.path.join(path, name)
+            with open(file_path, "wb") as f:
+                f.write(memoryview(data))
+            os.chmod(file_path, stat.S_IMODE(mode))
+        for name, target in self.links.items():
+            link_path = os.path.join(path, name)
+            if os.path.lexists(link_path):
+                os.remove(link_path)
+            os.symlink(target, link_path)
+
+
 @PublicAPI(stability="beta")
 class Checkpoint:
     """Ray AIR Checkpoint.
@@ -133,7 +214,10 @@ class Checkpoint:
     Checkpoints can be pickled and sent to remote processes.
     Please note that checkpoints pointing to local directories will be
     pickled as data representations, so the full checkpoint data will be
-    contained in the checkpoint object. If you want to avoid this,
+    contained in the checkpoint object. Each file is pickled as a separate
+    buffer, which Ray places in the object store without intermediate copies,
+    and which is only written to disk when the receiving process converts the
+    checkpoint into a directory. If you want to avoid this,
     consider passing only the checkpoint directory to the remote task
     and re-construct your checkpoint object in that function. Note that
     this will only work if the "remote" task is scheduled on the
@@ -161,6 +245,7 @@ class Checkpoint:
         data_dict: Optional[dict] = None,
         uri: Optional[str] = None,
         obj_ref: Optional[ray.ObjectRef] = None,
+        _file_buffers: Optional[_CheckpointFileBuffers] = None,
     ):
         # First, resolve file:// URIs to local paths
         if uri:
@@ -208,6 +293,9 @@ class Checkpoint:
                     f"supported: {resolved}"
                 )
             uri = resolved
+        elif _file_buffers:
+            # Only set when unpickling checkpoints that pointed to local directories
+            assert not local_path and not data_dict and not uri and not obj_ref
         else:
             raise ValueError("Cannot create checkpoint without data.")
 
@@ -215,6 +303,7 @@ class Checkpoint:
         self._data_dict: Optional[Dict[str, Any]] = data_dict
         self._uri: Optional[str] = uri
         self._obj_ref: Optional[ray.ObjectRef] = obj_ref
+        self._file_buffers: Optional[_CheckpointFileBuffers] = _file_buffers
 
         self._uuid = uuid.uuid4()
 
@@ -326,8 +415,8 @@ class Checkpoint:
         elif self._obj_ref:
             # If the checkpoint data is an object reference, resolve
             checkpoint_data = ray.get(self._obj_ref)
-        elif self._local_path or self._uri:
-            # Else, checkpoint is either on FS or external storage
+        elif self._local_path or self._uri or self._file_buffers:
+            # Else, checkpoint is either on FS, external storage, or file buffers
             with self.as_directory() as local_path:
                 checkpoint_data_path = os.path.join(
                     local_path, _DICT_CHECKPOINT_FILE_NAME
@@ -476,6 +565,7 @@ class Checkpoint:
             data_dict=other._data_dict,
             uri=other._uri,
             obj_ref=other._obj_ref,
+            _file_buffers=other._file_buffers,
         )
 
     def _get_temporary_checkpoint_dir(self) -> str:
@@ -548,6 +638,9 @@ class Checkpoint:
             elif external_path:
                 # If this exists on external storage (e.g. cloud), download
                 download_from_uri(uri=external_path, local_path=path, filelock=False)
+            elif self._file_buffers:
+                # If this was a local directory on another node, write its files
+                self._file_buffers.to_directory(path)
             else:
                 raise RuntimeError(
                     f"No valid location found for checkpoint {self}: {self._uri}"
@@ -720,7 +813,7 @@ class Checkpoint:
         objects for equality or to access the underlying data storage.
 
         The returned type is a string and one of
-        ``["local_path", "data_dict", "uri", "object_ref"]``.
+        ``["local_path", "data_dict", "uri", "object_ref", "file_buffers"]``.
 
         The data is the respective data value.
 
@@ -738,6 +831,8 @@ class Checkpoint:
             return "uri", self._uri
         elif self._obj_ref:
             return "object_ref", self._obj_ref
+        elif self._file_buffers:
+            return "file_buffers", self._file_buffers
         else:
             raise RuntimeError(
                 "Cannot get internal representation of empty checkpoint."
@@ -745,12 +840,19 @@ class Checkpoint:
 
     def __getstate__(self):
         if self._local_path:
-            blob = self.to_bytes()
-            return self.__class__.from_bytes(blob).__getstate__()
+            # Send the files instead of the path, which may not exist on the
+            # receiving node, without packing them into a single archive.
+            checkpoint = self.__class__(
+                _file_buffers=_CheckpointFileBuffers.from_directory(self._local_path)
+            )
+            checkpoint.__dict__.update(self._metadata.checkpoint_state)
+            return checkpoint.__getstate__()
         return self.__dict__
 
     def __setstate__(self, state):
         self.__dict__.update(state)
+        # Checkpoints pickled by older Ray versions have no file buffers
+        self.__dict__.setdefault("_file_buffers", None)
 
     def __fspath__(self):
         raise TypeError(
@@ -606,14 +606,79 @@ class CheckpointsSerdeTest(unittest.TestCase):
         self._testCheckpointSerde(checkpoint, *checkpoint.get_internal_representation())
 
     def testLocalCheckpointSerde(self):
-        # Local checkpoints are converted to bytes on serialization. Currently
-        # this is a pickled dict, so we compare with a dict checkpoint.
+        # Local checkpoints are converted to file buffers on serialization, which
+        # are only written to a directory when needed.
         source_checkpoint = Checkpoint.from_dict({"checkpoint_data": 5})
         with source_checkpoint.as_directory() as tmpdir:
             checkpoint = Checkpoint.from_directory(tmpdir)
-            self._testCheckpointSerde(
-                checkpoint, *source_checkpoint.get_internal_representation()
+
+            @ray.remote
+            def get_checkpoint_content(cp: Checkpoint):
+                type_, _ = cp.get_internal_representation()
+                return type_, cp.to_dict()["checkpoint_data"]
+
+            self.assertEqual(
+                ray.get(get_checkpoint_content.remote(checkpoint)),
+                ("file_buffers", 5),
+            )
+
+    def testLocalCheckpointFileBuffers(self):
+        # File buffers restore nested and empty files and directories, as well
+        # as file modes, also when pickled outside of Ray.
+        tmpdir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(tmpdir, "nested", "empty_dir"))
+        with open(os.path.join(tmpdir, "nested", "model.bin"), "wb") as f:
+            f.write(os.urandom(1024))
+        open(os.path.join(tmpdir, "empty.txt"), "w").close()
+        os.chmod(os.path.join(tmpdir, "empty.txt"), 0o751)
+
+        checkpoint = pickle.loads(pickle.dumps(Checkpoint.from_directory(tmpdir)))
+        self.assertEqual(checkpoint.get_internal_representation()[0], "file_buffers")
+        with checkpoint.as_directory() as checkpoint_dir:
+            self.assertTrue(os.path.isdir(os.path.join(checkpoint_dir, "nested")))
+            self.assertTrue(
+                os.path.isdir(os.path.join(checkpoint_dir, "nested", "empty_dir"))
+            )
+            for name in [os.path.join("nested", "model.bin"), "empty.txt"]:
+                with open(os.path.join(tmpdir, name), "rb") as f:
+                    expected = f.read()
+                with open(os.path.join(checkpoint_dir, name), "rb") as f:
+                    self.assertEqual(f.read(), expected)
+            self.assertEqual(
+                os.stat(os.path.join(checkpoint_dir, "empty.txt")).st_mode & 0o777,
+                0o751,
+            )
+        shutil.rmtree(tmpdir)
+
+    def testLocalCheckpointFileBuffersSymlinks(self):
+        # Symbolic links to files and directories, including dangling ones, are
+        # restored as links.
+        tmpdir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(tmpdir, "nested"))
+        with open(os.path.join(tmpdir, "nested", "model.bin"), "wb") as f:
+            f.write(os.urandom(1024))
+        os.symlink(os.path.join("nested", "model.bin"), os.path.join(tmpdir, "latest"))
+        os.symlink("nested", os.path.join(tmpdir, "nested_link"))
+        os.symlink("missing", os.path.join(tmpdir, "dangling"))
+
+        checkpoint = pickle.loads(pickle.dumps(Checkpoint.from_directory(tmpdir)))
+        with checkpoint.as_directory() as checkpoint_dir:
+            for name, target in [
+                ("latest", os.path.join("nested", "model.bin")),
+                ("nested_link", "nested"),
+                ("dangling", "missing"),
+            ]:
+                path = os.path.join(checkpoint_dir, name)
+                self.assertTrue(os.path.islink(path))
+                self.assertEqual(os.readlink(path), target)
+            with open(os.path.join(tmpdir, "nested", "model.bin"), "rb") as f:
+                expected = f.read()
+            with open(os.path.join(checkpoint_dir, "latest"), "rb") as f:
+                self.assertEqual(f.read(), expected)
+            self.assertTrue(
+                os.path.isfile(os.path.join(checkpoint_dir, "nested_link", "model.bin"))
             )
+        shutil.rmtree(tmpdir)
 
     def testBytesCheckpointSerde(self):
         # Bytes checkpoints are just dict checkpoints constructed
@@ -1,5 +1,4 @@
 import collections
-import heapq
 import random
 from typing import (
     TYPE_CHECKING,
@@ -23,6 +22,7 @@ from ray.data._internal.table_block import (
     TableBlockAccessor,
     TableBlockBuilder,
 )
+from ray.data._internal.util import _iter_rows_grouped_by_key
 from ray.data.aggregate import AggregateFn
 from ray.data.block import (
     Block,
@@ -403,11 +403,6 @@ class ArrowBlockAccessor(TableBlockAccessor):
     def sort_and_partition(
         self, boundaries: List[T], key: "SortKeyT", descending: bool
     ) -> List["Block[T]"]:
-        if len(key) > 1:
-            raise NotImplementedError(
-                "sorting by multiple columns is not supported yet"
-            )
-
         if self._table.num_rows == 0:
             # If the pyarrow table is empty we may not have schema
             # so calling sort_indices() will raise an error.
@@ -427,7 +422,13 @@ class ArrowBlockAccessor(TableBlockAccessor):
         # partition[i]. If `descending` is true, `boundaries` would also be
         # in descending order and we only need to count the number of items
         # *greater than* the boundary value instead.
-        if descending:
+        if len(key) > 1:
+            from ray.data._internal.sort import _partition_bounds
+
+            # The boundaries are keys of all columns, which are ordered like the
+            # sorted rows.
+            bounds = _partition_bounds(ArrowBlockAccessor(table), boundaries, key)
+        elif descending:
             num_rows = len(table[col])
             bounds = num_rows - np.searchsorted(
                 table[col], boundaries, sorter=np.arange(num_rows - 1, -1, -1)
@@ -444,7 +445,8 @@ class ArrowBlockAccessor(TableBlockAccessor):
     def combine(self, key: KeyFn, aggs: Tuple[AggregateFn]) -> Block[ArrowRow]:
         """Combine rows with the same key into an accumulator.
 
-        This assumes the block is already sorted by key in ascending order.
+        This assumes rows with the same key are contiguous, e.g., because the
+        block is sorted by key in ascending order.
 
         Args:
             key: The column name of key or None for global aggregation.
@@ -539,19 +541,22 @@ class ArrowBlockAccessor(TableBlockAccessor):
         key: KeyFn,
         aggs: Tuple[AggregateFn],
         finalize: bool,
+        presorted: bool = True,
     ) -> Tuple[Block[ArrowRow], BlockMetadata]:
-        """Aggregate sorted, partially combined blocks with the same key range.
+        """Aggregate partially combined blocks with the same key range.
 
-        This assumes blocks are already sorted by key in ascending order,
-        so we can do merge sort to get all the rows with the same key.
+        If presorted is True, this assumes blocks are already sorted by key in
+        ascending order, so we can do merge sort to get all the rows with the same
+        key. Otherwise, the rows are grouped by key with a hash table.
 
         Args:
-            blocks: A list of partially combined and sorted blocks.
+            blocks: A list of partially combined blocks.
             key: The column name of key or None for global aggregation.
             aggs: The aggregations to do.
             finalize: Whether to finalize the aggregation. This is used as an
                 optimization for cases where we repeatedly combine partially
                 aggregated groups.
+            presorted: Whether the blocks are sorted by key.
 
         Returns:
             A block of [k, v_1, ..., v_n] columns and its metadata where k is
@@ -565,8 +570,10 @@ class ArrowBlockAccessor(TableBlockAccessor):
             (lambda r: r[r._row.schema.names[0]]) if key is not None else (lambda r: 0)
         )
 
-        iter = heapq.merge(
-            *[ArrowBlockAccessor(block).iter_rows() for block in blocks], key=key_fn
+        iter = _iter_rows_grouped_by_key(
+            [ArrowBlockAccessor(block).iter_rows() for block in blocks],
+            key_fn,
+            presorted,
         )
         next_row = None
         builder = ArrowBlockBuilder()
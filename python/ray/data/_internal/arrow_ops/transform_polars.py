@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Tuple
 
 try:
     import pyarrow
@@ -25,16 +25,19 @@ def check_polars_installed():
 
 def sort(table: "pyarrow.Table", key: "SortKeyT", descending: bool) -> "pyarrow.Table":
     check_polars_installed()
-    col, _ = key[0]
     df = pl.from_arrow(table)
-    return df.sort(col, reverse=descending).to_arrow()
+    return df.sort(*_sort_args(key)).to_arrow()
 
 
 def concat_and_sort(
     blocks: List["pyarrow.Table"], key: "SortKeyT", descending: bool
 ) -> "pyarrow.Table":
     check_polars_installed()
-    col, _ = key[0]
     blocks = [pl.from_arrow(block) for block in blocks]
-    df = pl.concat(blocks).sort(col, reverse=descending)
+    df = pl.concat(blocks).sort(*_sort_args(key))
     return df.to_arrow()
+
+
+def _sort_args(key: "SortKeyT") -> Tuple[List[str], List[bool]]:
+    """Return the columns and the reverse flags to sort by with polars."""
+    return [col for col, _ in key], [order == "descending" for _, order in key]
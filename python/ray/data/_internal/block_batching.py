@@ -1,6 +1,20 @@
 import collections
 import itertools
-from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Union, Dict
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 
@@ -40,6 +54,7 @@ def batch_blocks(
     drop_last: bool = False,
     shuffle_buffer_min_size: Optional[int] = None,
     shuffle_seed: Optional[int] = None,
+    prefetch_batches: int = 0,
 ) -> Iterator[BatchType]:
     """Create batches of data from 1 or more blocks.
 
@@ -68,6 +83,11 @@ def batch_blocks(
             number of rows that must be in the local in-memory shuffle buffer in order
             to yield a batch.
         shuffle_seed: The seed to use for the local random shuffle.
+        prefetch_batches: The number of batches to prepare ahead of the
+            consumer. If greater than 0, fetching blocks and creating batches
+            runs in a background thread, and formatting batches in a pool of
+            up to this many threads, overlapping with the consumer's code.
+            Batches are still returned in order.
 
     Returns:
         An iterator over record batches.
@@ -81,7 +101,7 @@ def batch_blocks(
     else:
         batcher = Batcher(batch_size=batch_size)
 
-    def get_batches(block: Optional[ObjectRef[Block]] = None) -> Iterator[BatchType]:
+    def get_batches(block: Optional[ObjectRef[Block]] = None) -> Iterator[Block]:
         if block is not None:
             with stats.iter_get_s.timer():
                 block = ray.get(block)
@@ -95,20 +115,13 @@ def batch_blocks(
             # While the batcher has full batches, yield batches.
             with stats.iter_next_batch_s.timer():
                 batch = batcher.next_batch()
-            with stats.iter_format_batch_s.timer():
-                result = _format_batch(batch, batch_format)
-            with stats.iter_user_s.timer():
-                yield result
+            yield batch
         # Handle remainder batches.
         if block is None and not drop_last and batcher.has_any():
             with stats.iter_next_batch_s.timer():
                 batch = batcher.next_batch()
-            with stats.iter_format_batch_s.timer():
-                result = _format_batch(batch, batch_format)
-            with stats.iter_user_s.timer():
-                yield result
+            yield batch
 
-    block_window = []  # Handle empty sliding window gracefully.
     context = DatasetContext.get_current()
     if (
         prefetch_blocks > 0
@@ -119,21 +132,105 @@ def batch_blocks(
     else:
         prefetcher = WaitBlockPrefetcher()
 
-    # Batch blocks over the prefetch windows.
-    for block_window in _sliding_window(
-        blocks, prefetch_blocks + 1, clear_block_after_read
-    ):
-        block_window = list(block_window)
-        with stats.iter_wait_s.timer():
-            prefetcher.prefetch_blocks(block_window)
-        yield from get_batches(block_window[0])
+    def iter_unformatted_batches() -> Iterator[Block]:
+        block_window = []  # Handle empty sliding window gracefully.
+        # Batch blocks over the prefetch windows.
+        for block_window in _sliding_window(
+            blocks, prefetch_blocks + 1, clear_block_after_read
+        ):
+            block_window = list(block_window)
+            with stats.iter_wait_s.timer():
+                prefetcher.prefetch_blocks(block_window)
+            yield from get_batches(block_window[0])
+
+        # Consume remainder of final block window.
+        for block in block_window[1:]:
+            yield from get_batches(block)
+
+        # Consume any remaining batches, now that we're done adding blocks to the
+        # batcher.
+        yield from get_batches()
+
+    def format_batch(batch: Block) -> Tuple[BatchType, float]:
+        start = time.perf_counter()
+        result = _format_batch(batch, batch_format)
+        return result, time.perf_counter() - start
+
+    if prefetch_batches > 0:
+        results = _prefetch_batches(
+            iter_unformatted_batches(), format_batch, prefetch_batches, stats
+        )
+    else:
+        results = map(format_batch, iter_unformatted_batches())
 
-    # Consume remainder of final block window.
-    for block in block_window[1:]:
-        yield from get_batches(block)
+    for result, format_time in results:
+        stats.iter_format_batch_s.add(format_time)
+        with stats.iter_user_s.timer():
+            yield result
 
-    # Consume any remaining batches, now that we're done adding blocks to the batcher.
-    yield from get_batches()
+
+def _prefetch_batches(
+    batches: Iterator[Block],
+    format_fn: Callable[[Block], Any],
+    prefetch_batches: int,
+    stats: Union[DatasetStats, DatasetPipelineStats],
+) -> Iterator[Any]:
+    """Prepares batches ahead of the consumer in background threads.
+
+    A single thread drains ``batches`` (fetching blocks and slicing them into
+    batches) and submits each batch to a pool of ``prefetch_batches`` threads
+    running ``format_fn``. The pending results are queued in order, and at
+    most ``prefetch_batches`` of them are queued at any time.
+
+    The time the consumer spends waiting for the next result is recorded in
+    ``stats.iter_prefetch_wait_s``. The timers updated while draining
+    ``batches`` are only touched by the background thread, so callers should
+    return any timings measured in ``format_fn`` and record them themselves.
+    """
+    done = object()
+    results = queue.Queue(maxsize=prefetch_batches)
+    stopped = threading.Event()
+    pool = ThreadPoolExecutor(
+        max_workers=prefetch_batches, thread_name_prefix="ray_data_batch_format"
+    )
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for batch in batches:
+                if not put(pool.submit(format_fn, batch)):
+                    return
+        except BaseException as e:
+            put(e)
+            return
+        put(done)
+
+    producer = threading.Thread(
+        target=produce, name="ray_data_batch_prefetcher", daemon=True
+    )
+    producer.start()
+    try:
+        while True:
+            with stats.iter_prefetch_wait_s.timer():
+                item = results.get()
+                if item is done:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                result = item.result()
+            yield result
+    finally:
+        # Unblock the producer if the consumer stopped early.
+        stopped.set()
+        pool.shutdown(wait=False)
 
 
 def _format_batch(batch: Block, batch_format: str) -> BatchType:
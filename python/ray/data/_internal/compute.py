@@ -1,7 +1,19 @@
 import collections
 import logging
 import math
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+import time
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import ray
 from ray.data._internal.block_list import BlockList
@@ -41,6 +53,13 @@ BlockTransform = Union[
 # UDF on a batch or row.
 UDF = Union[BatchUDF, RowUDF]
 
+# How long an actor of an adaptive pool can be idle while its stage has no queued
+# inputs, before it's removed from the pool to free its resources.
+ADAPTIVE_ACTOR_IDLE_TIMEOUT_S = 1.0
+
+# The weight of the latest sample in the moving averages of an adaptive pool.
+_ADAPTIVE_EWMA_WEIGHT = 0.2
+
 
 @DeveloperAPI
 class ComputeStrategy:
@@ -185,6 +204,13 @@ class ActorPoolStrategy(ComputeStrategy):
     computation and avoiding actor startup delays, set max_tasks_in_flight_per_actor
     to 2 or greater; to try to decrease the delay due to queueing of tasks on the worker
     actors, set max_tasks_in_flight_per_actor to 1.
+
+    With ``adaptive=True``, the pool is scaled based on the measured actor startup
+    and task times instead: it only adds actors while the queued inputs would take
+    longer to process than starting an actor, removes actors that are idle while
+    there are no queued inputs (down to ``min_size`` while more inputs may arrive),
+    and sends each actor just enough tasks to hide the time it takes to fetch their
+    inputs, up to ``max_tasks_in_flight_per_actor``.
     """
 
     def __init__(
@@ -192,6 +218,7 @@ class ActorPoolStrategy(ComputeStrategy):
         min_size: int = 1,
         max_size: Optional[int] = None,
         max_tasks_in_flight_per_actor: Optional[int] = 2,
+        adaptive: bool = False,
     ):
         """Construct ActorPoolStrategy for a Dataset transform.
 
@@ -203,6 +230,8 @@ class ActorPoolStrategy(ComputeStrategy):
                 opportunities for pipelining task dependency prefetching with
                 computation and avoiding actor startup delays, but will also increase
                 queueing delay.
+            adaptive: Whether to scale the pool and the number of tasks in flight
+                per actor based on the measured actor startup and task times.
         """
         if min_size < 1:
             raise ValueError("min_size must be > 1", min_size)
@@ -216,6 +245,7 @@ class ActorPoolStrategy(ComputeStrategy):
         self.min_size = min_size
         self.max_size = max_size or float("inf")
         self.max_tasks_in_flight_per_actor = max_tasks_in_flight_per_actor
+        self.adaptive = adaptive
         self.num_workers = 0
         self.ready_to_total_workers_ratio = 0.8
 
@@ -266,57 +296,7 @@ class ActorPoolStrategy(ComputeStrategy):
         name = name.title()
         map_bar = ProgressBar(name, total=orig_num_blocks)
 
-        class BlockWorker:
-            def __init__(
-                self,
-                *fn_constructor_args: Any,
-                **fn_constructor_kwargs: Any,
-            ):
-                if not isinstance(fn, CallableClass):
-                    if fn_constructor_args or fn_constructor_kwargs:
-                        raise ValueError(
-                            "fn_constructor_{kw}args only valid for CallableClass "
-                            f"UDFs, but got: {fn}"
-                        )
-                    self.fn = fn
-                else:
-                    self.fn = fn(*fn_constructor_args, **fn_constructor_kwargs)
-
-            def ready(self):
-                return "ok"
-
-            def map_block_split(
-                self,
-                input_files: List[str],
-                num_blocks: int,
-                *blocks_and_fn_args,
-                **fn_kwargs,
-            ) -> BlockPartition:
-                return _map_block_split(
-                    block_fn,
-                    input_files,
-                    self.fn,
-                    num_blocks,
-                    *blocks_and_fn_args,
-                    **fn_kwargs,
-                )
-
-            @ray.method(num_returns=2)
-            def map_block_nosplit(
-                self,
-                input_files: List[str],
-                num_blocks: int,
-                *blocks_and_fn_args,
-                **fn_kwargs,
-            ) -> Tuple[Block, BlockMetadata]:
-                return _map_block_nosplit(
-                    block_fn,
-                    input_files,
-                    self.fn,
-                    num_blocks,
-                    *blocks_and_fn_args,
-                    **fn_kwargs,
-                )
+        BlockWorker = _make_block_worker_cls(block_fn, fn)
 
         if "num_cpus" not in remote_args:
             remote_args["num_cpus"] = 1
@@ -330,11 +310,20 @@ class ActorPoolStrategy(ComputeStrategy):
 
         BlockWorker = ray.remote(**remote_args)(BlockWorker)
 
-        workers = [
-            BlockWorker.remote(*fn_constructor_args, **fn_constructor_kwargs)
-            for _ in range(self.min_size)
-        ]
-        tasks = {w.ready.remote(): w for w in workers}
+        policy = _AdaptiveActorPoolPolicy(self) if self.adaptive else None
+        workers = []
+        tasks = {}
+
+        def start_worker():
+            w = BlockWorker.remote(*fn_constructor_args, **fn_constructor_kwargs)
+            workers.append(w)
+            tasks[w.ready.remote()] = w
+            if policy:
+                policy.on_worker_started(w)
+
+        for _ in range(self.min_size):
+            start_worker()
+        num_started = len(workers)
         tasks_in_flight = collections.defaultdict(int)
         metadata_mapping = {}
         block_indices = {}
@@ -350,12 +339,15 @@ class ActorPoolStrategy(ComputeStrategy):
                         len(workers) < self.max_size
                         and len(ready_workers) / len(workers)
                         > self.ready_to_total_workers_ratio
-                    ):
-                        w = BlockWorker.remote(
-                            *fn_constructor_args, **fn_constructor_kwargs
+                        and (
+                            policy is None
+                            or policy.should_scale_up(
+                                len(ready_workers), len(block_bundles)
+                            )
                         )
-                        workers.append(w)
-                        tasks[w.ready.remote()] = w
+                    ):
+                        start_worker()
+                        num_started += 1
                         map_bar.set_description(
                             "Map Progress ({} actors {} pending)".format(
                                 len(ready_workers), len(workers) - len(ready_workers)
@@ -371,8 +363,12 @@ class ActorPoolStrategy(ComputeStrategy):
                     results.append(obj_id)
                     tasks_in_flight[worker] -= 1
                     map_bar.update(1)
+                    if policy:
+                        policy.on_task_done(worker, ray.get(metadata_mapping[obj_id]))
                 else:
                     ready_workers.add(worker)
+                    if policy:
+                        policy.on_worker_ready(worker)
                     map_bar.set_description(
                         "Map Progress ({} actors {} pending)".format(
                             len(ready_workers), len(workers) - len(ready_workers)
@@ -380,10 +376,11 @@ class ActorPoolStrategy(ComputeStrategy):
                     )
 
                 # Schedule a new task.
-                while (
-                    block_bundles
-                    and tasks_in_flight[worker] < self.max_tasks_in_flight_per_actor
-                ):
+                if policy:
+                    max_tasks_in_flight = policy.max_tasks_in_flight()
+                else:
+                    max_tasks_in_flight = self.max_tasks_in_flight_per_actor
+                while block_bundles and tasks_in_flight[worker] < max_tasks_in_flight:
                     blocks, metas = block_bundles.pop()
                     # TODO(swang): Support block splitting for compute="actors".
                     ref, meta_ref = worker.map_block_nosplit.remote(
@@ -396,9 +393,21 @@ class ActorPoolStrategy(ComputeStrategy):
                     tasks[ref] = worker
                     block_indices[ref] = len(block_bundles)
                     tasks_in_flight[worker] += 1
+                    if policy:
+                        policy.on_task_submitted(worker)
+
+                # All the inputs have been submitted, so free the resources of the
+                # actors that are done.
+                if policy and not block_bundles:
+                    for w in policy.idle_workers_to_remove(
+                        len(workers), has_queued_inputs=False, inputs_done=True
+                    ):
+                        workers.remove(w)
+                        ready_workers.discard(w)
+                        ray.kill(w)
 
             map_bar.close()
-            self.num_workers += len(workers)
+            self.num_workers += num_started
             new_blocks, new_metadata = [], []
             # Put blocks in input order.
             results.sort(key=block_indices.get)
@@ -421,6 +430,119 @@ class ActorPoolStrategy(ComputeStrategy):
                 raise e
 
 
+class _AdaptiveActorPoolPolicy:
+    """Scaling policy of an ``ActorPoolStrategy(adaptive=True)`` actor pool.
+
+    The executor of the pool reports the lifecycle of its actors and tasks, and
+    the policy tracks moving averages of the actor startup time, of the task
+    duration (as measured by the task itself), and of the input latency: the time
+    it takes for a task sent to an idle actor to start running.
+    """
+
+    def __init__(self, strategy: ActorPoolStrategy):
+        self._strategy = strategy
+        self._startup_time: Optional[float] = None
+        self._task_duration: Optional[float] = None
+        self._input_latency = 0.0
+        self._start_times: Dict[Any, float] = {}
+        # The submission times of the tasks in flight of each actor, in order, and
+        # whether the actor was idle when the task was submitted.
+        self._submit_times: Dict[
+            Any, Deque[Tuple[float, bool]]
+        ] = collections.defaultdict(collections.deque)
+        self._idle_since: Dict[Any, float] = {}
+
+    def on_worker_started(self, worker: Any):
+        self._start_times[worker] = time.perf_counter()
+
+    def on_worker_ready(self, worker: Any):
+        now = time.perf_counter()
+        self._startup_time = _ewma(
+            self._startup_time, now - self._start_times.pop(worker)
+        )
+        self._idle_since[worker] = now
+
+    def on_task_submitted(self, worker: Any):
+        queue = self._submit_times[worker]
+        queue.append((time.perf_counter(), not queue))
+        self._idle_since.pop(worker, None)
+
+    def on_task_done(self, worker: Any, meta: BlockMetadata):
+        now = time.perf_counter()
+        queue = self._submit_times[worker]
+        submit_time, was_idle = queue.popleft()
+        duration = meta.exec_stats.wall_time_s if meta.exec_stats else None
+        if duration is not None:
+            self._task_duration = _ewma(self._task_duration, duration)
+            if was_idle:
+                self._input_latency = _ewma(
+                    self._input_latency, max(now - submit_time - duration, 0)
+                )
+        if not queue:
+            self._idle_since[worker] = now
+
+    def max_tasks_in_flight(self) -> int:
+        """The number of tasks to send to each actor.
+
+        While an actor runs a task, the inputs of its next tasks are fetched, so it
+        needs enough tasks in flight to cover the input latency, but any more only
+        add to the queueing delay at the end of the stage.
+        """
+        limit = self._strategy.max_tasks_in_flight_per_actor
+        if not self._task_duration:
+            return limit
+        depth = 1 + math.ceil(self._input_latency / self._task_duration)
+        return max(1, min(limit, depth))
+
+    def should_scale_up(self, num_ready_workers: int, num_queued_inputs: int) -> bool:
+        """Whether to add an actor, given that all of the ready actors are busy.
+
+        An actor is only added if the ready actors would take longer to process the
+        queued inputs than it takes to start an actor.
+        """
+        if num_queued_inputs == 0:
+            return False
+        if (
+            num_ready_workers == 0
+            or self._startup_time is None
+            or self._task_duration is None
+        ):
+            return True
+        queue_time = num_queued_inputs * self._task_duration / num_ready_workers
+        return queue_time > self._startup_time
+
+    def idle_workers_to_remove(
+        self, num_workers: int, has_queued_inputs: bool, inputs_done: bool
+    ) -> List[Any]:
+        """Return the ready actors to remove from the pool because they're idle.
+
+        While more inputs may arrive, actors are only removed after being idle for
+        ADAPTIVE_ACTOR_IDLE_TIMEOUT_S, and the pool is kept at its min size.
+        """
+        if has_queued_inputs:
+            return []
+        if inputs_done:
+            idle = list(self._idle_since)
+        else:
+            now = time.perf_counter()
+            idle = [
+                worker
+                for worker, since in self._idle_since.items()
+                if now - since >= ADAPTIVE_ACTOR_IDLE_TIMEOUT_S
+            ]
+            idle = idle[: max(num_workers - self._strategy.min_size, 0)]
+        for worker in idle:
+            del self._idle_since[worker]
+            self._submit_times.pop(worker, None)
+        return idle
+
+
+def _ewma(average: Optional[float], sample: float) -> float:
+    if average is None:
+        return sample
+    return (1 - _ADAPTIVE_EWMA_WEIGHT) * average + _ADAPTIVE_EWMA_WEIGHT * sample
+
+
 def get_compute(compute_spec: Union[str, ComputeStrategy]) -> ComputeStrategy:
     if not compute_spec or compute_spec == "tasks":
         return TaskPoolStrategy()
@@ -440,6 +562,66 @@ def is_task_compute(compute_spec: Union[str, ComputeStrategy]) -> bool:
     )
 
 
+def _make_block_worker_cls(block_fn: BlockTransform, fn: Optional[UDF]) -> type:
+    """Returns the (not yet remote) actor class used by actor pools to apply
+    ``block_fn`` with the (instantiated, for callable classes) ``fn``.
+    """
+
+    class BlockWorker:
+        def __init__(
+            self,
+            *fn_constructor_args: Any,
+            **fn_constructor_kwargs: Any,
+        ):
+            if not isinstance(fn, CallableClass):
+                if fn_constructor_args or fn_constructor_kwargs:
+                    raise ValueError(
+                        "fn_constructor_{kw}args only valid for CallableClass "
+                        f"UDFs, but got: {fn}"
+                    )
+                self.fn = fn
+            else:
+                self.fn = fn(*fn_constructor_args, **fn_constructor_kwargs)
+
+        def ready(self):
+            return "ok"
+
+        def map_block_split(
+            self,
+            input_files: List[str],
+            num_blocks: int,
+            *blocks_and_fn_args,
+            **fn_kwargs,
+        ) -> BlockPartition:
+            return _map_block_split(
+                block_fn,
+                input_files,
+                self.fn,
+                num_blocks,
+                *blocks_and_fn_args,
+                **fn_kwargs,
+            )
+
+        @ray.method(num_returns=2)
+        def map_block_nosplit(
+            self,
+            input_files: List[str],
+            num_blocks: int,
+            *blocks_and_fn_args,
+            **fn_kwargs,
+        ) -> Tuple[Block, BlockMetadata]:
+            return _map_block_nosplit(
+                block_fn,
+                input_files,
+                self.fn,
+                num_blocks,
+                *blocks_and_fn_args,
+                **fn_kwargs,
+            )
+
+    return BlockWorker
+
+
 def _map_block_split(
     block_fn: BlockTransform,
     input_files: List[str],
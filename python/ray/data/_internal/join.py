@@ -0,0 +1,238 @@
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+import ray
+from ray.data._internal.block_list import BlockList
+from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.progress_bar import ProgressBar
+from ray.data._internal.push_based_shuffle import PushBasedShufflePlan
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.shuffle import ShuffleOp, SimpleShufflePlan
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.data.context import DatasetContext
+
+if TYPE_CHECKING:
+    import pandas
+
+JOIN_TYPES = ("inner", "left", "outer")
+
+
+class _HashPartitionOp(ShuffleOp):
+    """Shuffle that partitions the rows of a dataset by the hash of a column.
+
+    Both sides of a join are partitioned with this op, so that output block i
+    of each side holds all the rows whose keys hash to partition i.
+    """
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: str,
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+        block = BlockAccessor.for_block(block)
+        parts = block.hash_partition(key, output_num_blocks)
+        meta = block.get_metadata(input_files=None, exec_stats=stats.build())
+        return parts + [meta]
+
+    @staticmethod
+    def reduce(
+        key: str,
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> (Block, BlockMetadata):
+        stats = BlockExecStats.builder()
+        builder = DelegatingBlockBuilder()
+        for block in mapper_outputs:
+            builder.add_block(block)
+        new_block = builder.build()
+        new_metadata = BlockAccessor.for_block(new_block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        return new_block, new_metadata
+
+
+class SimpleShuffleHashPartitionOp(_HashPartitionOp, SimpleShufflePlan):
+    pass
+
+
+class PushBasedHashPartitionOp(_HashPartitionOp, PushBasedShufflePlan):
+    pass
+
+
+def join_impl(
+    left: BlockList,
+    right: BlockList,
+    clear_input_blocks: bool,
+    on: str,
+    how: str,
+    left_columns: List[str],
+    right_columns: List[str],
+) -> Tuple[BlockList, dict]:
+    """Join the blocks of two tabular datasets on the given key column.
+
+    If one side is smaller than DatasetContext.join_broadcast_threshold_bytes and
+    none of its unmatched rows need to be kept, it is broadcast to one join task
+    per block of the other side. Otherwise, both sides are hash-partitioned on the
+    key, and the partitions with the same index are joined.
+    """
+    ctx = DatasetContext.get_current()
+    owned_by_consumer = left._owned_by_consumer
+    left_blocks, left_metadata = _unzip(left.get_blocks_with_metadata())
+    right_blocks, right_metadata = _unzip(right.get_blocks_with_metadata())
+    if clear_input_blocks:
+        left.clear()
+
+    broadcast_side = _choose_broadcast_side(
+        how, left_metadata, right_metadata, ctx.join_broadcast_threshold_bytes
+    )
+    join_blocks = cached_remote_fn(_join_blocks, num_returns=2)
+    join_args = [on, how, left_columns, right_columns]
+    if broadcast_side == "right":
+        small = _concat_blocks_remote(right_blocks)
+        pairs = [(block, small) for block in left_blocks]
+    elif broadcast_side == "left":
+        small = _concat_blocks_remote(left_blocks)
+        pairs = [(small, block) for block in right_blocks]
+    else:
+        num_partitions = max(len(left_blocks), len(right_blocks))
+        left_parts = _hash_partition(
+            BlockList(left_blocks, left_metadata, owned_by_consumer=owned_by_consumer),
+            clear_input_blocks,
+            on,
+            num_partitions,
+        )
+        right_parts = _hash_partition(
+            BlockList(right_blocks, right_metadata, owned_by_consumer=False),
+            False,
+            on,
+            num_partitions,
+        )
+        pairs = list(zip(left_parts, right_parts))
+    # Early release memory.
+    del left_blocks, right_blocks
+
+    blocks = []
+    metadata = []
+    for left_block, right_block in pairs:
+        block, meta = join_blocks.remote(*join_args, left_block, right_block)
+        blocks.append(block)
+        metadata.append(meta)
+    del pairs
+
+    join_bar = ProgressBar("Join", total=len(metadata))
+    metadata = join_bar.fetch_until_complete(metadata)
+    join_bar.close()
+    return BlockList(blocks, metadata, owned_by_consumer=owned_by_consumer), {}
+
+
+def _unzip(
+    blocks_with_metadata: List[Tuple[ray.ObjectRef, BlockMetadata]]
+) -> Tuple[List[ray.ObjectRef], List[BlockMetadata]]:
+    if not blocks_with_metadata:
+        return [], []
+    blocks, metadata = zip(*blocks_with_metadata)
+    return list(blocks), list(metadata)
+
+
+def _choose_broadcast_side(
+    how: str,
+    left_metadata: List[BlockMetadata],
+    right_metadata: List[BlockMetadata],
+    threshold_bytes: int,
+) -> Optional[str]:
+    """Return the side of the join to broadcast, or None to shuffle both sides.
+
+    A side can only be broadcast if its unmatched rows are dropped by the join, or
+    if it has no rows at all, since each join task only sees a part of the other
+    side.
+    """
+    candidates = []
+    for side, metadata in [("right", right_metadata), ("left", left_metadata)]:
+        num_rows = _num_rows(metadata)
+        if num_rows == 0:
+            return side
+        keeps_unmatched = how == "outer" or (how == "left" and side == "left")
+        size_bytes = _size_bytes(metadata)
+        if not keeps_unmatched and size_bytes is not None:
+            candidates.append((size_bytes, side))
+    if candidates:
+        size_bytes, side = min(candidates)
+        if size_bytes < threshold_bytes:
+            return side
+    return None
+
+
+def _num_rows(metadata: List[BlockMetadata]) -> Optional[int]:
+    if any(m.num_rows is None for m in metadata):
+        return None
+    return sum(m.num_rows for m in metadata)
+
+
+def _size_bytes(metadata: List[BlockMetadata]) -> Optional[int]:
+    if any(m.size_bytes is None for m in metadata):
+        return None
+    return sum(m.size_bytes for m in metadata)
+
+
+def _concat_blocks_remote(blocks: List[ray.ObjectRef]) -> ray.ObjectRef:
+    """Concatenate the given blocks into a single block in a remote task."""
+    return cached_remote_fn(_concat_blocks).remote(*blocks)
+
+
+def _concat_blocks(*blocks: Block) -> Block:
+    builder = DelegatingBlockBuilder()
+    for block in blocks:
+        builder.add_block(block)
+    return builder.build()
+
+
+def _hash_partition(
+    blocks: BlockList, clear_input_blocks: bool, key: str, num_partitions: int
+) -> List[ray.ObjectRef]:
+    ctx = DatasetContext.get_current()
+    if ctx.use_push_based_shuffle:
+        shuffle_op_cls = PushBasedHashPartitionOp
+    else:
+        shuffle_op_cls = SimpleShuffleHashPartitionOp
+    shuffle_op = shuffle_op_cls(map_args=[key], reduce_args=[key])
+    partitions, _ = shuffle_op.execute(blocks, num_partitions, clear_input_blocks)
+    return partitions.get_blocks()
+
+
+def _join_blocks(
+    on: str,
+    how: str,
+    left_columns: List[str],
+    right_columns: List[str],
+    left: Block,
+    right: Block,
+) -> Tuple[Block, BlockMetadata]:
+    """Join two blocks that hold all of the rows of some set of keys."""
+    stats = BlockExecStats.builder()
+    left_df = _to_pandas(left, on, left_columns)
+    right_df = _to_pandas(right, on, right_columns)
+    # Empty sides are built without type information, so take the key type from
+    # the other side.
+    if len(left_df) == 0:
+        left_df[on] = left_df[on].astype(right_df[on].dtype)
+    elif len(right_df) == 0:
+        right_df[on] = right_df[on].astype(left_df[on].dtype)
+
+    block = left_df.merge(right_df, on=on, how=how, suffixes=("", "_1"))
+    return block, BlockAccessor.for_block(block).get_metadata(
+        input_files=None, exec_stats=stats.build()
+    )
+
+
+def _to_pandas(block: Block, on: str, columns: List[str]) -> "pandas.DataFrame":
+    import pandas as pd
+
+    block = BlockAccessor.for_block(block)
+    if block.num_rows() == 0:
+        # Empty blocks may have no schema, and neither may empty datasets.
+        if on not in columns:
+            columns = [on] + columns
+        return pd.DataFrame({c: pd.Series([], dtype=object) for c in columns})
+    return block.to_pandas()
@@ -0,0 +1,140 @@
+"""Fingerprints of the lineage of a Dataset, used by ``Dataset.cache()`` to find
+the output of the same lineage cached on disk by an earlier job.
+"""
+import hashlib
+import io
+import json
+import posixpath
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+import ray
+from ray import cloudpickle
+from ray.cloudpickle.cloudpickle import (
+    _get_or_create_tracker_id,
+    _make_skeleton_class,
+    _make_skeleton_enum,
+)
+from ray.data._internal.lazy_block_list import LazyBlockList
+from ray.data._internal.stats import DatasetStats
+
+if TYPE_CHECKING:
+    import pyarrow.fs
+
+    from ray.data._internal.plan import ExecutionPlan
+
+# The file that marks a cache entry as completely written. It lists the data files
+# of the entry, since files of failed or concurrent writes may be next to them.
+CACHE_SUCCESS_FILE = "_SUCCESS"
+
+
+def lineage_fingerprint(plan: "ExecutionPlan") -> str:
+    """Return a hex digest that identifies the output of a plan with lazy input.
+
+    The digest covers the Ray version, the read tasks of the input, the size and
+    modification time of the input files, and all of the stages of the plan, so it
+    changes if any of them changes. Unlike the serialized lineage, it doesn't
+    depend on the UUIDs and stats of the datasets, so it's the same for the same
+    lineage in different jobs.
+    """
+    in_blocks = plan._in_blocks
+    if not isinstance(in_blocks, LazyBlockList):
+        raise ValueError(
+            "Only datasets created by the ray.data.read_*() APIs can be fingerprinted."
+        )
+    stages = plan._stages_before_snapshot + plan._stages_after_snapshot
+    buf = io.BytesIO()
+    _FingerprintPickler(buf).dump(
+        (
+            ray.__version__,
+            in_blocks._tasks,
+            in_blocks._remote_args,
+            _input_file_infos(in_blocks._tasks),
+            stages,
+        )
+    )
+    return hashlib.sha256(buf.getvalue()).hexdigest()
+
+
+def write_cache_manifest(
+    filesystem: "pyarrow.fs.FileSystem", entry: str, file_prefix: str
+) -> None:
+    """Commit the files of a cache entry whose names start with ``file_prefix``."""
+    import pyarrow.fs
+
+    files = sorted(
+        info.base_name
+        for info in filesystem.get_file_info(pyarrow.fs.FileSelector(entry))
+        if info.type == pyarrow.fs.FileType.File
+        and info.base_name.startswith(file_prefix)
+    )
+    with filesystem.open_output_stream(posixpath.join(entry, CACHE_SUCCESS_FILE)) as f:
+        f.write(json.dumps({"files": files}).encode("utf-8"))
+
+
+def read_cache_manifest(
+    filesystem: "pyarrow.fs.FileSystem", entry: str
+) -> Optional[List[str]]:
+    """Return the paths of the committed files of a cache entry, or None if the
+    entry isn't committed.
+    """
+    import pyarrow.fs
+
+    success_file = posixpath.join(entry, CACHE_SUCCESS_FILE)
+    if filesystem.get_file_info(success_file).type != pyarrow.fs.FileType.File:
+        return None
+    with filesystem.open_input_stream(success_file) as f:
+        try:
+            files = json.loads(f.read().decode("utf-8"))["files"]
+        except (ValueError, KeyError, TypeError):
+            return None
+    return [posixpath.join(entry, file) for file in files]
+
+
+def _input_file_infos(tasks: List[Any]) -> List[Tuple[str, Optional[int], Any]]:
+    """Return the path, size and modification time of the input files of the read
+    tasks whose filesystem is known.
+    """
+    infos = []
+    for task in tasks:
+        filesystem = task._input_filesystem()
+        if filesystem is None:
+            continue
+        infos += [
+            (info.path, info.size, info.mtime_ns)
+            for info in filesystem.get_file_info(task.get_metadata().input_files)
+        ]
+    return infos
+
+
+class _FingerprintPickler(cloudpickle.CloudPickler):
+    """Pickles the lineage of a plan without the state that varies between jobs."""
+
+    def persistent_id(self, obj: Any) -> Any:
+        from ray.data.dataset import Dataset
+
+        if isinstance(obj, Dataset):
+            # E.g., the stages of all-to-all operations capture their input dataset.
+            return ("Dataset", lineage_fingerprint(obj._plan))
+        if isinstance(obj, DatasetStats):
+            return "DatasetStats"
+        if isinstance(obj, ray.ObjectRef):
+            raise ValueError(
+                "The lineage of this dataset depends on in-memory data, so it can't "
+                "be fingerprinted."
+            )
+        return None
+
+    def reducer_override(self, obj: Any) -> Any:
+        reduced = super().reducer_override(obj)
+        if reduced is NotImplemented or reduced[0] not in (
+            _make_skeleton_class,
+            _make_skeleton_enum,
+        ):
+            return reduced
+        # Classes that are pickled by value, e.g. UDFs defined in the driver script,
+        # carry a tracker ID that's random in each process. Identify them by their
+        # qualified name instead; the bytecode of their methods is pickled as well.
+        tracker_id = _get_or_create_tracker_id(obj)
+        name = f"{obj.__module__}.{obj.__qualname__}"
+        args = tuple(name if arg is tracker_id else arg for arg in reduced[1])
+        return (reduced[0], args) + tuple(reduced[2:])
@@ -12,7 +12,6 @@ from typing import (
 )
 
 import collections
-import heapq
 import numpy as np
 
 from ray.data.block import (
@@ -31,6 +30,7 @@ from ray.data._internal.table_block import (
     TableBlockBuilder,
     VALUE_COL_NAME,
 )
+from ray.data._internal.util import _iter_rows_grouped_by_key
 from ray.data.aggregate import AggregateFn
 
 if TYPE_CHECKING:
@@ -332,18 +332,16 @@ class PandasBlockAccessor(TableBlockAccessor):
     def sort_and_partition(
         self, boundaries: List[T], key: "SortKeyT", descending: bool
     ) -> List[Block[T]]:
-        if len(key) > 1:
-            raise NotImplementedError(
-                "sorting by multiple columns is not supported yet"
-            )
-
         if self._table.shape[0] == 0:
             # If the pyarrow table is empty we may not have schema
             # so calling sort_indices() will raise an error.
             return [self._empty_table() for _ in range(len(boundaries) + 1)]
 
         col, _ = key[0]
-        table = self._table.sort_values(by=col, ascending=not descending)
+        table = self._table.sort_values(
+            by=[c for c, _ in key],
+            ascending=[order == "ascending" for _, order in key],
+        )
         if len(boundaries) == 0:
             return [table]
 
@@ -354,7 +352,13 @@ class PandasBlockAccessor(TableBlockAccessor):
         # partition[i]. If `descending` is true, `boundaries` would also be
         # in descending order and we only need to count the number of items
         # *greater than* the boundary value instead.
-        if descending:
+        if len(key) > 1:
+            from ray.data._internal.sort import _partition_bounds
+
+            # The boundaries are keys of all columns, which are ordered like the
+            # sorted rows.
+            bounds = _partition_bounds(PandasBlockAccessor(table), boundaries, key)
+        elif descending:
             num_rows = len(table[col])
             bounds = num_rows - table[col].searchsorted(
                 boundaries, sorter=np.arange(num_rows - 1, -1, -1)
@@ -371,7 +375,8 @@ class PandasBlockAccessor(TableBlockAccessor):
     def combine(self, key: KeyFn, aggs: Tuple[AggregateFn]) -> "pandas.DataFrame":
         """Combine rows with the same key into an accumulator.
 
-        This assumes the block is already sorted by key in ascending order.
+        This assumes rows with the same key are contiguous, e.g., because the
+        block is sorted by key in ascending order.
 
         Args:
             key: The column name of key or None for global aggregation.
@@ -452,7 +457,10 @@ class PandasBlockAccessor(TableBlockAccessor):
             ret = PandasBlockAccessor._empty_table()
         else:
             ret = pd.concat(blocks, ignore_index=True)
-            ret = ret.sort_values(by=key[0][0], ascending=not _descending)
+            ret = ret.sort_values(
+                by=[c for c, _ in key],
+                ascending=[order == "ascending" for _, order in key],
+            )
         return ret, PandasBlockAccessor(ret).get_metadata(
             None, exec_stats=stats.build()
         )
@@ -463,19 +471,22 @@ class PandasBlockAccessor(TableBlockAccessor):
         key: KeyFn,
         aggs: Tuple[AggregateFn],
         finalize: bool,
+        presorted: bool = True,
     ) -> Tuple["pandas.DataFrame", BlockMetadata]:
-        """Aggregate sorted, partially combined blocks with the same key range.
+        """Aggregate partially combined blocks with the same key range.
 
-        This assumes blocks are already sorted by key in ascending order,
-        so we can do merge sort to get all the rows with the same key.
+        If presorted is True, this assumes blocks are already sorted by key in
+        ascending order, so we can do merge sort to get all the rows with the same
+        key. Otherwise, the rows are grouped by key with a hash table.
 
         Args:
-            blocks: A list of partially combined and sorted blocks.
+            blocks: A list of partially combined blocks.
             key: The column name of key or None for global aggregation.
             aggs: The aggregations to do.
             finalize: Whether to finalize the aggregation. This is used as an
                 optimization for cases where we repeatedly combine partially
                 aggregated groups.
+            presorted: Whether the blocks are sorted by key.
 
         Returns:
             A block of [k, v_1, ..., v_n] columns and its metadata where k is
@@ -487,8 +498,10 @@ class PandasBlockAccessor(TableBlockAccessor):
         stats = BlockExecStats.builder()
         key_fn = (lambda r: r[r._row.columns[0]]) if key is not None else (lambda r: 0)
 
-        iter = heapq.merge(
-            *[PandasBlockAccessor(block).iter_rows() for block in blocks], key=key_fn
+        iter = _iter_rows_grouped_by_key(
+            [PandasBlockAccessor(block).iter_rows() for block in blocks],
+            key_fn,
+            presorted,
         )
         next_row = None
         builder = PandasBlockBuilder()
@@ -3,6 +3,7 @@ import functools
 import itertools
 import logging
 import uuid
+from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -29,11 +30,13 @@ from ray.data._internal.compute import (
 )
 from ray.data._internal.lazy_block_list import LazyBlockList
 from ray.data._internal.stats import DatasetStats
+from ray.data._internal.streaming_executor import StreamingExecutor
 from ray.data.block import Block
 from ray.data.context import DatasetContext
 
 if TYPE_CHECKING:
     import pyarrow
+    import pyarrow.dataset
 
 
 # Scheduling strategy can be inherited from prev stage if not specified.
@@ -303,6 +306,8 @@ class ExecutionPlan:
         if not self.has_computed_output():
             blocks, stats, stages = self._optimize()
             context = DatasetContext.get_current()
+            if context.use_streaming_executor and not context.block_splitting_enabled:
+                stages = _group_streaming_stages(stages)
             for stage_idx, stage in enumerate(stages):
                 if allow_clear_input_blocks:
                     clear_input_blocks = self._should_clear_input_blocks(
@@ -310,6 +315,14 @@ class ExecutionPlan:
                     )
                 else:
                     clear_input_blocks = False
+                if isinstance(stage, list):
+                    # A chain of one-to-one stages that are executed together.
+                    blocks, stats = StreamingExecutor(stage).execute(
+                        blocks, stats, clear_input_blocks, self._run_by_consumer
+                    )
+                    if context.enable_auto_log_stats:
+                        logger.info(stats.summary_string(include_parent=False))
+                    continue
                 stats_builder = stats.child_builder(stage.name)
                 blocks, stage_info = stage(
                     blocks, clear_input_blocks, self._run_by_consumer
@@ -532,6 +545,19 @@ def _pack_args(
     return fn_args, unpack
 
 
+@dataclass
+class ReadPushdown:
+    """A row filter or column projection that a read can apply while reading.
+
+    Attributes:
+        filter_expr: The rows to keep, or None to keep all rows.
+        columns: The columns to keep, or None to keep all columns.
+    """
+
+    filter_expr: Optional["pyarrow.dataset.Expression"] = None
+    columns: Optional[List[str]] = None
+
+
 class OneToOneStage(Stage):
     """A stage that transforms blocks independently (e.g., map or filter)."""
 
@@ -547,6 +573,7 @@ class OneToOneStage(Stage):
         fn_kwargs: Optional[Dict[str, Any]] = None,
         fn_constructor_args: Optional[Iterable[Any]] = None,
         fn_constructor_kwargs: Optional[Dict[str, Any]] = None,
+        read_pushdown: Optional[ReadPushdown] = None,
     ):
         super().__init__(name, None)
         self.block_fn = block_fn
@@ -558,6 +585,9 @@ class OneToOneStage(Stage):
         self.fn_kwargs = fn_kwargs
         self.fn_constructor_args = fn_constructor_args
         self.fn_constructor_kwargs = fn_constructor_kwargs
+        # If set, this stage is equivalent to the read applying this pushdown, so it
+        # can be pushed down into a directly preceding read stage.
+        self.read_pushdown = read_pushdown
 
     def can_fuse(self, prev: Stage):
         if not isinstance(prev, OneToOneStage):
@@ -790,12 +820,70 @@ def _rewrite_read_stages(
     dataset_uuid: str,
 ) -> Tuple[BlockList, DatasetStats, List[Stage]]:
     """Rewrites read stages into one-to-one stages, if needed."""
+    if _is_lazy(blocks) and stages:
+        blocks, stages = _push_down_into_read_stage(blocks, stages)
     if _is_lazy(blocks) and stages:
         blocks, stats, stages = _rewrite_read_stage(blocks, stages)
         stats.dataset_uuid = dataset_uuid
     return blocks, stats, stages
 
 
+def _push_down_into_read_stage(
+    in_blocks: LazyBlockList, stages: List[Stage]
+) -> Tuple[LazyBlockList, List[Stage]]:
+    """Push the filters and projections directly following a read into the read.
+
+    For example, suppose the plan was [Read -> Filter(expr) -> SelectColumns(cols)].
+    If all read tasks support it, this is rewritten to [Read(filter=expr,
+    columns=cols)], so that the read can skip the data that is filtered out, e.g.,
+    Parquet row groups whose statistics don't match the filter.
+
+    Args:
+        in_blocks: Lazy block list representing read stage.
+        stages: List of current stages.
+
+    Returns:
+        The lazy block list with the read tasks applying the pushdown, and the
+        remaining stages.
+    """
+    filter_expr = None
+    columns = None
+    num_pushed_down = 0
+    for stage in stages:
+        if not isinstance(stage, OneToOneStage) or stage.read_pushdown is None:
+            break
+        pushdown = stage.read_pushdown
+        if pushdown.filter_expr is not None:
+            if columns is not None:
+                # The read applies the filter before the projection, which could
+                # make a filter on a column that isn't selected succeed.
+                break
+            if filter_expr is None:
+                filter_expr = pushdown.filter_expr
+            else:
+                filter_expr = filter_expr & pushdown.filter_expr
+        if pushdown.columns is not None:
+            columns = pushdown.columns
+        num_pushed_down += 1
+    if num_pushed_down == 0:
+        return in_blocks, stages
+
+    tasks = [task._push_down(filter_expr, columns) for task in in_blocks._tasks]
+    if any(task is None for task in tasks):
+        return in_blocks, stages
+    logger.debug(
+        f"Pushed down {stages[:num_pushed_down]} into the read stage: "
+        f"filter={filter_expr}, columns={columns}."
+    )
+    in_blocks = LazyBlockList(
+        tasks,
+        ray_remote_args=in_blocks._remote_args,
+        stats_uuid=in_blocks._stats_uuid,
+        owned_by_consumer=in_blocks._owned_by_consumer,
+    )
+    return in_blocks, stages[num_pushed_down:]
+
+
 def _rewrite_read_stage(
     in_blocks: LazyBlockList, stages: List[Stage]
 ) -> Tuple[BlockList, DatasetStats, List[Stage]]:
@@ -910,6 +998,37 @@ def _fuse_one_to_one_stages(stages: List[Stage]) -> List[Stage]:
     return fused_stages
 
 
+def _group_streaming_stages(
+    stages: List[Stage],
+) -> List[Union[Stage, List[OneToOneStage]]]:
+    """Groups consecutive one-to-one stages into chains for the streaming executor.
+
+    Stages that can't be streamed (e.g. all-to-all stages) and single one-to-one
+    stages are kept as is.
+
+    Args:
+        stages: Stages to group, after fusion.
+
+    Returns:
+        The stages, with each chain of consecutive one-to-one stages replaced by
+        a list of these stages.
+    """
+    grouped: List[Union[Stage, List[OneToOneStage]]] = []
+    chain: List[OneToOneStage] = []
+    for stage in stages + [None]:
+        if isinstance(stage, OneToOneStage):
+            chain.append(stage)
+            continue
+        if len(chain) > 1:
+            grouped.append(chain)
+        else:
+            grouped.extend(chain)
+        chain = []
+        if stage is not None:
+            grouped.append(stage)
+    return grouped
+
+
 def _are_remote_args_compatible(prev_args, next_args):
     """Check if Ray remote arguments are compatible for merging."""
     prev_args = _canonicalize(prev_args)
@@ -38,6 +38,16 @@ class _MergeTaskSchedule:
             partition_size += 1
         return partition_size
 
+    def get_reducer_idx_range_for_merge_idx(self, merge_idx: int) -> range:
+        """
+        Return the indices of the P final reduce tasks that the intermediate
+        merge task with the given index produces outputs for.
+        """
+        start = merge_idx * self.merge_partition_size + min(
+            merge_idx, self._partitions_with_extra_task
+        )
+        return range(start, start + self.get_num_reducers_per_merge_idx(merge_idx))
+
     def get_merge_idx_for_reducer_idx(self, reducer_idx: int) -> int:
         if reducer_idx < self.merge_partition_size * self._partitions_with_extra_task:
             merge_idx = reducer_idx // (self.merge_partition_size + 1)
@@ -232,6 +242,10 @@ class _MergeStageIterator:
         self._all_merge_results = [
             [] for _ in range(self._stage.num_merge_tasks_per_round)
         ]
+        # The sizes in bytes of the merge results, in the same nested order.
+        self._all_merge_sizes = [
+            [] for _ in range(self._stage.num_merge_tasks_per_round)
+        ]
 
     def __next__(self):
         if not self._map_result_buffer or not self._map_result_buffer[0]:
@@ -247,13 +261,14 @@ class _MergeStageIterator:
             self._merge_idx
         )
         merge_result = self._shuffle_merge.options(
-            num_returns=1 + num_merge_returns,
+            num_returns=2 + num_merge_returns,
             **self._stage.get_merge_task_options(self._merge_idx),
         ).remote(
             *merge_args,
             reduce_args=self._reduce_args,
         )
         metadata_ref = merge_result.pop(-1)
+        self._all_merge_sizes[self._merge_idx].append(merge_result.pop(-1))
         self._all_merge_results[self._merge_idx].append(merge_result)
         del merge_result
 
@@ -266,6 +281,11 @@ class _MergeStageIterator:
         self._all_merge_results = []
         return all_merge_results
 
+    def pop_merge_sizes(self) -> List[List[ObjectRef]]:
+        all_merge_sizes = self._all_merge_sizes
+        self._all_merge_sizes = []
+        return all_merge_sizes
+
 
 class _ReduceStageIterator:
     def __init__(
@@ -275,12 +295,21 @@ class _ReduceStageIterator:
         all_merge_results: List[List[List[ObjectRef]]],
         ray_remote_args,
         reduce_args: List[Any],
+        shuffle_reduce_split=None,
+        split_fns: Optional[Tuple[Callable, Callable]] = None,
+        split_boundaries: Optional[Dict[int, List[Any]]] = None,
     ):
         self._shuffle_reduce = shuffle_reduce
+        self._shuffle_reduce_split = shuffle_reduce_split
+        self._split_fns = split_fns
         self._stage = stage
-        self._reduce_arg_blocks: List[Tuple[int, List[ObjectRef]]] = []
+        self._reduce_arg_blocks: List[
+            Tuple[int, int, List[ObjectRef], Optional[List[Any]]]
+        ] = []
         self._ray_remote_args = ray_remote_args
         self._reduce_args = reduce_args
+        if split_boundaries is None:
+            split_boundaries = {}
 
         for reduce_idx in self._stage.merge_schedule.round_robin_reduce_idx_iterator():
             merge_idx = self._stage.merge_schedule.get_merge_idx_for_reducer_idx(
@@ -289,8 +318,19 @@ class _ReduceStageIterator:
             reduce_arg_blocks = [
                 merge_results.pop(0) for merge_results in all_merge_results[merge_idx]
             ]
-            self._reduce_arg_blocks.append((reduce_idx, reduce_arg_blocks))
-        assert len(self._reduce_arg_blocks) == stage.merge_schedule.output_num_blocks
+            boundaries = split_boundaries.get(reduce_idx)
+            if boundaries is None:
+                self._reduce_arg_blocks.append((reduce_idx, 0, reduce_arg_blocks, None))
+            else:
+                # Split the output block into one output block per range.
+                for split_idx in range(len(boundaries) + 1):
+                    self._reduce_arg_blocks.append(
+                        (reduce_idx, split_idx, reduce_arg_blocks, boundaries)
+                    )
+        assert (
+            len({reduce_idx for reduce_idx, *_ in self._reduce_arg_blocks})
+            == stage.merge_schedule.output_num_blocks
+        )
 
         for merge_idx, merge_results in enumerate(all_merge_results):
             assert all(len(merge_result) == 0 for merge_result in merge_results), (
@@ -298,7 +338,7 @@ class _ReduceStageIterator:
                 f"{merge_idx}"
             )
 
-        self._reduce_results: List[Tuple[int, ObjectRef]] = []
+        self._reduce_results: List[Tuple[Tuple[int, int], ObjectRef]] = []
 
     def __iter__(self):
         return self
@@ -307,18 +347,32 @@ class _ReduceStageIterator:
         if not self._reduce_arg_blocks:
             raise StopIteration
 
-        reduce_idx, reduce_arg_blocks = self._reduce_arg_blocks.pop(0)
+        next_reduce = self._reduce_arg_blocks.pop(0)
+        reduce_idx, split_idx, reduce_arg_blocks, boundaries = next_reduce
         merge_idx = self._stage.merge_schedule.get_merge_idx_for_reducer_idx(reduce_idx)
         # Submit one partition of reduce tasks, one for each of the P
         # outputs produced by the corresponding merge task.
         # We also add the merge task arguments so that the reduce task
         # is colocated with its inputs.
-        block, meta = self._shuffle_reduce.options(
-            **self._ray_remote_args,
-            **self._stage.get_merge_task_options(merge_idx),
-            num_returns=2,
-        ).remote(*self._reduce_args, *reduce_arg_blocks, partial_reduce=False)
-        self._reduce_results.append((reduce_idx, block))
+        if boundaries is None:
+            block, meta = self._shuffle_reduce.options(
+                **self._ray_remote_args,
+                **self._stage.get_merge_task_options(merge_idx),
+                num_returns=2,
+            ).remote(*self._reduce_args, *reduce_arg_blocks, partial_reduce=False)
+        else:
+            block, meta = self._shuffle_reduce_split.options(
+                **self._ray_remote_args,
+                **self._stage.get_merge_task_options(merge_idx),
+                num_returns=2,
+            ).remote(
+                *self._split_fns,
+                *reduce_arg_blocks,
+                reduce_args=self._reduce_args,
+                boundaries=boundaries,
+                split_idx=split_idx,
+            )
+        self._reduce_results.append(((reduce_idx, split_idx), block))
         return meta
 
     def pop_reduce_results(self):
@@ -462,9 +516,24 @@ class PushBasedShufflePlan(ShuffleOp):
 
         map_bar.close()
         all_merge_results = merge_stage_iter.pop_merge_results()
+        all_merge_sizes = merge_stage_iter.pop_merge_sizes()
+
+        ctx = DatasetContext.get_current()
+        split_boundaries = {}
+        if ctx.push_based_shuffle_skew_factor is not None:
+            split_boundaries = self._split_skewed_partitions(
+                stage.merge_schedule,
+                all_merge_results,
+                all_merge_sizes,
+                ctx.push_based_shuffle_skew_factor,
+            )
+        del all_merge_sizes
+        num_reduce_tasks = output_num_blocks + sum(
+            len(boundaries) for boundaries in split_boundaries.values()
+        )
 
         # Execute and wait for the reduce stage.
-        reduce_bar = ProgressBar("Shuffle Reduce", total=output_num_blocks)
+        reduce_bar = ProgressBar("Shuffle Reduce", total=num_reduce_tasks)
         shuffle_reduce = cached_remote_fn(self.reduce)
         reduce_stage_iter = _ReduceStageIterator(
             stage,
@@ -472,10 +541,14 @@ class PushBasedShufflePlan(ShuffleOp):
             all_merge_results,
             reduce_ray_remote_args,
             self._reduce_args,
+            # The reduce and split functions are passed as arguments, so that the
+            # remote function is defined once instead of once per shuffle.
+            shuffle_reduce_split=cached_remote_fn(PushBasedShufflePlan._reduce_split),
+            split_fns=(self.reduce, self._split_reducer_input),
+            split_boundaries=split_boundaries,
         )
 
-        max_reduce_tasks_in_flight = output_num_blocks
-        ctx = DatasetContext.get_current()
+        max_reduce_tasks_in_flight = num_reduce_tasks
         if ctx.pipeline_push_based_shuffle_reduce_tasks:
             # If pipelining is enabled, we should still try to utilize all
             # cores.
@@ -506,8 +579,8 @@ class PushBasedShufflePlan(ShuffleOp):
         del sorted_blocks
 
         assert (
-            len(new_blocks) == output_num_blocks
-        ), f"Expected {output_num_blocks} outputs, produced {len(new_blocks)}"
+            len(new_blocks) == num_reduce_tasks
+        ), f"Expected {num_reduce_tasks} outputs, produced {len(new_blocks)}"
         reduce_bar.close()
 
         stats = {
@@ -557,7 +630,8 @@ class PushBasedShufflePlan(ShuffleOp):
         reduce_args: Optional[List[Any]] = None,
     ) -> List[Union[BlockMetadata, Block]]:
         """
-        Returns list of [BlockMetadata, O1, O2, O3, ...output_num_blocks].
+        Returns list of [O1, O2, O3, ...output_num_blocks, output sizes,
+        BlockMetadata].
         """
         assert (
             len({len(mapper_outputs) for mapper_outputs in all_mapper_outputs}) == 1
@@ -569,6 +643,7 @@ class PushBasedShufflePlan(ShuffleOp):
         num_rows = 0
         size_bytes = 0
         schema = None
+        partition_sizes = []
         for i, mapper_outputs in enumerate(zip(*all_mapper_outputs)):
             block, meta = reduce_fn(*reduce_args, *mapper_outputs, partial_reduce=True)
             yield block
@@ -576,9 +651,12 @@ class PushBasedShufflePlan(ShuffleOp):
             block = BlockAccessor.for_block(block)
             num_rows += block.num_rows()
             size_bytes += block.size_bytes()
+            partition_sizes.append(block.size_bytes())
             schema = block.schema()
             del block
 
+        # The sizes of the outputs, for detecting skewed output blocks.
+        yield partition_sizes
         yield BlockMetadata(
             num_rows=num_rows,
             size_bytes=size_bytes,
@@ -587,6 +665,69 @@ class PushBasedShufflePlan(ShuffleOp):
             exec_stats=stats.build(),
         )
 
+    @staticmethod
+    def _reduce_split(
+        reduce_fn,
+        split_fn,
+        *reducer_inputs: List[Block],
+        reduce_args: List[Any],
+        boundaries: List[Any],
+        split_idx: int,
+    ) -> Tuple[Block, BlockMetadata]:
+        """Reduce the rows of the reducer inputs in one range of the boundaries."""
+        blocks = [
+            split_fn(block, i, boundaries, split_idx, *reduce_args)
+            for i, block in enumerate(reducer_inputs)
+        ]
+        return reduce_fn(*reduce_args, *blocks, partial_reduce=False)
+
+    def _split_skewed_partitions(
+        self,
+        schedule: _MergeTaskSchedule,
+        all_merge_results: List[List[List[ObjectRef]]],
+        all_merge_sizes: List[List[ObjectRef]],
+        skew_factor: float,
+    ) -> Dict[int, List[Any]]:
+        """
+        Return the boundaries to split each skewed output block by, keyed by the
+        reduce task index.
+
+        An output block is skewed if it's larger than skew_factor times the mean
+        output block size. It's split into about as many output blocks as it's
+        larger than the mean, if the shuffle op supports it.
+        """
+        partition_sizes = [0] * schedule.output_num_blocks
+        for merge_idx, size_refs in enumerate(all_merge_sizes):
+            reducer_idxs = schedule.get_reducer_idx_range_for_merge_idx(merge_idx)
+            for sizes in ray.get(size_refs):
+                for reduce_idx, size in zip(reducer_idxs, sizes):
+                    partition_sizes[reduce_idx] += size
+        mean_size = sum(partition_sizes) / len(partition_sizes)
+        if mean_size == 0:
+            return {}
+
+        split_boundaries = {}
+        for merge_idx, merge_results in enumerate(all_merge_results):
+            reducer_idxs = schedule.get_reducer_idx_range_for_merge_idx(merge_idx)
+            for i, reduce_idx in enumerate(reducer_idxs):
+                size = partition_sizes[reduce_idx]
+                if size <= skew_factor * mean_size:
+                    continue
+                num_splits = min(
+                    math.ceil(size / mean_size), schedule.output_num_blocks
+                )
+                reducer_inputs = [merge_result[i] for merge_result in merge_results]
+                boundaries = self._split_boundaries(reducer_inputs, num_splits)
+                if not boundaries:
+                    continue
+                logger.info(
+                    f"Splitting output block {reduce_idx} of {size} bytes, "
+                    f"{size / mean_size:.1f}x the mean output block size, into "
+                    f"{len(boundaries) + 1} blocks."
+                )
+                split_boundaries[reduce_idx] = boundaries
+        return split_boundaries
+
     @staticmethod
     def _compute_shuffle_schedule(
         num_cpus_per_node_map: Dict[str, int],
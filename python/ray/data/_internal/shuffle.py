@@ -4,6 +4,7 @@ from ray.data._internal.block_list import BlockList
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data.block import Block, BlockMetadata
+from ray.types import ObjectRef
 
 
 class ShuffleOp:
@@ -51,6 +52,31 @@ class ShuffleOp:
         """
         raise NotImplementedError
 
+    def _split_boundaries(
+        self, reducer_inputs: List[ObjectRef[Block]], num_splits: int
+    ) -> Optional[List[Any]]:
+        """
+        Return (num_splits - 1) boundaries that split the inputs of an output
+        block into ranges, or None if the output block can't be split.
+
+        The push-based shuffle uses this to split skewed output blocks: the rows in
+        each range are selected with `_split_reducer_input()` and reduced by a
+        separate task into an output block of their own.
+        """
+        return None
+
+    @staticmethod
+    def _split_reducer_input(
+        block: Block,
+        input_idx: int,
+        boundaries: List[Any],
+        split_idx: int,
+        *reduce_args: List[Any],
+    ) -> Block:
+        """Return the rows of the input_idx-th reducer input in the given range of
+        the boundaries."""
+        raise NotImplementedError
+
 
 class SimpleShufflePlan(ShuffleOp):
     def execute(
@@ -1,6 +1,6 @@
+import collections
 import random
 import sys
-import heapq
 from typing import Union, Callable, Iterator, List, Tuple, Any, Optional, TYPE_CHECKING
 
 import numpy as np
@@ -24,6 +24,7 @@ from ray.data.block import (
 )
 from ray.data._internal.block_builder import BlockBuilder
 from ray.data._internal.size_estimator import SizeEstimator
+from ray.data._internal.util import _iter_rows_grouped_by_key, _stable_hash
 
 
 class SimpleBlockBuilder(BlockBuilder[T]):
@@ -281,12 +282,26 @@ class SimpleBlockAccessor(BlockAccessor):
         ret.append(items[prev_i:])
         return ret
 
+    def hash_partition(self, key: KeyFn, num_partitions: int) -> List[List[T]]:
+        if key is None:
+            assert num_partitions == 1, num_partitions
+            return [self._items]
+
+        groups = collections.defaultdict(list)
+        for item in self._items:
+            groups[key(item)].append(item)
+        ret = [[] for _ in range(num_partitions)]
+        for group_key, items in groups.items():
+            ret[_stable_hash(group_key) % num_partitions].extend(items)
+        return ret
+
     def combine(
         self, key: KeyFn, aggs: Tuple[AggregateFn]
     ) -> Block[Tuple[KeyType, AggType]]:
         """Combine rows with the same key into an accumulator.
 
-        This assumes the block is already sorted by key in ascending order.
+        This assumes rows with the same key are contiguous, e.g., because the
+        block is sorted by key in ascending order.
 
         Args:
             key: The key function that returns the key from the row
@@ -369,20 +384,23 @@ class SimpleBlockAccessor(BlockAccessor):
         key: KeyFn,
         aggs: Tuple[AggregateFn],
         finalize: bool,
+        presorted: bool = True,
     ) -> Tuple[Block[Tuple[KeyType, Union[U, AggType]]], BlockMetadata]:
-        """Aggregate sorted, partially combined blocks with the same key range.
+        """Aggregate partially combined blocks with the same key range.
 
-        This assumes blocks are already sorted by key in ascending order,
-        so we can do merge sort to get all the rows with the same key.
+        If presorted is True, this assumes blocks are already sorted by key in
+        ascending order, so we can do merge sort to get all the rows with the same
+        key. Otherwise, the rows are grouped by key with a hash table.
 
         Args:
-            blocks: A list of partially combined and sorted blocks.
+            blocks: A list of partially combined blocks.
             key: The key function that returns the key from the row
                 or None for global aggregation.
             aggs: The aggregations to do.
             finalize: Whether to finalize the aggregation. This is used as an
                 optimization for cases where we repeatedly combine partially
                 aggregated groups.
+            presorted: Whether the blocks are sorted by key.
 
         Returns:
             A block of (k, v_1, ..., v_n) tuples and its metadata where k is
@@ -394,8 +412,10 @@ class SimpleBlockAccessor(BlockAccessor):
         stats = BlockExecStats.builder()
         key_fn = (lambda r: r[0]) if key else (lambda r: 0)
 
-        iter = heapq.merge(
-            *[SimpleBlockAccessor(block).iter_rows() for block in blocks], key=key_fn
+        iter = _iter_rows_grouped_by_key(
+            [SimpleBlockAccessor(block).iter_rows() for block in blocks],
+            key_fn,
+            presorted,
         )
         next_row = None
         ret = []
@@ -4,9 +4,9 @@ We implement a distributed sorting algorithm similar to
 Sorting is done in 3 stages: sampling, sorting individual blocks, and
 merging sorted blocks.
 
-Sampling: we get a number of sample items from each block, sort them, and
-use them to compute boundaries that would partition all items into
-approximately equal ranges.
+Sampling: we summarize the keys of each block with a quantile sketch, merge the
+sketches, and use them to compute boundaries that would partition all items
+into approximately equal ranges.
 
 Sorting: each block is sorted locally, then partitioned into smaller blocks
 according to the boundaries. Each partitioned block is passed to a merge task.
@@ -16,12 +16,14 @@ Merging: a merge task would receive a block from every worker that consists
 of items in a certain range. It then merges the sorted blocks into one sorted
 block and becomes part of the new, sorted dataset.
 """
-from typing import Any, Callable, List, Tuple, TypeVar, Union
+import bisect
+import itertools
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar, Union
 
 import numpy as np
 
+import ray
 from ray.data._internal.block_list import BlockList
-from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.push_based_shuffle import PushBasedShufflePlan
 from ray.data._internal.remote_fn import cached_remote_fn
@@ -37,8 +39,27 @@ T = TypeVar("T")
 # (Callable).
 SortKeyT = Union[None, List[Tuple[str, str]], Callable[[T], Any]]
 
+# The number of sketch items to keep per reducer when sampling the boundaries. The
+# boundaries split the sketch items, so the reducers get about the same number of
+# rows up to a fraction of 1 / SKETCH_ITEMS_PER_REDUCER.
+SKETCH_ITEMS_PER_REDUCER = 10
+
+# The max number of sketches merged by a single task when sampling the boundaries.
+SKETCH_MERGE_FANIN = 16
+
 
 class _SortOp(ShuffleOp):
+    def __init__(
+        self,
+        map_args: List[Any] = None,
+        reduce_args: List[Any] = None,
+        split_equal_keys: bool = True,
+    ):
+        super().__init__(map_args, reduce_args)
+        # Whether the rows of a single key may end up in different output blocks
+        # when a skewed output block is split.
+        self._split_equal_keys = split_equal_keys
+
     @staticmethod
     def map(
         idx: int,
@@ -68,6 +89,51 @@ class _SortOp(ShuffleOp):
             mapper_outputs, key, descending
         )
 
+    def _split_boundaries(
+        self, reducer_inputs: List[ObjectRef[Block]], num_splits: int
+    ) -> Optional[List[Tuple[T, Optional[int], Optional[int]]]]:
+        key, descending = self._reduce_args
+        # The boundaries are (key, input index, position) items, so that the rows of
+        # a hot key can be split at a position of one of the reducer inputs.
+        n_samples = max(
+            int(num_splits * SKETCH_ITEMS_PER_REDUCER / len(reducer_inputs)), 1
+        )
+        sketch_block = cached_remote_fn(_sketch_sorted_block)
+        sketches = [
+            sketch_block.remote(block, i, n_samples, key, descending)
+            for i, block in enumerate(reducer_inputs)
+        ]
+        sketch = ray.get(
+            _merge_sketch_tree(sketches, num_splits * SKETCH_ITEMS_PER_REDUCER)
+        )
+        boundaries = sketch.quantiles(np.arange(1, num_splits) / num_splits)
+        if any(b is None for b in boundaries):
+            return None
+        if not self._split_equal_keys:
+            boundaries = [(k, None, None) for k, _, _ in boundaries]
+        if descending:
+            boundaries.reverse()
+        return boundaries
+
+    @staticmethod
+    def _split_reducer_input(
+        block: Block,
+        input_idx: int,
+        boundaries: List[Tuple[T, Optional[int], Optional[int]]],
+        split_idx: int,
+        key: SortKeyT,
+        descending: bool,
+    ) -> Block:
+        # The reducer inputs are the outputs of merge tasks, so they're already
+        # sorted and can be split without sorting them again.
+        block = BlockAccessor.for_block(block)
+        values = _sorted_key_values(block, key)
+        bounds = [0]
+        for boundary in boundaries:
+            bounds.append(_count_before(values, input_idx, boundary, descending))
+        bounds.append(len(values))
+        return block.slice(bounds[split_idx], bounds[split_idx + 1], copy=False)
+
 
 class SimpleSortOp(_SortOp, SimpleShufflePlan):
     pass
@@ -83,42 +149,51 @@ def sample_boundaries(
     """
     Return (num_reducers - 1) items in ascending order from the blocks that
     partition the domain into ranges with approximately equally many elements.
-    """
-    # TODO(Clark): Support multiple boundary sampling keys.
-    if isinstance(key, list) and len(key) > 1:
-        raise ValueError("Multiple boundary sampling keys not supported.")
 
-    n_samples = int(num_reducers * 10 / len(blocks))
+    Each block is summarized by a quantile sketch in a sample task, and the sketches
+    are merged in a tree of tasks, so that the driver only fetches a single sketch
+    of bounded size. If the key has multiple columns, the items are
+    _MultiColumnKey objects, which are ordered like the sorted rows.
+    """
+    if isinstance(key, str):
+        key = [(key, "ascending")]
+    n_samples = max(int(num_reducers * SKETCH_ITEMS_PER_REDUCER / len(blocks)), 1)
+    max_sketch_size = num_reducers * SKETCH_ITEMS_PER_REDUCER
 
-    sample_block = cached_remote_fn(_sample_block)
+    sketch_block = cached_remote_fn(_sketch_block)
 
-    sample_results = [sample_block.remote(block, n_samples, key) for block in blocks]
+    sample_results = [sketch_block.remote(block, n_samples, key) for block in blocks]
+    sketch = _merge_sketch_tree(sample_results, max_sketch_size)
     sample_bar = ProgressBar("Sort Sample", len(sample_results))
-    samples = sample_bar.fetch_until_complete(sample_results)
+    sample_bar.block_until_complete(sample_results)
     sample_bar.close()
     del sample_results
-    samples = [s for s in samples if len(s) > 0]
-    # The dataset is empty
-    if len(samples) == 0:
-        return [None] * (num_reducers - 1)
-    builder = DelegatingBlockBuilder()
-    for sample in samples:
-        builder.add_block(sample)
-    samples = builder.build()
-    column = key[0][0] if isinstance(key, list) else None
-    sample_items = BlockAccessor.for_block(samples).to_numpy(column)
-    sample_items = np.sort(sample_items)
-    ret = [
-        np.quantile(sample_items, q, interpolation="nearest")
-        for q in np.linspace(0, 1, num_reducers)
-    ]
-    return ret[1:]
+    sketch = ray.get(sketch)
+    return sketch.quantiles(np.arange(1, num_reducers) / num_reducers)
+
+
+def _merge_sketch_tree(
+    sketches: List[ObjectRef["_QuantileSketch"]], max_size: int
+) -> ObjectRef["_QuantileSketch"]:
+    """Merge the sketches in a tree of tasks, and return the root sketch."""
+    merge_sketches = cached_remote_fn(_merge_sketches)
+    while len(sketches) > 1:
+        sketches = [
+            merge_sketches.remote(max_size, *sketches[i : i + SKETCH_MERGE_FANIN])
+            for i in range(0, len(sketches), SKETCH_MERGE_FANIN)
+        ]
+    return sketches[0]
 
 
 # Note: currently the map_groups() API relies on this implementation
-# to partition the same key into the same block.
+# to partition the same key into the same block, so it sorts with
+# split_equal_keys=False.
 def sort_impl(
-    blocks: BlockList, clear_input_blocks: bool, key: SortKeyT, descending: bool = False
+    blocks: BlockList,
+    clear_input_blocks: bool,
+    key: SortKeyT,
+    descending: bool = False,
+    split_equal_keys: bool = True,
 ) -> Tuple[BlockList, dict]:
     stage_info = {}
     blocks_list = blocks.get_blocks()
@@ -129,7 +204,9 @@ def sort_impl(
         key = [(key, "descending" if descending else "ascending")]
 
     if isinstance(key, list):
-        descending = key[0][1] == "descending"
+        # Keys of multiple columns already compare in the order of the sorted rows,
+        # whatever the order of each column, see _MultiColumnKey.
+        descending = len(key) == 1 and key[0][1] == "descending"
 
     num_mappers = len(blocks_list)
     # Use same number of output partitions.
@@ -145,7 +222,9 @@ def sort_impl(
     else:
         sort_op_cls = SimpleSortOp
     sort_op = sort_op_cls(
-        map_args=[boundaries, key, descending], reduce_args=[key, descending]
+        map_args=[boundaries, key, descending],
+        reduce_args=[key, descending],
+        split_equal_keys=split_equal_keys,
     )
     return sort_op.execute(
         blocks,
@@ -154,5 +233,255 @@ def sort_impl(
     )
 
 
-def _sample_block(block: Block[T], n_samples: int, key: SortKeyT) -> Block[T]:
-    return BlockAccessor.for_block(block).sample(n_samples, key)
+class _QuantileSketch:
+    """A mergeable summary of the distribution of the sort keys of a dataset.
+
+    The sketch is a list of keys in ascending order, each of which stands for
+    the number of rows given by its weight. Null keys of a single column are left
+    out.
+    """
+
+    def __init__(self, keys: List[Any], weights: np.ndarray):
+        self.keys = keys
+        self.weights = weights
+
+    @staticmethod
+    def for_block(block: Block[T], n_samples: int, key: SortKeyT) -> "_QuantileSketch":
+        """Summarize a block by a random sample of its keys.
+
+        Each sampled key is weighted by the number of rows it was sampled from, so
+        that the boundaries don't over-represent the rows of small blocks.
+        """
+        block = BlockAccessor.for_block(block)
+        samples = _to_keys(block.sample(n_samples, key), key)
+        if len(samples) == 0:
+            return _QuantileSketch([], np.empty(0))
+        weight = block.num_rows() / len(samples)
+        keys = [k for k in samples if not _is_null(k)]
+        keys = [keys[i] for i in _argsort(keys)]
+        return _QuantileSketch(keys, np.full(len(keys), weight))
+
+    @staticmethod
+    def merge(sketches: List["_QuantileSketch"], max_size: int) -> "_QuantileSketch":
+        """Merge sketches into a sketch of at most max_size keys."""
+        keys = list(itertools.chain.from_iterable(s.keys for s in sketches))
+        weights = np.concatenate([s.weights for s in sketches])
+        order = _argsort(keys)
+        sketch = _QuantileSketch([keys[i] for i in order], weights[order])
+        if len(sketch.keys) <= max_size:
+            return sketch
+        # Keep the keys at the midpoints of max_size equally weighted ranges.
+        total = sketch.weights.sum()
+        targets = (np.arange(max_size) + 0.5) * (total / max_size)
+        return _QuantileSketch(
+            sketch._keys_at(targets), np.full(max_size, total / max_size)
+        )
+
+    def quantiles(self, qs: np.ndarray) -> List[Any]:
+        """Return the keys at the given quantiles, or None if the sketch is empty."""
+        if len(self.keys) == 0:
+            return [None] * len(qs)
+        return self._keys_at(qs * self.weights.sum())
+
+    def _keys_at(self, cumulative_weights: np.ndarray) -> List[Any]:
+        indices = np.searchsorted(np.cumsum(self.weights), cumulative_weights)
+        indices = np.minimum(indices, len(self.keys) - 1)
+        return [self.keys[i] for i in indices]
+
+
+def _to_keys(samples: Block, key: SortKeyT) -> List[Any]:
+    if not isinstance(key, list):
+        # Samples of simple blocks are already a list of keys.
+        return samples
+    samples = BlockAccessor.for_block(samples)
+    if samples.num_rows() == 0:
+        return []
+    if len(key) == 1:
+        return list(samples.to_numpy(key[0][0]))
+    return list(_MultiColumnKeys(samples, key))
+
+
+def _is_null(key: Any) -> bool:
+    values = key if isinstance(key, tuple) else (key,)
+    # NaN is the only value that isn't equal to itself.
+    return any(v is None or v != v for v in values)
+
+
+def _argsort(keys: List[Any]) -> np.ndarray:
+    if len(keys) > 0 and not isinstance(keys[0], tuple):
+        arr = np.asarray(keys)
+        if arr.ndim == 1 and arr.dtype != object:
+            return np.argsort(arr, kind="stable")
+    return np.array(sorted(range(len(keys)), key=keys.__getitem__), dtype=np.int64)
+
+
+def _sorted_key_values(block: BlockAccessor, key: SortKeyT) -> Sequence[Any]:
+    if isinstance(key, list):
+        if block.num_rows() == 0:
+            return []
+        if len(key) > 1:
+            return _MultiColumnKeys(block, key)
+        return block.to_numpy(key[0][0])
+    return [key(x) if key else x for x in block.iter_rows()]
+
+
+def _partition_bounds(
+    block: BlockAccessor, boundaries: List[Any], key: SortKeyT
+) -> List[int]:
+    """Return the number of rows of a block sorted by multiple columns that are
+    before each of the boundaries."""
+    values = _sorted_key_values(block, key)
+    return [bisect.bisect_left(values, boundary) for boundary in boundaries]
+
+
+def _compare_values(a: Any, b: Any, descending: bool) -> int:
+    # Nulls are sorted to the end of a block, whether ascending or descending.
+    a_null, b_null = _is_null(a), _is_null(b)
+    if a_null or b_null:
+        return int(a_null) - int(b_null)
+    if a == b:
+        return 0
+    return 1 if (a > b) != descending else -1
+
+
+class _MultiColumnKey:
+    """The sort key of a row for a sort by multiple columns.
+
+    Keys compare column by column, each in the order it's sorted in, with nulls
+    last, so they're ordered like the sorted rows even if the columns are sorted
+    in different orders.
+    """
+
+    __slots__ = ("values", "descending")
+
+    def __init__(self, values: Tuple[Any, ...], descending: Tuple[bool, ...]):
+        self.values = values
+        self.descending = descending
+
+    def _compare(self, other: "_MultiColumnKey") -> int:
+        for a, b, descending in zip(self.values, other.values, self.descending):
+            result = _compare_values(a, b, descending)
+            if result != 0:
+                return result
+        return 0
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, _MultiColumnKey):
+            return NotImplemented
+        return self._compare(other) == 0
+
+    def __lt__(self, other: "_MultiColumnKey") -> bool:
+        return self._compare(other) < 0
+
+    def __gt__(self, other: "_MultiColumnKey") -> bool:
+        return self._compare(other) > 0
+
+    def __getstate__(self):
+        return self.values, self.descending
+
+    def __setstate__(self, state):
+        self.values, self.descending = state
+
+    def __repr__(self) -> str:
+        return f"_MultiColumnKey({self.values!r}, {self.descending!r})"
+
+
+class _MultiColumnKeys(Sequence):
+    """A view of the sort keys of the rows of a block sorted by multiple columns,
+    which only creates the keys that are accessed, e.g. by a binary search."""
+
+    def __init__(self, block: BlockAccessor, key: SortKeyT):
+        self._columns = [block.to_numpy(col) for col, _ in key]
+        self._descending = tuple(order == "descending" for _, order in key)
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def __getitem__(self, i: int) -> _MultiColumnKey:
+        return _MultiColumnKey(tuple(c[i] for c in self._columns), self._descending)
+
+
+def _num_not_null(values: Sequence[Any]) -> int:
+    # Null keys are sorted to the end of a block, whether ascending or descending.
+    lo, hi = 0, len(values)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _is_null(values[mid]):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def _count_before(
+    values: Sequence[Any],
+    input_idx: int,
+    boundary: Tuple[T, Optional[int], Optional[int]],
+    descending: bool,
+) -> int:
+    """Return the number of rows of a sorted reducer input before a boundary.
+
+    The rows with the boundary key are ordered by the index of their reducer
+    input, and then by their position in it, so that the rows of a hot key can be
+    split between several output blocks. If the boundary has no input index, all
+    the rows with the boundary key are after it.
+    """
+    boundary_key, boundary_idx, boundary_pos = boundary
+    n = _num_not_null(values)
+    if descending:
+        reversed_values = _Reversed(values, n)
+        lo = n - bisect.bisect_right(reversed_values, boundary_key)
+        hi = n - bisect.bisect_left(reversed_values, boundary_key)
+    else:
+        lo = bisect.bisect_left(values, boundary_key, 0, n)
+        hi = bisect.bisect_right(values, boundary_key, 0, n)
+    if boundary_idx is None:
+        return lo
+    if input_idx == boundary_idx:
+        # Descending sketches store negated positions, see _sketch_sorted_block.
+        return min(max(abs(boundary_pos), lo), hi)
+    # Descending boundaries are in the reverse order of input indices too.
+    return hi if (input_idx < boundary_idx) != descending else lo
+
+
+class _Reversed(Sequence):
+    """A reversed view of a prefix of a sequence, for binary searching descending
+    sequences."""
+
+    def __init__(self, seq: Sequence, length: int):
+        self._seq = seq
+        self._len = length
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, i: int) -> Any:
+        return self._seq[self._len - 1 - i]
+
+
+def _sketch_block(block: Block[T], n_samples: int, key: SortKeyT) -> _QuantileSketch:
+    return _QuantileSketch.for_block(block, n_samples, key)
+
+
+def _merge_sketches(max_size: int, *sketches: _QuantileSketch) -> _QuantileSketch:
+    return _QuantileSketch.merge(list(sketches), max_size)
+
+
+def _sketch_sorted_block(
+    block: Block[T], input_idx: int, n_samples: int, key: SortKeyT, descending: bool
+) -> _QuantileSketch:
+    """Summarize a sorted reducer input by a sample of (key, input index, position)
+    items, which are in the same order as the rows if the sort is ascending."""
+    block = BlockAccessor.for_block(block)
+    values = _sorted_key_values(block, key)
+    n = _num_not_null(values)
+    if n == 0:
+        return _QuantileSketch([], np.empty(0))
+    positions = np.sort(np.random.choice(n, min(n_samples, n), replace=False))
+    # Negate the positions of descending sorts, so that the items are in the
+    # reverse order of the rows, like the keys.
+    items = [
+        (values[p], input_idx, -int(p) if descending else int(p)) for p in positions
+    ]
+    items = [items[i] for i in _argsort(items)]
+    return _QuantileSketch(items, np.full(len(items), n / len(items)))
@@ -1,7 +1,8 @@
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
 import ray
 from ray.data._internal.fast_repartition import fast_repartition
+from ray.data._internal.join import join_impl
 from ray.data._internal.plan import AllToAllStage
 from ray.data._internal.shuffle_and_partition import (
     PushBasedShufflePartitionOp,
@@ -180,10 +181,41 @@ class ZipStage(AllToAllStage):
         super().__init__("zip", None, do_zip_all)
 
 
+class JoinStage(AllToAllStage):
+    """Implementation of `Dataset.join()`."""
+
+    def __init__(self, ds: "Dataset", other: "Dataset", on: str, how: str):
+        def do_join(block_list, clear_input_blocks: bool, *_):
+            _validate_key_fn(ds, on)
+            _validate_key_fn(other, on)
+            return join_impl(
+                block_list,
+                other._plan.execute(),
+                clear_input_blocks,
+                on,
+                how,
+                _column_names(ds),
+                _column_names(other),
+            )
+
+        super().__init__("join", None, do_join)
+
+
+def _column_names(ds: "Dataset") -> List[str]:
+    schema = ds.schema(fetch_if_missing=True)
+    return list(schema.names) if schema is not None else []
+
+
 class SortStage(AllToAllStage):
     """Implementation of `Dataset.sort()`."""
 
-    def __init__(self, ds: "Dataset", key: Optional[KeyFn], descending: bool):
+    def __init__(
+        self,
+        ds: "Dataset",
+        key: Union[KeyFn, List[Union[str, Tuple[str, str]]]],
+        descending: bool,
+        split_equal_keys: bool = True,
+    ):
         def do_sort(block_list, clear_input_blocks: bool, *_):
             # Handle empty dataset.
             if block_list.initial_num_blocks() == 0:
@@ -193,13 +225,31 @@ class SortStage(AllToAllStage):
                 block_list.clear()
             else:
                 blocks = block_list
+            sort_key = key
             if isinstance(key, list):
                 if not key:
                     raise ValueError("`key` must be a list of non-zero length")
-                for subkey in key:
-                    _validate_key_fn(ds, subkey)
+                default_order = "descending" if descending else "ascending"
+                sort_key = [
+                    (subkey, default_order) if isinstance(subkey, str) else subkey
+                    for subkey in key
+                ]
+                for subkey in sort_key:
+                    if (
+                        not isinstance(subkey, tuple)
+                        or len(subkey) != 2
+                        or subkey[1] not in ("ascending", "descending")
+                    ):
+                        raise ValueError(
+                            "`key` must be a list of column names or of (column, "
+                            "order) pairs, where the order is 'ascending' or "
+                            f"'descending', but got: {subkey}"
+                        )
+                    _validate_key_fn(ds, subkey[0])
             else:
                 _validate_key_fn(ds, key)
-            return sort_impl(blocks, clear_input_blocks, key, descending)
+            return sort_impl(
+                blocks, clear_input_blocks, sort_key, descending, split_equal_keys
+            )
 
         super().__init__("sort", None, do_sort)
@@ -207,6 +207,7 @@ class DatasetStats:
         self.iter_get_s: Timer = Timer()
         self.iter_next_batch_s: Timer = Timer()
         self.iter_format_batch_s: Timer = Timer()
+        self.iter_prefetch_wait_s: Timer = Timer()
         self.iter_user_s: Timer = Timer()
         self.iter_total_s: Timer = Timer()
 
@@ -303,6 +304,12 @@ class DatasetStats:
             out += "* In format_batch(): {}\n".format(
                 fmt(self.iter_format_batch_s.get())
             )
+            if self.iter_prefetch_wait_s.get():
+                # Batches were prepared in the background, overlapping with
+                # the user code.
+                out += "* Waiting for prefetched batches: {}\n".format(
+                    fmt(self.iter_prefetch_wait_s.get())
+                )
             out += "* In user code: {}\n".format(fmt(self.iter_user_s.get()))
             out += "* Total time: {}\n".format(fmt(self.iter_total_s.get()))
         return out
@@ -416,6 +423,7 @@ class DatasetPipelineStats:
         self.iter_get_s: Timer = Timer()
         self.iter_next_batch_s: Timer = Timer()
         self.iter_format_batch_s: Timer = Timer()
+        self.iter_prefetch_wait_s: Timer = Timer()
         self.iter_user_s: Timer = Timer()
         self.iter_total_s: Timer = Timer()
 
@@ -445,6 +453,12 @@ class DatasetPipelineStats:
             out += "* In format_batch(): {}\n".format(
                 fmt(self.iter_format_batch_s.get())
             )
+            if self.iter_prefetch_wait_s.get():
+                # Batches were prepared in the background, overlapping with
+                # the user code.
+                out += "* Waiting for prefetched batches: {}\n".format(
+                    fmt(self.iter_prefetch_wait_s.get())
+                )
             out += "* In user code: {}\n".format(fmt(self.iter_user_s.get()))
             out += "* Total time: {}\n".format(fmt(self.iter_total_s.get()))
 
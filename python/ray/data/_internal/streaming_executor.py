@@ -0,0 +1,439 @@
+import collections
+import logging
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
+
+import ray
+from ray.data._internal.block_list import BlockList
+from ray.data._internal.compute import (
+    ActorPoolStrategy,
+    _AdaptiveActorPoolPolicy,
+    _make_block_worker_cls,
+    _map_block_nosplit,
+    get_compute,
+)
+from ray.data._internal.progress_bar import ProgressBar
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import DatasetStats
+from ray.data.block import Block, BlockMetadata
+from ray.data.context import DEFAULT_SCHEDULING_STRATEGY, DatasetContext
+from ray.types import ObjectRef
+
+if TYPE_CHECKING:
+    from ray.data._internal.plan import OneToOneStage
+
+logger = logging.getLogger(__name__)
+
+# A block flowing through the stages: its ref, its metadata, and the number of
+# source blocks it was produced from (used for progress reporting).
+_StreamBlock = Tuple[ObjectRef[Block], BlockMetadata, int]
+
+
+class _StageExecutor:
+    """Executes a single one-to-one stage on a stream of input blocks.
+
+    Input blocks are bundled (if the stage has a target block size) and
+    submitted as soon as they arrive, subject to the concurrency limit of the
+    stage and the backpressure decision of the StreamingExecutor. Output blocks
+    are released in input order.
+    """
+
+    def __init__(
+        self, stage: "OneToOneStage", num_source_blocks: int, bar_position: int
+    ):
+        self.stage = stage
+        self.compute = get_compute(stage.compute)
+        self.fn_args = tuple(stage.fn_args or ())
+        self.fn_kwargs = stage.fn_kwargs or {}
+        self.remote_args = dict(stage.ray_remote_args)
+
+        self.inputs: Deque[_StreamBlock] = collections.deque()
+        self.inputs_done = False
+        self._pending_bundle: List[_StreamBlock] = []
+        self._pending_bundle_rows = 0
+        self._bundles: Deque[List[_StreamBlock]] = collections.deque()
+
+        # Metadata ref of each running task -> (sequence number, block ref,
+        # number of source blocks, worker or None).
+        self._in_flight: Dict[ObjectRef, Tuple[int, ObjectRef, int, Any]] = {}
+        # Completed tasks waiting for all earlier tasks to complete.
+        self._completed: Dict[int, _StreamBlock] = {}
+        self._next_seq = 0
+        self._next_output_seq = 0
+        self.outputs: Deque[_StreamBlock] = collections.deque()
+        # Metadata of all output blocks, for stats.
+        self.output_metadata: List[BlockMetadata] = []
+        self._output_bytes = 0
+
+        if isinstance(self.compute, ActorPoolStrategy):
+            self._init_actor_pool()
+        else:
+            self._map_block = cached_remote_fn(_map_block_nosplit).options(
+                **dict(self.remote_args, num_returns=2)
+            )
+            num_cpus = self.remote_args.get("num_cpus", 1) or 1
+            cluster_cpus = ray.cluster_resources().get("CPU", 1)
+            self._max_tasks_in_flight = max(1, int(cluster_cpus // num_cpus))
+
+        self._bar = ProgressBar(
+            stage.name.title(), total=num_source_blocks, position=bar_position
+        )
+
+    def _init_actor_pool(self):
+        stage = self.stage
+        if "num_cpus" not in self.remote_args:
+            self.remote_args["num_cpus"] = 1
+        if "scheduling_strategy" not in self.remote_args:
+            ctx = DatasetContext.get_current()
+            if ctx.scheduling_strategy == DEFAULT_SCHEDULING_STRATEGY:
+                self.remote_args["scheduling_strategy"] = "SPREAD"
+            else:
+                self.remote_args["scheduling_strategy"] = ctx.scheduling_strategy
+        self._worker_cls = ray.remote(**self.remote_args)(
+            _make_block_worker_cls(stage.block_fn, stage.fn)
+        )
+        self._constructor_args = tuple(stage.fn_constructor_args or ())
+        self._constructor_kwargs = stage.fn_constructor_kwargs or {}
+        self.workers = []
+        self._starting_workers: Dict[ObjectRef, Any] = {}
+        self._ready_workers = set()
+        self._worker_tasks = collections.defaultdict(int)
+        self._policy = None
+        if self.compute.adaptive:
+            self._policy = _AdaptiveActorPoolPolicy(self.compute)
+        self._num_started_workers = 0
+        for _ in range(self.compute.min_size):
+            self._start_worker()
+
+    def _start_worker(self):
+        worker = self._worker_cls.remote(
+            *self._constructor_args, **self._constructor_kwargs
+        )
+        self.workers.append(worker)
+        self._starting_workers[worker.ready.remote()] = worker
+        self._num_started_workers += 1
+        if self._policy:
+            self._policy.on_worker_started(worker)
+
+    def remove_idle_workers(self):
+        """Removes the idle actors of an adaptive actor pool from the pool."""
+        if not isinstance(self.compute, ActorPoolStrategy) or not self._policy:
+            return
+        self._bundle_inputs()
+        for worker in self._policy.idle_workers_to_remove(
+            len(self.workers),
+            has_queued_inputs=bool(self._bundles or self._pending_bundle),
+            inputs_done=self.inputs_done,
+        ):
+            self.workers.remove(worker)
+            self._ready_workers.discard(worker)
+            self._worker_tasks.pop(worker, None)
+            ray.kill(worker)
+
+    def add_input(self, block: _StreamBlock):
+        self.inputs.append(block)
+
+    def _bundle_inputs(self):
+        target_size = self.stage.target_block_size
+        while self.inputs:
+            block = self.inputs.popleft()
+            if target_size is None:
+                self._bundles.append([block])
+                continue
+            # Same bundling rule as _bundle_blocks_up_to_size().
+            num_rows = block[1].num_rows
+            if num_rows is None:
+                num_rows = float("inf")
+            if (
+                self._pending_bundle
+                and self._pending_bundle_rows + num_rows > target_size
+            ):
+                self._bundles.append(self._pending_bundle)
+                self._pending_bundle = []
+                self._pending_bundle_rows = 0
+            self._pending_bundle.append(block)
+            self._pending_bundle_rows += num_rows
+        if self.inputs_done and self._pending_bundle:
+            self._bundles.append(self._pending_bundle)
+            self._pending_bundle = []
+            self._pending_bundle_rows = 0
+
+    def has_work(self) -> bool:
+        """Whether there are inputs that haven't been submitted yet."""
+        self._bundle_inputs()
+        return bool(self._bundles)
+
+    def _idle_worker(self) -> Optional[Any]:
+        if self._policy:
+            max_tasks_in_flight = self._policy.max_tasks_in_flight()
+        else:
+            max_tasks_in_flight = self.compute.max_tasks_in_flight_per_actor
+        for worker in self._ready_workers:
+            if self._worker_tasks[worker] < max_tasks_in_flight:
+                return worker
+        return None
+
+    def can_submit(self) -> bool:
+        """Whether the concurrency limit of the stage allows a new task."""
+        if isinstance(self.compute, ActorPoolStrategy):
+            if self._idle_worker() is not None:
+                return True
+            # Scale up the pool while most of its actors are busy.
+            if (
+                len(self.workers) < self.compute.max_size
+                and len(self._ready_workers) / len(self.workers)
+                > self.compute.ready_to_total_workers_ratio
+                and not self._starting_workers
+                and (
+                    not self._policy
+                    or self._policy.should_scale_up(
+                        len(self._ready_workers), len(self._bundles)
+                    )
+                )
+            ):
+                self._start_worker()
+            return False
+        return len(self._in_flight) < self._max_tasks_in_flight
+
+    def submit(self):
+        """Submits a task for the next bundle of inputs."""
+        bundle = self._bundles.popleft()
+        blocks = tuple(ref for ref, _, _ in bundle)
+        input_files = [f for _, meta, _ in bundle for f in meta.input_files]
+        num_source_blocks = sum(n for _, _, n in bundle)
+        if isinstance(self.compute, ActorPoolStrategy):
+            worker = self._idle_worker()
+            block_ref, meta_ref = worker.map_block_nosplit.remote(
+                input_files,
+                len(blocks),
+                *(blocks + self.fn_args),
+                **self.fn_kwargs,
+            )
+            self._worker_tasks[worker] += 1
+            if self._policy:
+                self._policy.on_task_submitted(worker)
+        else:
+            worker = None
+            block_ref, meta_ref = self._map_block.remote(
+                self.stage.block_fn,
+                input_files,
+                self.stage.fn,
+                len(blocks),
+                *(blocks + self.fn_args),
+                **self.fn_kwargs,
+            )
+        self._in_flight[meta_ref] = (
+            self._next_seq,
+            block_ref,
+            num_source_blocks,
+            worker,
+        )
+        self._next_seq += 1
+
+    def waitables(self) -> List[ObjectRef]:
+        refs = list(self._in_flight)
+        if isinstance(self.compute, ActorPoolStrategy):
+            refs += list(self._starting_workers)
+        return refs
+
+    def on_ready(self, ref: ObjectRef) -> bool:
+        """Handles a ready ref, returns False if it doesn't belong to this stage."""
+        if isinstance(self.compute, ActorPoolStrategy):
+            if ref in self._starting_workers:
+                worker = self._starting_workers.pop(ref)
+                self._ready_workers.add(worker)
+                if self._policy:
+                    self._policy.on_worker_ready(worker)
+                return True
+        if ref not in self._in_flight:
+            return False
+        seq, block_ref, num_source_blocks, worker = self._in_flight.pop(ref)
+        meta = ray.get(ref)
+        if worker is not None:
+            self._worker_tasks[worker] -= 1
+            if self._policy:
+                self._policy.on_task_done(worker, meta)
+        self._completed[seq] = (block_ref, meta, num_source_blocks)
+        # Release outputs in input order.
+        while self._next_output_seq in self._completed:
+            block = self._completed.pop(self._next_output_seq)
+            self._next_output_seq += 1
+            self.outputs.append(block)
+            self.output_metadata.append(block[1])
+            self._output_bytes += block[1].size_bytes or 0
+            self._bar.update(block[2])
+        return True
+
+    def buffered_bytes(self) -> float:
+        """Estimated object store usage of the not yet consumed outputs."""
+        completed = sum(meta.size_bytes or 0 for _, meta, _ in self._completed.values())
+        outputs = sum(meta.size_bytes or 0 for _, meta, _ in self.outputs)
+        in_flight = 0
+        if self.output_metadata:
+            avg_bytes = self._output_bytes / len(self.output_metadata)
+            in_flight = avg_bytes * len(self._in_flight)
+        return completed + outputs + in_flight
+
+    def queued_bytes(self) -> int:
+        """The size of the bundles that are ready to be submitted.
+
+        A partial bundle can only be submitted after more inputs arrive, so it
+        doesn't count (otherwise it could block its own inputs).
+        """
+        self._bundle_inputs()
+        return sum(
+            meta.size_bytes or 0 for bundle in self._bundles for _, meta, _ in bundle
+        )
+
+    def done(self) -> bool:
+        return (
+            self.inputs_done
+            and not self.has_work()
+            and not self._in_flight
+            and not self._completed
+        )
+
+    def shutdown(self, kill: bool = False):
+        self._bar.close()
+        if isinstance(self.compute, ActorPoolStrategy):
+            self.compute.num_workers += self._num_started_workers
+            if kill:
+                for worker in self.workers:
+                    ray.kill(worker)
+            self.workers = []
+            self._starting_workers = {}
+            self._ready_workers = set()
+        elif kill:
+            for ref in self._in_flight:
+                ray.cancel(ref)
+
+
+class StreamingExecutor:
+    """Executes a chain of one-to-one stages with pipelining between stages.
+
+    Unlike the bulk execution of ExecutionPlan, where every stage finishes all of
+    its blocks before the next stage starts, each output block of a stage is passed
+    on to the next stage as soon as it is produced (in order), so that all stages
+    run concurrently. Each stage (except for the last one) only submits new tasks
+    while the estimated size of its produced but not yet consumed outputs is
+    below its share of the object store memory budget, which bounds the memory
+    used by intermediate blocks.
+    """
+
+    def __init__(self, stages: List["OneToOneStage"]):
+        self._stages = stages
+        context = DatasetContext.get_current()
+        object_store_memory = ray.cluster_resources().get(
+            "object_store_memory", float("inf")
+        )
+        budget = object_store_memory * context.streaming_executor_object_store_fraction
+        self._stage_budget = budget / max(1, len(stages) - 1)
+
+    def execute(
+        self,
+        blocks: BlockList,
+        stats: DatasetStats,
+        clear_input_blocks: bool,
+        run_by_consumer: bool,
+    ) -> Tuple[BlockList, DatasetStats]:
+        """Executes the stages on the given blocks.
+
+        Returns:
+            The output blocks of the last stage and the stats of all stages.
+        """
+        if blocks._owned_by_consumer:
+            assert (
+                run_by_consumer
+            ), "Blocks owned by consumer can only be consumed by consumer"
+        if blocks.initial_num_blocks() == 0:
+            return blocks, stats
+
+        start_time = time.perf_counter()
+        input_blocks = blocks.get_blocks_with_metadata()
+        if clear_input_blocks:
+            blocks.clear()
+
+        executors = [
+            _StageExecutor(stage, len(input_blocks), i)
+            for i, stage in enumerate(self._stages)
+        ]
+        for block_ref, meta in input_blocks:
+            executors[0].add_input((block_ref, meta, 1))
+        executors[0].inputs_done = True
+        del input_blocks
+
+        try:
+            output_blocks = self._run(executors)
+        except BaseException:
+            for executor in executors:
+                try:
+                    executor.shutdown(kill=True)
+                except Exception as err:
+                    logger.exception(f"Error shutting down stage: {err}")
+            raise
+
+        for executor in executors:
+            executor.shutdown()
+            stats = DatasetStats(
+                stages={executor.stage.name: executor.output_metadata},
+                parent=stats,
+            )
+            stats.dataset_uuid = uuid.uuid4().hex
+            # Stages run concurrently, so they all share the same wall time.
+            stats.time_total_s = time.perf_counter() - start_time
+
+        new_blocks, new_metadata = [], []
+        for block_ref, meta, _ in output_blocks:
+            new_blocks.append(block_ref)
+            new_metadata.append(meta)
+        return (
+            BlockList(new_blocks, new_metadata, owned_by_consumer=run_by_consumer),
+            stats,
+        )
+
+    def _run(self, executors: List[_StageExecutor]) -> List[_StreamBlock]:
+        output_blocks = []
+        last = executors[-1]
+        while not last.done():
+            # Submit tasks, downstream stages first so that they can free up the
+            # budget of their upstream stages.
+            for i in reversed(range(len(executors))):
+                executor = executors[i]
+                while executor.has_work() and executor.can_submit():
+                    if executor is not last:
+                        used = (
+                            executor.buffered_bytes() + executors[i + 1].queued_bytes()
+                        )
+                        # Backpressure: wait for the next stage to consume outputs.
+                        if used > 0 and used >= self._stage_budget:
+                            break
+                    executor.submit()
+
+            waitables = [ref for executor in executors for ref in executor.waitables()]
+            if waitables:
+                ready, rest = ray.wait(
+                    waitables, num_returns=1, timeout=0.1, fetch_local=False
+                )
+                if ready and rest:
+                    more_ready, _ = ray.wait(
+                        rest, num_returns=len(rest), timeout=0, fetch_local=False
+                    )
+                    ready += more_ready
+                for ref in ready:
+                    for executor in executors:
+                        if executor.on_ready(ref):
+                            break
+
+            # Pass outputs on to the next stage.
+            for i, executor in enumerate(executors):
+                executor.remove_idle_workers()
+                while executor.outputs:
+                    block = executor.outputs.popleft()
+                    if executor is last:
+                        output_blocks.append(block)
+                    else:
+                        executors[i + 1].add_input(block)
+                if i + 1 < len(executors) and executor.done():
+                    executors[i + 1].inputs_done = True
+        return output_blocks
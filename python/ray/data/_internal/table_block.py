@@ -3,10 +3,11 @@ from typing import Dict, Iterator, List, Union, Any, TypeVar, TYPE_CHECKING
 
 import numpy as np
 
-from ray.data.block import Block, BlockAccessor
+from ray.data.block import Block, BlockAccessor, KeyFn
 from ray.data.row import TableRow
 from ray.data._internal.block_builder import BlockBuilder
 from ray.data._internal.size_estimator import SizeEstimator
+from ray.data._internal.util import _hash_partition_ids
 
 if TYPE_CHECKING:
     from ray.data._internal.sort import SortKeyT
@@ -212,3 +213,43 @@ class TableBlockAccessor(BlockAccessor):
             return self._empty_table()
         k = min(n_samples, self.num_rows())
         return self._sample(k, key)
+
+    def hash_partition(self, key: KeyFn, num_partitions: int) -> List[Any]:
+        if key is not None and not isinstance(key, str):
+            raise ValueError(
+                "key must be a string or None when partitioning table blocks, but "
+                f"got: {type(key)}."
+            )
+        if self.num_rows() == 0:
+            return [self._empty_table() for _ in range(num_partitions)]
+        if key is None:
+            assert num_partitions == 1, num_partitions
+            return [self._table]
+
+        import pandas as pd
+
+        # Factorize the key column with a hash table, so that only the distinct keys
+        # of this block need to be hashed.
+        codes, uniques = pd.factorize(self.to_numpy(key), sort=False)
+        group_partitions = _hash_partition_ids(uniques, num_partitions)
+        if (codes < 0).any():
+            # Missing keys are not factorized, so they form a group of their own.
+            codes = np.where(codes < 0, len(group_partitions), codes)
+            group_partitions = np.append(group_partitions, 0)
+
+        # Order the groups by partition and the rows by group, so that each
+        # partition is a contiguous range of rows in which each key is contiguous.
+        group_ranks = np.empty(len(group_partitions), dtype=np.int64)
+        group_ranks[np.argsort(group_partitions, kind="stable")] = np.arange(
+            len(group_partitions)
+        )
+        row_partitions = group_partitions[codes]
+        table = self.take(np.argsort(group_ranks[codes], kind="stable"))
+        accessor = BlockAccessor.for_block(table)
+
+        partitions = []
+        start = 0
+        for end in np.cumsum(np.bincount(row_partitions, minlength=num_partitions)):
+            partitions.append(accessor.slice(start, int(end), copy=False))
+            start = int(end)
+        return partitions
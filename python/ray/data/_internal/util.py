@@ -1,9 +1,15 @@
+import collections
+import heapq
 import importlib
+import itertools
 import logging
+import numbers
 import os
-from typing import List, Union, Optional, TYPE_CHECKING
+import pickle
+from typing import Any, Callable, Iterator, List, Union, Optional, TYPE_CHECKING
 from types import ModuleType
 import sys
+import zlib
 
 import numpy as np
 
@@ -239,3 +245,80 @@ def _is_local_scheme(paths: Union[str, List[str]]) -> bool:
             f"but found mixed {paths}"
         )
     return num == len(paths)
+
+
+# Python's hash() is only stable across processes for numbers. The hashes of None
+# and of all other keys can differ between workers, so they are hashed explicitly.
+_MAX_INT_HASH = sys.hash_info.modulus
+
+
+def _stable_hash(value: Any) -> int:
+    """Hash a groupby key so that all workers agree on its hash.
+
+    Keys that compare equal hash to the same value, as with hash(). Keys that
+    aren't numbers, strings, bytes or tuples are hashed by their pickled bytes.
+    """
+    if value is None:
+        return 0
+    if isinstance(value, (str, bytes)):
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        return zlib.crc32(value)
+    if isinstance(value, tuple):
+        h = 0x345678
+        for v in value:
+            h = (h * 1000003) ^ _stable_hash(v)
+        return h & 0xFFFFFFFFFFFFFFFF
+    if isinstance(value, float) and value != value:
+        # NaN hashes by identity.
+        return 0
+    if isinstance(value, (numbers.Number, np.bool_)):
+        return hash(value)
+    try:
+        return zlib.crc32(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception as e:
+        raise TypeError(
+            f"Groupby keys of type {type(value).__name__} can't be hashed "
+            "consistently across workers."
+        ) from e
+
+
+def _hash_partition_ids(keys: Any, num_partitions: int) -> np.ndarray:
+    """Assign each of the given distinct keys to one of num_partitions partitions.
+
+    Integer keys are assigned with vectorized arithmetic that matches
+    _stable_hash(), so the partition of a key does not depend on the block format.
+    """
+    if (
+        isinstance(keys, np.ndarray)
+        and keys.dtype.kind in "iu"
+        and len(keys) > 0
+        and -_MAX_INT_HASH < keys.min()
+        and keys.max() < _MAX_INT_HASH
+    ):
+        hashes = keys.astype(np.int64)
+        # hash(-1) == -2 in CPython.
+        hashes[hashes == -1] = -2
+        return hashes % num_partitions
+    return np.fromiter(
+        (_stable_hash(k) % num_partitions for k in keys),
+        dtype=np.int64,
+        count=len(keys),
+    )
+
+
+def _iter_rows_grouped_by_key(
+    row_iters: List[Iterator[Any]], key_fn: Callable[[Any], Any], presorted: bool
+) -> Iterator[Any]:
+    """Iterate over the rows of several blocks so that equal keys are adjacent.
+
+    If presorted is True, the rows of each block must be sorted by key, and are
+    merge sorted. Otherwise, the rows are grouped by key in order of first
+    appearance.
+    """
+    if presorted:
+        return heapq.merge(*row_iters, key=key_fn)
+    groups = collections.defaultdict(list)
+    for row in itertools.chain.from_iterable(row_iters):
+        groups[key_fn(row)].append(row)
+    return itertools.chain.from_iterable(groups.values())
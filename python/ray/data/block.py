@@ -408,8 +408,15 @@ class BlockAccessor(Generic[T]):
         """Return a list of sorted partitions of this block."""
         raise NotImplementedError
 
+    def hash_partition(self, key: KeyFn, num_partitions: int) -> List["Block[T]"]:
+        """Return a list of partitions of this block by the hash of the key.
+
+        Rows with the same key go to the same partition and are contiguous in it.
+        """
+        raise NotImplementedError
+
     def combine(self, key: KeyFn, agg: "AggregateFn") -> Block[U]:
-        """Combine rows with the same key into an accumulator."""
+        """Combine contiguous rows with the same key into an accumulator."""
         raise NotImplementedError
 
     @staticmethod
@@ -58,6 +58,37 @@ DEFAULT_USE_PUSH_BASED_SHUFFLE = bool(
     os.environ.get("RAY_DATASET_PUSH_BASED_SHUFFLE", None)
 )
 
+# If set, push-based shuffles split the output blocks that are larger than this many
+# times the mean output block size into multiple output blocks, each reduced by a
+# separate task, if the shuffle supports it (e.g., sort). This changes the number of
+# output blocks, so it's disabled by default.
+DEFAULT_PUSH_BASED_SHUFFLE_SKEW_FACTOR = (
+    float(os.environ["RAY_DATASET_PUSH_BASED_SHUFFLE_SKEW_FACTOR"])
+    if "RAY_DATASET_PUSH_BASED_SHUFFLE_SKEW_FACTOR" in os.environ
+    else None
+)
+
+# Whether to execute chains of one-to-one stages with the streaming executor, which
+# passes each block to the next stage as soon as it is produced.
+DEFAULT_USE_STREAMING_EXECUTOR = bool(
+    int(os.environ.get("RAY_DATASET_USE_STREAMING_EXECUTOR", "0"))
+)
+
+# The fraction of the object store memory of the cluster that the streaming executor
+# lets the intermediate blocks of a chain of stages use.
+DEFAULT_STREAMING_EXECUTOR_OBJECT_STORE_FRACTION = ESTIMATED_SAFE_MEMORY_FRACTION
+
+# Whether to hash-partition groupby aggregations instead of range-partitioning them
+# with sampled boundaries. This skips the sampling pass and the sorts, but the
+# aggregated output is no longer ordered by key.
+DEFAULT_USE_HASH_BASED_GROUPBY = bool(
+    int(os.environ.get("RAY_DATASET_USE_HASH_BASED_GROUPBY", "0"))
+)
+
+# Dataset.join() broadcasts one side of the join to every block of the other side
+# instead of shuffling both sides if the smaller side is below this size.
+DEFAULT_JOIN_BROADCAST_THRESHOLD_BYTES = 10 * 1024 * 1024
+
 # The default global scheduling strategy.
 DEFAULT_SCHEDULING_STRATEGY = "DEFAULT"
 
@@ -107,6 +138,11 @@ class DatasetContext:
         actor_prefetcher_enabled: bool,
         use_push_based_shuffle: bool,
         pipeline_push_based_shuffle_reduce_tasks: bool,
+        push_based_shuffle_skew_factor: Optional[float],
+        use_streaming_executor: bool,
+        streaming_executor_object_store_fraction: float,
+        use_hash_based_groupby: bool,
+        join_broadcast_threshold_bytes: int,
         scheduling_strategy: SchedulingStrategyT,
         use_polars: bool,
         decoding_size_estimation: bool,
@@ -129,6 +165,13 @@ class DatasetContext:
         self.pipeline_push_based_shuffle_reduce_tasks = (
             pipeline_push_based_shuffle_reduce_tasks
         )
+        self.push_based_shuffle_skew_factor = push_based_shuffle_skew_factor
+        self.use_streaming_executor = use_streaming_executor
+        self.streaming_executor_object_store_fraction = (
+            streaming_executor_object_store_fraction
+        )
+        self.use_hash_based_groupby = use_hash_based_groupby
+        self.join_broadcast_threshold_bytes = join_broadcast_threshold_bytes
         self.scheduling_strategy = scheduling_strategy
         self.use_polars = use_polars
         self.decoding_size_estimation = decoding_size_estimation
@@ -164,6 +207,17 @@ class DatasetContext:
                     # because of a scheduling bug at large scale.
                     # See https://github.com/ray-project/ray/issues/25412.
                     pipeline_push_based_shuffle_reduce_tasks=True,
+                    push_based_shuffle_skew_factor=(
+                        DEFAULT_PUSH_BASED_SHUFFLE_SKEW_FACTOR
+                    ),
+                    use_streaming_executor=DEFAULT_USE_STREAMING_EXECUTOR,
+                    streaming_executor_object_store_fraction=(
+                        DEFAULT_STREAMING_EXECUTOR_OBJECT_STORE_FRACTION
+                    ),
+                    use_hash_based_groupby=DEFAULT_USE_HASH_BASED_GROUPBY,
+                    join_broadcast_threshold_bytes=(
+                        DEFAULT_JOIN_BROADCAST_THRESHOLD_BYTES
+                    ),
                     scheduling_strategy=DEFAULT_SCHEDULING_STRATEGY,
                     use_polars=DEFAULT_USE_POLARS,
                     decoding_size_estimation=DEFAULT_DECODING_SIZE_ESTIMATION_ENABLED,
@@ -2,6 +2,7 @@ import collections
 import itertools
 import logging
 import os
+import posixpath
 import sys
 import time
 import html
@@ -41,10 +42,11 @@ from ray.data._internal.equalize import _equalize
 from ray.data._internal.lazy_block_list import LazyBlockList
 from ray.data._internal.output_buffer import BlockOutputBuffer
 from ray.data._internal.util import _estimate_available_parallelism, _is_local_scheme
-from ray.data._internal.pandas_block import PandasBlockSchema
+from ray.data._internal.pandas_block import PandasBlockAccessor, PandasBlockSchema
 from ray.data._internal.plan import (
     ExecutionPlan,
     OneToOneStage,
+    ReadPushdown,
     _adapt_for_multiple_blocks,
 )
 from ray.data._internal.stage_impl import (
@@ -52,13 +54,14 @@ from ray.data._internal.stage_impl import (
     RepartitionStage,
     RandomShuffleStage,
     ZipStage,
+    JoinStage,
     SortStage,
 )
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.split import _split_at_index, _split_at_indices, _get_num_rows
 from ray.data._internal.stats import DatasetStats
-from ray.data._internal.table_block import VALUE_COL_NAME
+from ray.data._internal.table_block import VALUE_COL_NAME, TableBlockAccessor
 from ray.data.aggregate import AggregateFn, Max, Mean, Min, Std, Sum
 from ray.data.block import (
     VALID_BATCH_FORMATS,
@@ -116,6 +119,7 @@ if TYPE_CHECKING:
     import modin
     import pandas
     import pyarrow
+    import pyarrow.dataset
     import pyspark
     import tensorflow as tf
     import torch
@@ -710,6 +714,10 @@ class Dataset(Generic[T]):
 
         All input columns used to select need to be in the schema of the dataset.
 
+        If the dataset is read from Parquet files and this directly follows the
+        read (or an expression ``filter()`` that directly follows the read), the
+        columns are selected while reading, so the other columns are never read.
+
         Examples:
             >>> import ray
             >>> # Create a dataset with 3 columns
@@ -731,11 +739,23 @@ class Dataset(Generic[T]):
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """
-        return self.map_batches(
-            lambda batch: BlockAccessor.for_block(batch).select(columns=cols),
-            compute=compute,
-            **ray_remote_args,
+        context = DatasetContext.get_current()
+
+        @_adapt_for_multiple_blocks
+        def transform(block: Block) -> Iterable[Block]:
+            DatasetContext._set_current(context)
+            return [BlockAccessor.for_block(block).select(columns=cols)]
+
+        plan = self._plan.with_stage(
+            OneToOneStage(
+                "select_columns",
+                transform,
+                compute,
+                ray_remote_args,
+                read_pushdown=ReadPushdown(columns=cols),
+            )
         )
+        return Dataset(plan, self._epoch, self._lazy)
 
     def flat_map(
         self,
@@ -807,7 +827,7 @@ class Dataset(Generic[T]):
 
     def filter(
         self,
-        fn: RowUDF[T, U],
+        fn: Union[RowUDF[T, U], "pyarrow.dataset.Expression"],
         *,
         compute: Union[str, ComputeStrategy] = None,
         **ray_remote_args,
@@ -822,13 +842,23 @@ class Dataset(Generic[T]):
             >>> ds = ray.data.range(100)
             >>> ds.filter(lambda x: x % 2 == 0)
             Dataset(num_blocks=..., num_rows=50, schema=<class 'int'>)
+            >>> # Filter a tabular dataset with a pyarrow expression.
+            >>> import pyarrow.dataset as pds
+            >>> ds = ray.data.range_table(100)
+            >>> ds.filter(pds.field("value") % 2 == 0)
+            Dataset(num_blocks=..., num_rows=50, schema={value: int64})
+
+        If the predicate is a pyarrow expression and the dataset is read from
+        Parquet files, the filter is applied while reading if it directly follows
+        the read, which skips the row groups whose statistics don't match it.
 
         Time complexity: O(dataset size / parallelism)
 
         Args:
             fn: The predicate to apply to each record, or a class type
                 that can be instantiated to create such a callable. Callable classes are
-                only supported for the actor compute strategy.
+                only supported for the actor compute strategy. For tabular datasets,
+                this can also be a ``pyarrow.dataset.Expression`` over the columns.
             compute: The compute strategy, either "tasks" (default) to use Ray
                 tasks, or "actors" to use an autoscaling actor pool. If wanting to
                 configure the min or max size of the autoscaling actor pool, you can
@@ -851,6 +881,9 @@ class Dataset(Generic[T]):
                 "``compute=ActorPoolStrategy(min, max)``."
             )
 
+        if _is_arrow_expression(fn):
+            return self._filter_expression(fn, compute, ray_remote_args)
+
         self._warn_slow()
         context = DatasetContext.get_current()
 
@@ -869,6 +902,43 @@ class Dataset(Generic[T]):
         )
         return Dataset(plan, self._epoch, self._lazy)
 
+    def _filter_expression(
+        self,
+        expr: "pyarrow.dataset.Expression",
+        compute: Union[str, ComputeStrategy],
+        ray_remote_args: Dict[str, Any],
+    ) -> "Dataset[T]":
+        context = DatasetContext.get_current()
+
+        @_adapt_for_multiple_blocks
+        def transform(block: Block) -> Iterable[Block]:
+            import pyarrow.dataset as pds
+
+            DatasetContext._set_current(context)
+            accessor = BlockAccessor.for_block(block)
+            if accessor.num_rows() == 0:
+                return [block]
+            if not isinstance(accessor, TableBlockAccessor):
+                raise ValueError(
+                    "Filtering with a pyarrow expression is only supported for "
+                    "tabular datasets, use a predicate function instead."
+                )
+            table = pds.dataset(accessor.to_arrow()).to_table(filter=expr)
+            if isinstance(accessor, PandasBlockAccessor):
+                return [table.to_pandas()]
+            return [table]
+
+        plan = self._plan.with_stage(
+            OneToOneStage(
+                "filter",
+                transform,
+                compute,
+                ray_remote_args,
+                read_pushdown=ReadPushdown(filter_expr=expr),
+            )
+        )
+        return Dataset(plan, self._epoch, self._lazy)
+
     def repartition(self, num_blocks: int, *, shuffle: bool = False) -> "Dataset[T]":
         """Repartition the dataset into exactly this number of blocks.
 
@@ -1867,7 +1937,9 @@ class Dataset(Generic[T]):
         return self._aggregate_result(ret)
 
     def sort(
-        self, key: Optional[KeyFn] = None, descending: bool = False
+        self,
+        key: Union[None, KeyFn, List[Union[str, Tuple[str, str]]]] = None,
+        descending: bool = False,
     ) -> "Dataset[T]":
         # TODO ds.sort(lambda ...) fails with:
         #  Callable key '<function <lambda> at 0x1b07a4cb0>' requires
@@ -1888,6 +1960,11 @@ class Dataset(Generic[T]):
             ...     [{"value": i} for i in range(1000)])
             >>> ds.sort("value", descending=True)
             Dataset(num_blocks=..., num_rows=1000, schema={value: int64})
+            >>> # Sort by multiple columns, each in its own order.
+            >>> ds = ray.data.from_items(
+            ...     [{"group": i % 3, "value": i} for i in range(1000)])
+            >>> ds.sort([("group", "ascending"), ("value", "descending")])
+            Dataset(num_blocks=..., num_rows=1000, schema={group: int64, value: int64})
             >>> # Sort by a key function.
             >>> ds.sort(lambda record: record["value"]) # doctest: +SKIP
 
@@ -1895,7 +1972,12 @@ class Dataset(Generic[T]):
 
         Args:
             key:
-                - For Arrow tables, key must be a single column name.
+                - For Arrow tables, key must be a single column name, or a list of
+                  column names or of (column name, "ascending" or "descending")
+                  pairs to sort by several columns. The rows are sorted by the
+                  first column, then rows with equal values by the next column,
+                  and so on. Column names without an order are sorted in the
+                  order given by ``descending``.
                 - For datasets of Python objects, key can be either a lambda
                   function that returns a comparison key to sort by, or None
                   to sort by the original value.
@@ -1938,6 +2020,60 @@ class Dataset(Generic[T]):
         plan = self._plan.with_stage(ZipStage(other))
         return Dataset(plan, self._epoch, self._lazy)
 
+    def join(self, other: "Dataset[U]", on: str, *, how: str = "inner") -> "Dataset":
+        """Join this dataset with another on the values of a key column.
+
+        Both datasets must be tabular (Arrow or pandas). The output has the
+        columns of this dataset, followed by the columns of ``other`` other than
+        the key. Columns of ``other`` with the same name as a column of this
+        dataset are disambiguated with a _1 suffix.
+
+        If the smaller dataset is below
+        ``DatasetContext.join_broadcast_threshold_bytes`` in size, it's broadcast
+        to one join task per block of the larger dataset. Otherwise, both datasets
+        are shuffled by the hash of the key, so that rows with the same key are
+        joined in the same task. The unmatched rows of the side kept by a left or
+        outer join are never broadcast.
+
+        This is a blocking operation.
+
+        NOTE: Joined datasets are not lineage-serializable, i.e. they can not be
+        used as a tunable hyperparameter in Ray Tune.
+
+        Examples:
+            >>> import ray
+            >>> features = ray.data.from_items(
+            ...     [{"id": i, "x": i * 2} for i in range(4)])
+            >>> labels = ray.data.from_items(
+            ...     [{"id": i, "y": i % 2} for i in range(3)])
+            >>> features.join(labels, on="id").count() # doctest: +SKIP
+            3
+            >>> features.join(labels, on="id", how="left").count() # doctest: +SKIP
+            4
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            other: The dataset to join with on the right hand side.
+            on: The name of the key column, which both datasets must have.
+            how: The type of join: "inner" to keep only the rows with matching
+                keys, "left" to also keep the unmatched rows of this dataset, or
+                "outer" to also keep the unmatched rows of both datasets. Columns
+                of unmatched rows are filled with nulls.
+
+        Returns:
+            The joined dataset. Its rows are not ordered by key.
+        """
+        from ray.data._internal.join import JOIN_TYPES
+
+        if not isinstance(on, str):
+            raise ValueError(f"`on` must be a column name, but got: {on!r}.")
+        if how not in JOIN_TYPES:
+            raise ValueError(f"`how` must be one of {JOIN_TYPES}, but got: {how!r}.")
+
+        plan = self._plan.with_stage(JoinStage(self, other, on, how))
+        return Dataset(plan, self._epoch, self._lazy)
+
     def limit(self, limit: int) -> "Dataset[T]":
         """Truncate the dataset to the first ``limit`` records.
 
@@ -2572,6 +2708,7 @@ class Dataset(Generic[T]):
         drop_last: bool = False,
         local_shuffle_buffer_size: Optional[int] = None,
         local_shuffle_seed: Optional[int] = None,
+        prefetch_batches: int = 0,
     ) -> Iterator[BatchType]:
         """Return a local batched iterator over the dataset.
 
@@ -2602,6 +2739,10 @@ class Dataset(Generic[T]):
                 buffer in order to yield a batch. When there are no more rows to add to
                 the buffer, the remaining rows in the buffer will be drained.
             local_shuffle_seed: The seed to use for the local random shuffle.
+            prefetch_batches: The number of batches to prepare ahead of the
+                consumer. If greater than 0, blocks are fetched, sliced into
+                batches, and converted to ``batch_format`` in background
+                threads while the caller processes the current batch.
 
         Returns:
             An iterator over record batches.
@@ -2626,6 +2767,7 @@ class Dataset(Generic[T]):
             drop_last=drop_last,
             shuffle_buffer_min_size=local_shuffle_buffer_size,
             shuffle_seed=local_shuffle_seed,
+            prefetch_batches=prefetch_batches,
         )
 
         stats.iter_total_s.add(time.perf_counter() - time_start)
@@ -3728,6 +3870,82 @@ class Dataset(Generic[T]):
         """
         return self._plan.has_computed_output()
 
+    def cache(
+        self,
+        path: str,
+        *,
+        filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+    ) -> "Dataset[T]":
+        """Cache the output of this dataset on disk, keyed by its lineage.
+
+        The cache entry is a directory of Parquet files under ``path``, named by a
+        fingerprint of the lineage of this dataset: its read tasks, the size and
+        modification time of its input files, and its transformations. If the entry
+        exists, e.g. because an earlier job ran the same preprocessing, this returns a
+        dataset that reads it instead of executing the lineage. Otherwise, this
+        executes the dataset and writes its output to the entry.
+
+        Changing the inputs or the transformations changes the fingerprint, so stale
+        entries are never read. They aren't deleted either, though.
+
+        This is only supported for tabular datasets created by the
+        ``ray.data.read_*()`` APIs. The output of cache hits is in Arrow format.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.read_parquet("s3://bucket/path") # doctest: +SKIP
+            >>> ds = ds.map_batches(preprocess) # doctest: +SKIP
+            >>> ds = ds.cache("s3://bucket/cache") # doctest: +SKIP
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            path: The root directory of the cache entries.
+            filesystem: The filesystem of the cache directory. If None, it's inferred
+                from the path.
+
+        Returns:
+            A dataset with the same rows as this dataset.
+        """
+        from ray.data._internal.lineage_cache import (
+            lineage_fingerprint,
+            read_cache_manifest,
+            write_cache_manifest,
+        )
+        from ray.data.datasource.file_based_datasource import (
+            _resolve_paths_and_filesystem,
+        )
+        from ray.data.read_api import read_parquet
+
+        if not self.has_serializable_lineage():
+            raise ValueError(
+                "Only datasets created by the ray.data.read_*() APIs can be cached, "
+                "since the lineage of other datasets depends on in-memory data."
+            )
+        entry = posixpath.join(path, lineage_fingerprint(self._plan))
+        [entry], filesystem = _resolve_paths_and_filesystem(entry, filesystem)
+        cached_files = read_cache_manifest(filesystem, entry)
+        if cached_files:
+            logger.info(f"Reading the cached output of the dataset from {entry}.")
+            # Only read the committed files, since the entry may also contain the
+            # files of failed or concurrent writes.
+            ds = read_parquet(cached_files, filesystem=filesystem)
+            return Dataset(ds._plan, self._epoch, self._lazy)
+
+        ds = self.fully_executed()
+        if ds.count() == 0:
+            # There are no files to read back.
+            return ds
+        if ds._dataset_format() not in ["arrow", "pandas"]:
+            raise ValueError(
+                "Only tabular datasets can be cached, but this dataset is in "
+                f"{ds._dataset_format()} format."
+            )
+        ds.write_parquet(entry, filesystem=filesystem)
+        # Mark the entry as complete only after all of its files are written.
+        write_cache_manifest(filesystem, entry, f"{ds._get_uuid()}_")
+        return ds
+
     def stats(self) -> str:
         """Returns a string containing execution timing information."""
         return self._plan.stats().summary_string()
@@ -4198,6 +4416,15 @@ def _block_to_arrow(block: Block):
     return block.to_arrow()
 
 
+def _is_arrow_expression(fn: Any) -> bool:
+    if "pyarrow" not in sys.modules:
+        # An expression can't have been created without importing pyarrow.
+        return False
+    import pyarrow.dataset as pds
+
+    return isinstance(fn, pds.Expression)
+
+
 def _sliding_window(iterable: Iterable, n: int):
     """Creates an iterator consisting of n-width sliding windows over
     iterable. The sliding windows are constructed lazily such that an
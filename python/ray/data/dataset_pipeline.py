@@ -148,6 +148,7 @@ class DatasetPipeline(Generic[T]):
         drop_last: bool = False,
         local_shuffle_buffer_size: Optional[int] = None,
         local_shuffle_seed: Optional[int] = None,
+        prefetch_batches: int = 0,
     ) -> Iterator[BatchType]:
         """Return a local batched iterator over the data in the pipeline.
 
@@ -181,6 +182,10 @@ class DatasetPipeline(Generic[T]):
                 therefore ``batch_size`` must also be specified when using local
                 shuffling.
             local_shuffle_seed: The seed to use for the local random shuffle.
+            prefetch_batches: The number of batches to prepare ahead of the
+                consumer. If greater than 0, blocks are fetched, sliced into
+                batches, and converted to ``batch_format`` in background
+                threads while the caller processes the current batch.
 
         Returns:
             An iterator over record batches.
@@ -210,6 +215,7 @@ class DatasetPipeline(Generic[T]):
             drop_last=drop_last,
             shuffle_buffer_min_size=local_shuffle_buffer_size,
             shuffle_seed=local_shuffle_seed,
+            prefetch_batches=prefetch_batches,
         )
         self._stats.iter_total_s.add(time.perf_counter() - time_start)
 
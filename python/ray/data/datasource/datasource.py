@@ -1,5 +1,16 @@
 import builtins
-from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 
@@ -18,6 +29,9 @@ from ray.data.context import DatasetContext
 from ray.types import ObjectRef
 from ray.util.annotations import Deprecated, DeveloperAPI, PublicAPI
 
+if TYPE_CHECKING:
+    import pyarrow.dataset
+
 WriteResult = Any
 
 
@@ -174,6 +188,22 @@ class ReadTask(Callable[[], Iterable[Block]]):
     def get_metadata(self) -> BlockPartitionMetadata:
         return self._metadata
 
+    def _push_down(
+        self,
+        filter_expr: Optional["pyarrow.dataset.Expression"],
+        columns: Optional[List[str]],
+    ) -> Optional["ReadTask"]:
+        """Return a read task that applies the given row filter and column
+        projection while reading, or None if this read task can't apply them.
+        """
+        return None
+
+    def _input_filesystem(self) -> Optional["pyarrow.fs.FileSystem"]:
+        """Return the filesystem of the input files in the metadata, or None if
+        it's unknown.
+        """
+        return None
+
     def __call__(self) -> Iterable[Block]:
         context = DatasetContext.get_current()
         result = self._read_fn()
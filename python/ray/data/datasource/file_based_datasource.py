@@ -491,14 +491,34 @@ class _FileBasedDatasourceReader(Reader):
                 rows_per_file=self._delegate._rows_per_file(),
                 file_sizes=file_sizes,
             )
-            read_task = ReadTask(
-                lambda read_paths=read_paths: read_files(read_paths, filesystem), meta
+            read_task = _FileReadTask(
+                lambda read_paths=read_paths: read_files(read_paths, filesystem),
+                meta,
+                filesystem,
             )
             read_tasks.append(read_task)
 
         return read_tasks
 
 
+class _FileReadTask(ReadTask):
+    """A read task for files, which knows the filesystem of its input files."""
+
+    def __init__(
+        self,
+        read_fn: Callable[[], Iterable[Block]],
+        metadata: BlockMetadata,
+        filesystem: Union["pyarrow.fs.FileSystem", "_S3FileSystemWrapper"],
+    ):
+        super().__init__(read_fn, metadata)
+        self._filesystem = filesystem
+
+    def _input_filesystem(self) -> "pyarrow.fs.FileSystem":
+        if isinstance(self._filesystem, _S3FileSystemWrapper):
+            return self._filesystem.unwrap()
+        return self._filesystem
+
+
 def _add_partitions(
     data: Union["pyarrow.Table", "pd.DataFrame"], partitions: Dict[str, Any]
 ) -> Union["pyarrow.Table", "pd.DataFrame"]:
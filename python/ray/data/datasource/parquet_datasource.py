@@ -1,6 +1,7 @@
+import copy
 import itertools
 import logging
-from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Union
 
 import numpy as np
 
@@ -8,7 +9,7 @@ from ray.data._internal.output_buffer import BlockOutputBuffer
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.util import _check_pyarrow_version
-from ray.data.block import Block
+from ray.data.block import Block, BlockMetadata
 from ray.data.context import DatasetContext
 from ray.data.datasource.datasource import Reader, ReadTask
 from ray.data.datasource.file_based_datasource import _resolve_paths_and_filesystem
@@ -24,6 +25,7 @@ import ray.cloudpickle as cloudpickle
 
 if TYPE_CHECKING:
     import pyarrow
+    import pyarrow.dataset
     from pyarrow.dataset import ParquetFileFragment
 
 
@@ -257,21 +259,13 @@ class _ParquetDatasourceReader(Reader):
             )
             if meta.size_bytes is not None:
                 meta.size_bytes = int(meta.size_bytes * self._encoding_ratio)
-            block_udf, reader_args, columns, schema = (
-                self._block_udf,
-                self._reader_args,
-                self._columns,
-                self._schema,
-            )
             read_tasks.append(
-                ReadTask(
-                    lambda p=serialized_pieces: _read_pieces(
-                        block_udf,
-                        reader_args,
-                        columns,
-                        schema,
-                        p,
-                    ),
+                _ParquetReadTask(
+                    self._block_udf,
+                    self._reader_args,
+                    self._columns,
+                    self._schema,
+                    serialized_pieces,
                     meta,
                 )
             )
@@ -330,6 +324,97 @@ class _ParquetDatasourceReader(Reader):
         return max(ratio, PARQUET_ENCODING_RATIO_ESTIMATE_LOWER_BOUND)
 
 
+class _ParquetReadTask(ReadTask):
+    """A read task for Parquet pieces, which can apply a row filter and a column
+    projection while reading the pieces.
+    """
+
+    def __init__(
+        self,
+        block_udf: Optional[Callable[[Block], Block]],
+        reader_args: Dict[str, Any],
+        columns: Optional[List[str]],
+        schema: Optional[Union[type, "pyarrow.lib.Schema"]],
+        serialized_pieces: List[_SerializedPiece],
+        metadata: BlockMetadata,
+        projected: bool = False,
+    ):
+        super().__init__(
+            lambda: _read_pieces(
+                block_udf, reader_args, columns, schema, serialized_pieces
+            ),
+            metadata,
+        )
+        self._block_udf = block_udf
+        self._reader_args = reader_args
+        self._columns = columns
+        self._schema = schema
+        self._serialized_pieces = serialized_pieces
+        self._projected = projected
+
+    def _push_down(
+        self,
+        filter_expr: Optional["pyarrow.dataset.Expression"],
+        columns: Optional[List[str]],
+    ) -> Optional["_ParquetReadTask"]:
+        import pyarrow as pa
+
+        if self._block_udf is not None:
+            # The UDF sees the rows and columns before they're filtered out.
+            return None
+        if filter_expr is not None and self._projected:
+            # A filter following a projection must not see the columns that
+            # weren't selected.
+            return None
+        if columns is not None:
+            if not columns or not isinstance(self._schema, pa.Schema):
+                return None
+            if self._projected:
+                available = self._columns
+            else:
+                available = self._schema.names
+            if len(set(columns)) != len(columns) or any(
+                c not in available for c in columns
+            ):
+                # Leave raising errors for unknown columns to the projection.
+                return None
+
+        reader_args = self._reader_args
+        metadata = copy.copy(self.get_metadata())
+        if filter_expr is not None:
+            reader_args = reader_args.copy()
+            if reader_args.get("filter") is not None:
+                filter_expr = reader_args["filter"] & filter_expr
+            reader_args["filter"] = filter_expr
+            metadata.num_rows = None
+        if columns is not None and isinstance(metadata.schema, pa.Schema):
+            metadata.schema = _project_schema(metadata.schema, columns)
+        return _ParquetReadTask(
+            self._block_udf,
+            reader_args,
+            columns if columns is not None else self._columns,
+            self._schema,
+            self._serialized_pieces,
+            metadata,
+            self._projected or columns is not None,
+        )
+
+    def _input_filesystem(self) -> Optional["pyarrow.fs.FileSystem"]:
+        if not self._serialized_pieces:
+            return None
+        return self._serialized_pieces[0].deserialize().filesystem
+
+
+def _project_schema(
+    schema: "pyarrow.lib.Schema", columns: Optional[List[str]]
+) -> "pyarrow.lib.Schema":
+    import pyarrow as pa
+
+    if not columns or not isinstance(schema, pa.Schema):
+        return schema
+    return pa.schema([schema.field(column) for column in columns], schema.metadata)
+
+
 def _read_pieces(
     block_udf, reader_args, columns, schema, serialized_pieces: List[_SerializedPiece]
 ) -> Iterator["pyarrow.Table"]:
@@ -345,7 +430,7 @@ def _read_pieces(
     assert len(pieces) > 0
 
     import pyarrow as pa
-    from pyarrow.dataset import _get_partition_keys
+    from pyarrow.dataset import FileSystemDataset, _get_partition_keys
 
     ctx = DatasetContext.get_current()
     output_buffer = BlockOutputBuffer(
@@ -355,21 +440,40 @@ def _read_pieces(
 
     logger.debug(f"Reading {len(pieces)} parquet pieces")
     use_threads = reader_args.pop("use_threads", False)
+    # The columns may be a projection of the schema pushed down into this read.
+    output_schema = _project_schema(schema, columns)
     for piece in pieces:
         part = _get_partition_keys(piece.partition_expression)
-        batches = piece.to_batches(
-            use_threads=use_threads,
-            columns=columns,
-            schema=schema,
-            batch_size=PARQUET_READER_ROW_BATCH_SIZE,
-            **reader_args,
-        )
+        if part and reader_args.get("filter") is not None:
+            # Partition columns aren't stored in the files. Scan the piece as a
+            # dataset, which sets them from the partition expression before
+            # filtering, and skips the piece if its partition doesn't match.
+            batches = FileSystemDataset(
+                [piece], schema, piece.format, piece.filesystem
+            ).to_batches(
+                use_threads=use_threads,
+                columns=columns,
+                batch_size=PARQUET_READER_ROW_BATCH_SIZE,
+                **reader_args,
+            )
+        else:
+            batches = piece.to_batches(
+                use_threads=use_threads,
+                columns=columns,
+                schema=schema,
+                batch_size=PARQUET_READER_ROW_BATCH_SIZE,
+                **reader_args,
+            )
         for batch in batches:
-            table = pa.Table.from_batches([batch], schema=schema)
+            table = pa.Table.from_batches([batch], schema=output_schema)
             if part:
                 for col, value in part.items():
+                    col_index = table.schema.get_field_index(col)
+                    if col_index < 0:
+                        # The partition column wasn't selected.
+                        continue
                     table = table.set_column(
-                        table.schema.get_field_index(col),
+                        col_index,
                         col,
                         pa.array([value] * len(table)),
                     )
@@ -5,6 +5,7 @@ from ray.data._internal.compute import CallableClass, ComputeStrategy
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.plan import AllToAllStage
 from ray.data._internal.shuffle import ShuffleOp, SimpleShufflePlan
+from ray.data._internal.stage_impl import SortStage
 from ray.data._internal.push_based_shuffle import PushBasedShufflePlan
 from ._internal.table_block import TableBlockAccessor
 from ray.data.aggregate import (
@@ -114,6 +115,60 @@ class PushBasedGroupbyOp(_GroupbyOp, PushBasedShufflePlan):
     pass
 
 
+class _HashGroupbyOp(ShuffleOp):
+    """Groupby that partitions rows by the hash of the key.
+
+    Unlike _GroupbyOp, this needs neither sampled boundaries nor sorted blocks,
+    but the output blocks are not sorted by key.
+    """
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: KeyFn,
+        aggs: Tuple[AggregateFn],
+    ) -> List[Union[BlockMetadata, Block]]:
+        """Hash-partition the block and combine rows with the same key."""
+        stats = BlockExecStats.builder()
+
+        block = _GroupbyOp._prune_unused_columns(block, key, aggs)
+
+        partitions = BlockAccessor.for_block(block).hash_partition(
+            key, output_num_blocks
+        )
+        parts = [BlockAccessor.for_block(p).combine(key, aggs) for p in partitions]
+        meta = BlockAccessor.for_block(block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        return parts + [meta]
+
+    @staticmethod
+    def reduce(
+        key: KeyFn,
+        aggs: Tuple[AggregateFn],
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> (Block, BlockMetadata):
+        """Aggregate unsorted, partially combined blocks."""
+        return BlockAccessor.for_block(mapper_outputs[0]).aggregate_combined_blocks(
+            list(mapper_outputs),
+            key,
+            aggs,
+            finalize=not partial_reduce,
+            presorted=False,
+        )
+
+
+class SimpleShuffleHashGroupbyOp(_HashGroupbyOp, SimpleShufflePlan):
+    pass
+
+
+class PushBasedHashGroupbyOp(_HashGroupbyOp, PushBasedShufflePlan):
+    pass
+
+
 @PublicAPI
 class GroupedDataset(Generic[T]):
     """Represents a grouped dataset created by calling ``Dataset.groupby()``.
@@ -195,22 +250,33 @@ class GroupedDataset(Generic[T]):
             num_reducers = num_mappers
             if self._key is None:
                 num_reducers = 1
-                boundaries = []
-            else:
-                boundaries = sort.sample_boundaries(
-                    blocks.get_blocks(),
-                    [(self._key, "ascending")]
-                    if isinstance(self._key, str)
-                    else self._key,
-                    num_reducers,
-                )
             ctx = DatasetContext.get_current()
-            if ctx.use_push_based_shuffle:
-                shuffle_op_cls = PushBasedGroupbyOp
+            if ctx.use_hash_based_groupby:
+                # Hash partitioning needs no boundaries, so the sampling pass is
+                # skipped.
+                if ctx.use_push_based_shuffle:
+                    shuffle_op_cls = PushBasedHashGroupbyOp
+                else:
+                    shuffle_op_cls = SimpleShuffleHashGroupbyOp
+                map_args = [self._key, aggs]
             else:
-                shuffle_op_cls = SimpleShuffleGroupbyOp
+                if self._key is None:
+                    boundaries = []
+                else:
+                    boundaries = sort.sample_boundaries(
+                        blocks.get_blocks(),
+                        [(self._key, "ascending")]
+                        if isinstance(self._key, str)
+                        else self._key,
+                        num_reducers,
+                    )
+                if ctx.use_push_based_shuffle:
+                    shuffle_op_cls = PushBasedGroupbyOp
+                else:
+                    shuffle_op_cls = SimpleShuffleGroupbyOp
+                map_args = [boundaries, self._key, aggs]
             shuffle_op = shuffle_op_cls(
-                map_args=[boundaries, self._key, aggs], reduce_args=[self._key, aggs]
+                map_args=map_args, reduce_args=[self._key, aggs]
             )
             return shuffle_op.execute(
                 blocks,
@@ -316,10 +382,13 @@ class GroupedDataset(Generic[T]):
             value is combined from results of all groups.
         """
         # Globally sort records by key.
-        # Note that sort() will ensure that records of the same key partitioned
-        # into the same block.
+        # Note that this sort will ensure that records of the same key partitioned
+        # into the same block, even if skewed blocks are split.
         if self._key is not None:
-            sorted_ds = self._dataset.sort(self._key)
+            plan = self._dataset._plan.with_stage(
+                SortStage(self._dataset, self._key, False, split_equal_keys=False)
+            )
+            sorted_ds = Dataset(plan, self._dataset._epoch, self._dataset._lazy)
         else:
             sorted_ds = self._dataset.repartition(1)
 
@@ -9,6 +9,7 @@ from ray.util.annotations import DeveloperAPI, PublicAPI
 if TYPE_CHECKING:
     import pandas as pd
     import numpy as np
+    import pyarrow
     from ray.air.data_batch_type import DataBatchType
 
 
@@ -39,7 +40,8 @@ class Preprocessor(abc.ABC):
       ``_is_fittable=False``.
     * ``_transform_pandas`` and/or ``_transform_numpy`` for best performance,
       implement both. Otherwise, the data will be converted to the match the
-      implemented method.
+      implemented method. ``_transform_arrow`` can also be implemented to
+      transform Arrow data without converting it.
     """
 
     class FitStatus(str, Enum):
@@ -188,6 +190,7 @@ class Preprocessor(abc.ABC):
 
         We will infer and pick the best transform to use:
             * ``pandas`` data format prioritizes ``pandas`` transform if available.
+            * ``arrow`` data format prioritizes ``arrow`` transform if available.
             * ``arrow`` and ``numpy`` data format prioritizes ``numpy`` transform if available. # noqa: E501
             * Fall back to what's available if no preferred path found.
         """
@@ -204,6 +207,9 @@ class Preprocessor(abc.ABC):
         has_transform_numpy = (
             self.__class__._transform_numpy != Preprocessor._transform_numpy
         )
+        has_transform_arrow = (
+            self.__class__._transform_arrow != Preprocessor._transform_arrow
+        )
 
         # Infer transform type by prioritizing native transformation to minimize
         # data conversion cost.
@@ -213,21 +219,30 @@ class Preprocessor(abc.ABC):
                 transform_type = "pandas"
             elif has_transform_numpy:
                 transform_type = "numpy"
+            elif has_transform_arrow:
+                transform_type = "arrow"
             else:
                 raise NotImplementedError(
-                    "None of `_transform_numpy` or `_transform_pandas` "
-                    f"are implemented for dataset format `{data_format}`."
+                    "None of `_transform_numpy`, `_transform_pandas` or "
+                    "`_transform_arrow` are implemented for dataset format "
+                    f"`{data_format}`."
                 )
         elif data_format == "arrow" or data_format == "numpy":
-            # Arrow -> Numpy is more efficient
-            if has_transform_numpy:
+            # Perform native arrow transformation if possible, Arrow -> Numpy is
+            # more efficient otherwise
+            if data_format == "arrow" and has_transform_arrow:
+                transform_type = "arrow"
+            elif has_transform_numpy:
                 transform_type = "numpy"
             elif has_transform_pandas:
                 transform_type = "pandas"
+            elif has_transform_arrow:
+                transform_type = "arrow"
             else:
                 raise NotImplementedError(
-                    "None of `_transform_numpy` or `_transform_pandas` "
-                    f"are implemented for dataset format `{data_format}`."
+                    "None of `_transform_numpy`, `_transform_pandas` or "
+                    "`_transform_arrow` are implemented for dataset format "
+                    f"`{data_format}`."
                 )
 
         return transform_type
@@ -256,10 +271,14 @@ class Preprocessor(abc.ABC):
             return dataset.map_batches(
                 self._transform_numpy, batch_format="numpy", **kwargs
             )
+        elif transform_type == "arrow":
+            return dataset.map_batches(
+                self._transform_arrow, batch_format="pyarrow", **kwargs
+            )
         else:
             raise ValueError(
                 "Invalid transform type returned from _determine_transform_to_use; "
-                f'"pandas" and "numpy" allowed, but got: {transform_type}'
+                f'"pandas", "numpy" and "arrow" allowed, but got: {transform_type}'
             )
 
     def _get_transform_config(self) -> Dict[str, Any]:
@@ -274,7 +293,9 @@ class Preprocessor(abc.ABC):
         import pandas as pd
         import numpy as np
         from ray.air.util.data_batch_conversion import (
+            DataType,
             convert_batch_type_to_pandas,
+            convert_pandas_to_batch_type,
             _convert_batch_type_to_numpy,
         )
 
@@ -302,6 +323,12 @@ class Preprocessor(abc.ABC):
             return self._transform_pandas(convert_batch_type_to_pandas(data))
         elif transform_type == "numpy":
             return self._transform_numpy(_convert_batch_type_to_numpy(data))
+        elif transform_type == "arrow":
+            if data_format != "arrow":
+                data = convert_pandas_to_batch_type(
+                    convert_batch_type_to_pandas(data), DataType.ARROW
+                )
+            return self._transform_arrow(data)
 
     @DeveloperAPI
     def _transform_pandas(self, df: "pd.DataFrame") -> "pd.DataFrame":
@@ -314,3 +341,8 @@ class Preprocessor(abc.ABC):
     ) -> Union["np.ndarray", Dict[str, "np.ndarray"]]:
         """Run the transformation on a data batch in a NumPy ndarray format."""
         raise NotImplementedError()
+
+    @DeveloperAPI
+    def _transform_arrow(self, table: "pyarrow.Table") -> "pyarrow.Table":
+        """Run the transformation on a data batch in a pyarrow Table format."""
+        raise NotImplementedError()
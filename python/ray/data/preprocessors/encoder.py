@@ -1,7 +1,8 @@
 from functools import partial
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional
 
 from collections import Counter, OrderedDict
+import numpy as np
 import pandas as pd
 import pandas.api.types
 
@@ -9,6 +10,9 @@ from ray.data import Dataset
 from ray.data.preprocessor import Preprocessor
 from ray.util.annotations import PublicAPI
 
+if TYPE_CHECKING:
+    import pyarrow
+
 
 @PublicAPI(stability="alpha")
 class OrdinalEncoder(Preprocessor):
@@ -117,6 +121,21 @@ class OrdinalEncoder(Preprocessor):
         df[self.columns] = df[self.columns].apply(column_ordinal_encoder)
         return df
 
+    def _transform_arrow(self, table: "pyarrow.Table") -> "pyarrow.Table":
+        _validate_arrow(table, *self.columns)
+
+        for column in self.columns:
+            stats = self.stats_[f"unique_values({column})"]
+            values = table.column(column)
+            if _is_arrow_list_type(values.type) and self.encode_lists:
+                encoded = _get_arrow_list_value_indices(values, stats)
+            else:
+                encoded = _get_arrow_value_indices(values, stats)
+            table = table.set_column(
+                table.schema.get_field_index(column), column, encoded
+            )
+        return table
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -232,6 +251,24 @@ class OneHotEncoder(Preprocessor):
         df = df.drop(columns=list(columns_to_drop))
         return df
 
+    def _transform_arrow(self, table: "pyarrow.Table") -> "pyarrow.Table":
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        _validate_arrow(table, *self.columns)
+
+        # Compute new one-hot encoded columns
+        for column in self.columns:
+            stats = self.stats_[f"unique_values({column})"]
+            indices = _get_arrow_value_indices(table.column(column), stats)
+            for column_value, index in stats.items():
+                is_value = pc.fill_null(pc.equal(indices, index), False)
+                table = table.append_column(
+                    f"{column}_{column_value}", is_value.cast(pa.int64())
+                )
+        # Drop original unencoded columns.
+        return table.drop(self.columns)
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -335,6 +372,25 @@ class MultiHotEncoder(Preprocessor):
 
         return df
 
+    def _transform_arrow(self, table: "pyarrow.Table") -> "pyarrow.Table":
+        import pyarrow as pa
+
+        _validate_arrow(table, *self.columns)
+
+        for column in self.columns:
+            stats = self.stats_[f"unique_values({column})"]
+            encoded = pa.chunked_array(
+                [
+                    _get_arrow_chunk_value_counts(chunk, stats)
+                    for chunk in table.column(column).chunks
+                ],
+                type=pa.list_(pa.int64()),
+            )
+            table = table.set_column(
+                table.schema.get_field_index(column), column, encoded
+            )
+        return table
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -411,6 +467,15 @@ class LabelEncoder(Preprocessor):
         df[self.label_column] = df[self.label_column].transform(column_label_encoder)
         return df
 
+    def _transform_arrow(self, table: "pyarrow.Table") -> "pyarrow.Table":
+        _validate_arrow(table, self.label_column)
+
+        stats = self.stats_[f"unique_values({self.label_column})"]
+        encoded = _get_arrow_value_indices(table.column(self.label_column), stats)
+        return table.set_column(
+            table.schema.get_field_index(self.label_column), self.label_column, encoded
+        )
+
     def __repr__(self):
         return f"{self.__class__.__name__}(label_column={self.label_column!r})"
 
@@ -547,7 +612,48 @@ def _get_unique_value_indices(
                 )
         return [result]
 
-    value_counts = dataset.map_batches(get_pd_value_counts, batch_format="pandas")
+    def get_pa_value_counts_per_column(col: "pyarrow.ChunkedArray"):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if pa.types.is_dictionary(col.type):
+            col = col.cast(col.type.value_type)
+        if _is_arrow_list_type(col.type):
+            if not encode_lists:
+                # convert to tuples to make lists hashable
+                return Counter(
+                    None if element is None else tuple(element)
+                    for element in col.to_pylist()
+                )
+            col = pc.list_flatten(col)
+        value_counts = pc.value_counts(col)
+        return Counter(
+            dict(
+                zip(
+                    value_counts.field("values").to_pylist(),
+                    value_counts.field("counts").to_pylist(),
+                )
+            )
+        )
+
+    def get_pa_value_counts(table: "pyarrow.Table") -> List[Dict[str, Counter]]:
+        table_columns = table.column_names
+        result = {}
+        for col in columns:
+            if col in table_columns:
+                result[col] = get_pa_value_counts_per_column(table.column(col))
+            else:
+                raise ValueError(
+                    f"Column '{col}' does not exist in Table, which has columns: {table_columns}"  # noqa: E501
+                )
+        return [result]
+
+    if dataset._dataset_format() == "arrow":
+        # Count values with Arrow compute functions instead of converting the
+        # blocks to pandas.
+        value_counts = dataset.map_batches(get_pa_value_counts, batch_format="pyarrow")
+    else:
+        value_counts = dataset.map_batches(get_pd_value_counts, batch_format="pandas")
     final_counters = {col: Counter() for col in columns}
     for batch in value_counts.iter_batches(batch_size=None):
         for col_value_counts in batch:
@@ -603,3 +709,119 @@ def _is_series_composed_of_lists(series: pd.Series) -> bool:
     return pandas.api.types.is_object_dtype(series.dtype) and isinstance(
         first_not_none_element, list
     )
+
+
+def _validate_arrow(table: "pyarrow.Table", *columns: str) -> None:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    def has_nulls(column: "pyarrow.ChunkedArray") -> bool:
+        if column.null_count > 0:
+            return True
+        if pa.types.is_floating(column.type):
+            return pc.any(pc.is_nan(column)).as_py() or False
+        return False
+
+    null_columns = [column for column in columns if has_nulls(table.column(column))]
+    if null_columns:
+        raise ValueError(
+            f"Unable to transform columns {null_columns} because they contain "
+            f"null values. Consider imputing missing values first."
+        )
+
+
+def _is_arrow_list_type(arrow_type: "pyarrow.DataType") -> bool:
+    import pyarrow as pa
+
+    return pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type)
+
+
+def _get_arrow_value_indices(
+    column: "pyarrow.ChunkedArray", stats: Dict
+) -> "pyarrow.ChunkedArray":
+    """Look up the index of each value of a column in the fitted ``stats``.
+
+    Values that aren't in ``stats`` are encoded as nulls. Lists are looked up as
+    tuples.
+    """
+    import pyarrow as pa
+
+    return pa.chunked_array(
+        [_get_arrow_chunk_value_indices(chunk, stats) for chunk in column.chunks],
+        type=pa.int64(),
+    )
+
+
+def _get_arrow_list_value_indices(
+    column: "pyarrow.ChunkedArray", stats: Dict
+) -> "pyarrow.ChunkedArray":
+    """Look up the index of each list element of a column in the fitted ``stats``."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    chunks = []
+    for chunk in column.chunks:
+        # The offsets of a sliced array don't start at 0, unlike its flattened
+        # values.
+        offsets = pc.subtract(chunk.offsets, chunk.offsets[0]).cast(pa.int32())
+        indices = _get_arrow_chunk_value_indices(chunk.flatten(), stats)
+        chunks.append(pa.ListArray.from_arrays(offsets, indices))
+    return pa.chunked_array(chunks, type=pa.list_(pa.int64()))
+
+
+def _get_arrow_chunk_value_indices(
+    chunk: "pyarrow.Array", stats: Dict
+) -> "pyarrow.Array":
+    """Look up the index of each value of a chunk in the fitted ``stats``."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if _is_arrow_list_type(chunk.type):
+        # Lists are categories, so they can't be looked up by Arrow.
+        return pa.array(
+            [stats.get(tuple(element)) for element in chunk.to_pylist()],
+            type=pa.int64(),
+        )
+
+    if pa.types.is_dictionary(chunk.type):
+        # Look up each distinct value once.
+        return _get_arrow_chunk_value_indices(chunk.dictionary, stats).take(
+            chunk.indices
+        )
+
+    # The indices of the fitted values are their positions in `stats`.
+    try:
+        value_set = pa.array(list(stats), type=chunk.type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, OverflowError):
+        # None of the fitted values has the type of the column.
+        return pa.nulls(len(chunk), type=pa.int64())
+    return pc.index_in(chunk, value_set=value_set).cast(pa.int64())
+
+
+def _get_arrow_chunk_value_counts(
+    chunk: "pyarrow.Array", stats: Dict
+) -> "pyarrow.Array":
+    """Count how often each fitted value occurs in each list of a chunk.
+
+    Scalars are treated as lists with a single element.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if _is_arrow_list_type(chunk.type):
+        values = chunk.flatten()
+        rows = pc.list_parent_indices(chunk).to_numpy()
+    else:
+        values = chunk
+        rows = np.arange(len(chunk))
+    indices = _get_arrow_chunk_value_indices(values, stats)
+    is_fitted = indices.is_valid().to_numpy(zero_copy_only=False)
+    indices = indices.fill_null(0).to_numpy()
+
+    num_rows, num_values = len(chunk), len(stats)
+    counts = np.bincount(
+        rows[is_fitted] * num_values + indices[is_fitted],
+        minlength=num_rows * num_values,
+    )
+    offsets = np.arange(num_rows + 1, dtype=np.int32) * num_values
+    return pa.ListArray.from_arrays(pa.array(offsets), pa.array(counts, pa.int64()))
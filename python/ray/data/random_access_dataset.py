@@ -1,10 +1,11 @@
 import bisect
 import logging
+import math
 import random
 import time
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import numpy as np
-from typing import List, Any, Generic, Optional, TYPE_CHECKING
+from typing import Dict, List, Any, Generic, Optional, TYPE_CHECKING
 
 import ray
 from ray.types import ObjectRef
@@ -18,6 +19,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The max number of decoded rows that each worker caches, in LRU order.
+ROW_CACHE_SIZE = 10000
+
+# Look for hot blocks to replicate after every this many key lookups.
+REPLICATION_CHECK_INTERVAL = 10000
+
+# A block is hot, and replicated to more workers, if the lookups of each of its
+# replicas are more than this many times the mean lookups per worker.
+HOT_BLOCK_LOAD_FACTOR = 2
+
 
 @PublicAPI(stability="beta")
 class RandomAccessDataset(Generic[T]):
@@ -58,6 +69,7 @@ class RandomAccessDataset(Generic[T]):
                 if self._lower_bound is None:
                     self._lower_bound = b[0]
                 self._upper_bounds.append(b[1])
+        self._upper_bounds_array = np.asarray(self._upper_bounds)
 
         logger.info("[setup] Creating {} random access workers.".format(num_workers))
         ctx = DatasetContext.get_current()
@@ -91,6 +103,11 @@ class RandomAccessDataset(Generic[T]):
             ]
         )
 
+        # The number of lookups of each block since the last replication check, and
+        # the number of lookups of all blocks.
+        self._block_access_counts = defaultdict(int)
+        self._num_accesses = 0
+
         logger.info("[setup] Finished assigning blocks to workers.")
         self._build_time = time.perf_counter() - start
 
@@ -137,6 +154,7 @@ class RandomAccessDataset(Generic[T]):
         block_index = self._find_le(key)
         if block_index is None:
             return ray.put(None)
+        self._record_accesses({block_index: 1})
         return self._worker_for(block_index).get.remote(block_index, key)
 
     def multiget(self, keys: List[Any]) -> List[Optional[T]]:
@@ -148,24 +166,27 @@ class RandomAccessDataset(Generic[T]):
         Returns:
             List of found records (in pydict form), or None for missing records.
         """
+        block_indices = self._find_le_batch(keys)
+        # Send a single request to each worker with the keys of all of its blocks.
         batches = defaultdict(list)
-        for k in keys:
-            batches[self._find_le(k)].append(k)
-        futures = {}
-        for index, keybatch in batches.items():
+        block_counts = defaultdict(int)
+        for i, (k, index) in enumerate(zip(keys, block_indices)):
             if index is None:
                 continue
-            fut = self._worker_for(index).multiget.remote(
-                [index] * len(keybatch), keybatch
+            block_counts[index] += 1
+            batches[self._worker_for(index)].append((i, index, k))
+        futures = {
+            worker: worker.multiget.remote(
+                [index for _, index, _ in batch], [k for _, _, k in batch]
             )
-            futures[index] = fut
-        results = {}
-        for i, fut in futures.items():
-            keybatch = batches[i]
-            values = ray.get(fut)
-            for k, v in zip(keybatch, values):
-                results[k] = v
-        return [results.get(k) for k in keys]
+            for worker, batch in batches.items()
+        }
+        results = [None] * len(keys)
+        for worker, fut in futures.items():
+            for (i, _, _), value in zip(batches[worker], ray.get(fut)):
+                results[i] = value
+        self._record_accesses(block_counts)
+        return results
 
     def stats(self) -> str:
         """Returns a string containing access timing information."""
@@ -185,6 +206,15 @@ class RandomAccessDataset(Generic[T]):
         msg += "- Mean access time: {}us\n".format(
             int(total_time / (1 + sum(accesses)) * 1e6)
         )
+        cache_hits = sum(s["cache_hits"] for s in stats)
+        cache_lookups = cache_hits + sum(s["cache_misses"] for s in stats)
+        msg += "- Row cache hit rate: {}% of {} rows\n".format(
+            round(100 * cache_hits / max(cache_lookups, 1), 1), cache_lookups
+        )
+        replicas = [len(w) for w in self._block_to_workers_map.values()] or [0]
+        msg += "- Replicas per block: {} min, {} max, {} replicated\n".format(
+            min(replicas), max(replicas), sum(r > 1 for r in replicas)
+        )
         return msg
 
     def _worker_for(self, block_index: int):
@@ -196,39 +226,109 @@ class RandomAccessDataset(Generic[T]):
             return None
         return i
 
+    def _find_le_batch(self, keys: List[Any]) -> List[Optional[int]]:
+        if not self._upper_bounds:
+            return [None] * len(keys)
+        try:
+            keys_array = np.asarray(keys)
+            indices = np.searchsorted(self._upper_bounds_array, keys_array)
+            found = (indices < len(self._upper_bounds)) & (
+                keys_array >= self._lower_bound
+            )
+        except TypeError:
+            # The keys can't be compared in a vectorized way, e.g., mixed types.
+            return [self._find_le(k) for k in keys]
+        return [int(i) if f else None for i, f in zip(indices, found)]
+
+    def _record_accesses(self, block_counts: Dict[int, int]):
+        for block_index, count in block_counts.items():
+            self._block_access_counts[block_index] += count
+            self._num_accesses += count
+        if self._num_accesses >= REPLICATION_CHECK_INTERVAL:
+            self._replicate_hot_blocks()
+
+    def _replicate_hot_blocks(self):
+        """Replicate the blocks with the most lookups to more workers.
+
+        Each block should get at most HOT_BLOCK_LOAD_FACTOR times the mean lookups
+        per worker per replica, so a block with skewed lookups is copied from the
+        object store to the least loaded workers until it does. The counts are
+        halved afterwards, so that the replicas follow changes in the lookups.
+        """
+        mean_worker_load = self._num_accesses / len(self._workers)
+        worker_loads = defaultdict(float)
+        for block_index, count in self._block_access_counts.items():
+            workers = self._block_to_workers_map[block_index]
+            for worker in workers:
+                worker_loads[worker] += count / len(workers)
+
+        new_blocks = defaultdict(dict)
+        for block_index, count in sorted(
+            self._block_access_counts.items(), key=lambda item: -item[1]
+        ):
+            workers = self._block_to_workers_map[block_index]
+            if count / len(workers) <= HOT_BLOCK_LOAD_FACTOR * mean_worker_load:
+                break
+            num_replicas = min(math.ceil(count / mean_worker_load), len(self._workers))
+            candidates = sorted(
+                (w for w in self._workers if w not in workers),
+                key=lambda w: worker_loads[w],
+            )
+            for worker in candidates[: num_replicas - len(workers)]:
+                worker_loads[worker] += count / num_replicas
+                new_blocks[worker][block_index] = self._non_empty_blocks[block_index]
+                workers.append(worker)
+                self._worker_to_blocks_map[worker].append(block_index)
+            logger.info(
+                "Replicated block {} with {} of {} lookups to {} workers.".format(
+                    block_index, count, self._num_accesses, len(workers)
+                )
+            )
+        # The lookups sent to the workers later are executed after their new blocks
+        # are added, since the tasks of an actor are executed in submission order.
+        for worker, blocks in new_blocks.items():
+            worker.add_blocks.remote(blocks)
+
+        for block_index in self._block_access_counts:
+            self._block_access_counts[block_index] //= 2
+        self._num_accesses //= 2
+
 
 @ray.remote(num_cpus=0)
 class _RandomAccessWorker:
     def __init__(self, key_field, dataset_format):
         self.blocks = None
+        self.key_columns = None
         self.key_field = key_field
         self.dataset_format = dataset_format
         self.num_accesses = 0
         self.total_time = 0
+        # Decoded rows keyed by (block index, row index), in LRU order.
+        self.row_cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def assign_blocks(self, block_ref_dict):
-        self.blocks = {k: ray.get(ref) for k, ref in block_ref_dict.items()}
+        self.blocks = {}
+        self.key_columns = {}
+        self.add_blocks(block_ref_dict)
+
+    def add_blocks(self, block_ref_dict):
+        for k, ref in block_ref_dict.items():
+            block = ray.get(ref)
+            self.blocks[k] = block
+            self.key_columns[k] = np.asarray(block[self.key_field])
 
     def get(self, block_index, key):
         start = time.perf_counter()
-        result = self._get(block_index, key)
+        result = self._multiget([block_index], [key])[0]
         self.total_time += time.perf_counter() - start
         self.num_accesses += 1
         return result
 
     def multiget(self, block_indices, keys):
         start = time.perf_counter()
-        if self.dataset_format == "arrow" and len(set(block_indices)) == 1:
-            # Fast path: use np.searchsorted for vectorized search on a single block.
-            # This is ~3x faster than the naive case.
-            block = self.blocks[block_indices[0]]
-            col = block[self.key_field]
-            indices = np.searchsorted(col, keys)
-            acc = BlockAccessor.for_block(block)
-            result = [acc._get_row(i) for i in indices]
-            # assert result == [self._get(i, k) for i, k in zip(block_indices, keys)]
-        else:
-            result = [self._get(i, k) for i, k in zip(block_indices, keys)]
+        result = self._multiget(block_indices, keys)
         self.total_time += time.perf_counter() - start
         self.num_accesses += 1
         return result
@@ -241,8 +341,54 @@ class _RandomAccessWorker:
             "num_blocks": len(self.blocks),
             "num_accesses": self.num_accesses,
             "total_time": self.total_time,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
         }
 
+    def _multiget(self, block_indices, keys):
+        positions = defaultdict(list)
+        for i, block_index in enumerate(block_indices):
+            positions[block_index].append(i)
+        result = [None] * len(keys)
+        for block_index, block_positions in positions.items():
+            block_keys = [keys[i] for i in block_positions]
+            rows = self._find_rows(block_index, block_keys)
+            for i, row in zip(block_positions, rows):
+                result[i] = row
+        return result
+
+    def _find_rows(self, block_index, keys):
+        column = self.key_columns[block_index]
+        try:
+            # Use np.searchsorted to search for all the keys of a block at once.
+            # This is ~3x faster than binary searching for each key in Python.
+            if column.dtype == object:
+                keys = np.asarray(keys, dtype=object)
+            else:
+                keys = np.asarray(keys)
+            indices = np.searchsorted(column, keys)
+            found = indices < len(column)
+            found[found] = column[indices[found]] == keys[found]
+        except TypeError:
+            return [self._get(block_index, k) for k in keys]
+        return [
+            self._get_row(block_index, i) if f else None for i, f in zip(indices, found)
+        ]
+
+    def _get_row(self, block_index, i):
+        cache_key = (block_index, int(i))
+        row = self.row_cache.get(cache_key)
+        if row is not None:
+            self.row_cache.move_to_end(cache_key)
+            self.cache_hits += 1
+            return row
+        self.cache_misses += 1
+        row = BlockAccessor.for_block(self.blocks[block_index])._get_row(int(i))
+        self.row_cache[cache_key] = row
+        if len(self.row_cache) > ROW_CACHE_SIZE:
+            self.row_cache.popitem(last=False)
+        return row
+
     def _get(self, block_index, key):
         if block_index is None:
             return None
@@ -253,8 +399,7 @@ class _RandomAccessWorker:
         i = _binary_search_find(column, key)
         if i is None:
             return None
-        acc = BlockAccessor.for_block(block)
-        return acc._get_row(i)
+        return self._get_row(block_index, i)
 
 
 def _binary_search_find(column, x):
@@ -269,6 +269,15 @@ def use_push_based_shuffle(request):
     ctx.use_push_based_shuffle = original
 
 
+@pytest.fixture
+def use_hash_based_groupby():
+    ctx = ray.data.context.DatasetContext.get_current()
+    original = ctx.use_hash_based_groupby
+    ctx.use_hash_based_groupby = True
+    yield
+    ctx.use_hash_based_groupby = original
+
+
 @pytest.fixture(params=[True, False])
 def enable_automatic_tensor_extension_cast(request):
     ctx = ray.data.context.DatasetContext.get_current()
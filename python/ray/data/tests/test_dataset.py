@@ -1,3 +1,4 @@
+import datetime
 import itertools
 import math
 import os
@@ -378,6 +379,53 @@ def test_zip_arrow(ray_start_regular_shared):
     assert result[0] == {"id": 0, "id_1": 0, "id_2": 0}
 
 
+@pytest.mark.parametrize("how", ["inner", "left", "outer"])
+@pytest.mark.parametrize("broadcast", [False, True])
+def test_join(ray_start_regular_shared, how, broadcast, use_push_based_shuffle):
+    ctx = ray.data.context.DatasetContext.get_current()
+    original = ctx.join_broadcast_threshold_bytes
+    ctx.join_broadcast_threshold_bytes = 1024**3 if broadcast else 0
+    try:
+        left = ray.data.from_items(
+            [{"id": i, "x": i * 2, "y": "l"} for i in range(20)], parallelism=4
+        )
+        right = ray.data.from_items(
+            [{"id": i, "y": "r"} for i in range(10, 30, 2)], parallelism=3
+        )
+        ds = left.join(right, on="id", how=how)
+        result = ds.to_pandas().sort_values("id").reset_index(drop=True)
+        assert list(result.columns) == ["id", "x", "y", "y_1"]
+        expected = pd.DataFrame({"id": range(20), "x": range(0, 40, 2), "y": "l"})
+        expected = expected.merge(
+            pd.DataFrame({"id": range(10, 30, 2), "y": "r"}),
+            on="id",
+            how=how,
+            suffixes=("", "_1"),
+        )
+        expected = expected.sort_values("id").reset_index(drop=True)
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+        # Joining with an empty dataset.
+        empty = right.filter(lambda r: False)
+        assert left.join(empty, on="id", how=how).count() == (
+            0 if how == "inner" else 20
+        )
+    finally:
+        ctx.join_broadcast_threshold_bytes = original
+
+
+def test_join_errors(ray_start_regular_shared):
+    ds = ray.data.range_table(10)
+    with pytest.raises(ValueError):
+        ds.join(ds, on="value", how="cross")
+    with pytest.raises(ValueError):
+        ds.join(ds, on=lambda r: r["value"])
+    with pytest.raises(ValueError):
+        ds.join(ds, on="foo").fully_executed()
+    with pytest.raises(ValueError):
+        ray.data.range(10).join(ds, on="value").fully_executed()
+
+
 def test_batch_tensors(ray_start_regular_shared):
     import torch
 
@@ -1884,6 +1932,37 @@ def test_iter_batches_empty_block(ray_start_regular_shared):
     assert list(ds.iter_batches(batch_size=1, local_shuffle_buffer_size=1)) == [[0]]
 
 
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_iter_batches_prefetch_batches(ray_start_regular_shared, pipelined):
+    ds = ray.data.range(100, parallelism=10)
+    if pipelined:
+        ds = ds.window(blocks_per_window=2)
+    batches = list(ds.iter_batches(batch_size=7, prefetch_batches=3))
+    assert [len(batch) for batch in batches] == [7] * 14 + [2]
+    assert [r for batch in batches for r in batch] == list(range(100))
+
+    # Errors are raised in the consumer.
+    def fail(x):
+        if x == 50:
+            raise ValueError("oops")
+        return x
+
+    ds = ray.data.range(100, parallelism=10).map(fail)
+    if pipelined:
+        ds = ds.window(blocks_per_window=2)
+    with pytest.raises(ValueError):
+        for _ in ds.iter_batches(prefetch_batches=2):
+            pass
+
+    # Stopping early doesn't hang.
+    ds = ray.data.range(100, parallelism=10)
+    if pipelined:
+        ds = ds.repeat()
+    it = ds.iter_batches(batch_size=10, prefetch_batches=2)
+    assert next(it) == list(range(10))
+    it.close()
+
+
 @pytest.mark.parametrize("pipelined", [False, True])
 @pytest.mark.parametrize("ds_format", ["arrow", "pandas", "simple"])
 def test_iter_batches_local_shuffle(shutdown_only, pipelined, ds_format):
@@ -3211,6 +3290,58 @@ def test_groupby_tabular_count(
     ]
 
 
+@pytest.mark.parametrize("num_parts", [1, 30])
+@pytest.mark.parametrize("ds_format", ["simple", "arrow", "pandas"])
+def test_groupby_hash_based(
+    ray_start_regular_shared,
+    ds_format,
+    num_parts,
+    use_push_based_shuffle,
+    use_hash_based_groupby,
+):
+    xs = list(range(100))
+    random.shuffle(xs)
+    if ds_format == "simple":
+        ds = ray.data.from_items(xs).repartition(num_parts)
+        agg_ds = ds.groupby(lambda x: x % 3).aggregate(Count(), Sum(), Mean())
+        assert sorted(agg_ds.take_all()) == [
+            (0, 34, 1683, 49.5),
+            (1, 33, 1617, 49.0),
+            (2, 33, 1650, 50.0),
+        ]
+        return
+
+    ds = ray.data.from_items([{"A": str(x % 3), "B": x} for x in xs]).repartition(
+        num_parts
+    )
+    if ds_format == "pandas":
+        ds = ds.map_batches(lambda x: x, batch_size=None, batch_format="pandas")
+    agg_ds = ds.groupby("A").aggregate(Count(), Sum("B"), Mean("B"))
+    assert agg_ds.num_blocks() == num_parts
+    assert [row.as_pydict() for row in agg_ds.sort("A").iter_rows()] == [
+        {"A": "0", "count()": 34, "sum(B)": 1683, "mean(B)": 49.5},
+        {"A": "1", "count()": 33, "sum(B)": 1617, "mean(B)": 49.0},
+        {"A": "2", "count()": 33, "sum(B)": 1650, "mean(B)": 50.0},
+    ]
+
+    # Global aggregation.
+    assert ds.groupby(None).count().take_all()[0]["count()"] == 100
+
+
+def test_groupby_hash_based_process_independent_keys(
+    ray_start_regular_shared, use_hash_based_groupby
+):
+    # The hash() of dates differs between worker processes, so equal keys must
+    # still be assigned to the same partition by all mappers.
+    ds = ray.data.from_items(list(range(300))).repartition(30)
+    agg_ds = ds.groupby(lambda x: datetime.date(2022, 1, 1 + x % 3)).count()
+    assert sorted(agg_ds.take_all()) == [
+        (datetime.date(2022, 1, 1), 100),
+        (datetime.date(2022, 1, 2), 100),
+        (datetime.date(2022, 1, 3), 100),
+    ]
+
+
 @pytest.mark.parametrize("num_parts", [1, 30])
 @pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
 def test_groupby_tabular_sum(
@@ -5249,6 +5380,49 @@ def test_actor_pool_strategy_default_num_actors(shutdown_only):
     ), "Number of actors is out of the expected bound"
 
 
+def test_actor_pool_strategy_adaptive(shutdown_only):
+    def f(x):
+        import time
+
+        time.sleep(0.1)
+        return x
+
+    num_cpus = 4
+    ray.init(num_cpus=num_cpus)
+    compute_strategy = ray.data.ActorPoolStrategy(1, num_cpus, adaptive=True)
+    ds = ray.data.range(20, parallelism=20).map_batches(
+        f, batch_size=1, compute=compute_strategy
+    )
+    assert sorted(ds.take_all()) == list(range(20))
+    assert 1 <= compute_strategy.num_workers <= num_cpus
+    # The idle actors are removed once all the inputs have been processed.
+    wait_for_condition(lambda: ray.available_resources().get("CPU", 0) == num_cpus)
+
+
+def test_adaptive_actor_pool_policy():
+    from ray.data._internal.compute import _AdaptiveActorPoolPolicy
+
+    policy = _AdaptiveActorPoolPolicy(
+        ray.data.ActorPoolStrategy(1, 8, max_tasks_in_flight_per_actor=4, adaptive=True)
+    )
+    # Nothing has been measured yet.
+    assert policy.should_scale_up(0, 1)
+    assert not policy.should_scale_up(4, 0)
+    assert policy.max_tasks_in_flight() == 4
+
+    policy._startup_time = 1.0
+    policy._task_duration = 0.1
+    # Scale up only if the queued inputs take longer than starting an actor.
+    assert not policy.should_scale_up(4, 10)
+    assert policy.should_scale_up(4, 100)
+    # Send just enough tasks to cover the input latency.
+    assert policy.max_tasks_in_flight() == 1
+    policy._input_latency = 0.15
+    assert policy.max_tasks_in_flight() == 3
+    policy._input_latency = 10
+    assert policy.max_tasks_in_flight() == 4
+
+
 def test_default_batch_format(shutdown_only):
     ds = ray.data.range(100)
     assert ds.default_batch_format() == list
@@ -9,6 +9,7 @@ import pyarrow.parquet as pq
 from typing import Any
 
 import ray
+from ray._private.test_utils import run_string_as_driver
 from ray.data.block import BlockAccessor
 from ray.data.datasource import (
     DefaultFileMetadataProvider,
@@ -487,6 +488,62 @@ def test_parquet_read_partitioned_with_filter(ray_start_regular_shared, tmp_path
     assert ds._plan.execute()._num_computed() == 2
     assert sorted(values) == [[1, "a"], [1, "a"]]
 
+    # Filters on partition columns are pushed down into the read, alone and
+    # combined with filters on data columns and projections.
+    ds = ray.data.read_parquet(str(tmp_path)).filter(pa.dataset.field("one") == 3)
+    assert ds._plan._last_optimized_stages == []
+    values = [[s["one"], s["two"]] for s in ds.take()]
+    assert sorted(values) == [[3, "b"], [3, "c"], [3, "c"]]
+
+    ds = ray.data.read_parquet(str(tmp_path))
+    ds = ds.filter(
+        (pa.dataset.field("one") == 1) & (pa.dataset.field("two") == "b")
+    ).select_columns(["two"])
+    assert ds._plan._last_optimized_stages == []
+    assert ds.take() == [{"two": "b"}]
+
+
+def test_parquet_read_pushdown(ray_start_regular_shared, tmp_path):
+    df = pd.DataFrame(
+        {"one": list(range(10)), "two": [str(i) for i in range(10)], "three": 1.0}
+    )
+    pq.write_table(pa.Table.from_pandas(df[:5]), os.path.join(tmp_path, "a.parquet"))
+    pq.write_table(pa.Table.from_pandas(df[5:]), os.path.join(tmp_path, "b.parquet"))
+
+    # The filter and the projection are both pushed down into the read.
+    ds = ray.data.read_parquet(str(tmp_path))
+    ds = ds.filter(pa.dataset.field("one") > 6).select_columns(["two", "one"])
+    assert ds._plan._last_optimized_stages == []
+    assert ds.schema().names == ["two", "one"]
+    assert ds.take() == [{"two": str(i), "one": i} for i in [7, 8, 9]]
+
+    # Filters after a projection aren't pushed down, but are still applied.
+    ds = ray.data.read_parquet(str(tmp_path))
+    ds = ds.select_columns(["one"]).filter(pa.dataset.field("one") < 2)
+    assert len(ds._plan._last_optimized_stages) == 1
+    assert ds.take() == [{"one": 0}, {"one": 1}]
+    with pytest.raises(Exception):
+        ray.data.read_parquet(str(tmp_path)).select_columns(["one"]).filter(
+            pa.dataset.field("two") == "1"
+        )
+
+    # Reads with a UDF can't push down.
+    ds = ray.data.read_parquet(str(tmp_path), _block_udf=lambda block: block)
+    ds = ds.filter(pa.dataset.field("one") == 3)
+    assert len(ds._plan._last_optimized_stages) == 1
+    assert ds.take() == [{"one": 3, "two": "3", "three": 1.0}]
+
+    # Unknown columns still raise.
+    with pytest.raises(KeyError):
+        ray.data.read_parquet(str(tmp_path)).select_columns(["one", "four"])
+
+    # Expression filters on in-memory datasets keep the block format.
+    ds = ray.data.from_pandas(df).filter(pa.dataset.field("two") == "4")
+    assert ds._dataset_format() == "pandas"
+    assert ds.take() == [{"one": 4, "two": "4", "three": 1.0}]
+    with pytest.raises(ValueError):
+        ray.data.range(10).filter(pa.dataset.field("value") == 1)
+
 
 def test_parquet_read_partitioned_explicit(ray_start_regular_shared, tmp_path):
     df = pd.DataFrame(
@@ -906,6 +963,83 @@ def test_parquet_read_empty_file(ray_start_regular_shared, tmp_path):
     pd.testing.assert_frame_equal(ds.to_pandas(), table.to_pandas())
 
 
+def test_parquet_cache(ray_start_regular_shared, tmp_path):
+    data_path = os.path.join(tmp_path, "data")
+    cache_path = os.path.join(tmp_path, "cache")
+    os.mkdir(data_path)
+    pq.write_table(pa.table({"a": [1, 2, 3]}), os.path.join(data_path, "1.parquet"))
+
+    def add_one(df):
+        df["a"] += 1
+        return df
+
+    def cached():
+        ds = ray.data.read_parquet(data_path).map_batches(add_one)
+        return ds.cache(cache_path)
+
+    # A cache miss executes the dataset and writes its output.
+    ds = cached()
+    assert sorted(ds.to_pandas()["a"]) == [2, 3, 4]
+    [entry] = os.listdir(cache_path)
+    assert os.path.exists(os.path.join(cache_path, entry, "_SUCCESS"))
+
+    # A cache hit reads the output back instead.
+    ds = cached()
+    assert all(f.startswith(os.path.join(cache_path, entry)) for f in ds.input_files())
+    assert sorted(ds.to_pandas()["a"]) == [2, 3, 4]
+
+    # Files of failed or concurrent writes in the entry aren't read.
+    [committed] = [
+        f for f in os.listdir(os.path.join(cache_path, entry)) if f != "_SUCCESS"
+    ]
+    shutil.copy(
+        os.path.join(cache_path, entry, committed),
+        os.path.join(cache_path, entry, "0" * 32 + "_000000.parquet"),
+    )
+    assert sorted(cached().to_pandas()["a"]) == [2, 3, 4]
+
+    # Changing the transformations or the inputs misses the cache.
+    ds = ray.data.read_parquet(data_path).map_batches(lambda df: df)
+    assert sorted(ds.cache(cache_path).to_pandas()["a"]) == [1, 2, 3]
+    assert len(os.listdir(cache_path)) == 2
+    pq.write_table(pa.table({"a": [4, 5]}), os.path.join(data_path, "1.parquet"))
+    assert sorted(cached().to_pandas()["a"]) == [5, 6]
+    assert len(os.listdir(cache_path)) == 3
+
+    # Datasets created from in-memory data can't be cached.
+    with pytest.raises(ValueError):
+        ray.data.from_items([1, 2]).cache(cache_path)
+
+
+def test_parquet_cache_fingerprint_across_jobs(ray_start_regular_shared, tmp_path):
+    pq.write_table(pa.table({"a": [1, 2, 3]}), os.path.join(tmp_path, "1.parquet"))
+    driver_script = f"""
+import ray
+from ray._private.test_utils import run_string_as_driver
+from ray.data._internal.lineage_cache import lineage_fingerprint
+
+class AddOne:
+    def __call__(self, df):
+        df["a"] += 1
+        return df
+
+ray.init(address="auto")
+ds = ray.data.read_parquet({str(tmp_path)!r}).map_batches(AddOne, compute="actors")
+print("fingerprint:", lineage_fingerprint(ds._plan))
+"""
+
+    def fingerprint():
+        [line] = [
+            line
+            for line in run_string_as_driver(driver_script).splitlines()
+            if line.startswith("fingerprint:")
+        ]
+        return line
+
+    # Class UDFs defined in the driver are fingerprinted the same in each job.
+    assert fingerprint() == fingerprint()
+
+
 if __name__ == "__main__":
     import sys
 
@@ -857,6 +857,66 @@ def test_label_encoder():
     null_encoder.transform_batch(nonnull_df)
 
 
+@pytest.mark.parametrize(
+    "encoder",
+    [
+        OrdinalEncoder(["A", "B", "D"]),
+        OrdinalEncoder(["D"], encode_lists=False),
+        OneHotEncoder(["A", "C"]),
+        OneHotEncoder(["A", "B"], max_categories={"B": 2}),
+        MultiHotEncoder(["B", "C", "D"]),
+        LabelEncoder("A"),
+    ],
+)
+def test_encoders_arrow(encoder):
+    """Tests that encoders fit and transform Arrow data like pandas data."""
+    col_a = ["red", "green", "blue", "red"]
+    col_b = ["warm", "cold", "hot", "cold"]
+    col_c = [1, 10, 5, 10]
+    col_d = [["warm"], [], ["hot", "warm", "cold"], ["cold", "cold"]]
+    in_df = pd.DataFrame.from_dict({"A": col_a, "B": col_b, "C": col_c, "D": col_d})
+    table = pyarrow.Table.from_pandas(in_df)
+    # Include a sliced chunk and a dictionary encoded column.
+    table = pyarrow.concat_tables([table, table.slice(1)])
+    table = table.set_column(
+        table.schema.get_field_index("B"), "B", table.column("B").dictionary_encode()
+    )
+
+    def to_lists(df: pd.DataFrame) -> pd.DataFrame:
+        return df.applymap(lambda x: list(x) if isinstance(x, np.ndarray) else x)
+
+    pandas_ds = ray.data.from_pandas(
+        pd.concat([in_df, in_df.iloc[1:]], ignore_index=True)
+    )
+    arrow_ds = ray.data.from_arrow(table)
+    assert arrow_ds._dataset_format() == "arrow"
+
+    expected_stats = encoder.fit(pandas_ds).stats_
+    expected_df = to_lists(encoder.transform(pandas_ds).to_pandas())
+
+    assert encoder.fit(arrow_ds).stats_ == expected_stats
+    assert encoder._determine_transform_to_use("arrow") == "arrow"
+    out_df = to_lists(encoder.transform(arrow_ds).to_pandas())
+    pd.testing.assert_frame_equal(out_df, expected_df, check_dtype=False)
+
+    out_table = encoder.transform_batch(table)
+    assert isinstance(out_table, pyarrow.Table)
+    pd.testing.assert_frame_equal(
+        to_lists(out_table.to_pandas()), expected_df, check_dtype=False
+    )
+
+    # Values that weren't fitted are encoded like in pandas.
+    unseen_df = pd.DataFrame.from_dict(
+        {"A": ["yellow"], "B": ["cool"], "C": [3], "D": [["hot"]]}
+    )
+    unseen_table = pyarrow.Table.from_pandas(unseen_df)
+    pd.testing.assert_frame_equal(
+        to_lists(encoder.transform_batch(unseen_table).to_pandas()),
+        to_lists(encoder.transform_batch(unseen_df)),
+        check_dtype=False,
+    )
+
+
 @pytest.mark.parametrize("predefined_dtypes", [True, False])
 def test_categorizer(predefined_dtypes):
     """Tests basic Categorizer functionality."""
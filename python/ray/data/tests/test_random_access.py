@@ -2,6 +2,7 @@ import pytest
 import pyarrow
 
 import ray
+from ray.data import random_access_dataset
 
 from ray.tests.conftest import *  # noqa
 
@@ -61,6 +62,36 @@ def test_stats(ray_start_regular_shared):
     rad.multiget([1, 2, 3])
     stats = rad.stats()
     assert "Accesses per worker: 2 min, 2 max, 2 mean" in stats, stats
+    assert "Row cache hit rate: 0.0% of 4 rows" in stats, stats
+    ray.get(rad.get_async(0))
+    stats = rad.stats()
+    assert "Row cache hit rate: 20.0% of 5 rows" in stats, stats
+
+
+def test_multiget_missing_keys(ray_start_regular_shared):
+    ds = ray.data.range_table(100, parallelism=5)
+    ds = ds.map_batches(lambda df: df[df["value"] % 2 == 0])
+    rad = ds.to_random_access_dataset("value", num_workers=2)
+    # Odd keys fall within the range of some block, but aren't in it.
+    results = rad.multiget(list(range(100)))
+    assert results == [{"value": i} if i % 2 == 0 else None for i in range(100)]
+
+
+def test_hot_block_replication(ray_start_regular_shared, monkeypatch):
+    monkeypatch.setattr(random_access_dataset, "REPLICATION_CHECK_INTERVAL", 100)
+    ds = ray.data.range_table(100, parallelism=10)
+    rad = ds.to_random_access_dataset("value", num_workers=4)
+    # Start from a single replica of each block.
+    rad._block_to_workers_map = {i: [rad._workers[0]] for i in range(10)}
+
+    # All the lookups go to the first block, so it's replicated to all workers.
+    for _ in range(10):
+        assert rad.multiget(list(range(10))) == [{"value": i} for i in range(10)]
+    assert len(rad._block_to_workers_map[0]) == 4
+    assert all(len(rad._block_to_workers_map[i]) == 1 for i in range(1, 10))
+    assert "Replicas per block: 1 min, 4 max, 1 replicated" in rad.stats()
+    for i in range(100):
+        assert ray.get(rad.get_async(i)) == {"value": i}
 
 
 if __name__ == "__main__":
@@ -215,6 +215,77 @@ def test_sort_pandas_with_empty_blocks(ray_start_regular, use_push_based_shuffle
     assert ds.sort("value").count() == 0
 
 
+def test_sample_boundaries(ray_start_regular):
+    from ray.data._internal.sort import _MultiColumnKey, sample_boundaries
+
+    # One large block and many small blocks: the boundaries should split the rows
+    # of the large block, rather than the same number of samples from each block.
+    dfs = [pd.DataFrame({"a": range(10000), "b": 0})]
+    dfs += [
+        pd.DataFrame({"a": range(10000 + 10 * i, 10010 + 10 * i), "b": i})
+        for i in range(9)
+    ]
+    blocks = ray.data.from_pandas(dfs)._plan.execute().get_blocks()
+    boundaries = sample_boundaries(blocks, [("a", "ascending")], 10)
+    assert len(boundaries) == 9
+    assert boundaries == sorted(boundaries)
+    assert all(b < 10000 for b in boundaries), boundaries
+
+    # Multiple key columns produce row keys in lexicographic order.
+    boundaries = sample_boundaries(blocks, [("b", "ascending"), ("a", "ascending")], 4)
+    assert len(boundaries) == 3
+    assert all(isinstance(b, _MultiColumnKey) for b in boundaries)
+    assert boundaries == sorted(boundaries)
+    assert [b.values[0] for b in boundaries] == sorted(b.values[0] for b in boundaries)
+
+    # Null keys are ignored.
+    blocks = (
+        ray.data.from_pandas(
+            [pd.DataFrame({"a": [None, 1.0, 2.0]}), pd.DataFrame({"a": [np.nan] * 3})]
+        )
+        ._plan.execute()
+        .get_blocks()
+    )
+    assert sample_boundaries(blocks, [("a", "ascending")], 2) == [1.0]
+
+
+@pytest.mark.parametrize("batch_format", ["pyarrow", "pandas"])
+def test_sort_multiple_keys(ray_start_regular, batch_format, use_push_based_shuffle):
+    num_items = 1000
+    rows = [
+        {"a": random.randint(0, 9), "b": random.randint(0, 99), "c": i}
+        for i in range(num_items)
+    ]
+    ds = ray.data.from_items(rows, parallelism=8).map_batches(
+        lambda t: t, batch_format=batch_format, batch_size=None
+    )
+
+    def sorted_rows(sorted_ds):
+        return [(row["a"], row["b"], row["c"]) for row in sorted_ds.iter_rows()]
+
+    # Each column is sorted in its own order.
+    sorted_ds = ds.sort([("a", "ascending"), ("b", "descending")])
+    result = sorted_rows(sorted_ds)
+    assert [r[:2] for r in result] == sorted(
+        [(r["a"], r["b"]) for r in rows], key=lambda r: (r[0], -r[1])
+    )
+    assert sorted(r[2] for r in result) == list(range(num_items))
+    assert len([n for n in sorted_ds._block_num_rows() if n > 0]) > 1
+
+    # Column names without an order use ``descending``.
+    result = sorted_rows(ds.sort(["a", "b", "c"], descending=True))
+    assert result == sorted([(r["a"], r["b"], r["c"]) for r in rows], reverse=True)
+    result = sorted_rows(ds.sort(["a", ("c", "descending")]))
+    assert result == sorted(
+        [(r["a"], r["b"], r["c"]) for r in rows], key=lambda r: (r[0], -r[2])
+    )
+
+    with pytest.raises(ValueError, match="order"):
+        ds.sort([("a", "up")]).fully_executed()
+    with pytest.raises(ValueError):
+        ds.sort(["a", "d"]).fully_executed()
+
+
 def test_push_based_shuffle_schedule():
     def _test(num_input_blocks, merge_factor, num_cpus_per_node_map):
         num_cpus = sum(v for v in num_cpus_per_node_map.values())
@@ -327,6 +398,41 @@ def test_push_based_shuffle_stats(ray_start_cluster):
         ctx.use_push_based_shuffle = original
 
 
+@pytest.mark.parametrize("descending", [False, True])
+def test_push_based_shuffle_skew_split(ray_start_regular, descending):
+    ctx = ray.data.context.DatasetContext.get_current()
+    try:
+        original = ctx.use_push_based_shuffle
+        original_skew_factor = ctx.push_based_shuffle_skew_factor
+        ctx.use_push_based_shuffle = True
+        ctx.push_based_shuffle_skew_factor = 2
+
+        # Half of the rows have the same key, so they all go to one output block,
+        # which is split between the rows of the hot key.
+        keys = [0] * 5000 + list(range(1, 5001))
+        random.shuffle(keys)
+        ds = ray.data.from_pandas(
+            [pd.DataFrame({"a": keys[i : i + 1000]}) for i in range(0, 10000, 1000)]
+        )
+        sorted_ds = ds.sort("a", descending=descending)
+        assert sorted_ds.num_blocks() > 10
+        assert [r["a"] for r in sorted_ds.iter_rows()] == sorted(
+            keys, reverse=descending
+        )
+
+        # The records of a key are still in a single block for map_groups().
+        counts = (
+            ds.groupby("a")
+            .map_groups(lambda df: pd.DataFrame({"a": df["a"][:1], "n": len(df)}))
+            .to_pandas()
+        )
+        assert len(counts) == 5001
+        assert counts[counts["a"] == 0]["n"].tolist() == [5000]
+    finally:
+        ctx.use_push_based_shuffle = original
+        ctx.push_based_shuffle_skew_factor = original_skew_factor
+
+
 def test_sort_multinode(ray_start_cluster, use_push_based_shuffle):
     cluster = ray_start_cluster
     cluster.add_node(
@@ -90,6 +90,26 @@ Dataset iterator time breakdown:
     )
 
 
+def test_dataset_stats_prefetch_batches(ray_start_regular_shared):
+    ds = ray.data.range(1000, parallelism=10)
+    for batch in ds.iter_batches(prefetch_batches=2):
+        pass
+    stats = canonicalize(ds.stats())
+    assert (
+        """
+Dataset iterator time breakdown:
+* In ray.wait(): T
+* In ray.get(): T
+* In next_batch(): T
+* In format_batch(): T
+* Waiting for prefetched batches: T
+* In user code: T
+* Total time: T
+"""
+        in stats
+    ), stats
+
+
 def test_dataset_stats_shuffle(ray_start_regular_shared):
     context = DatasetContext.get_current()
     context.optimize_fuse_stages = True
@@ -0,0 +1,161 @@
+import time
+
+import pytest
+
+import ray
+from ray.data._internal.plan import (
+    AllToAllStage,
+    OneToOneStage,
+    _group_streaming_stages,
+)
+from ray.data.context import DatasetContext
+from ray.data import ActorPoolStrategy
+from ray.tests.conftest import *  # noqa
+
+
+@pytest.fixture
+def enable_streaming_executor():
+    ctx = DatasetContext.get_current()
+    original = ctx.use_streaming_executor
+    ctx.use_streaming_executor = True
+    yield
+    ctx.use_streaming_executor = original
+
+
+@ray.remote(num_cpus=0)
+class Timeline:
+    def __init__(self):
+        self.events = []
+
+    def record(self, stage, value):
+        self.events.append((stage, value, time.time()))
+
+    def get(self):
+        return self.events
+
+
+def test_group_streaming_stages():
+    def one_to_one(name):
+        return OneToOneStage(name, None, "tasks", {})
+
+    def all_to_all(name):
+        return AllToAllStage(name, None, None)
+
+    a, b, c = one_to_one("a"), one_to_one("b"), one_to_one("c")
+    shuffle = all_to_all("shuffle")
+    assert _group_streaming_stages([a, b, shuffle, c]) == [[a, b], shuffle, c]
+    assert _group_streaming_stages([a]) == [a]
+    assert _group_streaming_stages([shuffle, a, b, c]) == [shuffle, [a, b, c]]
+    assert _group_streaming_stages([]) == []
+
+
+@pytest.mark.parametrize("compute", ["tasks", ActorPoolStrategy(1, 2)])
+def test_streaming_executor(
+    ray_start_regular_shared, enable_streaming_executor, compute
+):
+    ds = ray.data.range(100, parallelism=20)
+    ds = ds.map_batches(lambda x: [r * 2 for r in x], compute=compute)
+    ds = ds.map(lambda x: x + 1, num_cpus=0.5)
+    assert ds.take_all() == [r * 2 + 1 for r in range(100)]
+
+    stats = ds.stats()
+    assert "read->map_batches" in stats, stats
+    assert "map:" in stats, stats
+
+
+def test_streaming_executor_batch_size(
+    ray_start_regular_shared, enable_streaming_executor
+):
+    ds = ray.data.range(100, parallelism=20).map(lambda x: x, num_cpus=0.5)
+    ds = ds.map_batches(lambda x: [len(x)] * len(x), batch_size=20)
+    assert ds.num_blocks() == 5
+    assert ds.take_all() == [20] * 100
+
+
+def test_streaming_executor_overlaps_stages(
+    ray_start_regular_shared, enable_streaming_executor
+):
+    timeline = Timeline.remote()
+
+    def slow_map(x):
+        time.sleep(0.1 * x)
+        ray.get(timeline.record.remote("first", x))
+        return x
+
+    def record(x):
+        ray.get(timeline.record.remote("second", x))
+        return x
+
+    ds = ray.data.range(10, parallelism=10).map(slow_map, num_cpus=0.5)
+    ds = ds.map(record, num_cpus=0.25)
+    assert ds.take_all() == list(range(10))
+
+    events = ray.get(timeline.get.remote())
+    last_first = max(t for stage, _, t in events if stage == "first")
+    first_second = min(t for stage, _, t in events if stage == "second")
+    # The second stage started before the first stage finished.
+    assert first_second < last_first, events
+
+
+def test_streaming_executor_backpressure(
+    ray_start_regular_shared, enable_streaming_executor
+):
+    timeline = Timeline.remote()
+
+    def fast_map(x):
+        ray.get(timeline.record.remote("first", x))
+        return x
+
+    def slow_map(x):
+        ray.get(timeline.record.remote("second", x))
+        time.sleep(0.05)
+        return x
+
+    # Before any output size is known, the first stage can start as many tasks
+    # as fit into the cluster at once.
+    burst = int(ray.cluster_resources()["CPU"] // 0.5)
+    num_blocks = burst + 10
+
+    ctx = DatasetContext.get_current()
+    original = ctx.streaming_executor_object_store_fraction
+    # Only a single intermediate block fits into the budget.
+    ctx.streaming_executor_object_store_fraction = 1e-12
+    try:
+        ds = ray.data.range(num_blocks, parallelism=num_blocks)
+        ds = ds.map(fast_map, num_cpus=0.5)
+        ds = ds.map(
+            slow_map,
+            compute=ActorPoolStrategy(1, 1, max_tasks_in_flight_per_actor=1),
+        )
+        assert ds.take_all() == list(range(num_blocks))
+    finally:
+        ctx.streaming_executor_object_store_fraction = original
+
+    # The first stage doesn't run ahead of the slow actor stage: when the actor
+    # starts on its k-th block, only the blocks of the initial burst and a few
+    # blocks in flight or queued for the actor have been produced.
+    events = ray.get(timeline.get.remote())
+    first_times = sorted(t for stage, _, t in events if stage == "first")
+    second_times = sorted(t for stage, _, t in events if stage == "second")
+    assert len(first_times) == len(second_times) == num_blocks
+    for k, start_time in enumerate(second_times):
+        num_produced = sum(t < start_time for t in first_times)
+        assert num_produced <= max(burst, k) + 3, (k, num_produced, burst)
+
+
+def test_streaming_executor_error(ray_start_regular_shared, enable_streaming_executor):
+    def fail(x):
+        if x == 5:
+            raise ValueError("oops")
+        return x
+
+    ds = ray.data.range(10, parallelism=10).map(lambda x: x, num_cpus=0.5)
+    ds = ds.map(fail, compute=ActorPoolStrategy(1, 1))
+    with pytest.raises(ray.exceptions.RayTaskError):
+        ds.take_all()
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
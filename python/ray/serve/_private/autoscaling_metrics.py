@@ -1,11 +1,11 @@
-import bisect
 import logging
 import threading
 import time
-from collections import defaultdict
 from dataclasses import dataclass, field
 from threading import Event
-from typing import Callable, DefaultDict, Dict, List, Optional, Type
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+import numpy as np
 
 import ray
 from ray.serve._private.constants import SERVE_LOGGER_NAME
@@ -89,11 +89,132 @@ class TimeStampedValue:
     value: float = field(compare=False)
 
 
+class _TimeSeries:
+    """The data points of a single metric, sorted by timestamp.
+
+    Points are stored in preallocated NumPy arrays. Live points occupy
+    `[start, end)`; compaction only moves `start` forward, and the live
+    points are shifted back to the front of the arrays (or the arrays are
+    doubled) when `end` reaches the capacity, so appends are amortized O(1).
+    A running sum of the values is kept next to them so that window
+    averages don't need to touch every point in the window.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._values = np.empty(capacity, dtype=np.float64)
+        # _cumsum[i] is the sum of all values in [start, i], up to an
+        # offset that is the same for every live index.
+        self._cumsum = np.empty(capacity, dtype=np.float64)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def _reserve(self):
+        """Make room for one more point at index `end`."""
+        capacity = len(self._timestamps)
+        if self._end < capacity:
+            return
+
+        size = len(self)
+        if size * 2 > capacity:
+            capacity *= 2
+        timestamps = np.empty(capacity, dtype=np.float64)
+        values = np.empty(capacity, dtype=np.float64)
+        cumsum = np.empty(capacity, dtype=np.float64)
+        timestamps[:size] = self._timestamps[self._start : self._end]
+        values[:size] = self._values[self._start : self._end]
+        np.cumsum(values[:size], out=cumsum[:size])
+
+        self._timestamps, self._values, self._cumsum = timestamps, values, cumsum
+        self._start, self._end = 0, size
+
+    def add(self, timestamp: float, value: float):
+        self._reserve()
+        start, end = self._start, self._end
+
+        if end == start or timestamp >= self._timestamps[end - 1]:
+            # Fast path: points almost always arrive in timestamp order.
+            self._timestamps[end] = timestamp
+            self._values[end] = value
+            self._cumsum[end] = value + (self._cumsum[end - 1] if end > start else 0)
+        else:
+            # Keep the points sorted, placing the new point after the ones
+            # with the same timestamp.
+            idx = start + int(
+                np.searchsorted(self._timestamps[start:end], timestamp, side="right")
+            )
+            self._timestamps[idx + 1 : end + 1] = self._timestamps[idx:end]
+            self._values[idx + 1 : end + 1] = self._values[idx:end]
+            self._timestamps[idx] = timestamp
+            self._values[idx] = value
+            offset = self._cumsum[idx - 1] if idx > start else 0
+            self._cumsum[idx : end + 1] = offset + np.cumsum(
+                self._values[idx : end + 1]
+            )
+        self._end = end + 1
+
+    def window_start_index(self, window_start_timestamp_s: float) -> int:
+        """Index of the first point after window_start_timestamp_s."""
+        start, end = self._start, self._end
+        if end == start or window_start_timestamp_s < self._timestamps[start]:
+            # Fast path: the whole series is in the window.
+            return start
+        return start + int(
+            self._timestamps[start:end].searchsorted(
+                window_start_timestamp_s, side="right"
+            )
+        )
+
+    def compact(self, window_start_idx: int) -> int:
+        """Drop all points before window_start_idx.
+
+        Returns:
+            The index the window starts at after compaction.
+        """
+        self._start = window_start_idx
+        if self._start == self._end:
+            self._start = self._end = 0
+        return self._start
+
+    def window_average(self, window_start_idx: int) -> Optional[float]:
+        num_points = self._end - window_start_idx
+        if num_points <= 0:
+            return None
+        window_sum = (
+            self._cumsum.item(self._end - 1)
+            - self._cumsum.item(window_start_idx)
+            + self._values.item(window_start_idx)
+        )
+        return window_sum / num_points
+
+    def window_max(self, window_start_idx: int) -> Optional[float]:
+        if self._end <= window_start_idx:
+            return None
+        return float(self._values[window_start_idx : self._end].max())
+
+    def to_list(self) -> List[TimeStampedValue]:
+        return [
+            TimeStampedValue(float(timestamp), float(value))
+            for timestamp, value in zip(
+                self._timestamps[self._start : self._end],
+                self._values[self._start : self._end],
+            )
+        ]
+
+
 class InMemoryMetricsStore:
     """A very simple, in memory time series database"""
 
     def __init__(self):
-        self.data: DefaultDict[str, List[TimeStampedValue]] = defaultdict(list)
+        self._series: Dict[str, _TimeSeries] = dict()
+
+    @property
+    def data(self) -> Dict[str, List[TimeStampedValue]]:
+        """All data points of every metric. Used for debugging and testing."""
+        return {key: series.to_list() for key, series in self._series.items()}
 
     def add_metrics_point(self, data_points: Dict[str, float], timestamp: float):
         """Push new data points to the store.
@@ -106,21 +227,23 @@ class InMemoryMetricsStore:
               collected at.
         """
         for name, value in data_points.items():
-            # Using in-sort to insert while maintaining sorted ordering.
-            bisect.insort(a=self.data[name], x=TimeStampedValue(timestamp, value))
-
-    def _get_datapoints(self, key: str, window_start_timestamp_s: float) -> List[float]:
-        """Get all data points given key after window_start_timestamp_s"""
-
-        datapoints = self.data[key]
-
-        idx = bisect.bisect(
-            a=datapoints,
-            x=TimeStampedValue(
-                timestamp=window_start_timestamp_s, value=0  # dummy value
-            ),
-        )
-        return datapoints[idx:]
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = _TimeSeries()
+            series.add(timestamp, value)
+
+    def _get_window(
+        self, key: str, window_start_timestamp_s: float, do_compact: bool
+    ) -> Tuple[Optional[_TimeSeries], int]:
+        """Get the series for key and the index its window starts at."""
+        series = self._series.get(key)
+        if series is None:
+            return None, 0
+
+        idx = series.window_start_index(window_start_timestamp_s)
+        if do_compact:
+            idx = series.compact(idx)
+        return series, idx
 
     def window_average(
         self, key: str, window_start_timestamp_s: float, do_compact: bool = True
@@ -139,14 +262,10 @@ class InMemoryMetricsStore:
             The average of all the datapoints for the key on and after time
             window_start_timestamp_s, or None if there are no such points.
         """
-        points_after_idx = self._get_datapoints(key, window_start_timestamp_s)
-
-        if do_compact:
-            self.data[key] = points_after_idx
-
-        if len(points_after_idx) == 0:
-            return
-        return sum(point.value for point in points_after_idx) / len(points_after_idx)
+        series, idx = self._get_window(key, window_start_timestamp_s, do_compact)
+        if series is None:
+            return None
+        return series.window_average(idx)
 
     def max(self, key: str, window_start_timestamp_s: float, do_compact: bool = True):
         """Perform a max operation for metric `key`.
@@ -163,9 +282,7 @@ class InMemoryMetricsStore:
             Max value of the data points for the key on and after time
             window_start_timestamp_s, or None if there are no such points.
         """
-        points_after_idx = self._get_datapoints(key, window_start_timestamp_s)
-
-        if do_compact:
-            self.data[key] = points_after_idx
-
-        return max((point.value for point in points_after_idx), default=None)
+        series, idx = self._get_window(key, window_start_timestamp_s, do_compact)
+        if series is None:
+            return None
+        return series.window_max(idx)
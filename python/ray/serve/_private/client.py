@@ -361,6 +361,7 @@ class ServeControllerClient:
         missing_ok: Optional[bool] = False,
         sync: bool = True,
         _internal_pickled_http_request: bool = False,
+        _internal_http_proxy: bool = False,
     ) -> Union[RayServeHandle, RayServeSyncHandle]:
         """Retrieve RayServeHandle for service deployment to invoke it from Python.
 
@@ -375,7 +376,13 @@ class ServeControllerClient:
         Returns:
             RayServeHandle
         """
-        cache_key = (deployment_name, missing_ok, sync)
+        cache_key = (
+            deployment_name,
+            missing_ok,
+            sync,
+            _internal_pickled_http_request,
+            _internal_http_proxy,
+        )
         if cache_key in self.handle_cache:
             cached_handle = self.handle_cache[cache_key]
             if cached_handle.is_polling and cached_handle.is_same_loop:
@@ -390,12 +397,14 @@ class ServeControllerClient:
                 self._controller,
                 deployment_name,
                 _internal_pickled_http_request=_internal_pickled_http_request,
+                _internal_http_proxy=_internal_http_proxy,
             )
         else:
             handle = RayServeHandle(
                 self._controller,
                 deployment_name,
                 _internal_pickled_http_request=_internal_pickled_http_request,
+                _internal_http_proxy=_internal_http_proxy,
             )
 
         self.handle_cache[cache_key] = handle
@@ -7,6 +7,7 @@ import ray
 from ray.actor import ActorHandle
 from ray.serve.config import DeploymentConfig, ReplicaConfig
 from ray.serve._private.autoscaling_policy import AutoscalingPolicy
+from ray.serve._private.constants import DEFAULT_REPLICA_SELECTION_POLICY
 from ray.serve.generated.serve_pb2 import (
     DeploymentInfo as DeploymentInfoProto,
     DeploymentStatusInfo as DeploymentStatusInfoProto,
@@ -285,3 +286,4 @@ class RunningReplicaInfo:
     actor_handle: ActorHandle
     max_concurrent_queries: int
     is_cross_language: bool = False
+    replica_selection_policy: str = DEFAULT_REPLICA_SELECTION_POLICY
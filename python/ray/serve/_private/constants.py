@@ -87,6 +87,16 @@ DEFAULT_HEALTH_CHECK_TIMEOUT_S = 30
 #: being marked unhealthy.
 REPLICA_HEALTH_CHECK_UNHEALTHY_THRESHOLD = 3
 
+#: Maximum number of chunks of a streamed HTTP response that a replica buffers
+#: ahead of the HTTP proxy. The user's generator is paused once it's reached.
+STREAMING_RESPONSE_MAX_BUFFERED_CHUNKS = 16
+
+#: Seconds after which a replica closes a streamed HTTP response that the HTTP
+#: proxy stopped pulling chunks from, e.g. because the proxy died.
+STREAMING_RESPONSE_IDLE_TIMEOUT_S = float(
+    os.environ.get("RAY_SERVE_STREAMING_RESPONSE_IDLE_TIMEOUT_S", "60")
+)
+
 # Key used to idenfity given json represents a serialized RayServeHandle
 SERVE_HANDLE_JSON_KEY = "__SerializedServeHandle__"
 
@@ -117,6 +127,17 @@ class ServeHandleType(str, Enum):
     ASYNC = "ASYNC"
 
 
+class ReplicaSelectionPolicyType(str, Enum):
+    """Policies used by the router to pick a replica for each query."""
+
+    ROUND_ROBIN = "round_robin"
+    POWER_OF_TWO_CHOICES = "power_of_two_choices"
+    LEAST_IN_FLIGHT = "least_in_flight"
+
+
+DEFAULT_REPLICA_SELECTION_POLICY = ReplicaSelectionPolicyType.ROUND_ROBIN.value
+
+
 # Deprecation message for V1 migrations.
 MIGRATION_MESSAGE = (
     "See https://docs.ray.io/en/latest/serve/index.html for more information."
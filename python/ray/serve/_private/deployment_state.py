@@ -32,6 +32,7 @@ from ray.serve._private.common import (
 )
 from ray.serve.config import DeploymentConfig
 from ray.serve._private.constants import (
+    DEFAULT_REPLICA_SELECTION_POLICY,
     MAX_DEPLOYMENT_CONSTRUCTOR_RETRY_COUNT,
     MAX_NUM_DELETED_DEPLOYMENTS,
     REPLICA_HEALTH_CHECK_UNHEALTHY_THRESHOLD,
@@ -199,6 +200,7 @@ class ActorReplicaWrapper:
 
         self._actor_resources: Dict[str, float] = None
         self._max_concurrent_queries: int = None
+        self._replica_selection_policy: str = DEFAULT_REPLICA_SELECTION_POLICY
         self._graceful_shutdown_timeout_s: float = 0.0
         self._healthy: bool = True
         self._health_check_period_s: float = 0.0
@@ -257,6 +259,10 @@ class ActorReplicaWrapper:
     def max_concurrent_queries(self) -> int:
         return self._max_concurrent_queries
 
+    @property
+    def replica_selection_policy(self) -> str:
+        return self._replica_selection_policy
+
     @property
     def node_id(self) -> Optional[str]:
         """Returns the node id of the actor, None if not placed."""
@@ -273,6 +279,9 @@ class ActorReplicaWrapper:
         self._max_concurrent_queries = (
             deployment_info.deployment_config.max_concurrent_queries
         )
+        self._replica_selection_policy = (
+            deployment_info.deployment_config.replica_selection_policy
+        )
         self._graceful_shutdown_timeout_s = (
             deployment_info.deployment_config.graceful_shutdown_timeout_s
         )
@@ -467,6 +476,9 @@ class ActorReplicaWrapper:
 
                 deployment_config, version = ray.get(self._ready_obj_ref)
                 self._max_concurrent_queries = deployment_config.max_concurrent_queries
+                self._replica_selection_policy = (
+                    deployment_config.replica_selection_policy
+                )
                 self._graceful_shutdown_timeout_s = (
                     deployment_config.graceful_shutdown_timeout_s
                 )
@@ -684,6 +696,7 @@ class DeploymentReplica(VersionedReplica):
             actor_handle=self._actor.actor_handle,
             max_concurrent_queries=self._actor.max_concurrent_queries,
             is_cross_language=self._actor.is_cross_language,
+            replica_selection_policy=self._actor.replica_selection_policy,
         )
 
     @property
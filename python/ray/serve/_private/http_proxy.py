@@ -23,6 +23,7 @@ from ray.serve._private.http_util import (
     receive_http_body,
     Response,
     set_socket_reuse_port,
+    StreamingResponseHandle,
 )
 from ray.serve._private.common import EndpointInfo, EndpointTag
 from ray.serve._private.constants import SERVE_LOGGER_NAME, SERVE_NAMESPACE
@@ -41,6 +42,60 @@ SERVE_REQUEST_PROCESSING_TIMEOUT_S = (
 )
 
 
+async def _stream_response(
+    response: StreamingResponseHandle, scope, send, client_disconnection_task
+) -> str:
+    """Send a response whose body is pulled chunk by chunk from the replica.
+
+    Each chunk is sent to the client as soon as it's received, so neither the
+    replica nor the proxy holds the full body.
+    """
+    await send(
+        {
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": response.raw_headers,
+        }
+    )
+
+    while True:
+        chunks_ref = response.replica_handle.get_response_chunks.remote(
+            response.stream_id
+        )
+        chunks_task = asyncio.wrap_future(chunks_ref.future())
+        done, _ = await asyncio.wait(
+            [chunks_task, client_disconnection_task], return_when=FIRST_COMPLETED
+        )
+        if client_disconnection_task in done:
+            logger.warning(
+                f"Client from {scope['client']} disconnected, cancelling the "
+                "streamed response."
+            )
+            chunks_task.cancel()
+            response.replica_handle.cancel_response_stream.remote(response.stream_id)
+            return DISCONNECT_ERROR_CODE
+
+        try:
+            chunks, finished = chunks_task.result()
+        except (RayTaskError, RayActorError) as error:
+            # The response has already started, so the status code can't be
+            # changed anymore. Returning without completing the body makes the
+            # server close the connection, which tells the client that the
+            # response is incomplete.
+            logger.error(f"Streamed response failed: {error}")
+            client_disconnection_task.cancel()
+            return "500"
+
+        for chunk in chunks:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        if finished:
+            break
+
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+    client_disconnection_task.cancel()
+    return str(response.status_code)
+
+
 async def _send_request_to_handle(handle, scope, receive, send) -> str:
     http_body_bytes = await receive_http_body(scope, receive, send)
 
@@ -101,7 +156,6 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
                 backoff = True
             else:
                 result = await object_ref
-                client_disconnection_task.cancel()
                 break
         except asyncio.CancelledError:
             # Here because the client disconnected, we will return a custom
@@ -131,6 +185,11 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
         await Response(error_message, status_code=500).send(scope, receive, send)
         return "500"
 
+    if isinstance(result, StreamingResponseHandle):
+        # Keep listening for the client disconnecting while streaming.
+        return await _stream_response(result, scope, send, client_disconnection_task)
+
+    client_disconnection_task.cancel()
     if isinstance(result, (starlette.responses.Response, RawASGIResponse)):
         await result(scope, receive, send)
         return str(result.status_code)
@@ -139,6 +198,24 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
         return "200"
 
 
+class _RouteTrieNode:
+    """A node in the segment trie used by LongestPrefixRouter.
+
+    Each node corresponds to a '/'-separated path segment. `route` is the
+    route that ends exactly at this node (e.g. '/a/b'), and `slash_route` is
+    the route that ends at this node followed by a trailing '/' (e.g. '/a/b/'
+    or the root route '/'), which only matches if the target continues past
+    this node.
+    """
+
+    __slots__ = ("children", "route", "slash_route")
+
+    def __init__(self):
+        self.children: Dict[str, "_RouteTrieNode"] = dict()
+        self.route: Optional[str] = None
+        self.slash_route: Optional[str] = None
+
+
 class LongestPrefixRouter:
     """Router that performs longest prefix matches on incoming routes."""
 
@@ -147,6 +224,10 @@ class LongestPrefixRouter:
         self._get_handle = get_handle
         # Routes sorted in order of decreasing length.
         self.sorted_routes: List[str] = list()
+        # Trie of route path segments, used for matching in time
+        # proportional to the depth of the target route rather than the
+        # number of routes.
+        self._route_trie = _RouteTrieNode()
         # Endpoints associated with the routes.
         self.route_info: Dict[str, EndpointTag] = dict()
         # Contains a ServeHandle for each endpoint.
@@ -155,6 +236,34 @@ class LongestPrefixRouter:
     def endpoint_exists(self, endpoint: EndpointTag) -> bool:
         return endpoint in self.handles
 
+    @staticmethod
+    def _build_route_trie(routes: List[str]) -> _RouteTrieNode:
+        root = _RouteTrieNode()
+        for route in routes:
+            if not route.startswith("/"):
+                # Targets always start with '/', so this route can't match.
+                continue
+
+            node = root
+            segments = route[1:].split("/")
+            # A trailing '/' produces an empty last segment. Instead of a
+            # child node, it's recorded as the slash route of its parent.
+            ends_with_slash = segments[-1] == ""
+            if ends_with_slash:
+                segments.pop()
+
+            for segment in segments:
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _RouteTrieNode()
+                node = child
+
+            if ends_with_slash:
+                node.slash_route = route
+            else:
+                node.route = route
+        return root
+
     def update_routes(self, endpoints: Dict[EndpointTag, EndpointInfo]) -> None:
         logger.debug(f"Got updated endpoints: {endpoints}.")
 
@@ -176,6 +285,7 @@ class LongestPrefixRouter:
         # Routes are sorted in order of decreasing length to enable longest
         # prefix matching.
         self.sorted_routes = sorted(routes, key=lambda x: len(x), reverse=True)
+        self._route_trie = self._build_route_trie(self.sorted_routes)
         self.route_info = route_info
 
     def match_route(
@@ -183,6 +293,11 @@ class LongestPrefixRouter:
     ) -> Tuple[Optional[str], Optional[RayServeHandle]]:
         """Return the longest prefix match among existing routes for the route.
 
+        A route matches if the target route starts with it and either the
+        route ends in a '/', the match is exact, or the next character in
+        the target route is a '/'. For example, '/route' matches
+        '/route/suffix' but *not* '/routesuffix'.
+
         Args:
             target_route: route to match against.
 
@@ -190,28 +305,34 @@ class LongestPrefixRouter:
             (matched_route (str), serve_handle (RayServeHandle)) if found,
             else (None, None).
         """
+        if not target_route.startswith("/"):
+            return None, None
+
+        node = self._route_trie
+        # The target always continues past the root, so the root route '/'
+        # matches any target.
+        matched_route = node.slash_route
+
+        segments = target_route[1:].split("/")
+        last_idx = len(segments) - 1
+        for idx, segment in enumerate(segments):
+            node = node.children.get(segment)
+            if node is None:
+                break
+
+            # Routes deeper in the trie are longer, so they take precedence.
+            # A route ending in '/' is longer than the same route without it
+            # but only matches if the target continues past this segment.
+            if idx < last_idx and node.slash_route is not None:
+                matched_route = node.slash_route
+            elif node.route is not None:
+                matched_route = node.route
+
+        if matched_route is None:
+            return None, None
 
-        for route in self.sorted_routes:
-            if target_route.startswith(route):
-                matched = False
-                # If the route we matched on ends in a '/', then so does the
-                # target route and this must be a match.
-                if route.endswith("/"):
-                    matched = True
-                # If the route we matched on doesn't end in a '/', we need to
-                # do another check to ensure that either this is an exact match
-                # or the next character in the target route is a '/'. This is
-                # to guard against the scenario where we have '/route' as a
-                # prefix and there's a request to '/routesuffix'. In this case,
-                # it should *not* be a match.
-                elif len(target_route) == len(route) or target_route[len(route)] == "/":
-                    matched = True
-
-                if matched:
-                    endpoint = self.route_info[route]
-                    return route, self.handles[endpoint]
-
-        return None, None
+        endpoint = self.route_info[matched_route]
+        return matched_route, self.handles[endpoint]
 
 
 class HTTPProxy:
@@ -238,6 +359,7 @@ class HTTPProxy:
                 sync=False,
                 missing_ok=True,
                 _internal_pickled_http_request=True,
+                _internal_http_proxy=True,
             )
 
         self.prefix_router = LongestPrefixRouter(get_handle)
@@ -4,13 +4,15 @@ from dataclasses import dataclass
 import inspect
 import json
 import logging
-from typing import Any, Dict, Type
+from typing import Any, AsyncIterator, Dict, Iterator, List, Tuple, Type, Union
 
 import starlette.responses
 import starlette.requests
+from starlette.concurrency import iterate_in_threadpool
 from starlette.types import Send, ASGIApp
 from fastapi.encoders import jsonable_encoder
 
+from ray.actor import ActorHandle
 from ray.serve.exceptions import RayServeException
 from ray.serve._private.constants import SERVE_LOGGER_NAME
 
@@ -159,6 +161,91 @@ class ASGIHTTPSender(Send):
         return RawASGIResponse(self.messages)
 
 
+@dataclass
+class StreamingResponseHandle:
+    """Returned by a replica in place of a response whose body is streamed.
+
+    The HTTP proxy sends the `http.response.start` message right away and
+    then pulls the body chunks from the replica that produced them by calling
+    `get_response_chunks` until the body is complete.
+    """
+
+    replica_handle: ActorHandle
+    stream_id: str
+    status_code: int
+    raw_headers: List[Tuple[bytes, bytes]]
+
+
+class ResponseChunkBuffer:
+    """Buffers the body chunks of a streamed response in the replica.
+
+    A background task drains the body iterator into a bounded queue, so the
+    user's generator only runs `max_buffered_chunks` chunks ahead of the
+    HTTP proxy. Synchronous iterators are run in a threadpool, as starlette
+    does for its StreamingResponse, to avoid blocking the event loop.
+    """
+
+    _END = object()
+
+    def __init__(
+        self,
+        body_iterator: Union[Iterator, AsyncIterator],
+        max_buffered_chunks: int,
+        charset: str = "utf-8",
+    ):
+        if not hasattr(body_iterator, "__aiter__"):
+            body_iterator = iterate_in_threadpool(body_iterator)
+        self._charset = charset
+        self._error = None
+        self._queue = asyncio.Queue(maxsize=max_buffered_chunks)
+        self._drain_task = asyncio.get_event_loop().create_task(
+            self._drain(body_iterator)
+        )
+
+    def _encode(self, chunk: Union[bytes, str]) -> bytes:
+        if isinstance(chunk, bytes):
+            return chunk
+        elif isinstance(chunk, str):
+            return chunk.encode(self._charset)
+        raise TypeError(
+            f"Streamed response chunks must be bytes or str, got {type(chunk)}."
+        )
+
+    async def _drain(self, body_iterator: AsyncIterator):
+        try:
+            async for chunk in body_iterator:
+                await self._queue.put(self._encode(chunk))
+        except Exception as e:
+            self._error = e
+        await self._queue.put(self._END)
+
+    async def next_chunks(self) -> Tuple[List[bytes], bool]:
+        """Wait for the next chunk and return all chunks buffered so far.
+
+        Returns the chunks and whether the body is complete. If the body
+        iterator raised an exception, it's raised here instead.
+        """
+        chunks = []
+        item = await self._queue.get()
+        while item is not self._END:
+            chunks.append(item)
+            if self._queue.empty():
+                return chunks, False
+            item = self._queue.get_nowait()
+
+        if self._error is not None:
+            raise self._error
+        return chunks, True
+
+    def cancel(self):
+        """Stop the body iterator and wake up a pending `next_chunks` call."""
+        self._drain_task.cancel()
+        self._error = RayServeException("The streamed response was cancelled.")
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(self._END)
+
+
 def make_fastapi_class_based_view(fastapi_app, cls: Type) -> None:
     """Transform the `cls`'s methods and class annotations to FastAPI routes.
 
@@ -1,12 +1,13 @@
 import aiorwlock
 import asyncio
+from dataclasses import dataclass, field
 from importlib import import_module
 import inspect
 import logging
 import os
 import pickle
 import time
-from typing import Any, Callable, Optional, Tuple, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import starlette.responses
 
@@ -26,13 +27,20 @@ from ray.serve._private.constants import (
     DEFAULT_LATENCY_BUCKET_MS,
     SERVE_LOGGER_NAME,
     SERVE_NAMESPACE,
+    STREAMING_RESPONSE_IDLE_TIMEOUT_S,
+    STREAMING_RESPONSE_MAX_BUFFERED_CHUNKS,
 )
 from ray.serve.deployment import Deployment
 from ray.serve.exceptions import RayServeException
-from ray.serve._private.http_util import ASGIHTTPSender
+from ray.serve._private.http_util import (
+    ASGIHTTPSender,
+    ResponseChunkBuffer,
+    StreamingResponseHandle,
+)
 from ray.serve._private.logging_utils import access_log_msg, configure_component_logger
 from ray.serve._private.router import Query, RequestMetadata
 from ray.serve._private.utils import (
+    get_random_letters,
     parse_import_path,
     parse_request_item,
     wrap_to_ray_error,
@@ -47,6 +55,19 @@ def _format_replica_actor_name(deployment_name: str):
     return f"ServeReplica:{deployment_name}"
 
 
+@dataclass
+class _ResponseStream:
+    """A streamed HTTP response whose request is still ongoing."""
+
+    buffer: ResponseChunkBuffer
+    start_time: float
+    route: str = ""
+    # Set when the stream is closed, i.e. the body was sent, failed, was
+    # cancelled, or timed out.
+    closed: asyncio.Event = field(default_factory=asyncio.Event)
+    idle_timer: Optional[asyncio.TimerHandle] = None
+
+
 def create_replica_wrapper(name: str):
     """Creates a replica class wrapping the provided function or class.
 
@@ -202,6 +223,15 @@ def create_replica_wrapper(name: str):
             query = Query(request_args, request_kwargs, request_metadata, return_num=1)
             return await self.replica.handle_request(query)
 
+        async def get_response_chunks(self, stream_id: str) -> Tuple[List[bytes], bool]:
+            return await self.replica.get_response_chunks(stream_id)
+
+        def cancel_response_stream(self, stream_id: str):
+            self.replica.cancel_response_stream(stream_id)
+
+        async def wait_for_response_stream(self, stream_id: str):
+            await self.replica.wait_for_response_stream(stream_id)
+
         async def is_allocated(self) -> str:
             """poke the replica to check whether it's alive.
 
@@ -280,6 +310,11 @@ class RayServeReplica:
 
         self.num_ongoing_requests = 0
 
+        # Streamed HTTP responses whose body hasn't been fully pulled by the
+        # HTTP proxy yet, keyed by stream ID. Their requests are ongoing until
+        # then.
+        self._response_streams: Dict[str, _ResponseStream] = {}
+
         self.request_counter = metrics.Counter(
             "serve_deployment_request_counter",
             description=(
@@ -377,9 +412,9 @@ class RayServeReplica:
     def _collect_autoscaling_metrics(self):
         method_stat = self._get_handle_request_stats()
 
-        num_inflight_requests = 0
+        num_inflight_requests = len(self._response_streams)
         if method_stat is not None:
-            num_inflight_requests = method_stat["pending"] + method_stat["running"]
+            num_inflight_requests += method_stat["pending"] + method_stat["running"]
 
         return {self.replica_tag: num_inflight_requests}
 
@@ -405,8 +440,138 @@ class RayServeReplica:
             return self.callable
         return getattr(self.callable, method_name)
 
-    async def ensure_serializable_response(self, response: Any) -> Any:
-        if isinstance(response, starlette.responses.StreamingResponse):
+    def _start_response_stream(
+        self,
+        body_iterator,
+        status_code: int,
+        raw_headers: List[Tuple[bytes, bytes]],
+        charset: str = "utf-8",
+    ) -> StreamingResponseHandle:
+        stream_id = get_random_letters(16)
+        self._response_streams[stream_id] = _ResponseStream(
+            ResponseChunkBuffer(
+                body_iterator, STREAMING_RESPONSE_MAX_BUFFERED_CHUNKS, charset=charset
+            ),
+            start_time=time.time(),
+        )
+        self._reset_response_stream_timer(stream_id)
+        return StreamingResponseHandle(
+            ray.get_runtime_context().current_actor,
+            stream_id,
+            status_code=status_code,
+            raw_headers=raw_headers,
+        )
+
+    async def get_response_chunks(self, stream_id: str) -> Tuple[List[bytes], bool]:
+        """Return the next chunks of a streamed response body.
+
+        Waits until at least one chunk is available. Returns the chunks and
+        whether the body is complete.
+        """
+        stream = self._response_streams.get(stream_id)
+        if stream is None:
+            raise RayServeException(f"Response stream '{stream_id}' doesn't exist.")
+
+        # The stream isn't idle while the HTTP proxy waits for chunks.
+        if stream.idle_timer is not None:
+            stream.idle_timer.cancel()
+        try:
+            chunks, finished = await stream.buffer.next_chunks()
+        except Exception as e:
+            if stream_id in self._response_streams:
+                logger.exception(f"Response stream failed due to {type(e).__name__}:")
+                self._close_response_stream(stream_id, "ERROR")
+            raise
+
+        if finished:
+            self._close_response_stream(stream_id, "OK")
+        else:
+            self._reset_response_stream_timer(stream_id)
+        return chunks, finished
+
+    def cancel_response_stream(self, stream_id: str):
+        self._close_response_stream(stream_id, "CANCELLED")
+
+    async def wait_for_response_stream(self, stream_id: str):
+        """Wait until a streamed response is closed.
+
+        Routers call this to hold the replica's slot for the request until its
+        body has been streamed.
+        """
+        stream = self._response_streams.get(stream_id)
+        if stream is not None:
+            await stream.closed.wait()
+
+    def _reset_response_stream_timer(self, stream_id: str):
+        stream = self._response_streams.get(stream_id)
+        if stream is None:
+            return
+        if stream.idle_timer is not None:
+            stream.idle_timer.cancel()
+        stream.idle_timer = asyncio.get_event_loop().call_later(
+            STREAMING_RESPONSE_IDLE_TIMEOUT_S, self._on_response_stream_idle, stream_id
+        )
+
+    def _on_response_stream_idle(self, stream_id: str):
+        logger.warning(
+            f"Closing response stream '{stream_id}' because no chunks were "
+            f"requested from it for {STREAMING_RESPONSE_IDLE_TIMEOUT_S}s."
+        )
+        self._close_response_stream(stream_id, "ERROR")
+
+    def _close_response_stream(self, stream_id: str, status: str):
+        """Stop a streamed response and record its request as finished."""
+        stream = self._response_streams.pop(stream_id, None)
+        if stream is None:
+            return
+        stream.buffer.cancel()
+        if stream.idle_timer is not None:
+            stream.idle_timer.cancel()
+        if status == "OK":
+            self.request_counter.inc()
+        elif status == "ERROR":
+            self.error_counter.inc()
+        self._record_request_finished(stream.route, status, stream.start_time)
+        stream.closed.set()
+
+    def _record_request_finished(self, route: str, status: str, start_time: float):
+        latency_ms = (time.time() - start_time) * 1000
+        self.processing_latency_tracker.observe(latency_ms)
+        logger.info(
+            access_log_msg(
+                method="HANDLE",
+                route=route,
+                status=status,
+                latency_ms=latency_ms,
+            )
+        )
+
+    async def ensure_serializable_response(
+        self, response: Any, stream: bool = False
+    ) -> Any:
+        """Convert the user's response into something the caller can receive.
+
+        Generators and starlette StreamingResponses can't be pickled. If
+        `stream` is set (the request came from the HTTP proxy), their body is
+        streamed to the proxy chunk by chunk. Otherwise, it's materialized.
+        """
+        is_generator = inspect.isgenerator(response) or inspect.isasyncgen(response)
+        if stream and isinstance(response, starlette.responses.StreamingResponse):
+            return self._start_response_stream(
+                response.body_iterator,
+                response.status_code,
+                response.raw_headers,
+                charset=response.charset,
+            )
+        elif stream and is_generator:
+            return self._start_response_stream(
+                response, 200, [(b"content-type", b"text/plain; charset=utf-8")]
+            )
+        elif inspect.isgenerator(response):
+            return list(response)
+        elif inspect.isasyncgen(response):
+            return [chunk async for chunk in response]
+        elif isinstance(response, starlette.responses.StreamingResponse):
 
             async def mock_receive():
                 # This is called in a tight loop in response() just to check
@@ -455,8 +620,12 @@ class RayServeReplica:
                     # call with non-empty args
                     result = await method_to_call(*args, **kwargs)
 
-            result = await self.ensure_serializable_response(result)
-            self.request_counter.inc()
+            result = await self.ensure_serializable_response(
+                result, stream=request_item.metadata.is_http_proxy_request
+            )
+            if not isinstance(result, StreamingResponseHandle):
+                # Streamed responses are counted once their body is sent.
+                self.request_counter.inc()
         except Exception as e:
             logger.exception(f"Request failed due to {type(e).__name__}:")
             success = False
@@ -494,27 +663,34 @@ class RayServeReplica:
     async def handle_request(self, request: Query) -> asyncio.Future:
         async with self.rwlock.reader_lock:
             num_running_requests = self._get_handle_request_stats()["running"]
-            self.num_processing_items.set(num_running_requests)
+            self.num_processing_items.set(
+                num_running_requests + len(self._response_streams)
+            )
 
             start_time = time.time()
             result, success = await self.invoke_single(request)
-            latency_ms = (time.time() - start_time) * 1000
 
-            self.processing_latency_tracker.observe(latency_ms)
-
-            logger.info(
-                access_log_msg(
-                    method="HANDLE",
-                    route=request.metadata.call_method,
-                    status="OK" if success else "ERROR",
-                    latency_ms=latency_ms,
+            if isinstance(result, StreamingResponseHandle):
+                # The request is finished once its body has been streamed.
+                stream = self._response_streams[result.stream_id]
+                stream.start_time = start_time
+                stream.route = request.metadata.call_method
+                tracker = result
+            else:
+                self._record_request_finished(
+                    request.metadata.call_method,
+                    "OK" if success else "ERROR",
+                    start_time,
                 )
-            )
+                tracker = b""
+
             if request.return_num == 1:
                 return result
             else:
                 # Returns a small object for router to track request status.
-                return b"", result
+                # For streamed responses, it's the stream, which the router
+                # tracks until the body has been sent.
+                return tracker, result
 
     async def prepare_for_shutdown(self):
         """Perform graceful shutdown.
@@ -530,8 +706,14 @@ class RayServeReplica:
             # The handle_request method wasn't even invoked.
             if method_stat is None:
                 break
-            # The handle_request method has 0 inflight requests.
-            if method_stat["running"] + method_stat["pending"] == 0:
+            # The handle_request method has 0 inflight requests and all
+            # streamed responses have been sent.
+            self.num_ongoing_requests = (
+                method_stat["running"]
+                + method_stat["pending"]
+                + len(self._response_streams)
+            )
+            if self.num_ongoing_requests == 0:
                 break
             else:
                 logger.info(
@@ -0,0 +1,113 @@
+from abc import ABC, abstractmethod
+import itertools
+import random
+from typing import Callable, Iterator, List
+
+from ray.serve._private.common import RunningReplicaInfo
+from ray.serve._private.constants import ReplicaSelectionPolicyType
+
+
+class ReplicaSelectionPolicy(ABC):
+    """Decides the order in which the router tries replicas for a query.
+
+    The router calls `update_replicas` whenever the replica membership
+    changes and `choose_replicas` for every query it tries to assign. The
+    router walks the candidates in the returned order and sends the query to
+    the first one that is below its `max_concurrent_queries` limit.
+    """
+
+    def __init__(self):
+        self._replicas: List[RunningReplicaInfo] = []
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]):
+        """Called by the router after the set of running replicas changed."""
+        self._replicas = list(replicas)
+
+    @abstractmethod
+    def choose_replicas(
+        self, num_in_flight: Callable[[RunningReplicaInfo], int]
+    ) -> Iterator[RunningReplicaInfo]:
+        """Return candidate replicas in the order they should be tried.
+
+        Args:
+            num_in_flight: Returns the number of queries this router has
+                assigned to the given replica that haven't completed yet.
+
+        Returns:
+            An iterator over replicas. It should yield each replica at most
+            once.
+        """
+        raise NotImplementedError
+
+
+class RoundRobinPolicy(ReplicaSelectionPolicy):
+    """Cycle through replicas in a fixed, randomly shuffled order."""
+
+    def __init__(self):
+        super().__init__()
+        self._replica_iterator = itertools.cycle(self._replicas)
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]):
+        # Shuffle the replicas randomly to avoid multiple handles sending
+        # requests in the same order.
+        super().update_replicas(replicas)
+        random.shuffle(self._replicas)
+        self._replica_iterator = itertools.cycle(self._replicas)
+
+    def choose_replicas(
+        self, num_in_flight: Callable[[RunningReplicaInfo], int]
+    ) -> Iterator[RunningReplicaInfo]:
+        for _ in range(len(self._replicas)):
+            yield next(self._replica_iterator)
+
+
+class PowerOfTwoChoicesPolicy(ReplicaSelectionPolicy):
+    """Sample two replicas at random and prefer the less loaded one.
+
+    If both sampled replicas are at capacity, the remaining replicas are
+    tried from least to most loaded so a query is only queued when every
+    replica is full.
+    """
+
+    def choose_replicas(
+        self, num_in_flight: Callable[[RunningReplicaInfo], int]
+    ) -> Iterator[RunningReplicaInfo]:
+        if len(self._replicas) <= 2:
+            yield from sorted(self._replicas, key=num_in_flight)
+            return
+
+        chosen = random.sample(self._replicas, 2)
+        yield from sorted(chosen, key=num_in_flight)
+
+        remaining = [replica for replica in self._replicas if replica not in chosen]
+        yield from sorted(remaining, key=num_in_flight)
+
+
+class LeastInFlightPolicy(ReplicaSelectionPolicy):
+    """Try replicas from least to most in-flight queries.
+
+    Ties are broken randomly so that concurrent handles don't all pile onto
+    the same idle replica.
+    """
+
+    def choose_replicas(
+        self, num_in_flight: Callable[[RunningReplicaInfo], int]
+    ) -> Iterator[RunningReplicaInfo]:
+        replicas = list(self._replicas)
+        random.shuffle(replicas)
+        yield from sorted(replicas, key=num_in_flight)
+
+
+def create_replica_selection_policy(policy: str) -> ReplicaSelectionPolicy:
+    """Instantiate the replica selection policy with the given name."""
+    if policy == ReplicaSelectionPolicyType.ROUND_ROBIN:
+        return RoundRobinPolicy()
+    elif policy == ReplicaSelectionPolicyType.POWER_OF_TWO_CHOICES:
+        return PowerOfTwoChoicesPolicy()
+    elif policy == ReplicaSelectionPolicyType.LEAST_IN_FLIGHT:
+        return LeastInFlightPolicy()
+    else:
+        raise ValueError(
+            f"Unknown replica selection policy '{policy}'. Valid policies are "
+            f"{[p.value for p in ReplicaSelectionPolicyType]}."
+        )
@@ -1,11 +1,10 @@
 import asyncio
+from collections import deque
 from dataclasses import dataclass
-import itertools
+import functools
 import logging
 import pickle
-import random
-import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 
 import ray
 from ray.actor import ActorHandle
@@ -14,8 +13,13 @@ from ray.exceptions import RayActorError, RayTaskError
 from ray.util import metrics
 
 from ray.serve._private.common import RunningReplicaInfo
-from ray.serve._private.constants import SERVE_LOGGER_NAME
+from ray.serve._private.constants import (
+    DEFAULT_REPLICA_SELECTION_POLICY,
+    SERVE_LOGGER_NAME,
+)
+from ray.serve._private.http_util import StreamingResponseHandle
 from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
+from ray.serve._private.replica_selection import create_replica_selection_policy
 from ray.serve._private.utils import (
     compute_iterable_delta,
     JavaActorHandleProxy,
@@ -37,6 +41,10 @@ class RequestMetadata:
     # and it needs to be deserialized by the replica.
     http_arg_is_pickled: bool = False
 
+    # This flag will be set to true only for requests sent by the HTTP proxy,
+    # which streams generator responses to the client.
+    is_http_proxy_request: bool = False
+
 
 @dataclass
 class Query:
@@ -68,25 +76,23 @@ class ReplicaSet:
         event_loop: asyncio.AbstractEventLoop,
     ):
         self.deployment_name = deployment_name
-        self.in_flight_queries: Dict[RunningReplicaInfo, set] = dict()
-        # The iterator used for load balancing among replicas. Using itertools
-        # cycle, we implements a round-robin policy, skipping overloaded
-        # replicas.
-        # NOTE(simon): We can make this more pluggable and consider different
-        # policies like: min load, pick min of two replicas, pick replicas on
-        # the same node.
-        self.replica_iterator = itertools.cycle(self.in_flight_queries.keys())
-
-        # Used to unblock this replica set waiting for free replicas. A newly
-        # added replica or updated max_concurrent_queries value means the
-        # query that waits on a free replica might be unblocked on.
-
-        # Python 3.8 has deprecated the 'loop' parameter, and Python 3.10 has
-        # removed it alltogether. Call accordingly.
-        if sys.version_info.major >= 3 and sys.version_info.minor >= 10:
-            self.config_updated_event = asyncio.Event()
-        else:
-            self.config_updated_event = asyncio.Event(loop=event_loop)
+        # Number of queries assigned to each replica that haven't completed
+        # yet. Counters are decremented by completion callbacks attached to
+        # the object refs of the queries, so we never need to poll them.
+        self.in_flight_queries: Dict[RunningReplicaInfo, int] = dict()
+        # The policy used for load balancing among replicas. It is updated
+        # to the deployment's configured policy once replicas are received
+        # from the controller.
+        self.replica_selection_policy_name = DEFAULT_REPLICA_SELECTION_POLICY
+        self.replica_selection_policy = create_replica_selection_policy(
+            self.replica_selection_policy_name
+        )
+
+        # Queries waiting for a free replica, in FIFO order. A completed
+        # query frees one slot, so it wakes up exactly one waiter. A newly
+        # added replica or updated max_concurrent_queries value may free
+        # many slots, so it wakes up all of them.
+        self._pending_waiters: Deque[asyncio.Future] = deque()
 
         self.num_queued_queries = 0
         self.num_queued_queries_gauge = metrics.Gauge(
@@ -101,16 +107,32 @@ class ReplicaSet:
             {"deployment": self.deployment_name}
         )
 
-    def _reset_replica_iterator(self):
-        """Reset the iterator used to load balance replicas.
+    def _reset_replica_selection_policy(self):
+        """Reset the policy used to load balance replicas.
 
         This call is expected to be called after the replica membership has
-        been updated. It will shuffle the replicas randomly to avoid multiple
-        handle sending requests in the same order.
+        been updated.
         """
-        replicas = list(self.in_flight_queries.keys())
-        random.shuffle(replicas)
-        self.replica_iterator = itertools.cycle(replicas)
+        self.replica_selection_policy.update_replicas(
+            list(self.in_flight_queries.keys())
+        )
+
+    def _num_in_flight(self, replica: RunningReplicaInfo) -> int:
+        return self.in_flight_queries[replica]
+
+    def _wake_up_one_waiter(self):
+        while len(self._pending_waiters) > 0:
+            waiter = self._pending_waiters.popleft()
+            # Skip waiters whose query was cancelled while waiting.
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def _wake_up_all_waiters(self):
+        while len(self._pending_waiters) > 0:
+            waiter = self._pending_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
 
     def update_running_replicas(self, running_replicas: List[RunningReplicaInfo]):
         added, removed, _ = compute_iterable_delta(
@@ -118,7 +140,7 @@ class ReplicaSet:
         )
 
         for new_replica in added:
-            self.in_flight_queries[new_replica] = set()
+            self.in_flight_queries[new_replica] = 0
 
         for removed_replica in removed:
             # Delete it directly because shutdown is processed by controller.
@@ -126,18 +148,83 @@ class ReplicaSet:
             # actor error.
             self.in_flight_queries.pop(removed_replica, None)
 
-        if len(added) > 0 or len(removed) > 0:
+        # All replicas of a deployment share the same deployment config, so
+        # any of them tells us which policy the deployment is configured with.
+        policy_changed = False
+        if len(running_replicas) > 0:
+            policy_name = running_replicas[0].replica_selection_policy
+            if policy_name != self.replica_selection_policy_name:
+                self.replica_selection_policy_name = policy_name
+                self.replica_selection_policy = create_replica_selection_policy(
+                    policy_name
+                )
+                policy_changed = True
+
+        if len(added) > 0 or len(removed) > 0 or policy_changed:
             logger.debug(f"ReplicaSet: +{len(added)}, -{len(removed)} replicas.")
-            self._reset_replica_iterator()
-            self.config_updated_event.set()
+            self._reset_replica_selection_policy()
+            self._wake_up_all_waiters()
+
+    def _on_query_completed(
+        self, replica: RunningReplicaInfo, completion: asyncio.Future
+    ):
+        """Callback run in the event loop when a query's object ref is ready."""
+        if replica not in self.in_flight_queries:
+            # The replica was removed while the query was in flight, so it
+            # doesn't hold a slot anymore.
+            return
+
+        # NOTE: the result is already available here, so retrieving the
+        # exception doesn't block.
+        error = None if completion.cancelled() else completion.exception()
+        if isinstance(error, RayActorError):
+            logger.debug(
+                f"Removing {replica.replica_tag} from replica set "
+                "because the actor exited."
+            )
+            self.in_flight_queries.pop(replica, None)
+            self._reset_replica_selection_policy()
+        else:
+            # Application errors (RayTaskError) are ignored.
+            if error is not None and not isinstance(error, RayTaskError):
+                logger.error(
+                    "Handle received unexpected error when processing request: "
+                    f"{error!r}"
+                )
+            elif error is None and not completion.cancelled():
+                stream = completion.result()
+                if isinstance(stream, StreamingResponseHandle):
+                    # The query keeps its slot until the replica has sent the
+                    # body of its streamed response.
+                    self._add_completion_callback(
+                        replica,
+                        stream.replica_handle.wait_for_response_stream.remote(
+                            stream.stream_id
+                        ),
+                    )
+                    return
+            self.in_flight_queries[replica] -= 1
+
+        self._wake_up_one_waiter()
+
+    def _track_query(self, replica: RunningReplicaInfo, ref: ray.ObjectRef):
+        self.in_flight_queries[replica] += 1
+        self._add_completion_callback(replica, ref)
+
+    def _add_completion_callback(self, replica: RunningReplicaInfo, ref: ray.ObjectRef):
+        completion = asyncio.wrap_future(ref.future())
+        completion.add_done_callback(
+            functools.partial(self._on_query_completed, replica)
+        )
 
     def _try_assign_replica(self, query: Query) -> Optional[ray.ObjectRef]:
         """Try to assign query to a replica, return the object ref if succeeded
         or return None if it can't assign this query to any replicas.
         """
-        for _ in range(len(self.in_flight_queries.keys())):
-            replica = next(self.replica_iterator)
-            if len(self.in_flight_queries[replica]) >= replica.max_concurrent_queries:
+        for replica in self.replica_selection_policy.choose_replicas(
+            self._num_in_flight
+        ):
+            if self._num_in_flight(replica) >= replica.max_concurrent_queries:
                 # This replica is overloaded, try next one
                 continue
 
@@ -168,56 +255,16 @@ class ReplicaSet:
                     ).SerializeToString(),
                     [arg],
                 )
-                self.in_flight_queries[replica].add(user_ref)
+                self._track_query(replica, user_ref)
             else:
                 # Directly passing args because it might contain an ObjectRef.
                 tracker_ref, user_ref = replica.actor_handle.handle_request.remote(
                     pickle.dumps(query.metadata), *query.args, **query.kwargs
                 )
-                self.in_flight_queries[replica].add(tracker_ref)
+                self._track_query(replica, tracker_ref)
             return user_ref
         return None
 
-    @property
-    def _all_query_refs(self):
-        return list(itertools.chain.from_iterable(self.in_flight_queries.values()))
-
-    def _drain_completed_object_refs(self) -> int:
-        refs = self._all_query_refs
-        # NOTE(simon): even though the timeout is 0, a large number of refs can still
-        # cause some blocking delay in the event loop. Consider moving this to async?
-        done, _ = ray.wait(refs, num_returns=len(refs), timeout=0)
-        replicas_to_remove = []
-        for replica_info, replica_in_flight_queries in self.in_flight_queries.items():
-            completed_queries = replica_in_flight_queries.intersection(done)
-            if len(completed_queries):
-                try:
-                    # NOTE(simon): this ray.get call should be cheap because all these
-                    # refs are ready as indicated by previous `ray.wait` call.
-                    ray.get(list(completed_queries))
-                except RayActorError:
-                    logger.debug(
-                        f"Removing {replica_info.replica_tag} from replica set "
-                        "because the actor exited."
-                    )
-                    replicas_to_remove.append(replica_info)
-                except RayTaskError:
-                    # Ignore application error.
-                    pass
-                except Exception:
-                    logger.exception(
-                        "Handle received unexpected error when processing request."
-                    )
-
-                replica_in_flight_queries.difference_update(completed_queries)
-
-        if len(replicas_to_remove) > 0:
-            for replica_info in replicas_to_remove:
-                self.in_flight_queries.pop(replica_info, None)
-            self._reset_replica_iterator()
-
-        return len(done)
-
     async def assign_replica(self, query: Query) -> ray.ObjectRef:
         """Given a query, submit it to a replica and return the object ref.
         This method will keep track of the in flight queries for each replicas
@@ -231,24 +278,29 @@ class ReplicaSet:
         )
         await query.resolve_async_tasks()
         assigned_ref = self._try_assign_replica(query)
+        num_retries = 0
         while assigned_ref is None:  # Can't assign a replica right now.
             logger.debug(
                 "Failed to assign a replica for " f"query {query.metadata.request_id}"
             )
-            # Maybe there exists a free replica, we just need to refresh our
-            # query tracker.
-            num_finished = self._drain_completed_object_refs()
             # All replicas are really busy, wait for a query to complete or the
-            # config to be updated.
-            if num_finished == 0:
-                logger.debug("All replicas are busy, waiting for a free replica.")
-                await asyncio.wait(
-                    self._all_query_refs + [self.config_updated_event.wait()],
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-                if self.config_updated_event.is_set():
-                    self.config_updated_event.clear()
-            # We are pretty sure a free replica is ready now, let's recurse and
+            # replicas to be updated. A query that was woken up but lost the
+            # free slot to a new query keeps its place at the head of the line.
+            waiter = asyncio.get_event_loop().create_future()
+            if num_retries == 0:
+                self._pending_waiters.append(waiter)
+            else:
+                self._pending_waiters.appendleft(waiter)
+            num_retries += 1
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass on the wake up we might have consumed to the next
+                # waiter so a freed slot is never lost.
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_up_one_waiter()
+                raise
+            # We are pretty sure a free replica is ready now, let's retry and
             # assign this query a replica.
             assigned_ref = self._try_assign_replica(query)
         self.num_queued_queries -= 1
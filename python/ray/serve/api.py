@@ -263,6 +263,7 @@ def deployment(
     ray_actor_options: Default[Dict] = DEFAULT.VALUE,
     user_config: Default[Any] = DEFAULT.VALUE,
     max_concurrent_queries: Default[int] = DEFAULT.VALUE,
+    replica_selection_policy: Default[str] = DEFAULT.VALUE,
     autoscaling_config: Default[Union[Dict, AutoscalingConfig]] = DEFAULT.VALUE,
     graceful_shutdown_wait_loop_s: Default[float] = DEFAULT.VALUE,
     graceful_shutdown_timeout_s: Default[float] = DEFAULT.VALUE,
@@ -285,6 +286,7 @@ def deployment(
     ray_actor_options: Default[Dict] = DEFAULT.VALUE,
     user_config: Default[Optional[Any]] = DEFAULT.VALUE,
     max_concurrent_queries: Default[int] = DEFAULT.VALUE,
+    replica_selection_policy: Default[str] = DEFAULT.VALUE,
     autoscaling_config: Default[Union[Dict, AutoscalingConfig, None]] = DEFAULT.VALUE,
     graceful_shutdown_wait_loop_s: Default[float] = DEFAULT.VALUE,
     graceful_shutdown_timeout_s: Default[float] = DEFAULT.VALUE,
@@ -333,6 +335,11 @@ def deployment(
         max_concurrent_queries (Default[int]): The maximum number of queries
             that will be sent to a replica of this deployment without receiving
             a response. Defaults to 100.
+        replica_selection_policy (Default[str]): The policy handles use to
+            pick a replica for each query. "round_robin" cycles through the
+            replicas, "power_of_two_choices" picks the less loaded of two
+            random replicas, and "least_in_flight" picks the replica with the
+            fewest in-flight queries. Defaults to "round_robin".
         is_driver_deployment (Optional[bool]): [Experiment] when set it as True, serve
             will deploy exact one deployment to every node.
 
@@ -387,6 +394,7 @@ def deployment(
         num_replicas=num_replicas if num_replicas is not None else 1,
         user_config=user_config,
         max_concurrent_queries=max_concurrent_queries,
+        replica_selection_policy=replica_selection_policy,
         autoscaling_config=autoscaling_config,
         graceful_shutdown_wait_loop_s=graceful_shutdown_wait_loop_s,
         graceful_shutdown_timeout_s=graceful_shutdown_timeout_s,
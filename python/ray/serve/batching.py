@@ -7,7 +7,9 @@ from dataclasses import dataclass
 
 
 from ray._private.signature import extract_signature, flatten_args, recover_args
+from ray.serve.context import get_internal_replica_context
 from ray.serve.exceptions import RayServeException
+from ray.util import metrics
 from ray.util.annotations import PublicAPI
 
 
@@ -43,12 +45,113 @@ def _batch_args_kwargs(
     return recover_args(batched_flattened_args)
 
 
+class _AdaptiveBatchTuner:
+    """Tunes the batch size and wait timeout of a _BatchQueue online.
+
+    Tracks the request arrival rate and a linear model of the handler's
+    execution time, t(b) = fixed_s + per_item_s * b, as exponentially
+    weighted moving averages. The batch size is the largest one whose
+    expected latency (the time to fill the batch plus the time to execute
+    it) fits in target_latency_s, and the wait timeout is the part of the
+    latency budget that's left after executing a batch of that size. Both
+    are capped by the configured max_batch_size and batch_wait_timeout_s.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int,
+        max_timeout_s: float,
+        target_latency_s: float,
+        smoothing_factor: float = 0.2,
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_timeout_s = max_timeout_s
+        self.target_latency_s = target_latency_s
+        self.smoothing_factor = smoothing_factor
+
+        self.batch_size = max_batch_size
+        self.timeout_s = min(max_timeout_s, target_latency_s)
+
+        self._last_arrival_time: Optional[float] = None
+        # Moving average of the time between two requests.
+        self._arrival_gap_s: Optional[float] = None
+
+        # Exponentially decayed sums used to fit the execution time model
+        # with least squares: weight, batch size, duration, batch size^2,
+        # and batch size * duration.
+        self._sum_w = 0.0
+        self._sum_b = 0.0
+        self._sum_t = 0.0
+        self._sum_bb = 0.0
+        self._sum_bt = 0.0
+
+    def on_request_arrival(self, now: float):
+        if self._last_arrival_time is not None:
+            gap = max(0.0, now - self._last_arrival_time)
+            if self._arrival_gap_s is None:
+                self._arrival_gap_s = gap
+            else:
+                self._arrival_gap_s += self.smoothing_factor * (
+                    gap - self._arrival_gap_s
+                )
+        self._last_arrival_time = now
+
+    def on_batch_executed(self, batch_size: int, duration_s: float):
+        decay = 1 - self.smoothing_factor
+        self._sum_w = decay * self._sum_w + 1
+        self._sum_b = decay * self._sum_b + batch_size
+        self._sum_t = decay * self._sum_t + duration_s
+        self._sum_bb = decay * self._sum_bb + batch_size * batch_size
+        self._sum_bt = decay * self._sum_bt + batch_size * duration_s
+        self._update()
+
+    def execution_time_model(self) -> Tuple[float, float]:
+        """Returns the (fixed_s, per_item_s) estimate of the handler."""
+        if self._sum_w == 0:
+            return 0.0, 0.0
+
+        denominator = self._sum_w * self._sum_bb - self._sum_b * self._sum_b
+        if denominator > 1e-9 * self._sum_w * self._sum_bb:
+            per_item_s = (
+                self._sum_w * self._sum_bt - self._sum_b * self._sum_t
+            ) / denominator
+        else:
+            # All recent batches had the same size, so we can't tell the
+            # fixed cost apart. Assume the cost is proportional to the size,
+            # which errs on the side of smaller batches.
+            per_item_s = self._sum_t / self._sum_b
+        per_item_s = max(0.0, per_item_s)
+        fixed_s = max(0.0, (self._sum_t - per_item_s * self._sum_b) / self._sum_w)
+        return fixed_s, per_item_s
+
+    def _update(self):
+        fixed_s, per_item_s = self.execution_time_model()
+
+        if self._arrival_gap_s is None:
+            batch_size = self.max_batch_size
+        else:
+            # Solve (b - 1) * gap + fixed_s + per_item_s * b <= target for b.
+            per_item_latency_s = self._arrival_gap_s + per_item_s
+            budget_s = self.target_latency_s - fixed_s + self._arrival_gap_s
+            if per_item_latency_s <= 0:
+                batch_size = self.max_batch_size
+            else:
+                batch_size = int(budget_s / per_item_latency_s)
+        self.batch_size = max(1, min(self.max_batch_size, batch_size))
+
+        execution_time_s = fixed_s + per_item_s * self.batch_size
+        self.timeout_s = max(
+            0.0, min(self.max_timeout_s, self.target_latency_s - execution_time_s)
+        )
+
+
 class _BatchQueue:
     def __init__(
         self,
         max_batch_size: int,
         timeout_s: float,
         handle_batch_func: Optional[Callable] = None,
+        target_latency_s: Optional[float] = None,
     ) -> None:
         """Async queue that accepts individual items and returns batches.
 
@@ -59,29 +162,83 @@ class _BatchQueue:
         If handle_batch_func is passed in, a background coroutine will run to
         poll from the queue and call handle_batch_func on the results.
 
+        If target_latency_s is passed in, the batch size and timeout used to
+        wait for a batch are tuned online to meet the latency target, with
+        max_batch_size and timeout_s as upper bounds. The chosen values are
+        exported as metrics.
+
         Arguments:
             max_batch_size: max number of elements to return in a batch.
             timeout_s: time to wait before returning an incomplete
                 batch.
             handle_batch_func(Optional[Callable]): callback to run in the
                 background to handle batches if provided.
+            target_latency_s(Optional[float]): latency target to tune
+                the batch size and timeout for if provided.
         """
         self.queue: asyncio.Queue[_SingleRequest] = asyncio.Queue()
         self.full_batch_event = asyncio.Event()
         self.max_batch_size = max_batch_size
         self.timeout_s = timeout_s
 
+        # The batch size and timeout currently used to wait for a batch.
+        # They are only different from the configured ones in adaptive mode.
+        self.effective_batch_size = max_batch_size
+        self.effective_timeout_s = timeout_s
+        self._tuner: Optional[_AdaptiveBatchTuner] = None
+        if target_latency_s is not None:
+            self._tuner = _AdaptiveBatchTuner(
+                max_batch_size, timeout_s, target_latency_s
+            )
+            self._init_adaptive_metrics(handle_batch_func)
+            self._update_effective_params()
+
         self._handle_batch_task = None
         if handle_batch_func is not None:
             self._handle_batch_task = asyncio.get_event_loop().create_task(
                 self._handle_batches(handle_batch_func)
             )
 
+    def _init_adaptive_metrics(self, handle_batch_func: Optional[Callable]):
+        tags = {
+            "function": getattr(handle_batch_func, "__qualname__", ""),
+            "deployment": "",
+            "replica": "",
+        }
+        replica_context = get_internal_replica_context()
+        if replica_context is not None:
+            tags["deployment"] = replica_context.deployment
+            tags["replica"] = replica_context.replica_tag
+
+        self.batch_size_gauge = metrics.Gauge(
+            "serve_batch_adaptive_batch_size",
+            description=(
+                "The batch size currently chosen by @serve.batch in adaptive mode."
+            ),
+            tag_keys=("function", "deployment", "replica"),
+        ).set_default_tags(tags)
+        self.timeout_gauge = metrics.Gauge(
+            "serve_batch_adaptive_wait_timeout_s",
+            description=(
+                "The batch wait timeout currently chosen by @serve.batch in "
+                "adaptive mode."
+            ),
+            tag_keys=("function", "deployment", "replica"),
+        ).set_default_tags(tags)
+
+    def _update_effective_params(self):
+        self.effective_batch_size = self._tuner.batch_size
+        self.effective_timeout_s = self._tuner.timeout_s
+        self.batch_size_gauge.set(self.effective_batch_size)
+        self.timeout_gauge.set(self.effective_timeout_s)
+
     def put(self, request: Tuple[_SingleRequest, asyncio.Future]) -> None:
+        if self._tuner is not None:
+            self._tuner.on_request_arrival(time.time())
         self.queue.put_nowait(request)
         # Signal when the full batch is ready. The event will be reset
         # in wait_for_batch.
-        if self.queue.qsize() == self.max_batch_size:
+        if self.queue.qsize() >= self.effective_batch_size:
             self.full_batch_event.set()
 
     async def wait_for_batch(self) -> List[Any]:
@@ -91,10 +248,14 @@ class _BatchQueue:
         to self.timeout_s for a full batch. After the timeout, returns as many
         items as are ready.
 
+        In adaptive mode, waits for up to self.effective_timeout_s for
+        self.effective_batch_size items instead. Items that are already
+        queued are still pulled up to self.max_batch_size.
+
         Always returns a batch with at least one item - will block
         indefinitely until an item comes in.
         """
-        curr_timeout = self.timeout_s
+        curr_timeout = self.effective_timeout_s
         batch = []
         while len(batch) == 0:
             loop_start = time.time()
@@ -115,10 +276,10 @@ class _BatchQueue:
             while len(batch) < self.max_batch_size and not self.queue.empty():
                 batch.append(self.queue.get_nowait())
 
-            # Reset the event if there are fewer than max_batch_size requests
+            # Reset the event if there are fewer than a full batch of requests
             # in the queue.
             if (
-                self.queue.qsize() < self.max_batch_size
+                self.queue.qsize() < self.effective_batch_size
                 and self.full_batch_event.is_set()
             ):
                 self.full_batch_event.clear()
@@ -137,6 +298,7 @@ class _BatchQueue:
             futures = [item.future for item in batch]
 
             try:
+                start_time = time.time()
                 # Method call.
                 if self_arg is not None:
                     results = await func(self_arg, *args, **kwargs)
@@ -144,6 +306,10 @@ class _BatchQueue:
                 else:
                     results = await func(*args, **kwargs)
 
+                if self._tuner is not None:
+                    self._tuner.on_batch_executed(len(batch), time.time() - start_time)
+                    self._update_effective_params()
+
                 if len(results) != len(batch):
                     raise RayServeException(
                         "Batched function doesn't preserve batch size. "
@@ -206,13 +372,17 @@ def batch(func: F) -> G:
 # "Decorator factory" use case (called with arguments).
 @overload
 def batch(
-    max_batch_size: Optional[int] = 10, batch_wait_timeout_s: Optional[float] = 0.0
+    max_batch_size: Optional[int] = 10,
+    batch_wait_timeout_s: Optional[float] = 0.0,
+    target_latency_s: Optional[float] = None,
 ) -> Callable[[F], G]:
     pass
 
 
 @PublicAPI(stability="beta")
-def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
+def batch(
+    _func=None, max_batch_size=10, batch_wait_timeout_s=0.0, target_latency_s=None
+):
     """Converts a function to asynchronously handle batches.
 
     The function can be a standalone function or a class method. In both
@@ -238,6 +408,15 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
             one call to the underlying function.
         batch_wait_timeout_s: the maximum duration to wait for
             `max_batch_size` elements before running the underlying function.
+        target_latency_s: [Experimental] if set, the batch size and wait
+            timeout are tuned online from the observed request arrival rate
+            and execution time of the underlying function, so that the time a
+            request spends waiting for a batch plus executing it stays within
+            this target. `max_batch_size` and `batch_wait_timeout_s` are then
+            upper bounds, so `batch_wait_timeout_s` must be > 0. The chosen
+            values are reported by the
+            `serve_batch_adaptive_batch_size` and
+            `serve_batch_adaptive_wait_timeout_s` metrics.
     """
     # `_func` will be None in the case when the decorator is parametrized.
     # See the comment at the end of this function for a detailed explanation.
@@ -265,6 +444,21 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
     if batch_wait_timeout_s < 0:
         raise ValueError("batch_wait_timeout_s must be a float >= 0")
 
+    if target_latency_s is not None:
+        if not isinstance(target_latency_s, (float, int)):
+            raise TypeError("target_latency_s must be None or a float > 0")
+
+        if target_latency_s <= 0:
+            raise ValueError("target_latency_s must be None or a float > 0")
+
+        if batch_wait_timeout_s == 0:
+            # The adaptive wait timeout is capped by batch_wait_timeout_s, so
+            # it would never wait for a batch to fill.
+            raise ValueError(
+                "target_latency_s requires batch_wait_timeout_s > 0, which is "
+                "the upper bound of the adaptive wait timeout"
+            )
+
     def _batch_decorator(_func):
         @wraps(_func)
         async def batch_wrapper(*args, **kwargs):
@@ -287,7 +481,9 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
             # runs, we just get a reference to the attribute.
             batch_queue_attr = f"__serve_batch_queue_{_func.__name__}"
             if not hasattr(batch_queue_object, batch_queue_attr):
-                batch_queue = _BatchQueue(max_batch_size, batch_wait_timeout_s, _func)
+                batch_queue = _BatchQueue(
+                    max_batch_size, batch_wait_timeout_s, _func, target_latency_s
+                )
                 setattr(batch_queue_object, batch_queue_attr, batch_queue)
             else:
                 batch_queue = getattr(batch_queue_object, batch_queue_attr)
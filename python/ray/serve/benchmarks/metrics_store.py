@@ -0,0 +1,58 @@
+# Microbenchmark for the controller's InMemoryMetricsStore.
+#
+# The controller ingests one metrics push per replica and handle every
+# metrics interval, and queries the window average / max of every series on
+# each autoscaling decision. This benchmark simulates that pattern for a
+# large number of series and reports ingest and query throughput.
+#
+#   python metrics_store.py --num-series 10000
+
+import time
+
+import click
+import numpy as np
+
+from ray.serve._private.autoscaling_metrics import InMemoryMetricsStore
+
+
+def run_benchmark(num_series: int, num_rounds: int, look_back_period_s: float):
+    store = InMemoryMetricsStore()
+    keys = [f"replica_{i}" for i in range(num_series)]
+    values = np.random.randint(0, 100, size=(num_rounds, num_series)).tolist()
+
+    ingest_time_s = 0
+    query_time_s = 0
+    for round_idx in range(num_rounds):
+        timestamp = float(round_idx)
+
+        # Every replica pushes its own metrics separately.
+        start = time.perf_counter()
+        for key, value in zip(keys, values[round_idx]):
+            store.add_metrics_point({key: value}, timestamp)
+        ingest_time_s += time.perf_counter() - start
+
+        window_start = timestamp - look_back_period_s
+        start = time.perf_counter()
+        for key in keys:
+            store.window_average(key, window_start)
+            store.max(key, window_start, do_compact=False)
+        query_time_s += time.perf_counter() - start
+
+    num_points = num_series * num_rounds
+    print(
+        f"{num_series} series, {num_rounds} rounds: "
+        f"ingest {num_points / ingest_time_s:.0f} points/s, "
+        f"query {2 * num_points / query_time_s:.0f} aggregations/s"
+    )
+
+
+@click.command()
+@click.option("--num-series", type=int, default=10000)
+@click.option("--num-rounds", type=int, default=100)
+@click.option("--look-back-period-s", type=float, default=30)
+def main(num_series: int, num_rounds: int, look_back_period_s: float):
+    run_benchmark(num_series, num_rounds, look_back_period_s)
+
+
+if __name__ == "__main__":
+    main()
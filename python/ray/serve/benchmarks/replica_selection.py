@@ -0,0 +1,125 @@
+# A benchmark comparing replica selection policies under skewed latencies.
+#
+# We deploy a deployment whose replicas have very different service times
+# (one replica is much slower than the rest) and drive it with a fixed number
+# of concurrent clients through a handle. With round robin, queries keep being
+# assigned to the slow replica as long as it is below max_concurrent_queries,
+# so they queue behind it (head-of-line blocking) while other replicas are
+# idle. Load-aware policies route around the slow replica.
+#
+# It prints the p50/p99 latency and throughput for each policy:
+#
+#   python replica_selection.py --num-replicas 8 --num-clients 64
+
+import asyncio
+import os
+import time
+
+import click
+import numpy as np
+
+import ray
+from ray import serve
+
+
+@ray.remote(num_cpus=0)
+class SlowReplicaMarker:
+    """Lets exactly one replica claim to be the slow one."""
+
+    def __init__(self):
+        self.owner = None
+
+    def claim(self, actor_id: str) -> bool:
+        if self.owner is None:
+            self.owner = actor_id
+        return self.owner == actor_id
+
+
+@serve.deployment
+class SkewedLatency:
+    def __init__(self, marker, slow_latency_s: float, fast_latency_s: float):
+        self.latency_s = fast_latency_s
+        actor_id = ray.get_runtime_context().get_actor_id()
+        if ray.get(marker.claim.remote(actor_id)):
+            self.latency_s = slow_latency_s
+
+    async def __call__(self):
+        await asyncio.sleep(self.latency_s)
+        return os.getpid()
+
+
+async def run_client(handle, num_queries: int, latencies: list):
+    for _ in range(num_queries):
+        start = time.perf_counter()
+        await (await handle.remote())
+        latencies.append(time.perf_counter() - start)
+
+
+async def run_test(
+    policy: str,
+    num_replicas: int,
+    num_clients: int,
+    num_queries_per_client: int,
+    slow_latency_s: float,
+    fast_latency_s: float,
+):
+    marker = SlowReplicaMarker.remote()
+    deployment = SkewedLatency.options(
+        num_replicas=num_replicas,
+        max_concurrent_queries=100,
+        replica_selection_policy=policy,
+    )
+    serve.run(deployment.bind(marker, slow_latency_s, fast_latency_s))
+    handle = deployment.get_handle(sync=False)
+
+    # warmup
+    await run_client(handle, 10, [])
+
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *[
+            run_client(handle, num_queries_per_client, latencies)
+            for _ in range(num_clients)
+        ]
+    )
+    qps = len(latencies) / (time.perf_counter() - start)
+
+    latencies_ms = np.array(latencies) * 1000
+    print(
+        f"{policy}: p50 {np.percentile(latencies_ms, 50):.1f}ms, "
+        f"p99 {np.percentile(latencies_ms, 99):.1f}ms, {int(qps)} requests/s"
+    )
+    serve.shutdown()
+    ray.kill(marker)
+
+
+@click.command()
+@click.option("--num-replicas", type=int, default=8)
+@click.option("--num-clients", type=int, default=64)
+@click.option("--num-queries-per-client", type=int, default=100)
+@click.option("--slow-latency-s", type=float, default=0.2)
+@click.option("--fast-latency-s", type=float, default=0.01)
+def main(
+    num_replicas: int,
+    num_clients: int,
+    num_queries_per_client: int,
+    slow_latency_s: float,
+    fast_latency_s: float,
+):
+    ray.init(address="auto")
+    for policy in ["round_robin", "power_of_two_choices", "least_in_flight"]:
+        asyncio.get_event_loop().run_until_complete(
+            run_test(
+                policy,
+                num_replicas,
+                num_clients,
+                num_queries_per_client,
+                slow_latency_s,
+                fast_latency_s,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# Microbenchmark for the HTTP proxy's route matching.
+#
+# The proxy matches the path of every incoming HTTP request against the
+# route prefixes of all deployments. This benchmark measures the match
+# throughput of LongestPrefixRouter as the number of routes grows, compared
+# to a linear scan over the routes sorted by decreasing length.
+#
+#   python route_matching.py --num-queries 100000
+
+import random
+import time
+from typing import List, Optional
+
+import click
+
+from ray.serve._private.common import EndpointInfo
+from ray.serve._private.http_proxy import LongestPrefixRouter
+
+
+def linear_scan_match(sorted_routes: List[str], target_route: str) -> Optional[str]:
+    for route in sorted_routes:
+        if target_route.startswith(route):
+            if (
+                route.endswith("/")
+                or len(target_route) == len(route)
+                or target_route[len(route)] == "/"
+            ):
+                return route
+    return None
+
+
+def run_benchmark(num_routes: int, num_queries: int):
+    routes = [f"/app_{i}/model" for i in range(num_routes)]
+    router = LongestPrefixRouter(lambda name: name)
+    router.update_routes(
+        {f"endpoint_{i}": EndpointInfo(route=route) for i, route in enumerate(routes)}
+    )
+
+    targets = [
+        f"{random.choice(routes)}/predict" if random.random() < 0.9 else "/missing"
+        for _ in range(num_queries)
+    ]
+
+    start = time.perf_counter()
+    for target in targets:
+        router.match_route(target)
+    trie_qps = num_queries / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for target in targets:
+        linear_scan_match(router.sorted_routes, target)
+    linear_qps = num_queries / (time.perf_counter() - start)
+
+    print(
+        f"{num_routes} routes: trie {trie_qps:.0f} matches/s, "
+        f"linear scan {linear_qps:.0f} matches/s"
+    )
+
+
+@click.command()
+@click.option("--num-queries", type=int, default=100000)
+def main(num_queries: int):
+    for num_routes in [1, 10, 100, 1000]:
+        run_benchmark(num_routes, num_queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,8 @@ from ray.serve._private.constants import (
     DEFAULT_HEALTH_CHECK_TIMEOUT_S,
     DEFAULT_HTTP_HOST,
     DEFAULT_HTTP_PORT,
+    DEFAULT_REPLICA_SELECTION_POLICY,
+    ReplicaSelectionPolicyType,
 )
 from ray.serve._private.utils import DEFAULT
 from ray.serve.generated.serve_pb2 import (
@@ -109,6 +111,10 @@ class DeploymentConfig(BaseModel):
         max_concurrent_queries (Optional[int]): The maximum number of queries
             that will be sent to a replica of this deployment without receiving
             a response. Defaults to 100.
+        replica_selection_policy (Optional[str]): The policy handles use
+            to pick a replica for each query. One of "round_robin",
+            "power_of_two_choices" or "least_in_flight". Defaults to
+            "round_robin".
         user_config (Optional[Any]): Arguments to pass to the reconfigure
             method of the deployment. The reconfigure method is called if
             user_config is not None. Must be json-serializable.
@@ -129,6 +135,7 @@ class DeploymentConfig(BaseModel):
 
     num_replicas: NonNegativeInt = 1
     max_concurrent_queries: Optional[int] = None
+    replica_selection_policy: str = DEFAULT_REPLICA_SELECTION_POLICY
     user_config: Any = None
 
     graceful_shutdown_timeout_s: NonNegativeFloat = (
@@ -171,6 +178,16 @@ class DeploymentConfig(BaseModel):
                 raise ValueError("max_concurrent_queries must be >= 0")
         return v
 
+    @validator("replica_selection_policy", always=True)
+    def replica_selection_policy_valid(cls, v):
+        valid_policies = [policy.value for policy in ReplicaSelectionPolicyType]
+        if v not in valid_policies:
+            raise ValueError(
+                f'Got invalid replica_selection_policy "{v}". Valid policies '
+                f"are {valid_policies}."
+            )
+        return v
+
     @validator("user_config", always=True)
     def user_config_json_serializable(cls, v):
         if isinstance(v, bytes):
@@ -234,6 +251,9 @@ class DeploymentConfig(BaseModel):
         if "version" in data:
             if data["version"] == "":
                 data["version"] = None
+        if "replica_selection_policy" in data:
+            if data["replica_selection_policy"] == "":
+                data["replica_selection_policy"] = DEFAULT_REPLICA_SELECTION_POLICY
         if "user_configured_option_names" in data:
             data["user_configured_option_names"] = set(
                 data["user_configured_option_names"]
@@ -311,6 +311,7 @@ class Deployment:
         ray_actor_options: Default[Optional[Dict]] = DEFAULT.VALUE,
         user_config: Default[Optional[Any]] = DEFAULT.VALUE,
         max_concurrent_queries: Default[int] = DEFAULT.VALUE,
+        replica_selection_policy: Default[str] = DEFAULT.VALUE,
         autoscaling_config: Default[
             Union[Dict, AutoscalingConfig, None]
         ] = DEFAULT.VALUE,
@@ -376,6 +377,8 @@ class Deployment:
             new_config.user_config = user_config
         if max_concurrent_queries is not DEFAULT.VALUE:
             new_config.max_concurrent_queries = max_concurrent_queries
+        if replica_selection_policy is not DEFAULT.VALUE:
+            new_config.replica_selection_policy = replica_selection_policy
 
         if func_or_class is None:
             func_or_class = self._func_or_class
@@ -443,6 +446,7 @@ class Deployment:
         ray_actor_options: Default[Optional[Dict]] = DEFAULT.VALUE,
         user_config: Default[Optional[Any]] = DEFAULT.VALUE,
         max_concurrent_queries: Default[int] = DEFAULT.VALUE,
+        replica_selection_policy: Default[str] = DEFAULT.VALUE,
         autoscaling_config: Default[
             Union[Dict, AutoscalingConfig, None]
         ] = DEFAULT.VALUE,
@@ -470,6 +474,7 @@ class Deployment:
             ray_actor_options=ray_actor_options,
             user_config=user_config,
             max_concurrent_queries=max_concurrent_queries,
+            replica_selection_policy=replica_selection_policy,
             autoscaling_config=autoscaling_config,
             graceful_shutdown_wait_loop_s=graceful_shutdown_wait_loop_s,
             graceful_shutdown_timeout_s=graceful_shutdown_timeout_s,
@@ -526,6 +531,7 @@ def deployment_to_schema(d: Deployment) -> DeploymentSchema:
         "num_replicas": None if d._config.autoscaling_config else d.num_replicas,
         "route_prefix": d.route_prefix,
         "max_concurrent_queries": d.max_concurrent_queries,
+        "replica_selection_policy": d._config.replica_selection_policy,
         "user_config": d.user_config,
         "autoscaling_config": d._config.autoscaling_config,
         "graceful_shutdown_wait_loop_s": d._config.graceful_shutdown_wait_loop_s,
@@ -569,6 +575,7 @@ def schema_to_deployment(s: DeploymentSchema) -> Deployment:
         num_replicas=s.num_replicas,
         user_config=s.user_config,
         max_concurrent_queries=s.max_concurrent_queries,
+        replica_selection_policy=s.replica_selection_policy,
         autoscaling_config=s.autoscaling_config,
         graceful_shutdown_wait_loop_s=s.graceful_shutdown_wait_loop_s,
         graceful_shutdown_timeout_s=s.graceful_shutdown_timeout_s,
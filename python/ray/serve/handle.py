@@ -116,12 +116,16 @@ class RayServeHandle:
         *,
         _router: Optional[Router] = None,
         _internal_pickled_http_request: bool = False,
+        _internal_http_proxy: bool = False,
     ):
         self.controller_handle = controller_handle
         self.deployment_name = deployment_name
         self.handle_options = handle_options or HandleOptions()
         self.handle_tag = f"{self.deployment_name}#{get_random_letters()}"
         self._pickled_http_request = _internal_pickled_http_request
+        # Only the handles of the HTTP proxy stream generator responses. This
+        # isn't serialized, so handles passed to deployments never stream.
+        self._http_proxy = _internal_http_proxy
 
         self.request_counter = metrics.Counter(
             "serve_handle_request_counter",
@@ -209,6 +213,7 @@ class RayServeHandle:
             new_options,
             _router=self.router,
             _internal_pickled_http_request=self._pickled_http_request,
+            _internal_http_proxy=self._http_proxy,
         )
 
     def _remote(self, deployment_name, handle_options, args, kwargs) -> Coroutine:
@@ -217,6 +222,7 @@ class RayServeHandle:
             deployment_name,
             call_method=handle_options.method_name,
             http_arg_is_pickled=self._pickled_http_request,
+            is_http_proxy_request=self._http_proxy,
         )
         coro = self.router.assign_request(request_metadata, *args, **kwargs)
         return coro
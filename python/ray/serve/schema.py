@@ -121,6 +121,14 @@ class DeploymentSchema(
         ),
         gt=0,
     )
+    replica_selection_policy: str = Field(
+        default=DEFAULT.VALUE,
+        description=(
+            "The policy handles use to pick a replica for each query. One of "
+            '"round_robin", "power_of_two_choices", or "least_in_flight". '
+            "Uses a default if null."
+        ),
+    )
     user_config: Optional[Dict] = Field(
         default=DEFAULT.VALUE,
         description=(
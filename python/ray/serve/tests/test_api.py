@@ -1,5 +1,8 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import os
+import pickle
+import time
 from ray.serve.deployment_graph import RayServeDAGHandle
 
 import requests
@@ -10,6 +13,7 @@ import ray
 from ray import serve
 from ray._private.test_utils import SignalActor, wait_for_condition
 from ray.serve.application import Application
+from ray.serve._private.http_util import HTTPRequestWrapper
 
 
 @serve.deployment()
@@ -116,6 +120,116 @@ def test_starlette_response(serve_instance):
     assert resp.status_code == 418
 
 
+@pytest.mark.parametrize("use_async", [False, True])
+def test_generator_streaming(serve_instance, use_async):
+    signal = SignalActor.remote()
+
+    if use_async:
+
+        @serve.deployment
+        async def streaming(_):
+            yield b"first"
+            await signal.wait.remote()
+            for i in range(3):
+                yield str(i)
+
+    else:
+
+        @serve.deployment
+        def streaming(_):
+            yield b"first"
+            ray.get(signal.wait.remote())
+            for i in range(3):
+                yield str(i)
+
+    handle = serve.run(streaming.bind())
+
+    # The first chunk is received before the generator has finished.
+    resp = requests.get("http://127.0.0.1:8000/streaming", stream=True)
+    assert resp.status_code == 200
+    chunks = resp.iter_content(chunk_size=None)
+    assert next(chunks) == b"first"
+    ray.get(signal.send.remote())
+    assert b"".join(chunks) == b"012"
+
+    # Calls through a handle receive all chunks at once.
+    assert ray.get(handle.remote(None)) == [b"first", "0", "1", "2"]
+
+
+def test_generator_streaming_error(serve_instance):
+    @serve.deployment
+    def streaming(_):
+        yield "first"
+        raise RuntimeError("oops")
+
+    serve.run(streaming.bind())
+
+    # The response has already started when the generator raises, so the
+    # connection is closed before the body is complete.
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        requests.get("http://127.0.0.1:8000/streaming").content
+
+
+def test_generator_streaming_holds_replica_slot(serve_instance):
+    signal = SignalActor.remote()
+
+    @ray.remote
+    class StartCounter:
+        def __init__(self):
+            self.count = 0
+
+        def inc(self):
+            self.count += 1
+
+        def get(self):
+            return self.count
+
+    counter = StartCounter.remote()
+
+    @serve.deployment(max_concurrent_queries=1)
+    def streaming(_):
+        ray.get(counter.inc.remote())
+        yield "first"
+        ray.get(signal.wait.remote())
+        yield "last"
+
+    serve.run(streaming.bind())
+
+    url = "http://127.0.0.1:8000/streaming"
+    resp = requests.get(url, stream=True)
+    chunks = resp.iter_content(chunk_size=None)
+    assert next(chunks) == b"first"
+
+    # The request of a streamed response is ongoing until its body has been
+    # sent, so another request isn't assigned to the replica before that.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        second = executor.submit(lambda: requests.get(url).text)
+        time.sleep(1)
+        assert ray.get(counter.get.remote()) == 1
+        ray.get(signal.send.remote())
+        assert b"".join(chunks) == b"last"
+        assert second.result() == "firstlast"
+    assert ray.get(counter.get.remote()) == 2
+
+
+def test_generator_not_streamed_to_pickled_request_handles(serve_instance):
+    @serve.deployment
+    def generator(_):
+        yield "first"
+        yield "last"
+
+    serve.run(generator.bind())
+
+    # Handles that send pickled HTTP requests but don't belong to the HTTP proxy
+    # get the materialized generator rather than a stream.
+    handle = serve.context.get_global_client().get_handle(
+        "generator", _internal_pickled_http_request=True
+    )
+    request = pickle.dumps(HTTPRequestWrapper({"type": "http"}, b""))
+    assert ray.get(handle.remote(request)) == ["first", "last"]
+    assert requests.get("http://127.0.0.1:8000/generator").text == "firstlast"
+
+
 @pytest.mark.parametrize("use_async", [False, True])
 def test_deploy_function_no_params(serve_instance, use_async):
     serve.start()
@@ -69,6 +69,29 @@ class TestInMemoryMetricsStore:
         assert s.max("m1", window_start_timestamp_s=0) == 2
         assert s.max("m2", window_start_timestamp_s=0) == -1
 
+    def test_many_points(self):
+        # Insert enough points to grow and shift the underlying buffers.
+        s = InMemoryMetricsStore()
+        for i in range(1000):
+            s.add_metrics_point({"m1": i}, timestamp=i)
+            if i % 100 == 99:
+                s.window_average("m1", window_start_timestamp_s=i - 50)
+        assert (
+            s.window_average("m1", window_start_timestamp_s=989, do_compact=False)
+            == 994.5
+        )
+        assert s.max("m1", window_start_timestamp_s=0, do_compact=False) == 999
+        # Points before the last compaction window should have been removed.
+        assert len(s.data["m1"]) == 50
+        assert s.data["m1"][0].timestamp == 950
+
+        # Out of order insert in the middle of the buffer.
+        s.add_metrics_point({"m1": -1000}, timestamp=975.5)
+        assert (
+            s.window_average("m1", window_start_timestamp_s=975)
+            == (sum(range(976, 1000)) - 1000) / 25
+        )
+
 
 def test_e2e(serve_instance):
     @serve.deployment(
@@ -4,6 +4,7 @@ import pytest
 
 import ray
 from ray import serve
+from ray.serve.batching import _AdaptiveBatchTuner
 
 
 def test_batching(serve_instance):
@@ -131,6 +132,32 @@ async def test_decorator_validation():
             async def method(self, requests):
                 pass
 
+    class TargetLatency:
+        @serve.batch(batch_wait_timeout_s=1, target_latency_s=0.1)
+        async def method(self, requests):
+            pass
+
+    with pytest.raises(ValueError):
+
+        class ZeroTargetLatency:
+            @serve.batch(target_latency_s=0)
+            async def method(self, requests):
+                pass
+
+    with pytest.raises(ValueError):
+
+        class TargetLatencyZeroTimeout:
+            @serve.batch(target_latency_s=0.1)
+            async def method(self, requests):
+                pass
+
+    with pytest.raises(TypeError):
+
+        class NonTargetLatency:
+            @serve.batch(target_latency_s="a")
+            async def method(self, requests):
+                pass
+
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("use_class", [True, False])
@@ -257,6 +284,73 @@ async def test_batch_size_multiple_long_timeout(use_class):
         t3.result()
 
 
+@pytest.mark.parametrize(
+    "arrival_gap_s,expected_batch_size,expected_timeout_s",
+    [
+        # Low QPS: don't wait for other requests.
+        (1, 1, 0.1 - 0.011),
+        # Batch as many requests as can arrive and execute within the target.
+        (0.01, 9, 0.1 - 0.019),
+        # High QPS: capped by max_batch_size.
+        (0.0001, 32, 0.1 - 0.042),
+    ],
+)
+def test_adaptive_batch_tuner(arrival_gap_s, expected_batch_size, expected_timeout_s):
+    tuner = _AdaptiveBatchTuner(
+        max_batch_size=32, max_timeout_s=1, target_latency_s=0.1
+    )
+    assert tuner.batch_size == 32
+    assert tuner.timeout_s == 0.1
+
+    now = 0
+    for batch_size in [1, 2, 4, 8, 16, 32] * 3:
+        for _ in range(batch_size):
+            tuner.on_request_arrival(now)
+            now += arrival_gap_s
+        # The handler takes 10ms plus 1ms per item.
+        tuner.on_batch_executed(batch_size, 0.01 + 0.001 * batch_size)
+
+    fixed_s, per_item_s = tuner.execution_time_model()
+    assert fixed_s == pytest.approx(0.01)
+    assert per_item_s == pytest.approx(0.001)
+    assert tuner.batch_size == expected_batch_size
+    assert tuner.timeout_s == pytest.approx(expected_timeout_s)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_class", [True, False])
+async def test_adaptive_batching_low_qps(use_class):
+    # With a latency target, a lone request shouldn't wait for the full
+    # batch_wait_timeout_s.
+    @serve.batch(max_batch_size=10, batch_wait_timeout_s=1000, target_latency_s=0.1)
+    async def adaptive(requests):
+        return requests
+
+    class Adaptive:
+        @serve.batch(max_batch_size=10, batch_wait_timeout_s=1000, target_latency_s=0.1)
+        async def adaptive(self, requests):
+            return requests
+
+    cls = Adaptive()
+
+    async def call(arg):
+        if use_class:
+            return await cls.adaptive(arg)
+        else:
+            return await adaptive(arg)
+
+    for i in range(5):
+        assert await asyncio.wait_for(call(i), timeout=10) == i
+        await asyncio.sleep(0.2)
+
+    if use_class:
+        batch_queue = getattr(cls, "__serve_batch_queue_adaptive")
+    else:
+        batch_queue = getattr(adaptive.__wrapped__, "__serve_batch_queue_adaptive")
+    assert batch_queue.effective_batch_size == 1
+    assert batch_queue.effective_timeout_s <= 0.1
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("mode", ["args", "kwargs", "mixed", "out-of-order"])
 @pytest.mark.parametrize("use_class", [True, False])
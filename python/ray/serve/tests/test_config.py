@@ -52,6 +52,13 @@ class TestDeploymentConfig:
         # Test dynamic default for max_concurrent_queries.
         assert DeploymentConfig().max_concurrent_queries == 100
 
+        # Test replica_selection_policy validation.
+        assert DeploymentConfig().replica_selection_policy == "round_robin"
+        DeploymentConfig(replica_selection_policy="power_of_two_choices")
+        DeploymentConfig(replica_selection_policy="least_in_flight")
+        with pytest.raises(ValidationError, match="value_error"):
+            DeploymentConfig(replica_selection_policy="random")
+
     def test_deployment_config_update(self):
         b = DeploymentConfig(num_replicas=1, max_concurrent_queries=1)
 
@@ -211,6 +218,10 @@ def test_with_proto():
     config = DeploymentConfig(user_config={"python": ("native", ["objects"])})
     assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
 
+    # Test replica_selection_policy
+    config = DeploymentConfig(replica_selection_policy="least_in_flight")
+    assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
+
 
 def test_zero_default_proto():
     # Test that options set to zero (protobuf default value) still retain their
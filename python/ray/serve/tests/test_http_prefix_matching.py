@@ -97,6 +97,45 @@ def test_update_routes(mock_longest_prefix_router):
     assert route == "/endpoint2" and handle == "endpoint2"
 
 
+def test_many_routes(mock_longest_prefix_router):
+    router = mock_longest_prefix_router
+    router.update_routes(
+        {
+            f"endpoint_{i}_{j}": EndpointInfo(route=f"/model_{i}/version_{j}")
+            for i in range(100)
+            for j in range(10)
+        }
+    )
+
+    route, handle = router.match_route("/model_42/version_7/predict")
+    assert route == "/model_42/version_7" and handle == "endpoint_42_7"
+    route, handle = router.match_route("/model_42/version_7")
+    assert route == "/model_42/version_7" and handle == "endpoint_42_7"
+
+    # Matching happens on '/' boundaries only.
+    route, handle = router.match_route("/model_42/version_70")
+    assert route is None and handle is None
+    route, handle = router.match_route("/model_42")
+    assert route is None and handle is None
+
+
+def test_route_with_trailing_slash_precedence(mock_longest_prefix_router):
+    router = mock_longest_prefix_router
+    router.update_routes(
+        {
+            "endpoint1": EndpointInfo(route="/test"),
+            "endpoint2": EndpointInfo(route="/test/"),
+        }
+    )
+
+    route, handle = router.match_route("/test")
+    assert route == "/test" and handle == "endpoint1"
+    route, handle = router.match_route("/test/")
+    assert route == "/test/" and handle == "endpoint2"
+    route, handle = router.match_route("/test/subpath")
+    assert route == "/test/" and handle == "endpoint2"
+
+
 if __name__ == "__main__":
     import sys
 
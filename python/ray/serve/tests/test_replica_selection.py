@@ -0,0 +1,107 @@
+from collections import Counter
+
+import pytest
+
+from ray.serve._private.common import RunningReplicaInfo
+from ray.serve._private.replica_selection import (
+    create_replica_selection_policy,
+    LeastInFlightPolicy,
+    PowerOfTwoChoicesPolicy,
+    RoundRobinPolicy,
+)
+
+
+def make_replicas(num_replicas: int):
+    return [
+        RunningReplicaInfo(
+            deployment_name="my_deployment",
+            replica_tag=str(i),
+            actor_handle=None,
+            max_concurrent_queries=10,
+        )
+        for i in range(num_replicas)
+    ]
+
+
+@pytest.mark.parametrize(
+    "policy_name,policy_cls",
+    [
+        ("round_robin", RoundRobinPolicy),
+        ("power_of_two_choices", PowerOfTwoChoicesPolicy),
+        ("least_in_flight", LeastInFlightPolicy),
+    ],
+)
+def test_create_policy(policy_name, policy_cls):
+    assert isinstance(create_replica_selection_policy(policy_name), policy_cls)
+
+
+def test_create_invalid_policy():
+    with pytest.raises(ValueError):
+        create_replica_selection_policy("random")
+
+
+@pytest.mark.parametrize(
+    "policy_name", ["round_robin", "power_of_two_choices", "least_in_flight"]
+)
+@pytest.mark.parametrize("num_replicas", [0, 1, 2, 5])
+def test_every_replica_is_candidate_once(policy_name, num_replicas):
+    replicas = make_replicas(num_replicas)
+    policy = create_replica_selection_policy(policy_name)
+    policy.update_replicas(replicas)
+
+    for _ in range(10):
+        candidates = list(policy.choose_replicas(lambda r: 0))
+        assert sorted(candidates, key=lambda r: r.replica_tag) == replicas
+
+
+def test_round_robin_cycles():
+    replicas = make_replicas(4)
+    policy = RoundRobinPolicy()
+    policy.update_replicas(replicas)
+
+    first_choices = Counter(
+        next(iter(policy.choose_replicas(lambda r: 0))) for _ in range(8)
+    )
+    assert all(count == 2 for count in first_choices.values())
+    assert len(first_choices) == 4
+
+
+def test_least_in_flight_prefers_idle_replica():
+    replicas = make_replicas(5)
+    in_flight = {replica: 3 for replica in replicas}
+    in_flight[replicas[2]] = 0
+    in_flight[replicas[4]] = 1
+
+    policy = LeastInFlightPolicy()
+    policy.update_replicas(replicas)
+    for _ in range(10):
+        candidates = list(policy.choose_replicas(in_flight.get))
+        assert candidates[0] == replicas[2]
+        assert candidates[1] == replicas[4]
+
+
+def test_power_of_two_choices_prefers_less_loaded_sample():
+    replicas = make_replicas(10)
+    in_flight = {replica: i for i, replica in enumerate(replicas)}
+
+    policy = PowerOfTwoChoicesPolicy()
+    policy.update_replicas(replicas)
+    for _ in range(100):
+        candidates = list(policy.choose_replicas(in_flight.get))
+        # The first two candidates are the random sample, less loaded first.
+        assert in_flight[candidates[0]] < in_flight[candidates[1]]
+        # The remaining candidates are ordered from least to most loaded.
+        rest = [in_flight[replica] for replica in candidates[2:]]
+        assert rest == sorted(rest)
+
+    # The most loaded replica can never be the first choice.
+    first_choices = {
+        next(iter(policy.choose_replicas(in_flight.get))) for _ in range(100)
+    }
+    assert replicas[-1] not in first_choices
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s", __file__]))
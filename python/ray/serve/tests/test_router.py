@@ -3,10 +3,12 @@ Unit tests for the router class. Please don't add any test that will involve
 controller or the actual replica wrapper, use mock if necessary.
 """
 import asyncio
+import concurrent.futures
 
 import pytest
 
 import ray
+from ray.exceptions import RayActorError, RayTaskError
 from ray.serve._private.common import RunningReplicaInfo
 from ray.serve._private.router import Query, ReplicaSet, RequestMetadata
 from ray._private.test_utils import SignalActor
@@ -137,6 +139,80 @@ async def test_replica_set(ray_instance):
     assert num_queries_set == {2, 1}
 
 
+class FakeObjectRef:
+    """Object ref whose completion is controlled by the test."""
+
+    def __init__(self):
+        self._future = concurrent.futures.Future()
+
+    def future(self) -> concurrent.futures.Future:
+        return self._future
+
+    def complete(self, error: Exception = None):
+        if error is None:
+            self._future.set_result("DONE")
+        else:
+            self._future.set_exception(error)
+
+
+class FakeReplicaActor:
+    def __init__(self):
+        self.tracker_refs = []
+        self.handle_request = self
+
+    def remote(self, *args, **kwargs):
+        tracker_ref = FakeObjectRef()
+        self.tracker_refs.append(tracker_ref)
+        return tracker_ref, "user_ref"
+
+
+async def test_replica_set_completion_callbacks(ray_instance):
+    rs = ReplicaSet("my_deployment", asyncio.get_event_loop())
+    replicas = [
+        RunningReplicaInfo(
+            deployment_name="my_deployment",
+            replica_tag=str(i),
+            actor_handle=FakeReplicaActor(),
+            max_concurrent_queries=1,
+        )
+        for i in range(2)
+    ]
+    rs.update_running_replicas(replicas)
+
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+    await rs.assign_replica(query)
+    await rs.assign_replica(query)
+    assert list(rs.in_flight_queries.values()) == [1, 1]
+
+    # Both replicas are full, so these queries have to wait.
+    waiting_tasks = [
+        asyncio.get_event_loop().create_task(rs.assign_replica(query)) for _ in range(2)
+    ]
+    await asyncio.sleep(0.1)
+    assert not any(task.done() for task in waiting_tasks)
+    assert rs.num_queued_queries == 2
+
+    # Completing a query wakes up exactly one waiter, which takes the slot.
+    replicas[0].actor_handle.tracker_refs[0].complete()
+    await asyncio.wait(waiting_tasks, timeout=1, return_when=asyncio.FIRST_COMPLETED)
+    await asyncio.sleep(0.1)
+    assert [task.done() for task in waiting_tasks] == [True, False]
+    assert rs.in_flight_queries[replicas[0]] == 1
+
+    # Application errors free the slot as well.
+    replicas[1].actor_handle.tracker_refs[0].complete(
+        RayTaskError("f", "traceback", ValueError())
+    )
+    await asyncio.wait_for(waiting_tasks[1], timeout=1)
+    assert rs.in_flight_queries[replicas[1]] == 1
+    assert rs.num_queued_queries == 0
+
+    # An actor error removes the replica from the set.
+    replicas[1].actor_handle.tracker_refs[1].complete(RayActorError())
+    await asyncio.sleep(0.1)
+    assert list(rs.in_flight_queries.keys()) == [replicas[0]]
+
+
 if __name__ == "__main__":
     import sys
 
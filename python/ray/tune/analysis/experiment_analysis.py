@@ -26,12 +26,15 @@ from ray.tune.result import (
     EXPR_PROGRESS_FILE,
     EXPR_RESULT_FILE,
     EXPR_PARAM_FILE,
+    EXPR_RESULT_STORE_DIR,
     CONFIG_PREFIX,
     TRAINING_ITERATION,
 )
+from ray.tune.analysis.result_store import _ResultStore
 from ray.tune.experiment import Trial
 from ray.tune.execution.trial_runner import (
     _find_newest_experiment_checkpoint,
+    _load_experiment_checkpoint,
     _load_trial_from_checkpoint,
 )
 from ray.tune.trainable.util import TrainableUtil
@@ -50,6 +53,11 @@ class ExperimentAnalysis:
 
     To use this class, the experiment must be executed with the JsonLogger.
 
+    If the experiment was executed with the ParquetLoggerCallback, results
+    are read from its result store instead: trial dataframes are loaded
+    lazily on first access, and the best result of each trial is looked up
+    via the store's min/max index.
+
     Parameters:
         experiment_checkpoint_path: Path to a json file or directory
             representing an experiment state, or a directory containing
@@ -92,6 +100,18 @@ class ExperimentAnalysis:
 
         self._configs = {}
         self._trial_dataframes = {}
+        self._trial_dataframes_fetched = False
+        self._result_stores = []
+        if pd:
+            experiment_dirs = {path for _, path in self._checkpoints_and_paths}
+            self._result_stores = [
+                store
+                for store in (
+                    _ResultStore(str(experiment_dir / EXPR_RESULT_STORE_DIR))
+                    for experiment_dir in sorted(experiment_dirs)
+                )
+                if store
+            ]
 
         self.default_metric = default_metric
         if default_mode and default_mode not in ["min", "max"]:
@@ -110,6 +130,9 @@ class ExperimentAnalysis:
                 "pandas not installed. Run `pip install pandas` for "
                 "ExperimentAnalysis utilities."
             )
+        elif self._file_type == "parquet":
+            # Results are read lazily, but the trials have to be loaded.
+            self._get_trial_paths()
         else:
             self.fetch_trial_dataframes()
 
@@ -137,9 +160,8 @@ class ExperimentAnalysis:
     def _load_checkpoints_from_latest(self, latest_checkpoint: List[str]) -> None:
         # Collect all checkpoints and their directory paths.
         for path in latest_checkpoint:
-            with open(path) as f:
-                experiment_state = json.load(f, cls=TuneFunctionDecoder)
-                self._experiment_states.append(experiment_state)
+            experiment_state = _load_experiment_checkpoint(path)
+            self._experiment_states.append(experiment_state)
 
             if "checkpoints" not in experiment_state:
                 raise TuneError("Experiment state invalid; no checkpoints found.")
@@ -367,6 +389,8 @@ class ExperimentAnalysis:
         Each dataframe is indexed by iterations and contains reported
         metrics.
         """
+        if self._file_type == "parquet" and not self._trial_dataframes_fetched:
+            self.fetch_trial_dataframes()
         return self._trial_dataframes
 
     def dataframe(
@@ -723,6 +747,16 @@ class ExperimentAnalysis:
         Returns:
             A dictionary containing "trial dir" to Dataframe.
         """
+        if self._file_type == "parquet":
+            self._get_trial_paths()
+            trial_paths = {trial.trial_id: str(trial.logdir) for trial in self.trials}
+            for store in self._result_stores:
+                for trial_id, df in store.trial_dataframes().items():
+                    if trial_id in trial_paths:
+                        self._trial_dataframes[trial_paths[trial_id]] = df
+            self._trial_dataframes_fetched = True
+            return self._trial_dataframes
+
         fail_count = 0
         force_dtype = {"trial_id": str}  # Never convert trial_id to float.
         for path in self._get_trial_paths():
@@ -735,13 +769,13 @@ class ExperimentAnalysis:
                     df = pd.read_csv(
                         os.path.join(path, EXPR_PROGRESS_FILE), dtype=force_dtype
                     )
-                self.trial_dataframes[path] = df
+                self._trial_dataframes[path] = df
             except Exception:
                 fail_count += 1
 
         if fail_count:
             logger.debug("Couldn't read results from {} paths".format(fail_count))
-        return self.trial_dataframes
+        return self._trial_dataframes
 
     def stats(self) -> Dict:
         """Returns a dictionary of the statistics of the experiment.
@@ -763,8 +797,10 @@ class ExperimentAnalysis:
         """Overrides the existing file type.
 
         Args:
-            file_type: Read results from json or csv files. Has to be one
-                of [None, json, csv]. Defaults to csv.
+            file_type: Read results from json or csv files, or from the
+                result store written by the ParquetLoggerCallback. Has to be
+                one of [None, json, csv, parquet]. Defaults to parquet if the
+                experiment has a result store, and csv otherwise.
         """
         self._file_type = self._validate_filetype(file_type)
         self.fetch_trial_dataframes()
@@ -821,8 +857,17 @@ class ExperimentAnalysis:
         return _trial_paths
 
     def _validate_filetype(self, file_type: Optional[str] = None):
-        if file_type not in {None, "json", "csv"}:
-            raise ValueError("`file_type` has to be None or one of [json, csv].")
+        if file_type not in {None, "json", "csv", "parquet"}:
+            raise ValueError(
+                "`file_type` has to be None or one of [json, csv, parquet]."
+            )
+        if file_type == "parquet" and not self._result_stores:
+            raise ValueError(
+                "`file_type` is parquet, but the experiment has no result store. "
+                "Pass a `ParquetLoggerCallback` to the experiment to write one."
+            )
+        if file_type is None and self._result_stores:
+            return "parquet"
         return file_type or DEFAULT_FILE_TYPE
 
     def _validate_metric(self, metric: str) -> str:
@@ -849,6 +894,14 @@ class ExperimentAnalysis:
         assert mode is None or mode in ["max", "min"]
         assert not mode or metric
         rows = {}
+        if self._file_type == "parquet" and mode:
+            trial_paths = {trial.trial_id: str(trial.logdir) for trial in self.trials}
+            for store in self._result_stores:
+                for trial_id, row in store.best_rows(metric, mode).items():
+                    if trial_id in trial_paths:
+                        rows[trial_paths[trial_id]] = row
+            return rows
+
         for path, df in self.trial_dataframes.items():
             if mode == "max":
                 idx = df[metric].idxmax()
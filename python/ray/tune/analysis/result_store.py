@@ -0,0 +1,105 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from ray.tune.logger.parquet import RESULT_STORE_INDEX_KEY, _get_part_paths
+
+try:
+    import pandas as pd
+    from pandas import DataFrame
+except ImportError:
+    pd = None
+    DataFrame = None
+
+
+class _ResultStore:
+    """Reads the result store written by the ParquetLoggerCallback.
+
+    Args:
+        store_dir: The ``result_store`` directory of an experiment.
+    """
+
+    def __init__(self, store_dir: str):
+        self._part_paths = _get_part_paths(store_dir)
+
+    def __bool__(self) -> bool:
+        return bool(self._part_paths)
+
+    def read(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Tuple[str, str, Any]]] = None,
+    ) -> DataFrame:
+        """Reads the results of all trials in write order.
+
+        Args:
+            columns: Only read these columns. Columns that are not stored are
+                ignored.
+            filters: Only read rows matching these filters, in the format of
+                ``pyarrow.parquet.read_table``. Parts that don't contain the
+                filtered columns are skipped.
+        """
+        import pyarrow.parquet as pq
+
+        filter_columns = {column for column, _, _ in filters or []}
+        frames = []
+        for path in self._part_paths:
+            names = pq.read_schema(path).names
+            if not filter_columns.issubset(names):
+                continue
+            part_columns = None
+            if columns is not None:
+                part_columns = [column for column in columns if column in names]
+            table = pq.read_table(path, columns=part_columns, filters=filters)
+            frames.append(table.to_pandas())
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def trial_dataframes(self) -> Dict[str, DataFrame]:
+        """Returns the results of each trial by trial ID."""
+        df = self.read()
+        if df.empty:
+            return {}
+        return {
+            trial_id: trial_df.dropna(axis=1, how="all").reset_index(drop=True)
+            for trial_id, trial_df in df.groupby("trial_id", sort=False)
+        }
+
+    def metric_bounds(self, metric: str) -> Dict[str, Tuple[Any, Any]]:
+        """Returns the min and max value of ``metric`` by trial ID.
+
+        Only reads the index stored in the metadata of each part.
+        """
+        import pyarrow.parquet as pq
+
+        bounds = {}
+        for path in self._part_paths:
+            metadata = pq.read_schema(path).metadata or {}
+            index = json.loads(metadata.get(RESULT_STORE_INDEX_KEY, b"{}"))
+            for trial_id, (min_value, max_value) in index.get(metric, {}).items():
+                if trial_id in bounds:
+                    min_value = min(min_value, bounds[trial_id][0])
+                    max_value = max(max_value, bounds[trial_id][1])
+                bounds[trial_id] = (min_value, max_value)
+        return bounds
+
+    def best_rows(self, metric: str, mode: str) -> Dict[str, Dict]:
+        """Returns the first result with the min/max ``metric`` by trial ID.
+
+        Uses the index to find the best value of each trial, and then only
+        reads the rows containing one of these values.
+        """
+        best_values = {
+            trial_id: max_value if mode == "max" else min_value
+            for trial_id, (min_value, max_value) in self.metric_bounds(metric).items()
+        }
+        if not best_values:
+            return {}
+
+        df = self.read(filters=[(metric, "in", list(set(best_values.values())))])
+        rows = {}
+        for row in df.to_dict("records"):
+            trial_id = row["trial_id"]
+            if trial_id not in rows and row[metric] == best_values.get(trial_id):
+                rows[trial_id] = row
+        return rows
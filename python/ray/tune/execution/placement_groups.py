@@ -644,6 +644,27 @@ class _PlacementGroupManager:
         self._cached_pgs[pg] = trial.placement_group_factory
         return pg
 
+    def cache_in_use_pg(self, trial: "Trial") -> PlacementGroup:
+        """Move the placement group of a trial into the cache.
+
+        Unlike :meth:`cache_trial_pg`, this doesn't replace a staged placement
+        group, since the trial still needs the placement group. This is used for
+        actors that are pre-started for a trial before it is started.
+
+        Args:
+            trial: Trial object with the (currently in use) placement
+                group that should be cached.
+
+        Returns:
+            PlacementGroup object that was cached.
+
+        """
+        pg = self._in_use_trials.pop(trial)
+        self._in_use_pgs.pop(pg)
+
+        self._cached_pgs[pg] = trial.placement_group_factory
+        return pg
+
     def assign_cached_pg(self, pg: PlacementGroup, trial: "Trial") -> bool:
         """Assign a cached pg to a trial."""
         pgf = self._cached_pgs.pop(pg)
@@ -6,11 +6,11 @@ import os
 import random
 import time
 import traceback
-from collections import deque
+from collections import Counter, defaultdict, deque
 from contextlib import contextmanager
 from enum import Enum
 from functools import partial
-from typing import Callable, Dict, Iterable, List, Optional, Set, Union
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import ray
 from ray.air import Checkpoint
@@ -27,6 +27,7 @@ from ray.tune.result import STDERR_FILE, STDOUT_FILE, TRIAL_INFO
 from ray.tune.experiment.trial import Trial, _Location, _TrialInfo
 from ray.tune.utils import warn_if_slow
 from ray.tune.execution.placement_groups import (
+    PlacementGroupFactory,
     _PlacementGroupManager,
     _get_tune_pg_prefix,
 )
@@ -83,6 +84,81 @@ class _ActorClassCache:
 _class_cache = _ActorClassCache()
 
 
+class _ActorPool:
+    """Idle trainable actors that can be reused, keyed by placement group factory.
+
+    Actors are added when a trial stops with ``reuse_actors=True``, or when they
+    are pre-started for a pending trial whose placement group is ready. Each actor
+    is kept with the placement group it runs in. Pre-started actors also keep the
+    trial they were created for, which can use them without a reset.
+
+    Args:
+        max_idle: Maximum number of idle actors.
+    """
+
+    def __init__(self, max_idle: int = 1):
+        self.max_idle = max_idle
+        self._idle: Dict[
+            PlacementGroupFactory,
+            List[Tuple[ray.actor.ActorHandle, PlacementGroup, Optional[Trial]]],
+        ] = defaultdict(list)
+        self.stats = {"hits": 0, "misses": 0, "prestarted": 0, "evicted": 0}
+
+    def __len__(self) -> int:
+        return sum(len(actors) for actors in self._idle.values())
+
+    def is_full(self) -> bool:
+        return len(self) >= self.max_idle
+
+    def has_idle(self, pgf: PlacementGroupFactory) -> bool:
+        return bool(self._idle.get(pgf))
+
+    def add(
+        self,
+        runner: ray.actor.ActorHandle,
+        pg: PlacementGroup,
+        pgf: PlacementGroupFactory,
+        prestarted_for: Optional[Trial] = None,
+    ) -> None:
+        self._idle[pgf].append((runner, pg, prestarted_for))
+
+    def pop(
+        self, trial: Trial
+    ) -> Optional[Tuple[ray.actor.ActorHandle, PlacementGroup, Optional[Trial]]]:
+        """Return an idle actor for the trial, preferring one pre-started for it."""
+        actors = self._idle.get(trial.placement_group_factory)
+        if not actors:
+            return None
+        for i, (_, _, prestarted_for) in enumerate(actors):
+            if prestarted_for is trial:
+                return actors.pop(i)
+        return actors.pop(0)
+
+    def pop_unneeded(
+        self, num_needed: Dict[PlacementGroupFactory, int]
+    ) -> List[Tuple[ray.actor.ActorHandle, PlacementGroup, Optional[Trial]]]:
+        """Remove and return the idle actors in excess of the number needed for
+        each placement group factory.
+
+        Actors pre-started for a trial are kept over the others.
+        """
+        unneeded = []
+        for pgf, actors in self._idle.items():
+            actors.sort(key=lambda actor: actor[2] is None)
+            while len(actors) > num_needed.get(pgf, 0):
+                unneeded.append(actors.pop())
+        return unneeded
+
+    def pop_other(
+        self, pgf: PlacementGroupFactory
+    ) -> Optional[Tuple[ray.actor.ActorHandle, PlacementGroup, Optional[Trial]]]:
+        """Remove and return an idle actor of another placement group factory."""
+        for other_pgf, actors in self._idle.items():
+            if other_pgf != pgf and actors:
+                return actors.pop()
+        return None
+
+
 class _LocalWrapper:
     def __init__(self, result):
         self._result = result
@@ -231,10 +307,14 @@ class RayTrialExecutor:
 
         self._has_cleaned_up_pgs = False
         self._reuse_actors = reuse_actors
-        # The maxlen will be updated when `setup(max_pending_trials)` is called
-        self._cached_actor_pg = deque(maxlen=1)
+        # The max_idle will be updated when `setup(max_pending_trials)` is called
+        self._actor_pool = _ActorPool(max_idle=1)
+        self._prestart_actors = bool(int(os.environ.get("TUNE_PRESTART_ACTORS", "0")))
         self._pg_manager = _PlacementGroupManager(prefix=_get_tune_pg_prefix())
         self._staged_trials = set()
+        # Placement group factories of staged trials that waited for their
+        # placement group at the last eviction of idle actors.
+        self._starved_pgfs: Set[PlacementGroupFactory] = set()
         self._trial_just_finished = False
         self._trial_just_finished_before = False
         self.last_pg_recon = 0
@@ -256,13 +336,15 @@ class RayTrialExecutor:
     def setup(
         self, max_pending_trials: int, trainable_kwargs: Optional[Dict] = None
     ) -> None:
-        if len(self._cached_actor_pg) > 0:
+        if len(self._actor_pool) > 0:
             logger.warning(
                 "Cannot update maximum number of queued actors for reuse "
                 "during a run."
             )
         else:
-            self._cached_actor_pg = deque(maxlen=max_pending_trials)
+            self._actor_pool.max_idle = int(
+                os.environ.get("TUNE_MAX_IDLE_ACTORS", max_pending_trials)
+            )
         self._pg_manager.set_max_staging(max_pending_trials)
         self._trainable_kwargs = trainable_kwargs or {}
 
@@ -332,31 +414,43 @@ class RayTrialExecutor:
             Trial object or None.
 
         """
-        # TODO(xwjiang): This method should consider `self._cached_actor_pg`.
+        # TODO(xwjiang): This method should consider `self._actor_pool`.
         for trial in self._staged_trials:
             if self._pg_manager.has_ready(trial):
                 return trial
 
         return None
 
-    def _setup_remote_runner(self, trial):
+    def _init_trial_logdir(self, trial: Trial) -> Callable:
+        """Create the logdir of the trial and return its logger creator."""
         trial.init_logdir()
         # We checkpoint metadata here to try mitigating logdir duplication
         self._trials_to_cache.add(trial)
-        logger_creator = partial(
+        return partial(
             _noop_logger_creator,
             logdir=trial.logdir,
             should_chdir=self._chdir_to_trial_dir,
         )
 
-        if len(self._cached_actor_pg) > 0:
-            assert self._reuse_actors
-            existing_runner, pg = self._cached_actor_pg.popleft()
+    def _setup_remote_runner(self, trial):
+        logger_creator = self._init_trial_logdir(trial)
+
+        pooled_actor = self._actor_pool.pop(trial) if self._reuse_actors else None
+        if pooled_actor:
+            existing_runner, pg, prestarted_for = pooled_actor
+            self._actor_pool.stats["hits"] += 1
             logger.debug(f"Trial {trial}: Reusing cached runner " f"{existing_runner}")
 
             trial.set_runner(existing_runner)
-            if pg:
-                self._pg_manager.assign_cached_pg(pg, trial)
+            self._pg_manager.assign_cached_pg(pg, trial)
+
+            if prestarted_for is trial:
+                # The actor was created with the config of this trial
+                return existing_runner
+            if prestarted_for is not None:
+                # The trial the actor was pre-started for needs a new placement
+                # group now.
+                self._staged_trials.discard(prestarted_for)
 
             if not self.reset_trial(
                 trial, trial.config, trial.experiment_tag, logger_creator
@@ -367,6 +461,16 @@ class RayTrialExecutor:
                 )
             return existing_runner
 
+        runner = self._create_remote_runner(trial, logger_creator)
+        if runner and self._reuse_actors:
+            self._actor_pool.stats["misses"] += 1
+        return runner
+
+    def _create_remote_runner(self, trial: Trial, logger_creator: Callable):
+        """Create a new actor for the trial in its ready placement group.
+
+        Returns None if the placement group of the trial isn't ready.
+        """
         trainable_cls = trial.get_trainable_cls()
         if not trainable_cls:
             raise _AbortTrialExecution(
@@ -425,6 +529,84 @@ class RayTrialExecutor:
         with self._change_working_directory(trial):
             return full_actor_class.remote(**kwargs)
 
+    def _prestart_pooled_actors(self) -> None:
+        """Start actors for staged trials whose placement group is ready.
+
+        The actors are added to the actor pool, so that starting the trials, or
+        other trials with the same placement group factory, doesn't have to wait
+        for the actor to start and import the training code.
+        """
+        for trial in list(self._staged_trials):
+            if self._actor_pool.is_full():
+                break
+            pgf = trial.placement_group_factory
+            if (
+                trial.status != Trial.PENDING
+                or self._actor_pool.has_idle(pgf)
+                or not self._pg_manager.has_ready(trial)
+            ):
+                continue
+            try:
+                logger_creator = self._init_trial_logdir(trial)
+                runner = self._create_remote_runner(trial, logger_creator)
+            except Exception:
+                logger.debug(
+                    f"Trial {trial}: Could not pre-start runner:\n"
+                    f"{traceback.format_exc()}"
+                )
+                if self._pg_manager.trial_in_use(trial):
+                    self._pg_manager.remove_pg(
+                        self._pg_manager.remove_from_in_use(trial)
+                    )
+                self._staged_trials.discard(trial)
+                continue
+            if not runner:
+                continue
+            logger.debug(f"Trial {trial}: Pre-started runner {runner}")
+            pg = self._pg_manager.cache_in_use_pg(trial)
+            self._actor_pool.add(runner, pg, pgf, prestarted_for=trial)
+            self._actor_pool.stats["prestarted"] += 1
+
+    def _evict_pooled_actors(self, trials: List[Trial]) -> None:
+        """Stop idle actors that pending trials don't need, or whose resources
+        they need.
+
+        Idle actors are kept for as many pending trials as there are with their
+        placement group factory. If a staged trial has been waiting for its
+        placement group since the last call, an idle actor with another placement
+        group factory is stopped as well, to free its resources.
+        """
+        pending = [t for t in trials if t.status in (Trial.PENDING, Trial.PAUSED)]
+        evicted = self._actor_pool.pop_unneeded(
+            Counter(trial.placement_group_factory for trial in pending)
+        )
+
+        starved_pgfs = {
+            trial.placement_group_factory
+            for trial in pending
+            if trial in self._staged_trials
+            and not self._actor_pool.has_idle(trial.placement_group_factory)
+            and not self._pg_manager.has_ready(trial)
+        }
+        for pgf in starved_pgfs & self._starved_pgfs:
+            actor = self._actor_pool.pop_other(pgf)
+            if actor:
+                evicted.append(actor)
+        self._starved_pgfs = starved_pgfs
+
+        for runner, pg, prestarted_for in evicted:
+            logger.debug(f"Stopping idle runner {runner}")
+            self._actor_pool.stats["evicted"] += 1
+            self._pg_manager.clean_cached_pg(pg)
+            if prestarted_for is not None:
+                # The trial the actor was pre-started for needs a new placement
+                # group now.
+                self._staged_trials.discard(prestarted_for)
+            future = runner.stop.remote()
+            self._futures[future] = (_ExecutorEventType.STOP_RESULT, pg)
+            if self._trial_cleanup:  # force trial cleanup within a deadline
+                self._trial_cleanup.add(future)
+
     def _train(self, trial):
         """Start one iteration of training and save remote id."""
 
@@ -519,20 +701,15 @@ class RayTrialExecutor:
             if exc:
                 trial.handle_error(exc=exc)
             if hasattr(trial, "runner") and trial.runner:
-                if (
-                    not error
-                    and self._reuse_actors
-                    and (
-                        len(self._cached_actor_pg)
-                        < (self._cached_actor_pg.maxlen or float("inf"))
-                    )
-                ):
+                if not error and self._reuse_actors and not self._actor_pool.is_full():
                     logger.debug("Reusing actor for %s", trial.runner)
                     # Move PG into cache (disassociate from trial)
                     pg = self._pg_manager.cache_trial_pg(trial)
                     if pg:
                         # True if a placement group was replaced
-                        self._cached_actor_pg.append((trial.runner, pg))
+                        self._actor_pool.add(
+                            trial.runner, pg, trial.placement_group_factory
+                        )
                         should_destroy_actor = False
                     else:
                         # False if no placement group was replaced. This should
@@ -726,10 +903,7 @@ class RayTrialExecutor:
         """
         return (
             trial in self._staged_trials
-            or (
-                len(self._cached_actor_pg) > 0
-                and (self._pg_manager.has_cached_pg(trial.placement_group_factory))
-            )
+            or self._actor_pool.has_idle(trial.placement_group_factory)
             or self._pg_manager.can_stage()
             or self._pg_manager.has_ready(trial, update=True)
             or self._pg_manager.has_staging(trial)
@@ -738,7 +912,15 @@ class RayTrialExecutor:
     def debug_string(self) -> str:
         """Returns a human readable message for printing to the console."""
         total_resources = self._pg_manager.occupied_resources()
-        return self._resource_updater.debug_string(total_resources)
+        debug_str = self._resource_updater.debug_string(total_resources)
+        if self._reuse_actors:
+            stats = self._actor_pool.stats
+            debug_str += (
+                f"\nIdle actors for reuse: {len(self._actor_pool)} "
+                f"(hits: {stats['hits']}, misses: {stats['misses']}, "
+                f"pre-started: {stats['prestarted']}, evicted: {stats['evicted']})"
+            )
+        return debug_str
 
     def on_step_begin(self, trials: List[Trial]) -> None:
         """Before step() is called, update the available resources."""
@@ -751,11 +933,16 @@ class RayTrialExecutor:
         if time.time() > self.last_pg_recon + self.pg_recon_interval:
             # Only do this every now and then - usually the placement groups
             # should not get out of sync, and calling this often is inefficient
+            if self._reuse_actors:
+                self._evict_pooled_actors(trials)
             self._pg_manager.reconcile_placement_groups(trials)
             self.last_pg_recon = time.time()
 
         self._pg_manager.cleanup()
 
+        if self._reuse_actors and self._prestart_actors:
+            self._prestart_pooled_actors()
+
     def _do_force_trial_cleanup(self) -> None:
         if self._trial_cleanup:
             while True:
@@ -984,12 +1171,16 @@ class RayTrialExecutor:
             ###################################################################
             # when next_trial_exists and there are cached resources
             ###################################################################
-            # There could be existing PGs from either `self._cached_actor_pg`
+            # There could be existing PGs from either `self._actor_pool`
             # or from `self._pg_manager._ready`. If so and if there is indeed
             # a next trial to run, we return `PG_READY` future for trial
             # runner. The next trial can then be scheduled on this PG.
             if next_trial_exists:
-                if len(self._cached_actor_pg) > 0:
+                if any(
+                    self._actor_pool.has_idle(trial.placement_group_factory)
+                    for trial in live_trials
+                    if trial.status in (Trial.PENDING, Trial.PAUSED)
+                ):
                     return _ExecutorEvent(_ExecutorEventType.PG_READY)
                 # TODO(xwjiang): Expose proper API when we decide to do
                 #  ActorPool abstraction.
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, List, Mapping, Optional, Union, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Union, Tuple
 
 import click
 from datetime import datetime
@@ -8,6 +8,7 @@ import logging
 import os
 import time
 import traceback
+import uuid
 import warnings
 
 import ray
@@ -65,6 +66,60 @@ def _find_newest_experiment_checkpoint(ckpt_dir) -> Optional[str]:
     return max(full_paths)
 
 
+def _get_delta_log_path(experiment_checkpoint_path: str) -> str:
+    """Returns the path of the delta log belonging to an experiment checkpoint.
+
+    The delta log name doesn't start with `experiment_state` or end in
+    `.json`, so that it's never mistaken for an experiment checkpoint itself.
+    """
+    dirname, basename = os.path.split(experiment_checkpoint_path)
+    return os.path.join(dirname, f"deltas-{os.path.splitext(basename)[0]}.jsonl")
+
+
+def _load_experiment_checkpoint(experiment_checkpoint_path: str) -> Dict[str, Any]:
+    """Loads an experiment checkpoint, including its delta log.
+
+    The experiment checkpoint file holds a full snapshot of the runner state.
+    The delta log next to it holds one record per checkpoint taken since,
+    with the runner state and the states of the trials that changed. Records
+    of other snapshots (e.g. left over from a crash during compaction) and
+    an incomplete trailing record are ignored.
+    """
+    with open(experiment_checkpoint_path, "r") as f:
+        runner_state = json.load(f, cls=TuneFunctionDecoder)
+
+    delta_log_path = _get_delta_log_path(experiment_checkpoint_path)
+    snapshot_id = runner_state.get("snapshot_id")
+    if snapshot_id is None or not os.path.exists(delta_log_path):
+        return runner_state
+
+    deltas = []
+    with open(delta_log_path, "r") as f:
+        for line in f:
+            try:
+                delta = json.loads(line, cls=TuneFunctionDecoder)
+            except json.JSONDecodeError:
+                # The last record may have been cut off by a crash.
+                break
+            if delta["snapshot_id"] == snapshot_id:
+                deltas.append(delta)
+
+    if not deltas:
+        return runner_state
+
+    trial_states = {}
+    for cp in runner_state["checkpoints"]:
+        trial_state = json.loads(cp, cls=TuneFunctionDecoder)
+        trial_states[trial_state["trial_id"]] = trial_state
+    for delta in deltas:
+        for trial_id, cp in delta["checkpoints"].items():
+            trial_states[trial_id] = json.loads(cp, cls=TuneFunctionDecoder)
+        runner_state["runner_data"] = delta["runner_data"]
+        runner_state["stats"] = delta["stats"]
+    runner_state["checkpoints"] = list(trial_states.values())
+    return runner_state
+
+
 def _load_trial_from_checkpoint(trial_cp: dict, stub: bool = False, **kwargs):
     new_trial = Trial(
         trial_cp["trainable_name"], stub=stub, _setup_default_resource=False, **kwargs
@@ -112,6 +167,13 @@ class _ExperimentCheckpointManager:
     time (1/20) will be used for writing checkpoints, while 95% of the time
     (19/20) will be used to handle the rest of the training loop.
 
+    If ``incremental`` is set, only the first checkpoint writes a full
+    snapshot of all trials to the checkpoint file. Later checkpoints append
+    the states of the trials that changed since the previous checkpoint to
+    a delta log (see ``_load_experiment_checkpoint``). Once the delta log
+    grows larger than the snapshot, or if the checkpoint is forced, a new
+    snapshot is written and the delta log is started over.
+
     """
 
     def __init__(
@@ -124,6 +186,7 @@ class _ExperimentCheckpointManager:
         sync_trial_checkpoints: bool,
         local_dir: str,
         remote_dir: str,
+        incremental: bool = True,
     ):
         self._checkpoint_dir = checkpoint_dir
         self._auto_checkpoint_enabled = checkpoint_period == "auto"
@@ -142,10 +205,74 @@ class _ExperimentCheckpointManager:
 
         self._last_checkpoint_time = 0.0
 
+        self._incremental = incremental
+        # The checkpoint file of the current snapshot, which the delta log
+        # belongs to.
+        self._snapshot_file = None
+        self._snapshot_id = None
+        self._snapshot_size = 0
+        self._delta_log_size = 0
+        # Trial ID -> JSON state of the trial as last written.
+        self._written_trial_states: Dict[str, str] = {}
+
     @property
     def auto_checkpoint_enabled(self):
         return self._auto_checkpoint_enabled
 
+    def _write_snapshot(
+        self,
+        checkpoint_file: str,
+        trial_states: Dict[str, str],
+        runner_state: Dict[str, Any],
+    ):
+        snapshot_id = uuid.uuid4().hex
+        runner_state = {
+            "checkpoints": list(trial_states.values()),
+            **runner_state,
+            "snapshot_id": snapshot_id,
+        }
+        tmp_file_name = os.path.join(self._checkpoint_dir, ".tmp_checkpoint")
+        with open(tmp_file_name, "w") as f:
+            json.dump(runner_state, f, indent=2, cls=TuneFunctionEncoder)
+            self._snapshot_size = f.tell()
+
+        os.replace(tmp_file_name, checkpoint_file)
+        # Records in the old delta log belong to the old snapshot and are
+        # ignored from now on, so it can be started over.
+        delta_log_path = _get_delta_log_path(checkpoint_file)
+        if os.path.exists(delta_log_path):
+            os.remove(delta_log_path)
+
+        self._snapshot_file = checkpoint_file
+        self._snapshot_id = snapshot_id
+        self._delta_log_size = 0
+        self._written_trial_states = dict(trial_states)
+
+    def _append_delta(
+        self,
+        checkpoint_file: str,
+        trial_states: Dict[str, str],
+        runner_state: Dict[str, Any],
+    ):
+        # The trials cache their JSON state until it's invalidated, so
+        # unchanged trials are still represented by the same string object.
+        changed_trial_states = {
+            trial_id: trial_state
+            for trial_id, trial_state in trial_states.items()
+            if self._written_trial_states.get(trial_id) is not trial_state
+        }
+        delta = {
+            "snapshot_id": self._snapshot_id,
+            "checkpoints": changed_trial_states,
+            **runner_state,
+        }
+        line = json.dumps(delta, cls=TuneFunctionEncoder) + "\n"
+        with open(_get_delta_log_path(checkpoint_file), "a") as f:
+            f.write(line)
+
+        self._delta_log_size += len(line)
+        self._written_trial_states.update(changed_trial_states)
+
     def checkpoint(
         self,
         checkpoint_file: str,
@@ -173,19 +300,23 @@ class _ExperimentCheckpointManager:
             return
 
         def _serialize_and_write():
+            trial_states = trial_executor.get_checkpoints()
             runner_state = {
-                "checkpoints": list(trial_executor.get_checkpoints().values()),
                 "runner_data": trial_runner.__getstate__(),
                 "stats": {
                     "start_time": self._start_time,
                     "timestamp": self._last_checkpoint_time,
                 },
             }
-            tmp_file_name = os.path.join(self._checkpoint_dir, ".tmp_checkpoint")
-            with open(tmp_file_name, "w") as f:
-                json.dump(runner_state, f, indent=2, cls=TuneFunctionEncoder)
-
-            os.replace(tmp_file_name, checkpoint_file)
+            if (
+                self._incremental
+                and not force
+                and self._snapshot_file == checkpoint_file
+                and self._delta_log_size < self._snapshot_size
+            ):
+                self._append_delta(checkpoint_file, trial_states, runner_state)
+            else:
+                self._write_snapshot(checkpoint_file, trial_states, runner_state)
             search_alg.save_to_dir(self._checkpoint_dir, session_str=self._session_str)
 
         checkpoint_time_start = time.monotonic()
@@ -311,6 +442,8 @@ class TrialRunner:
         driver_sync_trial_checkpoints: bool = False,
     ):
         self._search_alg = search_alg or BasicVariantGenerator()
+        # Intermediate results passed to the search algorithm in batches
+        self._search_alg_results = []
         self._scheduler_alg = scheduler or FIFOScheduler()
         self.trial_executor = trial_executor or RayTrialExecutor()
         self._insufficient_resources_manager = _InsufficientResourcesManager()
@@ -477,6 +610,9 @@ class TrialRunner:
             sync_trial_checkpoints=sync_trial_checkpoints,
             local_dir=self._local_checkpoint_dir,
             remote_dir=self._remote_checkpoint_dir,
+            incremental=bool(
+                int(os.environ.get("TUNE_INCREMENTAL_EXPERIMENT_CHECKPOINT", "1"))
+            ),
         )
 
     @property
@@ -691,6 +827,7 @@ class TrialRunner:
         Args:
             force: Forces a checkpoint despite checkpoint_period.
         """
+        self._flush_search_alg_results()
         with warn_if_slow(
             "experiment_checkpoint",
             message="Checkpointing the experiment state took "
@@ -736,9 +873,8 @@ class TrialRunner:
             )
 
         logger.info(f"Using following checkpoint to resume: {newest_ckpt_path}")
-        with open(newest_ckpt_path, "r") as f:
-            runner_state = json.load(f, cls=TuneFunctionDecoder)
-            self.checkpoint_file = newest_ckpt_path
+        runner_state = _load_experiment_checkpoint(newest_ckpt_path)
+        self.checkpoint_file = newest_ckpt_path
 
         logger.warning(
             "".join(
@@ -812,13 +948,21 @@ class TrialRunner:
                 if trial.status == Trial.PENDING:
                     num_pending_trials += 1
 
-        if not self._search_alg.is_finished():
-            # Create pending trials until it fails.
-            while num_pending_trials < self._max_pending_trials:
-                if not self._update_trial_queue(blocking=wait_for_trial):
-                    break
-                wait_for_trial = False  # wait at most one trial
-                num_pending_trials += 1
+        num_new_trials = self._max_pending_trials - num_pending_trials
+        if not self._search_alg.is_finished() and num_new_trials > 0:
+            if wait_for_trial:
+                # Wait at most for one trial
+                if self._update_trial_queue(blocking=True):
+                    num_new_trials -= 1
+                else:
+                    num_new_trials = 0
+            if num_new_trials > 0:
+                # Create the remaining pending trials in one batch
+                self._flush_search_alg_results()
+                with warn_if_slow("search_alg.next_trials"):
+                    trials = self._search_alg.next_trials(num_new_trials)
+                for trial in trials:
+                    self.add_trial(trial)
 
         with warn_if_slow("choose_trial_to_run"):
             return self._scheduler_alg.choose_trial_to_run(self)
@@ -1106,8 +1250,9 @@ class TrialRunner:
             result.update(done=True)
         else:
             # Only updating search alg if the trial is not to be stopped.
-            with warn_if_slow("search_alg.on_trial_result"):
-                self._search_alg.on_trial_result(trial.trial_id, flat_result)
+            # The result is passed on in a batch before the search algorithm
+            # is asked for new trials or notified of a completed trial.
+            self._search_alg_results.append((trial.trial_id, flat_result))
 
         # If this is not a duplicate result, the callbacks should
         # be informed about the result.
@@ -1267,6 +1412,7 @@ class TrialRunner:
                 self._try_recover(trial, exc=exc)
             else:
                 self._scheduler_alg.on_trial_error(self, trial)
+                self._flush_search_alg_results()
                 self._search_alg.on_trial_complete(trial.trial_id, error=True)
                 self._callbacks.on_trial_error(
                     iteration=self._iteration, trials=self._trials, trial=trial
@@ -1351,6 +1497,7 @@ class TrialRunner:
                     # Clean up again if an actor was launched
                     self.trial_executor.stop_trial(trial, error=True)
                 self._scheduler_alg.on_trial_error(self, trial)
+                self._flush_search_alg_results()
                 self._search_alg.on_trial_complete(trial.trial_id, error=True)
                 self._callbacks.on_trial_error(
                     iteration=self._iteration, trials=self._trials, trial=trial
@@ -1402,6 +1549,7 @@ class TrialRunner:
         Returns:
             Boolean indicating if a new trial was created or not.
         """
+        self._flush_search_alg_results()
         trial = self._search_alg.next_trial()
         if blocking and not trial:
             start = time.time()
@@ -1421,6 +1569,14 @@ class TrialRunner:
 
         return False
 
+    def _flush_search_alg_results(self):
+        """Passes the buffered intermediate results to the search algorithm."""
+        if not self._search_alg_results:
+            return
+        results, self._search_alg_results = self._search_alg_results, []
+        with warn_if_slow("search_alg.on_trial_results"):
+            self._search_alg.on_trial_results(results)
+
     def request_stop_trial(self, trial):
         self._stop_queue.append(trial)
 
@@ -1459,7 +1615,8 @@ class TrialRunner:
         try:
             if trial.status in [Trial.ERROR, Trial.TERMINATED]:
                 return
-            elif trial.status in [Trial.PENDING, Trial.PAUSED]:
+            self._flush_search_alg_results()
+            if trial.status in [Trial.PENDING, Trial.PAUSED]:
                 self._scheduler_alg.on_trial_remove(self, trial)
                 self._search_alg.on_trial_complete(trial.trial_id)
             elif trial.status is Trial.RUNNING:
@@ -1516,6 +1673,7 @@ class TrialRunner:
             "_stop_queue",
             "_server",
             "_search_alg",
+            "_search_alg_results",
             "_scheduler_alg",
             "_pending_trial_queue_times",
             "trial_executor",
@@ -7,6 +7,7 @@ from ray.tune.logger.logger import (
 from ray.tune.logger.csv import CSVLogger, CSVLoggerCallback
 from ray.tune.logger.json import JsonLogger, JsonLoggerCallback
 from ray.tune.logger.noop import NoopLogger
+from ray.tune.logger.parquet import ParquetLoggerCallback
 from ray.tune.logger.tensorboardx import TBXLogger, TBXLoggerCallback
 
 DEFAULT_LOGGERS = (JsonLogger, CSVLogger, TBXLogger)
@@ -23,6 +24,7 @@ __all__ = [
     "JsonLogger",
     "JsonLoggerCallback",
     "NoopLogger",
+    "ParquetLoggerCallback",
     "TBXLogger",
     "TBXLoggerCallback",
     "UnifiedLogger",
@@ -0,0 +1,168 @@
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List
+
+from ray.tune.logger.logger import LoggerCallback
+from ray.tune.result import EXPR_RESULT_STORE_DIR
+from ray.tune.utils import flatten_dict
+from ray.util import log_once
+from ray.util.annotations import PublicAPI
+
+if TYPE_CHECKING:
+    from ray.tune.experiment.trial import Trial  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+# Key of the parquet metadata entry holding the per-trial min/max index.
+RESULT_STORE_INDEX_KEY = b"tune.result_index"
+
+
+def _get_part_paths(store_dir: str) -> List[str]:
+    """Returns the paths of all parts of a result store in write order."""
+    if not os.path.isdir(store_dir):
+        return []
+    return [
+        os.path.join(store_dir, name)
+        for name in sorted(os.listdir(store_dir))
+        if name.startswith("part-") and name.endswith(".parquet")
+    ]
+
+
+def _rows_to_table(rows: List[Dict]):
+    import pandas as pd
+    import pyarrow as pa
+
+    df = pd.DataFrame.from_records(rows)
+    for column in df.columns:
+        if df[column].dtype != object:
+            continue
+        try:
+            pa.array(df[column])
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Mixed or unsupported values, store them like the CSV logger does.
+            df[column] = df[column].map(lambda v: None if v is None else str(v))
+    return pa.Table.from_pandas(df, preserve_index=False), df
+
+
+def _build_index(df) -> Dict[str, Dict[str, List[float]]]:
+    """Returns ``{column: {trial_id: [min, max]}}`` for all numeric columns."""
+    import pandas as pd
+
+    index = {}
+    grouped = df.groupby("trial_id", sort=False)
+    for column in df.columns:
+        dtype = df[column].dtype
+        if (
+            column == "trial_id"
+            or not pd.api.types.is_numeric_dtype(dtype)
+            or pd.api.types.is_bool_dtype(dtype)
+        ):
+            continue
+        bounds = grouped[column].agg(["min", "max"]).dropna()
+        if len(bounds):
+            index[column] = {
+                trial_id: [min_value, max_value]
+                for trial_id, min_value, max_value in zip(
+                    bounds.index, bounds["min"].tolist(), bounds["max"].tolist()
+                )
+            }
+    return index
+
+
+@PublicAPI(stability="alpha")
+class ParquetLoggerCallback(LoggerCallback):
+    """Logs the results of all trials to a consolidated Parquet result store.
+
+    Results are flattened like in the CSVLoggerCallback, buffered, and
+    periodically written as a new part file to the ``result_store``
+    directory of the experiment. Each part stores the results of many trials
+    (with a ``trial_id`` column) and an index of the min/max value of every
+    numeric metric per trial in its metadata.
+
+    ``ExperimentAnalysis`` and ``ResultGrid`` pick up the result store
+    automatically. Trial dataframes are then loaded lazily with a single
+    read instead of parsing the progress file of every trial, and the best
+    results of each trial are found via the index without loading the
+    full results.
+
+    Requires ``pyarrow`` and ``pandas``.
+
+    Args:
+        max_buffered_rows: Write a new part once this many results are
+            buffered.
+        flush_period_s: Write a new part if the oldest buffered result is
+            older than this many seconds.
+    """
+
+    def __init__(self, max_buffered_rows: int = 1000, flush_period_s: float = 30):
+        try:
+            import pyarrow.parquet  # noqa: F401
+            import pandas  # noqa: F401
+        except ImportError:
+            if log_once("parquet-logger-install"):
+                logger.info(
+                    "pip install pyarrow pandas to use the ParquetLoggerCallback."
+                )
+            raise
+        self._max_buffered_rows = max_buffered_rows
+        self._flush_period_s = flush_period_s
+        # Buffered rows and time of the oldest buffered row per experiment dir.
+        self._buffers: Dict[str, List[Dict]] = defaultdict(list)
+        self._buffer_start: Dict[str, float] = {}
+        self._next_part: Dict[str, int] = {}
+
+    def log_trial_result(self, iteration: int, trial: "Trial", result: Dict):
+        tmp = result.copy()
+        tmp.pop("config", None)
+        row = flatten_dict(tmp, delimiter="/")
+        row["trial_id"] = trial.trial_id
+
+        experiment_dir = os.path.expanduser(trial.local_dir)
+        buffer = self._buffers[experiment_dir]
+        if not buffer:
+            self._buffer_start[experiment_dir] = time.monotonic()
+        buffer.append(row)
+
+        if (
+            len(buffer) >= self._max_buffered_rows
+            or time.monotonic() - self._buffer_start[experiment_dir]
+            >= self._flush_period_s
+        ):
+            self._write_part(experiment_dir)
+
+    def on_experiment_end(self, trials: List["Trial"], **info):
+        self.flush()
+
+    def flush(self):
+        """Writes all buffered results."""
+        for experiment_dir in list(self._buffers):
+            self._write_part(experiment_dir)
+
+    def _write_part(self, experiment_dir: str):
+        import pyarrow.parquet as pq
+
+        rows = self._buffers.pop(experiment_dir, None)
+        if not rows:
+            return
+
+        store_dir = os.path.join(experiment_dir, EXPR_RESULT_STORE_DIR)
+        os.makedirs(store_dir, exist_ok=True)
+        if experiment_dir not in self._next_part:
+            # Continue after the parts of previous runs of the experiment.
+            self._next_part[experiment_dir] = len(_get_part_paths(store_dir))
+        part = self._next_part[experiment_dir]
+        self._next_part[experiment_dir] += 1
+
+        table, df = _rows_to_table(rows)
+        metadata = dict(table.schema.metadata or {})
+        metadata[RESULT_STORE_INDEX_KEY] = json.dumps(_build_index(df)).encode()
+        table = table.replace_schema_metadata(metadata)
+
+        # Write to a temporary file first so readers never see partial parts.
+        path = os.path.join(store_dir, f"part-{part:06d}.parquet")
+        tmp_path = path + ".tmp"
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
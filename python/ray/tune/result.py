@@ -146,5 +146,9 @@ EXPR_PROGRESS_FILE = "progress.csv"
 # File that stores results of the trial.
 EXPR_RESULT_FILE = "result.json"
 
+# Directory under the experiment directory that stores the results of all
+# trials in parquet files.
+EXPR_RESULT_STORE_DIR = "result_store"
+
 # Config prefix when using ExperimentAnalysis.
 CONFIG_PREFIX = "config"
@@ -1,6 +1,6 @@
 import copy
 import logging
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
 from ray.tune.search.searcher import Searcher
 from ray.tune.search.util import _set_search_properties_backwards_compatible
@@ -111,6 +111,31 @@ class ConcurrencyLimiter(Searcher):
             self.num_unfinished_live_trials += 1
         return suggestion
 
+    def suggest_batch(self, trial_ids: List[str]) -> List[Optional[Dict]]:
+        if not self._limit_concurrency:
+            return self.searcher.suggest_batch(trial_ids)
+
+        for trial_id in trial_ids:
+            assert (
+                trial_id not in self.live_trials
+            ), f"Trial ID {trial_id} must be unique: already found in set."
+        num_available = self.max_concurrent - len(self.live_trials)
+        if num_available <= 0:
+            logger.debug(
+                f"Not providing suggestions for {len(trial_ids)} trials due to "
+                "concurrency limit: %s/%s.",
+                len(self.live_trials),
+                self.max_concurrent,
+            )
+            return [None]
+
+        suggestions = self.searcher.suggest_batch(trial_ids[:num_available])
+        for trial_id, suggestion in zip(trial_ids, suggestions):
+            if suggestion not in (None, Searcher.FINISHED):
+                self.live_trials.add(trial_id)
+                self.num_unfinished_live_trials += 1
+        return suggestions
+
     def on_trial_complete(
         self, trial_id: str, result: Optional[Dict] = None, error: bool = False
     ):
@@ -142,6 +167,9 @@ class ConcurrencyLimiter(Searcher):
     def on_trial_result(self, trial_id: str, result: Dict) -> None:
         self.searcher.on_trial_result(trial_id, result)
 
+    def on_trial_results(self, results: List[Tuple[str, Dict]]) -> None:
+        self.searcher.on_trial_results(results)
+
     def add_evaluated_point(
         self,
         parameters: Dict,
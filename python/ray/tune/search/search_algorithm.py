@@ -1,9 +1,9 @@
-from typing import Dict, List, Optional, Union, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
 from ray.util.annotations import DeveloperAPI
 
 if TYPE_CHECKING:
-    from ray.tune.experiment import Experiment
+    from ray.tune.experiment import Experiment, Trial
 
 
 @DeveloperAPI
@@ -76,6 +76,25 @@ class SearchAlgorithm:
         """
         raise NotImplementedError
 
+    def next_trials(self, max_num_trials: int) -> List["Trial"]:
+        """Returns up to ``max_num_trials`` Trial objects to be queued.
+
+        By default, this calls ``next_trial`` until it returns no trial.
+
+        Arguments:
+            max_num_trials: Maximum number of trials to return.
+
+        Returns:
+            trials: Returns a list of Trial objects.
+        """
+        trials = []
+        while len(trials) < max_num_trials:
+            trial = self.next_trial()
+            if not trial:
+                break
+            trials.append(trial)
+        return trials
+
     def on_trial_result(self, trial_id: str, result: Dict):
         """Called on each intermediate result returned by a trial.
 
@@ -87,6 +106,19 @@ class SearchAlgorithm:
         """
         pass
 
+    def on_trial_results(self, results: List[Tuple[str, Dict]]):
+        """Called with a batch of intermediate results of running trials.
+
+        The results are in the order they were returned, and are always passed
+        before the ``on_trial_complete`` notification of their trial. By
+        default, this calls ``on_trial_result`` for each result.
+
+        Arguments:
+            results: List of ``(trial_id, result)`` tuples.
+        """
+        for trial_id, result in results:
+            self.on_trial_result(trial_id, result)
+
     def on_trial_complete(
         self, trial_id: str, result: Optional[Dict] = None, error: bool = False
     ):
@@ -1,6 +1,6 @@
 import copy
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from ray.tune.error import TuneError
 from ray.tune.experiment import Experiment, _convert_to_experiment_list
@@ -102,6 +102,25 @@ class SearchGenerator(SearchAlgorithm):
             )
         return None
 
+    def next_trials(self, max_num_trials: int) -> List[Trial]:
+        """Provides up to ``max_num_trials`` Trial objects to be queued.
+
+        The configurations of all trials are queried from the searcher with a
+        single ``Searcher.suggest_batch`` call.
+
+        Returns:
+            List[Trial]: Returns a list of trials.
+        """
+        if type(self).next_trial is not SearchGenerator.next_trial:
+            # Subclasses that override `next_trial` create their trials there.
+            return super().next_trials(max_num_trials)
+        if self.is_finished():
+            return []
+        num_trials = int(min(max_num_trials, self._total_samples - self._counter))
+        return self.create_trials_if_possible(
+            self._experiment.spec, self._experiment.dir_name, num_trials
+        )
+
     def create_trial_if_possible(
         self, experiment_spec: Dict, output_path: str
     ) -> Optional[Trial]:
@@ -115,6 +134,39 @@ class SearchGenerator(SearchAlgorithm):
 
         if suggested_config is None:
             return
+        return self._create_trial(
+            experiment_spec, output_path, trial_id, suggested_config
+        )
+
+    def create_trials_if_possible(
+        self, experiment_spec: Dict, output_path: str, num_trials: int
+    ) -> List[Trial]:
+        logger.debug(f"creating up to {num_trials} trials")
+        trial_ids = [Trial.generate_id() for _ in range(num_trials)]
+        trials = []
+        for trial_id, suggested_config in zip(
+            trial_ids, self.searcher.suggest_batch(trial_ids)
+        ):
+            if suggested_config == Searcher.FINISHED:
+                self._finished = True
+                logger.debug("Searcher has finished.")
+                break
+            if suggested_config is None:
+                break
+            trials.append(
+                self._create_trial(
+                    experiment_spec, output_path, trial_id, suggested_config
+                )
+            )
+        return trials
+
+    def _create_trial(
+        self,
+        experiment_spec: Dict,
+        output_path: str,
+        trial_id: str,
+        suggested_config: Dict,
+    ) -> Trial:
         spec = copy.deepcopy(experiment_spec)
         spec["config"] = merge_dicts(spec["config"], copy.deepcopy(suggested_config))
 
@@ -136,6 +188,10 @@ class SearchGenerator(SearchAlgorithm):
         """Notifies the underlying searcher."""
         self.searcher.on_trial_result(trial_id, result)
 
+    def on_trial_results(self, results: List[Tuple[str, Dict]]):
+        """Notifies the underlying searcher of a batch of results."""
+        self.searcher.on_trial_results(results)
+
     def on_trial_complete(
         self, trial_id: str, result: Optional[Dict] = None, error: bool = False
     ):
@@ -3,7 +3,7 @@ import glob
 import logging
 import os
 import warnings
-from typing import Dict, Optional, List, Union, Any, TYPE_CHECKING
+from typing import Dict, Optional, List, Tuple, Union, Any, TYPE_CHECKING
 
 from ray.tune.search.util import _set_search_properties_backwards_compatible
 from ray.util.annotations import DeveloperAPI, PublicAPI
@@ -134,6 +134,20 @@ class Searcher:
         """
         pass
 
+    def on_trial_results(self, results: List[Tuple[str, Dict]]) -> None:
+        """Optional notification for a batch of results during training.
+
+        Tune may pass the intermediate results of several trials at once, in the
+        order they were reported. Results are always passed before the
+        ``on_trial_complete`` notification of their trial. By default, this
+        calls ``on_trial_result`` for each result.
+
+        Args:
+            results: List of ``(trial_id, result)`` tuples.
+        """
+        for trial_id, result in results:
+            self.on_trial_result(trial_id, result)
+
     def on_trial_complete(
         self, trial_id: str, result: Optional[Dict] = None, error: bool = False
     ) -> None:
@@ -171,6 +185,31 @@ class Searcher:
         """
         raise NotImplementedError
 
+    def suggest_batch(self, trial_ids: List[str]) -> List[Optional[Dict]]:
+        """Queries the algorithm to retrieve the next sets of parameters.
+
+        Searchers that fit a model to suggest parameters can override this to
+        fit it once for the whole batch. By default, this calls ``suggest``
+        for each trial ID until it returns ``None`` or ``FINISHED``.
+
+        Arguments:
+            trial_ids: Trial IDs used for subsequent notifications.
+
+        Returns:
+            List of configurations for the first trial IDs, in order. The list
+                may be shorter than ``trial_ids``, and it ends after the first
+                ``None`` or ``FINISHED`` it contains, which have the same meaning
+                as for ``suggest``.
+
+        """
+        suggestions = []
+        for trial_id in trial_ids:
+            suggestion = self.suggest(trial_id)
+            suggestions.append(suggestion)
+            if suggestion in (None, Searcher.FINISHED):
+                break
+        return suggestions
+
     def add_evaluated_point(
         self,
         parameters: Dict,
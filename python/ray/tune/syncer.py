@@ -510,7 +510,13 @@ class SyncerCallback(Callback):
     def _get_trial_sync_process(self, trial: "Trial"):
         return self._sync_processes.setdefault(
             trial.trial_id,
-            _BackgroundProcess(partial(sync_dir_between_nodes, max_size_bytes=None)),
+            _BackgroundProcess(
+                partial(
+                    sync_dir_between_nodes,
+                    max_size_bytes=None,
+                    delta=bool(int(os.environ.get("TUNE_SYNC_DELTA", "0"))),
+                )
+            ),
         )
 
     def _remove_trial_sync_process(self, trial: "Trial"):
@@ -10,6 +10,7 @@ from numpy import nan
 import ray
 from ray import tune
 from ray.tune import ExperimentAnalysis
+from ray.tune.logger import ParquetLoggerCallback
 import ray.tune.registry
 from ray.tune.utils.mock_trainable import MyTrainableClass
 from ray.tune.utils.util import is_nan
@@ -239,6 +240,37 @@ class ExperimentAnalysisSuite(unittest.TestCase):
         for df in dataframes.values():
             self.assertEqual(df.training_iteration.max(), 1)
 
+    def testResultStore(self):
+        analysis = tune.run(
+            MyTrainableClass,
+            name="test_result_store",
+            local_dir=self.test_dir,
+            stop={"training_iteration": 3},
+            num_samples=self.num_samples,
+            callbacks=[ParquetLoggerCallback()],
+            config={
+                "width": tune.sample_from(lambda spec: 10 + int(90 * random.random())),
+                "height": tune.sample_from(lambda spec: int(100 * random.random())),
+            },
+        )
+        # Results are read from the result store if it exists.
+        self.assertEqual(analysis._file_type, "parquet")
+        store_dataframes = dict(analysis.trial_dataframes)
+        store_df = analysis.dataframe(self.metric, mode="max")
+
+        analysis.set_filetype("csv")
+        csv_dataframes = analysis.trial_dataframes
+        csv_df = analysis.dataframe(self.metric, mode="max")
+
+        self.assertEqual(set(store_dataframes), set(csv_dataframes))
+        for path, df in store_dataframes.items():
+            self.assertEqual(
+                df[self.metric].tolist(), csv_dataframes[path][self.metric].tolist()
+            )
+        self.assertEqual(
+            sorted(store_df[self.metric].tolist()), sorted(csv_df[self.metric].tolist())
+        )
+
     def testIgnoreOtherExperiment(self):
         analysis = tune.run(
             MyTrainableClass,
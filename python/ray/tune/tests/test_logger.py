@@ -14,14 +14,17 @@ from ray.tune.logger import (
     JsonLoggerCallback,
     JsonLogger,
     CSVLogger,
+    ParquetLoggerCallback,
     TBXLoggerCallback,
     TBXLogger,
 )
+from ray.tune.analysis.result_store import _ResultStore
 from ray.tune.result import (
     EXPR_PARAM_FILE,
     EXPR_PARAM_PICKLE_FILE,
     EXPR_PROGRESS_FILE,
     EXPR_RESULT_FILE,
+    EXPR_RESULT_STORE_DIR,
 )
 
 
@@ -30,6 +33,10 @@ class Trial(namedtuple("MockTrial", ["evaluated_params", "trial_id", "logdir"]))
     def config(self):
         return self.evaluated_params
 
+    @property
+    def local_dir(self):
+        return self.logdir
+
     def init_logdir(self):
         return
 
@@ -167,6 +174,46 @@ class LoggerSuite(unittest.TestCase):
 
         self.assertEqual(loaded_config, config)
 
+    def testParquet(self):
+        trials = [
+            Trial(evaluated_params={}, trial_id=f"parquet_{i}", logdir=self.test_dir)
+            for i in range(2)
+        ]
+        logger = ParquetLoggerCallback(max_buffered_rows=4)
+        for i in range(3):
+            for t in trials:
+                rew = i + 4 if t.trial_id == "parquet_0" else 7 - i
+                logger.on_trial_result(
+                    i, [], t, result(i, rew, score=[1, 2, 3], hello={"world": 1})
+                )
+        # The first 4 results have been written, the rest is still buffered.
+        store_dir = os.path.join(self.test_dir, EXPR_RESULT_STORE_DIR)
+        self.assertEqual(len(os.listdir(store_dir)), 1)
+        logger.on_experiment_end(trials)
+        self.assertEqual(len(os.listdir(store_dir)), 2)
+
+        store = _ResultStore(store_dir)
+        dataframes = store.trial_dataframes()
+        self.assertSequenceEqual(
+            dataframes["parquet_0"]["episode_reward_mean"].tolist(), [4, 5, 6]
+        )
+        self.assertSequenceEqual(
+            dataframes["parquet_1"]["episode_reward_mean"].tolist(), [7, 6, 5]
+        )
+        self.assertIn("hello/world", dataframes["parquet_0"])
+        self.assertNotIn("config", dataframes["parquet_0"])
+
+        projected = store.read(columns=["trial_id", "mean_accuracy", "missing"])
+        self.assertSequenceEqual(list(projected), ["trial_id", "mean_accuracy"])
+
+        self.assertEqual(
+            store.metric_bounds("episode_reward_mean"),
+            {"parquet_0": (4, 6), "parquet_1": (5, 7)},
+        )
+        best_rows = store.best_rows("episode_reward_mean", "max")
+        self.assertEqual(best_rows["parquet_0"]["training_iteration"], 2)
+        self.assertEqual(best_rows["parquet_1"]["training_iteration"], 0)
+
     def testLegacyTBX(self):
         config = {
             "a": 2,
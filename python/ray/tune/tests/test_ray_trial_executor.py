@@ -12,6 +12,7 @@ from ray.rllib import _register_all
 from ray.tune import Trainable
 from ray.tune.callback import Callback
 from ray.tune.execution.ray_trial_executor import (
+    _ActorPool,
     _ExecutorEvent,
     _ExecutorEventType,
     RayTrialExecutor,
@@ -619,6 +620,117 @@ class RayExecutorPlacementGroupTest(unittest.TestCase):
         assert executor.has_resources_for_trial(trial2)
         assert not executor.has_resources_for_trial(trial3)
 
+    def testActorPoolKeyedByPlacementGroupFactory(self):
+        pgf1 = PlacementGroupFactory([{"CPU": 1}])
+        pgf2 = PlacementGroupFactory([{"CPU": 2}])
+
+        trial1 = Trial("__fake", placement_group_factory=pgf1)
+        trial2 = Trial("__fake", placement_group_factory=pgf1)
+        trial3 = Trial("__fake", placement_group_factory=pgf2)
+
+        pool = _ActorPool(max_idle=2)
+        pool.add("runner_a", "pg_a", PlacementGroupFactory([{"CPU": 1}]))
+        pool.add("runner_b", "pg_b", pgf1, prestarted_for=trial2)
+
+        assert pool.is_full()
+        assert pool.has_idle(pgf1)
+        assert not pool.has_idle(pgf2)
+
+        # Actors with a different shape are never handed out
+        assert pool.pop(trial3) is None
+
+        # Actors pre-started for a trial are handed out to that trial first
+        assert pool.pop(trial2) == ("runner_b", "pg_b", trial2)
+        assert pool.pop(trial1) == ("runner_a", "pg_a", None)
+        assert pool.pop(trial1) is None
+        assert len(pool) == 0
+
+        # Unneeded actors are evicted, keeping the ones pre-started for a trial
+        pool.add("runner_a", "pg_a", pgf1)
+        pool.add("runner_b", "pg_b", pgf1, prestarted_for=trial2)
+        pool.add("runner_c", "pg_c", pgf2)
+        assert pool.pop_unneeded({pgf1: 1, pgf2: 1}) == [("runner_a", "pg_a", None)]
+        assert pool.pop_other(pgf1) == ("runner_c", "pg_c", None)
+        assert pool.pop_other(pgf1) is None
+        assert pool.pop_unneeded({}) == [("runner_b", "pg_b", trial2)]
+        assert len(pool) == 0
+
+    @patch.dict(os.environ, {"TUNE_PRESTART_ACTORS": "1"})
+    def testPrestartPooledActors(self):
+        class B(Trainable):
+            def step(self):
+                return dict(foo=self.config["foo"], done=True)
+
+            def reset_config(self, config):
+                self.config = config
+                return True
+
+        register_trainable("prestart", B)
+
+        pgf = PlacementGroupFactory([{"CPU": 1}])
+        executor = RayTrialExecutor(reuse_actors=True)
+        executor.setup(max_pending_trials=2)
+        pgm = executor._pg_manager
+
+        trial1 = Trial("prestart", config={"foo": 1}, placement_group_factory=pgf)
+        trial2 = Trial("prestart", config={"foo": 2}, placement_group_factory=pgf)
+        trials = [trial1, trial2]
+
+        def prestart():
+            executor._stage_and_update_status(trials)
+            while len(executor._actor_pool) == 0:
+                time.sleep(0.5)
+                executor._stage_and_update_status(trials)
+                executor._prestart_pooled_actors()
+            [(runner, pg, prestarted_for)] = executor._actor_pool._idle[pgf]
+            return runner, pg, prestarted_for
+
+        # The actor is pre-started for a staged trial, and its placement group is
+        # moved from the trial into the cache
+        runner, pg, prestarted_for = prestart()
+        assert prestarted_for in trials
+        assert prestarted_for in executor._staged_trials
+        assert not pgm.trial_in_use(prestarted_for)
+        assert pgm._cached_pgs == {pg: pgf}
+        assert executor._actor_pool.stats["prestarted"] == 1
+
+        # Another trial can use the actor after resetting it, and the trial the
+        # actor was pre-started for is staged again
+        [other] = [trial for trial in trials if trial is not prestarted_for]
+        assert executor._start_trial(other)
+        assert other.runner is runner
+        assert pgm.trial_in_use(other)
+        assert prestarted_for not in executor._staged_trials
+        assert executor._actor_pool.stats["hits"] == 1
+        while True:
+            event = executor.get_next_executor_event(
+                live_trials={other}, next_trial_exists=False
+            )
+            if event.type == _ExecutorEventType.TRAINING_RESULT:
+                break
+        result = event.result[_ExecutorEvent.KEY_FUTURE_RESULT]
+        assert result["foo"] == other.config["foo"]
+
+        # An idle actor is evicted when a staged trial with another placement
+        # group factory waits for its resources
+        runner, pg, prestarted_for = prestart()
+        trial3 = Trial(
+            "prestart",
+            config={"foo": 3},
+            placement_group_factory=PlacementGroupFactory([{"CPU": 7}]),
+        )
+        trials.append(trial3)
+        executor._stage_and_update_status(trials)
+        assert trial3 in executor._staged_trials
+        executor._evict_pooled_actors(trials)
+        assert len(executor._actor_pool) == 1
+        executor._evict_pooled_actors(trials)
+        assert len(executor._actor_pool) == 0
+        assert executor._actor_pool.stats["evicted"] == 1
+        assert prestarted_for not in executor._staged_trials
+        assert pg not in pgm._cached_pgs
+        assert (_ExecutorEventType.STOP_RESULT, pg) in executor._futures.values()
+
     def testEmptyPlacementGroupFactory(self):
         # Empty bundles
         with self.assertRaises(ValueError):
@@ -19,7 +19,7 @@ from ray.tune.schedulers import TrialScheduler, FIFOScheduler
 from ray.tune.experiment import Experiment
 from ray.tune.search import BasicVariantGenerator
 from ray.tune.experiment import Trial
-from ray.tune.execution.trial_runner import TrialRunner
+from ray.tune.execution.trial_runner import TrialRunner, _get_delta_log_path
 from ray.tune.resources import Resources, json_to_resources, resources_to_json
 from ray.tune.search.repeater import Repeater
 from ray.tune.search._mock import _MockSuggestionAlgorithm
@@ -148,6 +148,57 @@ class TrialRunnerTest3(unittest.TestCase):
         self.assertEqual(searcher.counter["result"], 1)
         self.assertEqual(searcher.counter["complete"], 1)
 
+    def testSearchAlgBatchedNotification(self):
+        """Checks that trials are suggested and results passed in batches."""
+        os.environ["TUNE_MAX_PENDING_TRIALS_PG"] = "4"
+
+        class BatchedSearchAlgorithm(_MockSuggestionAlgorithm):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+                self.events = []
+                searcher = self.searcher
+                suggest_batch = searcher.suggest_batch
+                on_trial_complete = searcher.on_trial_complete
+
+                def record_suggest_batch(trial_ids):
+                    self.batches.append(len(trial_ids))
+                    return suggest_batch(trial_ids)
+
+                def record_on_trial_results(results):
+                    self.events += [("result", trial_id) for trial_id, _ in results]
+
+                def record_on_trial_complete(trial_id, **kwargs):
+                    self.events.append(("complete", trial_id))
+                    on_trial_complete(trial_id, **kwargs)
+
+                searcher.suggest_batch = record_suggest_batch
+                searcher.on_trial_results = record_on_trial_results
+                searcher.on_trial_complete = record_on_trial_complete
+
+        ray.init(num_cpus=4, local_mode=True, include_dashboard=False)
+        experiment_spec = {
+            "run": "__fake",
+            "num_samples": 4,
+            "stop": {"training_iteration": 2},
+        }
+        search_alg = BatchedSearchAlgorithm()
+        search_alg.add_configurations([Experiment.from_json("test", experiment_spec)])
+        runner = TrialRunner(search_alg=search_alg)
+
+        while not runner.is_finished():
+            runner.step()
+
+        # The first trial is suggested on its own while waiting for trials
+        self.assertEqual(search_alg.batches, [3])
+        for trial in runner.get_trials():
+            events = [
+                event
+                for event, trial_id in search_alg.events
+                if trial_id == trial.trial_id
+            ]
+            self.assertEqual(events, ["result", "complete"])
+
     def testSearchAlgFinished(self):
         """Checks that SearchAlg is Finished before all trials are done."""
         ray.init(num_cpus=4, local_mode=True, include_dashboard=False)
@@ -605,6 +656,45 @@ class TrialRunnerTest3(unittest.TestCase):
         self.assertEqual(count_checkpoints(tmpdir), 2)
         shutil.rmtree(tmpdir)
 
+    def testIncrementalCheckpoint(self):
+        ray.init(num_cpus=2)
+
+        trials = [
+            Trial("__fake", checkpoint_config=CheckpointConfig(checkpoint_frequency=1))
+            for _ in range(3)
+        ]
+        runner = TrialRunner(local_checkpoint_dir=self.tmpdir, checkpoint_period=0)
+        for trial in trials:
+            runner.add_trial(trial)
+
+        # The first checkpoint writes a snapshot, later ones append deltas.
+        runner.step()
+        runner.checkpoint()
+        with open(runner.checkpoint_file) as f:
+            snapshot = f.read()
+        delta_log_path = _get_delta_log_path(runner.checkpoint_file)
+
+        while not runner.is_finished():
+            runner.step()
+            runner.checkpoint()
+        with open(runner.checkpoint_file) as f:
+            self.assertEqual(f.read(), snapshot)
+        self.assertTrue(os.path.exists(delta_log_path))
+
+        # Resuming applies the deltas on top of the snapshot.
+        runner2 = TrialRunner(resume="LOCAL", local_checkpoint_dir=self.tmpdir)
+        self.assertEqual(
+            sorted(t.status for t in runner2.get_trials()), 3 * [Trial.TERMINATED]
+        )
+
+        # A forced checkpoint compacts the deltas into a new snapshot.
+        runner.checkpoint(force=True)
+        self.assertFalse(os.path.exists(delta_log_path))
+        runner3 = TrialRunner(resume="LOCAL", local_checkpoint_dir=self.tmpdir)
+        self.assertEqual(
+            sorted(t.status for t in runner3.get_trials()), 3 * [Trial.TERMINATED]
+        )
+
     def testCheckpointFreqBuffered(self):
         os.environ["TUNE_RESULT_BUFFER_LENGTH"] = "7"
         os.environ["TUNE_RESULT_BUFFER_MIN_TIME_S"] = "1"
@@ -952,6 +1042,36 @@ class SearchAlgorithmTest(unittest.TestCase):
         limiter2.on_trial_complete("test_2", {"result": 3})
         assert limiter2.suggest("test_3")["score"] == 3
 
+    def testSuggestBatchLimiter(self):
+        class TestSuggestion(Searcher):
+            def __init__(self):
+                self.index = 0
+                self.batches = []
+                super().__init__(metric="result", mode="max")
+
+            def suggest(self, trial_id):
+                self.index += 1
+                return {"score": self.index}
+
+            def suggest_batch(self, trial_ids):
+                self.batches.append(len(trial_ids))
+                return super().suggest_batch(trial_ids)
+
+            def on_trial_complete(self, trial_id, result=None, **kwargs):
+                pass
+
+        searcher = TestSuggestion()
+        limiter = ConcurrencyLimiter(searcher, max_concurrent=3)
+        suggestions = limiter.suggest_batch(["test_1", "test_2", "test_3", "test_4"])
+        assert [s["score"] for s in suggestions] == [1, 2, 3]
+        assert searcher.batches == [3]
+        assert limiter.suggest_batch(["test_4", "test_5"]) == [None]
+
+        limiter.on_trial_complete("test_1", {"result": 3})
+        suggestions = limiter.suggest_batch(["test_4", "test_5"])
+        assert [s["score"] for s in suggestions] == [4]
+        assert searcher.batches == [3, 1]
+
     def testBasicVariantLimiter(self):
         search_alg = BasicVariantGenerator(max_concurrent=2)
 
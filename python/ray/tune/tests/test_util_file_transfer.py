@@ -5,10 +5,14 @@ import os
 import pytest
 import shutil
 import tempfile
+from unittest.mock import patch
 
 from ray.exceptions import RayTaskError
 
 from ray.tune.utils.file_transfer import (
+    _DEFAULT_DELTA_BLOCK_SIZE_BYTES,
+    _get_recursive_files_manifest,
+    _hash_block,
     _sync_dir_between_different_nodes,
     delete_on_node,
     _sync_dir_on_same_node,
@@ -249,6 +253,88 @@ def test_multi_sync_different_node(ray_start_2_cpus, temp_data_dirs, num_workers
     assert_file(True, tmp_target, "subdir/level1.txt")
 
 
+def test_sync_nodes_delta(ray_start_2_cpus, temp_data_dirs):
+    """Check that delta syncs only transfer blocks not in the target directory"""
+    tmp_source, tmp_target = temp_data_dirs
+
+    block_size = _DEFAULT_DELTA_BLOCK_SIZE_BYTES
+    data = os.urandom(2 * block_size + 100)
+    with open(os.path.join(tmp_source, "subdir", "checkpoint.bin"), "wb") as f:
+        f.write(data)
+
+    node_ip = ray.util.get_node_ip_address()
+
+    def sync():
+        return _sync_dir_between_different_nodes(
+            source_ip=node_ip,
+            source_path=tmp_source,
+            target_ip=node_ip,
+            target_path=tmp_target,
+            delta=True,
+        )
+
+    stats = sync()
+    assert stats["bytes_sent"] == stats["bytes_total"]
+    assert_file(True, tmp_target, "subdir/nested/level2.txt")
+    assert_file(True, tmp_target, "subdir_exclude/something/somewhere.txt")
+
+    # Unchanged files are skipped
+    stats = sync()
+    assert stats["bytes_sent"] == 0
+    assert stats["num_files_skipped"] == stats["num_files"]
+
+    # Only the changed block of a modified file is sent, and blocks of a moved
+    # file are copied on the target node
+    data = data[:-1] + b"x"
+    with open(os.path.join(tmp_source, "subdir", "checkpoint.bin"), "wb") as f:
+        f.write(data)
+    shutil.move(
+        os.path.join(tmp_source, "level0.txt"),
+        os.path.join(tmp_source, "level0_moved.txt"),
+    )
+    stats = sync()
+    assert stats["bytes_sent"] == 100
+    assert stats["bytes_saved"] == stats["bytes_total"] - 100
+
+    with open(os.path.join(tmp_target, "subdir", "checkpoint.bin"), "rb") as f:
+        assert f.read() == data
+    with open(os.path.join(tmp_target, "level0_moved.txt")) as f:
+        assert f.read() == "Data"
+    assert not any(
+        file.endswith(".delta_tmp")
+        for _, _, files in os.walk(tmp_target)
+        for file in files
+    )
+
+
+def test_files_manifest_reuses_hashes(temp_data_dirs):
+    """Check that manifests only hash the files that changed since the last one"""
+    tmp_source, _ = temp_data_dirs
+
+    with patch(
+        "ray.tune.utils.file_transfer._hash_block", side_effect=_hash_block
+    ) as hash_block:
+        manifest = _get_recursive_files_manifest(tmp_source)
+        assert hash_block.call_count == 7
+
+        hash_block.reset_mock()
+        assert _get_recursive_files_manifest(tmp_source) == manifest
+        assert hash_block.call_count == 0
+
+        with open(os.path.join(tmp_source, "level0.txt"), "w") as f:
+            f.write("Changed data")
+        new_manifest = _get_recursive_files_manifest(tmp_source)
+        assert hash_block.call_count == 1
+        assert new_manifest[os.path.join(".", "level0.txt")][2] == [
+            _hash_block(b"Changed data")
+        ]
+
+        # Block hashes depend on the block size
+        hash_block.reset_mock()
+        _get_recursive_files_manifest(tmp_source, block_size_bytes=2)
+        assert hash_block.call_count == 6 * 2 + 6
+
+
 def test_max_size_exceeded(ray_start_2_cpus, temp_data_dirs):
     tmp_source, tmp_target = temp_data_dirs
 
@@ -1,10 +1,12 @@
 import fnmatch
+import hashlib
 import io
+import logging
 import os
 import shutil
 import tarfile
 
-from typing import Optional, Tuple, Dict, Generator, Union, List
+from typing import Optional, Tuple, Dict, Generator, Iterable, Union, List
 
 import ray
 from ray.util.annotations import DeveloperAPI
@@ -14,6 +16,16 @@ from ray.util.scheduling_strategies import PlacementGroupSchedulingStrategy
 
 _DEFAULT_CHUNK_SIZE_BYTES = 500 * 1024 * 1024  # 500 MiB
 _DEFAULT_MAX_SIZE_BYTES = 1 * 1024 * 1024 * 1024  # 1 GiB
+_DEFAULT_DELTA_BLOCK_SIZE_BYTES = 4 * 1024 * 1024  # 4 MiB
+
+# Suffix of the files that delta syncs stage their writes in.
+_DELTA_TMP_SUFFIX = ".delta_tmp"
+
+logger = logging.getLogger(__name__)
+
+# Block hashes of the files that manifests were created for, keyed by the path of
+# the file and the block size, so that unchanged files aren't hashed again.
+_block_hashes_cache: Dict[Tuple[str, int], Tuple[float, int, List[str]]] = {}
 
 
 @DeveloperAPI
@@ -27,8 +39,10 @@ def sync_dir_between_nodes(
     chunk_size_bytes: int = _DEFAULT_CHUNK_SIZE_BYTES,
     max_size_bytes: Optional[int] = _DEFAULT_MAX_SIZE_BYTES,
     return_futures: bool = False,
+    delta: bool = False,
 ) -> Union[
     None,
+    Dict[str, int],
     Tuple[ray.ObjectRef, ray.ActorID, ray.ObjectRef],
     Tuple[ray.ObjectRef, None, None],
 ]:
@@ -42,6 +56,11 @@ def sync_dir_between_nodes(
     the directory will be packed and sent through the Ray Object Store to the target
     node.
 
+    With ``delta=True``, files are compared block by block instead: the target node
+    sends the hashes of the blocks of its files, and only blocks whose content isn't
+    found anywhere in the target directory are streamed from the source node. This
+    is useful for large checkpoints that change only partially between syncs.
+
     Args:
         source_ip: IP of source node.
         source_path: Path to directory on source node.
@@ -59,10 +78,14 @@ def sync_dir_between_nodes(
         return_futures: If True, returns a tuple of the unpack future,
             the pack actor, and the files_stats future. If False (default) will
             block until synchronization finished and return None.
+        delta: If True, only transfer the blocks of files whose content isn't in
+            the target directory yet. Ignored if ``source_ip==target_ip``.
 
     Returns:
         None, or Tuple of unpack future, pack actor, and files_stats future.
         If ``source_ip==target_ip``, pack actor and files_stats future will be None.
+        With ``delta=True``, the transfer stats are returned instead of None, and
+        the files_stats future holds the block manifest of the target directory.
 
     """
     if source_ip != target_ip:
@@ -76,6 +99,7 @@ def sync_dir_between_nodes(
             chunk_size_bytes=chunk_size_bytes,
             max_size_bytes=max_size_bytes,
             return_futures=return_futures,
+            delta=delta,
         )
     elif source_path != target_path:
         ret = _sync_dir_on_same_node(
@@ -139,7 +163,8 @@ def _sync_dir_between_different_nodes(
     chunk_size_bytes: int = _DEFAULT_CHUNK_SIZE_BYTES,
     max_size_bytes: Optional[int] = _DEFAULT_MAX_SIZE_BYTES,
     return_futures: bool = False,
-) -> Union[None, Tuple[ray.ObjectRef, ray.ActorID, ray.ObjectRef]]:
+    delta: bool = False,
+) -> Union[None, Dict[str, int], Tuple[ray.ObjectRef, ray.ActorID, ray.ObjectRef]]:
     """Synchronize directory on source node to directory on target node.
 
     Per default, this function will collect information about already existing
@@ -160,11 +185,27 @@ def _sync_dir_between_different_nodes(
         return_futures: If True, returns a tuple of the unpack future,
             the pack actor, and the files_stats future. If False (default) will
             block until synchronization finished and return None.
+        delta: If True, only transfer the blocks of files whose content isn't in
+            the target directory yet.
 
     Returns:
         None, or Tuple of unpack future, pack actor, and files_stats future.
+        With ``delta=True``, the transfer stats are returned instead of None.
 
     """
+    if delta:
+        return _delta_sync_dir_between_different_nodes(
+            source_ip=source_ip,
+            source_path=source_path,
+            target_ip=target_ip,
+            target_path=target_path,
+            force_all=force_all,
+            exclude=exclude,
+            chunk_size_bytes=chunk_size_bytes,
+            max_size_bytes=max_size_bytes,
+            return_futures=return_futures,
+        )
+
     pack_actor_on_source_node = _PackActor.options(
         num_cpus=0,
         resources={f"node:{source_ip}": 0.01},
@@ -450,6 +491,317 @@ def _unpack_from_actor(pack_actor: ray.ActorID, target_dir: str) -> None:
     _unpack_dir(stream, target_dir=target_dir)
 
 
+def _delta_sync_dir_between_different_nodes(
+    source_ip: str,
+    source_path: str,
+    target_ip: str,
+    target_path: str,
+    force_all: bool = False,
+    exclude: Optional[List] = None,
+    chunk_size_bytes: int = _DEFAULT_CHUNK_SIZE_BYTES,
+    max_size_bytes: Optional[int] = _DEFAULT_MAX_SIZE_BYTES,
+    return_futures: bool = False,
+) -> Union[Dict[str, int], Tuple[ray.ObjectRef, ray.ActorID, ray.ObjectRef]]:
+    """Synchronize directory on source node to directory on target node, only
+    transferring the blocks of files that aren't in the target directory yet.
+
+    The target node sends a manifest of its files to the source node, which plans
+    which blocks to copy from existing target files and which to send, and then
+    streams the blocks to send in chunks without packing them into an archive.
+
+    See ``_sync_dir_between_different_nodes`` for the arguments. Returns the
+    transfer stats, or a tuple of the unpack future, the pack actor, and the
+    manifest future.
+    """
+    pack_actor_on_source_node = _DeltaPackActor.options(
+        num_cpus=0,
+        resources={f"node:{source_ip}": 0.01},
+        scheduling_strategy=PlacementGroupSchedulingStrategy(placement_group=None),
+    )
+    unpack_on_target_node = _unpack_delta_from_actor.options(
+        num_cpus=0,
+        resources={f"node:{target_ip}": 0.01},
+        scheduling_strategy=PlacementGroupSchedulingStrategy(placement_group=None),
+    )
+
+    if force_all:
+        manifest = None
+    else:
+        manifest = _remote_get_recursive_files_manifest.options(
+            num_cpus=0,
+            resources={f"node:{target_ip}": 0.01},
+            scheduling_strategy=PlacementGroupSchedulingStrategy(placement_group=None),
+        ).remote(target_path)
+
+    pack_actor = pack_actor_on_source_node.remote(
+        source_dir=source_path,
+        manifest=manifest,
+        chunk_size_bytes=chunk_size_bytes,
+        max_size_bytes=max_size_bytes,
+        exclude=exclude,
+    )
+    unpack_future = unpack_on_target_node.remote(pack_actor, target_path)
+
+    if return_futures:
+        return unpack_future, pack_actor, manifest
+
+    return ray.get(unpack_future)
+
+
+def _hash_block(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _get_recursive_files_manifest(
+    path: str, block_size_bytes: int = _DEFAULT_DELTA_BLOCK_SIZE_BYTES
+) -> Dict[str, Tuple[float, int, List[str]]]:
+    """Return dict of files mapping to stats and block hashes in ``path``.
+
+    Like ``_get_recursive_files_and_stats``, but each file maps to a tuple of
+    (mtime, filesize, block_hashes), where ``block_hashes`` are the hashes of the
+    consecutive blocks of ``block_size_bytes`` of the file.
+    """
+    manifest = {}
+    for key, (mtime, size) in _get_recursive_files_and_stats(path).items():
+        if key.endswith(_DELTA_TMP_SUFFIX):
+            # Left over from an interrupted sync
+            continue
+        file_path = os.path.abspath(os.path.join(path, key))
+        cache_key = file_path, block_size_bytes
+        cached = _block_hashes_cache.get(cache_key)
+        if cached is not None and cached[:2] == (mtime, size):
+            manifest[key] = cached
+            continue
+        try:
+            with open(file_path, "rb") as f:
+                hashes = [
+                    _hash_block(block)
+                    for block in iter(lambda: f.read(block_size_bytes), b"")
+                ]
+        except FileNotFoundError:
+            # Race condition, see ``_get_recursive_files_and_stats``
+            _block_hashes_cache.pop(cache_key, None)
+            continue
+        manifest[key] = _block_hashes_cache[cache_key] = mtime, size, hashes
+    return manifest
+
+
+# Only export once
+_remote_get_recursive_files_manifest = ray.remote(_get_recursive_files_manifest)
+
+
+@ray.remote
+class _DeltaPackActor:
+    """Actor planning and streaming a delta sync of a directory.
+
+    When initialized, the actor hashes the blocks of the files in ``source_dir``
+    that differ from the ``manifest`` of the target directory, and plans a list of
+    operations that rebuild them on the target node:
+
+    - ``("dir", key)``: Create directory ``key``.
+    - ``("file", key, mtime_ns, mode)``: Start writing file ``key``.
+    - ``("copy", key, offset, length, hash)``: Append a block of an existing file
+      in the target directory.
+    - ``("data", bytes)``: Append the given bytes. Planned as
+      ``("read", key, offset, length)`` and read when streamed.
+
+    The operations can be received in chunks by calling the remote ``next()``
+    task, and the transfer stats by calling ``get_stats()``.
+
+    Args:
+        source_dir: Path to local directory to sync.
+        exclude: Pattern of files to exclude, e.g.
+            ``["*/checkpoint_*]`` to exclude trial checkpoints.
+        manifest: Dict of relative filenames in the target directory mapping to a
+            tuple of (mtime, filesize, block_hashes). Files with the same mtime and
+            filesize are skipped, and blocks with known hashes are copied on the
+            target node.
+        chunk_size_bytes: Send at most this many bytes of data per chunk.
+        max_size_bytes: If the data to send exceeds this value, raise an error
+            before transfer. If ``None``, no limit is enforced.
+        block_size_bytes: Size of the blocks that are compared by hash. Must match
+            the block size of the manifest.
+    """
+
+    def __init__(
+        self,
+        source_dir: str,
+        exclude: Optional[List] = None,
+        manifest: Optional[Dict[str, Tuple[float, int, List[str]]]] = None,
+        chunk_size_bytes: int = _DEFAULT_CHUNK_SIZE_BYTES,
+        max_size_bytes: Optional[int] = _DEFAULT_MAX_SIZE_BYTES,
+        block_size_bytes: int = _DEFAULT_DELTA_BLOCK_SIZE_BYTES,
+    ):
+        self.source_dir = source_dir
+        self.chunk_size = chunk_size_bytes
+        self.stats = {
+            "num_files": 0,
+            "num_files_skipped": 0,
+            "bytes_total": 0,
+            "bytes_sent": 0,
+            "bytes_saved": 0,
+        }
+        self.ops = self._plan(exclude or [], manifest or {}, block_size_bytes)
+        self.iter = None
+
+        bytes_sent = self.stats["bytes_sent"]
+        if max_size_bytes and bytes_sent > max_size_bytes:
+            raise RuntimeError(
+                f"Delta of directory {source_dir} has a size of "
+                f"{_gib_string(bytes_sent)}, which exceeds the limit "
+                f"of {_gib_string(max_size_bytes)}. Please check the directory "
+                f"contents. If you want to transfer everything, you can increase "
+                f"or disable the limit by passing the `max_size` argument."
+            )
+
+    def _plan(
+        self,
+        exclude: List[str],
+        manifest: Dict[str, Tuple[float, int, List[str]]],
+        block_size: int,
+    ) -> List[tuple]:
+        # Any block with a known hash can be copied, not only the blocks at the
+        # same position of the same file.
+        known_blocks = {}
+        for key, (_, size, hashes) in manifest.items():
+            for i, block_hash in enumerate(hashes):
+                length = min(block_size, size - i * block_size)
+                known_blocks.setdefault(block_hash, (key, i * block_size, length))
+
+        ops = []
+        for root, dirs, files in os.walk(self.source_dir):
+            rel_root = os.path.relpath(root, self.source_dir)
+            for dir in dirs:
+                ops.append(("dir", os.path.join(rel_root, dir)))
+            for file in files:
+                key = os.path.join(rel_root, file)
+                if any(fnmatch.fnmatch(key, excl) for excl in exclude):
+                    continue
+                path = os.path.join(self.source_dir, key)
+                stat = os.lstat(path)
+                self.stats["num_files"] += 1
+                self.stats["bytes_total"] += stat.st_size
+                if key in manifest and manifest[key][:2] == (
+                    stat.st_mtime,
+                    stat.st_size,
+                ):
+                    self.stats["num_files_skipped"] += 1
+                    self.stats["bytes_saved"] += stat.st_size
+                    continue
+
+                ops.append(("file", key, stat.st_mtime_ns, stat.st_mode))
+                with open(path, "rb") as f:
+                    offset = 0
+                    for block in iter(lambda: f.read(block_size), b""):
+                        block_hash = _hash_block(block)
+                        if block_hash in known_blocks:
+                            ops.append(("copy", *known_blocks[block_hash], block_hash))
+                            self.stats["bytes_saved"] += len(block)
+                        else:
+                            ops.append(("read", key, offset, len(block)))
+                            self.stats["bytes_sent"] += len(block)
+                        offset += len(block)
+        return ops
+
+    def get_stats(self) -> Dict[str, int]:
+        return self.stats
+
+    def _chunk_generator(self) -> Generator[List[tuple], None, None]:
+        chunk = []
+        chunk_bytes = 0
+        for op in self.ops:
+            if op[0] == "read":
+                _, key, offset, length = op
+                with open(os.path.join(self.source_dir, key), "rb") as f:
+                    f.seek(offset)
+                    op = ("data", f.read(length))
+                chunk_bytes += length
+            chunk.append(op)
+            if chunk_bytes >= self.chunk_size:
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+        if chunk:
+            yield chunk
+
+    def next(self) -> Optional[List[tuple]]:
+        if not self.iter:
+            self.iter = iter(self._chunk_generator())
+        try:
+            return next(self.iter)
+        except StopIteration:
+            return None
+
+
+def _apply_delta(ops: Iterable[tuple], target_dir: str) -> None:
+    """Rebuild the changed files of a delta sync in ``target_dir``.
+
+    Files are written to temporary files first and only replace the existing files
+    once all of them are written, since their blocks may be copied from any
+    existing file.
+    """
+    os.makedirs(target_dir, exist_ok=True)
+    written = []
+    f = None
+    try:
+        for op in ops:
+            kind = op[0]
+            if kind == "dir":
+                os.makedirs(os.path.join(target_dir, op[1]), exist_ok=True)
+            elif kind == "file":
+                if f:
+                    f.close()
+                _, key, mtime_ns, mode = op
+                path = os.path.join(target_dir, key)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                f = open(path + _DELTA_TMP_SUFFIX, "wb")
+                written.append((path, mtime_ns, mode))
+            elif kind == "data":
+                f.write(op[1])
+            elif kind == "copy":
+                _, key, offset, length, block_hash = op
+                with open(os.path.join(target_dir, key), "rb") as source:
+                    source.seek(offset)
+                    block = source.read(length)
+                if _hash_block(block) != block_hash:
+                    raise RuntimeError(
+                        f"File {key} in {target_dir} changed during a delta sync. "
+                        f"Please retry the sync."
+                    )
+                f.write(block)
+        if f:
+            f.close()
+        for path, mtime_ns, mode in written:
+            os.chmod(path + _DELTA_TMP_SUFFIX, mode)
+            # Keep the source mtime so the file is skipped in the next sync
+            os.utime(path + _DELTA_TMP_SUFFIX, ns=(mtime_ns, mtime_ns))
+            os.replace(path + _DELTA_TMP_SUFFIX, path)
+    finally:
+        if f:
+            f.close()
+        for path, _, _ in written:
+            if os.path.exists(path + _DELTA_TMP_SUFFIX):
+                os.remove(path + _DELTA_TMP_SUFFIX)
+
+
+@ray.remote
+def _unpack_delta_from_actor(
+    pack_actor: ray.ActorID, target_dir: str
+) -> Dict[str, int]:
+    """Iterate over chunks received from delta pack actor and apply them."""
+    target_dir = os.path.normpath(target_dir)
+    ops = (op for chunk in _iter_remote(pack_actor) for op in chunk)
+    with TempFileLock(f"{target_dir}.lock"):
+        _apply_delta(ops, target_dir)
+    stats = ray.get(pack_actor.get_stats.remote())
+    logger.debug(
+        f"Delta synced {stats['num_files']} files to {target_dir}: sent "
+        f"{stats['bytes_sent']} of {stats['bytes_total']} bytes, saved "
+        f"{stats['bytes_saved']} bytes."
+    )
+    return stats
+
+
 def _copy_dir(
     source_dir: str,
     target_dir: str,
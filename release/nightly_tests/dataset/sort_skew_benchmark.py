@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+import ray
+from ray.data.context import DatasetContext
+from ray.data.dataset import Dataset
+
+from benchmark import Benchmark
+
+
+def make_zipf_dataset(num_rows: int, num_blocks: int, a: float) -> Dataset:
+    """Generate a dataset whose "key" column follows a Zipf distribution.
+
+    The smaller ``a`` is, the more rows share the most frequent keys, so the
+    output blocks of a sort that hold them are larger than the others.
+    """
+
+    def add_zipf_key(df: pd.DataFrame) -> pd.DataFrame:
+        df["key"] = np.random.zipf(a, len(df))
+        df["payload"] = np.random.rand(len(df))
+        return df
+
+    return (
+        ray.data.range_table(num_rows, parallelism=num_blocks)
+        .map_batches(add_zipf_key, batch_format="pandas")
+        .fully_executed()
+    )
+
+
+def sort(ds: Dataset, skew_factor) -> Dataset:
+    ctx = DatasetContext.get_current()
+    original = ctx.push_based_shuffle_skew_factor
+    ctx.push_based_shuffle_skew_factor = skew_factor
+    try:
+        return ds.sort("key").fully_executed()
+    finally:
+        ctx.push_based_shuffle_skew_factor = original
+
+
+if __name__ == "__main__":
+    DatasetContext.get_current().use_push_based_shuffle = True
+    benchmark = Benchmark("sort-skew")
+
+    num_blocks = int(ray.cluster_resources().get("CPU", 1)) * 2
+    for a in [1.1, 1.5, 2.0]:
+        ds = make_zipf_dataset(100_000_000, num_blocks, a)
+        benchmark.run(f"zipf-{a}-no-split", sort, ds=ds, skew_factor=None)
+        benchmark.run(f"zipf-{a}-split-2x", sort, ds=ds, skew_factor=2)
+
+    benchmark.write_result()
@@ -0,0 +1,104 @@
+"""Searcher overhead (1 node, 1k trials)
+
+In this run, we start a large number of short trials with a searcher that
+refits its model on each call, like model-based searchers do. We measure the
+driver overhead per trial when the searcher suggests one configuration per
+call, and when it suggests a batch of configurations per call with
+``Searcher.suggest_batch``.
+
+Cluster: cluster_1x16.yaml
+
+Test owner: krfricke
+
+Acceptance criteria: Batched suggestions should take less driver time per trial.
+"""
+import json
+import os
+import random
+import time
+from typing import Dict, List, Optional
+
+import ray
+from ray import tune
+from ray.tune.search import ConcurrencyLimiter, Searcher
+
+
+class _RefittingSearcher(Searcher):
+    """Searcher that takes ``fit_time_s`` to fit its model on each call."""
+
+    def __init__(self, fit_time_s: float):
+        super().__init__(metric="score", mode="max")
+        self.fit_time_s = fit_time_s
+        self.num_fits = 0
+
+    def _fit(self):
+        self.num_fits += 1
+        time.sleep(self.fit_time_s)
+
+    def suggest(self, trial_id: str) -> Optional[Dict]:
+        self._fit()
+        return {"x": random.uniform(0.0, 1.0)}
+
+    def on_trial_complete(
+        self, trial_id: str, result: Optional[Dict] = None, error: bool = False
+    ):
+        pass
+
+
+class _BatchRefittingSearcher(_RefittingSearcher):
+    def suggest_batch(self, trial_ids: List[str]) -> List[Optional[Dict]]:
+        self._fit()
+        return [{"x": random.uniform(0.0, 1.0)} for _ in trial_ids]
+
+
+def train(config):
+    tune.report(score=config["x"])
+
+
+def timed_searcher_run(searcher: _RefittingSearcher, num_samples: int) -> Dict:
+    max_concurrent = int(ray.cluster_resources().get("CPU", 1))
+    os.environ["TUNE_MAX_PENDING_TRIALS_PG"] = str(max_concurrent)
+
+    start_time = time.monotonic()
+    tune.run(
+        train,
+        search_alg=ConcurrencyLimiter(searcher, max_concurrent=max_concurrent),
+        num_samples=num_samples,
+        reuse_actors=True,
+        verbose=1,
+    )
+    time_taken = time.monotonic() - start_time
+    return {
+        "time_taken": time_taken,
+        "time_per_trial": time_taken / num_samples,
+        "num_fits": searcher.num_fits,
+    }
+
+
+def main():
+    ray.init(address="auto")
+
+    num_samples = 1000
+    fit_time_s = 0.1
+
+    result = {
+        "single": timed_searcher_run(_RefittingSearcher(fit_time_s), num_samples),
+        "batched": timed_searcher_run(_BatchRefittingSearcher(fit_time_s), num_samples),
+        "last_update": time.time(),
+    }
+    print(f"Searcher overhead: {result}")
+
+    test_output_json = os.environ.get("TEST_OUTPUT_JSON", "/tmp/tune_test.json")
+    with open(test_output_json, "wt") as f:
+        json.dump(result, f)
+
+    if result["batched"]["time_per_trial"] >= result["single"]["time_per_trial"]:
+        raise RuntimeError(
+            f"Batched suggestions took {result['batched']['time_per_trial']:.3f} s "
+            f"per trial, which is not less than the "
+            f"{result['single']['time_per_trial']:.3f} s of single suggestions."
+        )
+
+
+if __name__ == "__main__":
+    main()
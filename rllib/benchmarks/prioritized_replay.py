@@ -0,0 +1,75 @@
+"""Microbenchmark for the segment trees backing prioritized replay buffers.
+
+Compares looking up and updating a batch of priorities one item at a time
+with the batched (np.ndarray) versions of `SumSegmentTree.find_prefixsum_idx`
+and `SegmentTree.__setitem__`, as used by `PrioritizedReplayBuffer` to sample
+and update priorities.
+
+    python prioritized_replay.py --capacity 1048576 --batch-size 512
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from ray.rllib.execution.segment_tree import MinSegmentTree, SumSegmentTree
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--capacity", type=int, default=2**20)
+parser.add_argument("--batch-size", type=int, default=512)
+parser.add_argument("--num-iters", type=int, default=100)
+
+
+def timeit(fn, num_iters: int) -> float:
+    """Returns the mean time in ms that a call to `fn` takes."""
+    start = time.perf_counter()
+    for _ in range(num_iters):
+        fn()
+    return (time.perf_counter() - start) / num_iters * 1000
+
+
+def run_benchmark(capacity: int, batch_size: int, num_iters: int):
+    it_sum = SumSegmentTree(capacity)
+    it_min = MinSegmentTree(capacity)
+    priorities = np.random.random(capacity)
+    it_sum[np.arange(capacity)] = priorities
+    it_min[np.arange(capacity)] = priorities
+
+    idxes = np.random.randint(0, capacity, size=batch_size)
+    new_priorities = np.random.random(batch_size)
+    masses = np.random.random(batch_size) * it_sum.sum()
+
+    def sample_loop():
+        return [it_sum.find_prefixsum_idx(mass) for mass in masses]
+
+    def sample_batched():
+        return it_sum.find_prefixsum_idx(masses)
+
+    def update_loop():
+        for idx, priority in zip(idxes, new_priorities):
+            it_sum[int(idx)] = priority
+            it_min[int(idx)] = priority
+
+    def update_batched():
+        it_sum[idxes] = new_priorities
+        it_min[idxes] = new_priorities
+
+    assert sample_loop() == sample_batched().tolist()
+
+    print(f"capacity={capacity}, batch size={batch_size}")
+    for name, loop_fn, batched_fn in [
+        ("sample", sample_loop, sample_batched),
+        ("update", update_loop, update_batched),
+    ]:
+        loop_ms = timeit(loop_fn, num_iters)
+        batched_ms = timeit(batched_fn, num_iters)
+        print(
+            f"  {name}: per item {loop_ms:.2f}ms, batched {batched_ms:.2f}ms "
+            f"({loop_ms / batched_ms:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    run_benchmark(args.capacity, args.batch_size, args.num_iters)
@@ -1,5 +1,15 @@
 import operator
-from typing import Any, Optional
+from typing import Any, Optional, Union
+
+import numpy as np
+
+# Vectorized versions of the supported reduction operations, used to update
+# many tree nodes at once.
+_VECTORIZED_OPERATIONS = {
+    operator.add: np.add,
+    min: np.minimum,
+    max: np.maximum,
+}
 
 
 class SegmentTree:
@@ -15,7 +25,7 @@ class SegmentTree:
          over some specified contiguous subsequence of items in the array.
          Operation could be e.g. min/max/sum.
 
-    The data is stored in a list, where the length is 2 * capacity.
+    The data is stored in a numpy array, where the length is 2 * capacity.
     The second half of the list stores the actual values for each index, so if
     capacity=8, values are stored at indices 8 to 15. The first half of the
     array contains the reduced-values of the different (binary divided)
@@ -27,6 +37,10 @@ class SegmentTree:
     4-7: values of the tree.
     NOTE that the values of the tree are accessed by indices starting at 0, so
     `tree[0]` accesses `internal_array[4]` in the above example.
+
+    Items can also be read and written in batches by indexing with an
+    np.ndarray of indices, e.g. `tree[idxes] = values`. Batched updates
+    recompute each affected reduction value only once per tree level.
     """
 
     def __init__(
@@ -58,8 +72,9 @@ class SegmentTree:
                 else float("inf")
             )
         self.neutral_element = neutral_element
-        self.value = [self.neutral_element for _ in range(2 * capacity)]
+        self.value = np.full(2 * capacity, self.neutral_element, dtype=np.float64)
         self.operation = operation
+        self._vectorized_operation = _VECTORIZED_OPERATIONS.get(operation)
 
     def reduce(self, start: int = 0, end: Optional[int] = None) -> Any:
         """Applies `self.operation` to subsequence of our values.
@@ -131,14 +146,23 @@ class SegmentTree:
 
         return result
 
-    def __setitem__(self, idx: int, val: float) -> None:
+    def __setitem__(
+        self, idx: Union[int, np.ndarray], val: Union[float, np.ndarray]
+    ) -> None:
         """
         Inserts/overwrites a value in/into the tree.
 
         Args:
             idx: The index to insert to. Must be in [0, `self.capacity`[
-            val: The value to insert.
+                Can also be an np.ndarray of indices to insert into.
+            val: The value to insert or, if `idx` is an np.ndarray, the
+                values to insert (one per index). If an index appears more
+                than once, its last value is inserted.
         """
+        if isinstance(idx, np.ndarray):
+            self._set_batch(idx, val)
+            return
+
         assert 0 <= idx < self.capacity, f"idx={idx} capacity={self.capacity}"
 
         # Index of the leaf to insert into (always insert in "second half"
@@ -157,8 +181,45 @@ class SegmentTree:
             )
             idx = idx >> 1  # Divide by 2 (faster than division).
 
-    def __getitem__(self, idx: int) -> Any:
-        assert 0 <= idx < self.capacity
+    def _set_batch(self, idxes: np.ndarray, vals: Union[float, np.ndarray]) -> None:
+        assert np.all(
+            (0 <= idxes) & (idxes < self.capacity)
+        ), f"idxes={idxes} capacity={self.capacity}"
+
+        if self._vectorized_operation is None:
+            # Arbitrary operations can't be vectorized, update one by one.
+            for idx, val in zip(idxes, np.broadcast_to(vals, idxes.shape)):
+                self[int(idx)] = val
+            return
+
+        if len(idxes) == 0:
+            return
+
+        # Only keep the last value of each index, numpy doesn't guarantee
+        # which one is inserted otherwise.
+        vals = np.broadcast_to(vals, idxes.shape)
+        idxes, last_occurrences = np.unique(idxes[::-1], return_index=True)
+        vals = vals[::-1][last_occurrences]
+
+        # Insert into the leaves ("second half" of the tree).
+        idxes = idxes + self.capacity
+        self.value[idxes] = vals
+
+        # All leaves are on the same level, so the affected reduction values
+        # can be recalculated one level at a time, bottom up. The indices stay
+        # sorted, so duplicate parents are always next to each other.
+        while idxes[0] > 1:
+            idxes = idxes >> 1
+            idxes = idxes[np.append(True, idxes[1:] != idxes[:-1])]
+            self.value[idxes] = self._vectorized_operation(
+                self.value[2 * idxes], self.value[2 * idxes + 1]
+            )
+
+    def __getitem__(self, idx: Union[int, np.ndarray]) -> Any:
+        if isinstance(idx, np.ndarray):
+            assert np.all((0 <= idx) & (idx < self.capacity))
+        else:
+            assert 0 <= idx < self.capacity
         return self.value[idx + self.capacity]
 
     def get_state(self):
@@ -166,7 +227,8 @@ class SegmentTree:
 
     def set_state(self, state):
         assert len(state) == self.capacity * 2
-        self.value = state
+        # States from older versions store the values in a list.
+        self.value = np.array(state, dtype=np.float64)
 
 
 class SumSegmentTree(SegmentTree):
@@ -179,15 +241,24 @@ class SumSegmentTree(SegmentTree):
         """Returns the sum over a sub-segment of the tree."""
         return self.reduce(start, end)
 
-    def find_prefixsum_idx(self, prefixsum: float) -> int:
+    def find_prefixsum_idx(
+        self, prefixsum: Union[float, np.ndarray]
+    ) -> Union[int, np.ndarray]:
         """Finds highest i, for which: sum(arr[0]+..+arr[i - i]) <= prefixsum.
 
         Args:
-            prefixsum: `prefixsum` upper bound in above constraint.
+            prefixsum: `prefixsum` upper bound in above constraint. Can also
+                be an np.ndarray of upper bounds, which are all looked up at
+                once.
 
         Returns:
-            int: Largest possible index (i) satisfying above constraint.
+            Union[int, np.ndarray]: Largest possible index (i) satisfying
+                above constraint, or an np.ndarray with one index per
+                upper bound if `prefixsum` is an np.ndarray.
         """
+        if isinstance(prefixsum, np.ndarray):
+            return self._find_prefixsum_idx_batch(prefixsum)
+
         assert 0 <= prefixsum <= self.sum() + 1e-5
         # Global sum node.
         idx = 1
@@ -202,6 +273,22 @@ class SumSegmentTree(SegmentTree):
                 idx = update_idx + 1
         return idx - self.capacity
 
+    def _find_prefixsum_idx_batch(self, prefixsums: np.ndarray) -> np.ndarray:
+        assert np.all((0 <= prefixsums) & (prefixsums <= self.sum() + 1e-5))
+        prefixsums = prefixsums.astype(np.float64)
+        # Global sum node for each prefixsum.
+        idxes = np.ones(len(prefixsums), dtype=np.int64)
+
+        # All leaves are on the same level, so every prefixsum reaches the
+        # leaves after the same number of steps down the tree.
+        for _ in range(self.capacity.bit_length() - 1):
+            left_idxes = 2 * idxes
+            left_values = self.value[left_idxes]
+            go_right = left_values <= prefixsums
+            prefixsums -= np.where(go_right, left_values, 0.0)
+            idxes = left_idxes + go_right
+        return idxes - self.capacity
+
 
 class MinSegmentTree(SegmentTree):
     def __init__(self, capacity: int):
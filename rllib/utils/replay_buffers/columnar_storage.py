@@ -0,0 +1,148 @@
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import tree  # pip install dm_tree
+
+from ray.rllib.policy.sample_batch import SampleBatch
+from ray.util.annotations import DeveloperAPI
+
+
+@DeveloperAPI
+class ColumnarStorage:
+    """Stores single timesteps in preallocated per-column numpy arrays.
+
+    Can be used by ReplayBuffers instead of a list of SampleBatches when
+    storing single timesteps. One array of length `capacity` is allocated for
+    each column (and each leaf of nested columns) when the first item is
+    added. Items are written into these arrays by index and `gather` reads
+    many items at once via fancy indexing, so that neither adding nor sampling
+    creates per-item Python objects that have to be kept alive or
+    concatenated.
+
+    Supports the parts of the list interface that ReplayBuffers use
+    (`len()`, `append()` and reading/writing single items by index).
+    """
+
+    def __init__(self, capacity: int):
+        """Initializes a ColumnarStorage instance.
+
+        Args:
+            capacity: Max number of timesteps to store.
+        """
+        self.capacity = capacity
+        # Maps column names to (nested structures of) arrays of shape
+        # [capacity, ...]. Allocated when the first item is added.
+        self._columns: Optional[Dict[str, Any]] = None
+        self._num_items = 0
+
+    def __len__(self) -> int:
+        return self._num_items
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes allocated for all columns."""
+        if self._columns is None:
+            return 0
+        return sum(column.nbytes for column in tree.flatten(self._columns))
+
+    @staticmethod
+    def _get_values(item: SampleBatch) -> Dict[str, Any]:
+        # SampleBatches may hold plain lists, which tree would treat as
+        # nested structures instead of columns.
+        return {
+            key: np.asarray(value) if isinstance(value, list) else value
+            for key, value in item.items()
+        }
+
+    def _allocate_columns(self, values: Dict[str, Any]) -> None:
+        def allocate(value):
+            value = np.asarray(value)
+            dtype = value.dtype
+            # Strings and arbitrary objects (e.g. infos) don't have a fixed
+            # size per row, store references to them instead.
+            if dtype.kind in "OSU":
+                dtype = object
+            return np.zeros((self.capacity,) + value.shape[1:], dtype=dtype)
+
+        self._columns = {
+            key: tree.map_structure(allocate, value) for key, value in values.items()
+        }
+
+    def __setitem__(self, idx: int, item: SampleBatch) -> None:
+        if not isinstance(item, SampleBatch) or item.count != 1:
+            raise ValueError(
+                "ColumnarStorage can only store SampleBatches of a single "
+                f"timestep, but got {type(item).__name__} with "
+                f"{item.count} timesteps."
+            )
+        values = self._get_values(item)
+        if self._columns is None:
+            self._allocate_columns(values)
+        if values.keys() != self._columns.keys():
+            raise ValueError(
+                "All items stored in a ColumnarStorage must have the same "
+                f"columns. Expected {sorted(self._columns.keys())}, got "
+                f"{sorted(values.keys())}."
+            )
+
+        def write(column, value):
+            column[idx] = value[0]
+
+        for key, value in values.items():
+            tree.map_structure(write, self._columns[key], value)
+
+    def append(self, item: SampleBatch) -> None:
+        assert self._num_items < self.capacity, "ColumnarStorage is full."
+        self[self._num_items] = item
+        self._num_items += 1
+
+    def __getitem__(self, idx: int) -> SampleBatch:
+        return self.gather(np.array([idx]))
+
+    def gather(self, idxes: Union[List[int], np.ndarray]) -> SampleBatch:
+        """Returns a SampleBatch with the timesteps at the given indices.
+
+        Args:
+            idxes: The indices of the timesteps to return. May contain
+                duplicates.
+
+        Returns:
+            A SampleBatch with one timestep per index, in the order given.
+        """
+        if self._columns is None:
+            return SampleBatch()
+        idxes = np.asarray(idxes, dtype=np.int64)
+        return SampleBatch(
+            {
+                key: tree.map_structure(lambda column: column[idxes], column)
+                for key, column in self._columns.items()
+            }
+        )
+
+    def get_state(self) -> Dict[str, Any]:
+        """Returns the stored timesteps, trimmed to the number of items."""
+        columns = None
+        if self._columns is not None:
+            columns = tree.map_structure(
+                lambda column: column[: self._num_items], self._columns
+            )
+        return {"columns": columns, "num_items": self._num_items}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Restores the stored timesteps from `state`.
+
+        Args:
+            state: The state obtained by calling `get_state()`.
+        """
+        self._num_items = state["num_items"]
+        self._columns = None
+        if state["columns"] is not None:
+
+            def restore(stored):
+                column = np.zeros(
+                    (self.capacity,) + stored.shape[1:], dtype=stored.dtype
+                )
+                column[: len(stored)] = stored
+                return column
+
+            self._columns = tree.map_structure(restore, state["columns"])
@@ -1,4 +1,3 @@
-import random
 from typing import Any, Dict, List, Optional
 import numpy as np
 
@@ -82,13 +81,9 @@ class PrioritizedReplayBuffer(ReplayBuffer):
         ReplayBuffer._add_single_batch(self, item)
 
     def _sample_proportional(self, num_items: int) -> List[int]:
-        res = []
-        for _ in range(num_items):
-            # TODO(szymon): should we ensure no repeats?
-            mass = random.random() * self._it_sum.sum(0, len(self._storage))
-            idx = self._it_sum.find_prefixsum_idx(mass)
-            res.append(idx)
-        return res
+        # TODO(szymon): should we ensure no repeats?
+        masses = np.random.random(num_items) * self._it_sum.sum(0, len(self._storage))
+        return self._it_sum.find_prefixsum_idx(masses).tolist()
 
     @DeveloperAPI
     @override(ReplayBuffer)
@@ -130,33 +125,36 @@ class PrioritizedReplayBuffer(ReplayBuffer):
 
         idxes = self._sample_proportional(num_items)
 
-        weights = []
-        batch_indexes = []
-        p_min = self._it_min.min() / self._it_sum.sum()
+        total_prio = self._it_sum.sum()
+        p_min = self._it_min.min() / total_prio
         max_weight = (p_min * len(self)) ** (-beta)
-
-        for idx in idxes:
-            p_sample = self._it_sum[idx] / self._it_sum.sum()
-            weight = (p_sample * len(self)) ** (-beta)
-            count = self._storage[idx].count
-            # If zero-padded, count will not be the actual batch size of the
-            # data.
-            if (
-                isinstance(self._storage[idx], SampleBatch)
-                and self._storage[idx].zero_padded
-            ):
-                actual_size = self._storage[idx].max_seq_len
-            else:
-                actual_size = count
-            weights.extend([weight / max_weight] * actual_size)
-            batch_indexes.extend([idx] * actual_size)
-            self._num_timesteps_sampled += count
+        p_samples = self._it_sum[np.array(idxes, dtype=np.int64)] / total_prio
+        weights = (p_samples * len(self)) ** (-beta) / max_weight
+
+        if self._columnar_storage:
+            # Columnar storages only hold single timesteps.
+            actual_sizes = 1
+            self._num_timesteps_sampled += len(idxes)
+        else:
+            actual_sizes = []
+            for idx in idxes:
+                count = self._storage[idx].count
+                # If zero-padded, count will not be the actual batch size of
+                # the data.
+                if (
+                    isinstance(self._storage[idx], SampleBatch)
+                    and self._storage[idx].zero_padded
+                ):
+                    actual_sizes.append(self._storage[idx].max_seq_len)
+                else:
+                    actual_sizes.append(count)
+                self._num_timesteps_sampled += count
         batch = self._encode_sample(idxes)
 
         # Note: prioritization is not supported in multi agent lockstep
         if isinstance(batch, SampleBatch):
-            batch["weights"] = np.array(weights)
-            batch["batch_indexes"] = np.array(batch_indexes)
+            batch["weights"] = np.repeat(weights, actual_sizes)
+            batch["batch_indexes"] = np.repeat(idxes, actual_sizes)
 
         return batch
 
@@ -179,15 +177,21 @@ class PrioritizedReplayBuffer(ReplayBuffer):
             type(idxes).__name__
         )
         assert len(idxes) == len(priorities)
-        for idx, priority in zip(idxes, priorities):
-            assert priority > 0
-            assert 0 <= idx < len(self._storage)
-            delta = priority**self._alpha - self._it_sum[idx]
+        if len(idxes) == 0:
+            return
+
+        idxes = np.asarray(idxes, dtype=np.int64)
+        priorities = np.asarray(priorities, dtype=np.float64)
+        assert np.all(priorities > 0)
+        assert np.all((0 <= idxes) & (idxes < len(self._storage)))
+
+        alpha_priorities = priorities**self._alpha
+        for delta in alpha_priorities - self._it_sum[idxes]:
             self._prio_change_stats.push(delta)
-            self._it_sum[idx] = priority**self._alpha
-            self._it_min[idx] = priority**self._alpha
+        self._it_sum[idxes] = alpha_priorities
+        self._it_min[idxes] = alpha_priorities
 
-            self._max_priority = max(self._max_priority, priority)
+        self._max_priority = max(self._max_priority, float(priorities.max()))
 
     @DeveloperAPI
     @override(ReplayBuffer)
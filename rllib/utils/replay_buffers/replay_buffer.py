@@ -13,6 +13,7 @@ import psutil  # noqa E402
 from ray.util.debug import log_once
 from ray.rllib.policy.sample_batch import SampleBatch
 from ray.rllib.utils.deprecation import Deprecated
+from ray.rllib.utils.replay_buffers.columnar_storage import ColumnarStorage
 from ray.rllib.utils.metrics.window_stat import WindowStat
 from ray.rllib.utils.typing import SampleBatchType, T
 from ray.util.annotations import DeveloperAPI
@@ -123,6 +124,7 @@ class ReplayBuffer(ParallelIteratorWorker):
         self,
         capacity: int = 10000,
         storage_unit: Union[str, StorageUnit] = "timesteps",
+        columnar_storage: bool = False,
         **kwargs,
     ):
         """Initializes a (FIFO) ReplayBuffer instance.
@@ -133,6 +135,10 @@ class ReplayBuffer(ParallelIteratorWorker):
                 dropped to make space for new ones.
             storage_unit: If not a StorageUnit, either 'timesteps', 'sequences' or
                 'episodes'. Specifies how experiences are stored.
+            columnar_storage: Whether to store experiences in preallocated
+                numpy arrays (one per column) instead of a list of
+                SampleBatches. This makes sampling a single gather per column.
+                Only supported with storage_unit 'timesteps'.
             ``**kwargs``: Forward compatibility kwargs.
         """
 
@@ -150,9 +156,6 @@ class ReplayBuffer(ParallelIteratorWorker):
                 "or 'fragments', but is {}".format(storage_unit)
             )
 
-        # The actual storage (list of SampleBatches or MultiAgentBatches).
-        self._storage = []
-
         # Caps the number of timesteps stored in this buffer
         if capacity <= 0:
             raise ValueError(
@@ -160,6 +163,17 @@ class ReplayBuffer(ParallelIteratorWorker):
                 "but was set to {}.".format(capacity)
             )
         self.capacity = capacity
+
+        if columnar_storage and self.storage_unit != StorageUnit.TIMESTEPS:
+            raise ValueError(
+                "columnar_storage is only supported with storage_unit "
+                "'timesteps', but storage_unit is {}".format(self.storage_unit)
+            )
+        self._columnar_storage = columnar_storage
+
+        # The actual storage (list of SampleBatches or MultiAgentBatches, or
+        # per-column arrays of single timesteps).
+        self._storage = self._create_storage()
         # The next index to override in the buffer.
         self._next_idx = 0
         # len(self._hit_count) must always be less than len(capacity)
@@ -188,6 +202,11 @@ class ReplayBuffer(ParallelIteratorWorker):
         """Returns the number of items currently stored in this buffer."""
         return len(self._storage)
 
+    def _create_storage(self) -> Union[List[SampleBatchType], ColumnarStorage]:
+        if self._columnar_storage:
+            return ColumnarStorage(self.capacity)
+        return []
+
     @DeveloperAPI
     def add(self, batch: SampleBatchType, **kwargs) -> None:
         """Adds a batch of experiences to this buffer.
@@ -254,7 +273,13 @@ class ReplayBuffer(ParallelIteratorWorker):
         self._num_timesteps_added += item.count
         self._num_timesteps_added_wrap += item.count
 
-        if self._next_idx >= len(self._storage):
+        if self._columnar_storage:
+            if self._next_idx >= len(self._storage):
+                self._storage.append(item)
+            else:
+                self._storage[self._next_idx] = item
+            self._est_size_bytes = self._storage.nbytes
+        elif self._next_idx >= len(self._storage):
             self._storage.append(item)
             self._est_size_bytes += item.size_bytes()
         else:
@@ -308,7 +333,10 @@ class ReplayBuffer(ParallelIteratorWorker):
         """
         if len(self) == 0:
             raise ValueError("Trying to sample from an empty buffer.")
-        idxes = [random.randint(0, len(self) - 1) for _ in range(num_items)]
+        if self._columnar_storage:
+            idxes = np.random.randint(0, len(self), size=num_items)
+        else:
+            idxes = [random.randint(0, len(self) - 1) for _ in range(num_items)]
         sample = self._encode_sample(idxes)
         self._num_timesteps_sampled += sample.count
         return sample
@@ -343,7 +371,11 @@ class ReplayBuffer(ParallelIteratorWorker):
         Returns:
             The serializable local state.
         """
-        state = {"_storage": self._storage, "_next_idx": self._next_idx}
+        if self._columnar_storage:
+            storage = self._storage.get_state()
+        else:
+            storage = self._storage
+        state = {"_storage": storage, "_next_idx": self._next_idx}
         state.update(self.stats(debug=False))
         return state
 
@@ -355,8 +387,22 @@ class ReplayBuffer(ParallelIteratorWorker):
             state: The new state to set this buffer. Can be
                 obtained by calling `self.get_state()`.
         """
-        # The actual storage.
-        self._storage = state["_storage"]
+        # The actual storage. States of columnar storages are dicts, states of
+        # list storages are lists of batches. Convert between them if needed.
+        storage = state["_storage"]
+        if isinstance(storage, dict):
+            columnar_storage = ColumnarStorage(self.capacity)
+            columnar_storage.set_state(storage)
+            storage = columnar_storage
+            if not self._columnar_storage:
+                storage = [storage[i] for i in range(len(storage))]
+        elif self._columnar_storage:
+            columnar_storage = ColumnarStorage(self.capacity)
+            for item in storage:
+                for timestep in item.timeslices(1):
+                    columnar_storage.append(timestep)
+            storage = columnar_storage
+        self._storage = storage
         self._next_idx = state["_next_idx"]
         # Stats and counts.
         self._num_timesteps_added = state["added_count"]
@@ -368,6 +414,12 @@ class ReplayBuffer(ParallelIteratorWorker):
     @DeveloperAPI
     def _encode_sample(self, idxes: List[int]) -> SampleBatchType:
         """Fetches concatenated samples at given indices from the storage."""
+        if self._columnar_storage:
+            np.add.at(self._hit_count, idxes, 1)
+            out = self._storage.gather(idxes)
+            out.decompress_if_needed()
+            return out
+
         samples = []
         for i in idxes:
             self._hit_count[i] += 1
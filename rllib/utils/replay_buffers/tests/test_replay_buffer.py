@@ -174,6 +174,54 @@ class TestReplayBuffer(unittest.TestCase):
         assert other_buffer._est_size_bytes == buffer._est_size_bytes
         assert len(other_buffer) == len(other_buffer)
 
+    def test_columnar_storage(self):
+        """Tests adding, sampling, get-/set state, and eviction with
+        experiences stored in per-column arrays.
+        """
+        self.batch_id = 0
+
+        batch_size = 5
+        buffer_size = 15
+
+        buffer = ReplayBuffer(capacity=buffer_size, columnar_storage=True)
+
+        self._add_data_to_buffer(buffer, batch_size=batch_size, num_batches=3)
+        assert len(buffer) == 15
+        assert buffer._next_idx == 0
+        assert buffer._eviction_started is True
+
+        # A single sample call returns a batch with one row per item.
+        sample = buffer.sample(200)
+        assert sample.count == 200
+        assert sample[SampleBatch.OBS].shape == (200, 4)
+        num_sampled = np.bincount(sample["batch_id"], minlength=3)
+        assert np.allclose(num_sampled / 200, 3 * [1 / 3], atol=0.1)
+        assert buffer._num_timesteps_sampled == 200
+
+        # Evicting the oldest batch overwrites its rows.
+        self._add_data_to_buffer(buffer, batch_size=batch_size, num_batches=1)
+        assert set(buffer.sample(100)["batch_id"]) <= {1, 2, 3}
+
+        # Test set/get state, including from and to list storage.
+        state = buffer.get_state()
+        for columnar_storage in [True, False]:
+            other_buffer = ReplayBuffer(
+                capacity=buffer_size, columnar_storage=columnar_storage
+            )
+            other_buffer.set_state(state)
+            assert len(other_buffer) == len(buffer)
+            assert other_buffer._next_idx == buffer._next_idx
+            for i in range(len(buffer)):
+                assert other_buffer._storage[i]["batch_id"] == (
+                    buffer._storage[i]["batch_id"]
+                )
+        other_buffer = ReplayBuffer(capacity=buffer_size, columnar_storage=True)
+        other_buffer.set_state(ReplayBuffer(capacity=buffer_size).get_state())
+        assert len(other_buffer) == 0
+
+        with self.assertRaises(ValueError):
+            ReplayBuffer(capacity=10, storage_unit="episodes", columnar_storage=True)
+
     def test_sequences_unit(self):
         """Tests adding, sampling and eviction of sequences."""
         buffer = ReplayBuffer(capacity=10, storage_unit="sequences")
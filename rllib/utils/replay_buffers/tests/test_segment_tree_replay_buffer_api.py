@@ -94,6 +94,37 @@ class TestSegmentTree(unittest.TestCase):
         assert np.isclose(tree.min(2, -1), 4.0)
         assert np.isclose(tree.min(3, 4), 3.0)
 
+    def test_batched_set(self):
+        tree = SumSegmentTree(8)
+        min_tree = MinSegmentTree(8)
+        expected = np.zeros(8)
+
+        for _ in range(10):
+            idxes = np.random.randint(0, 8, size=6)
+            values = np.random.random(6)
+            tree[idxes] = values
+            min_tree[idxes] = values
+            # The last value of a repeated index wins, as with scalar sets.
+            for idx, value in zip(idxes, values):
+                expected[idx] = value
+
+            assert np.allclose(tree[np.arange(8)], expected)
+            assert np.isclose(tree.sum(), expected.sum())
+            assert np.isclose(tree.sum(2, 5), expected[2:5].sum())
+            written = min_tree[np.arange(8)] != np.inf
+            assert np.isclose(min_tree.min(), expected[written].min())
+
+    def test_batched_prefixsum_idx(self):
+        tree = SumSegmentTree(4)
+
+        tree[np.array([0, 1, 2, 3])] = np.array([0.5, 1.0, 1.0, 3.0])
+
+        prefixsums = np.array([0.00, 0.55, 0.99, 1.51, 3.00, 5.50])
+        assert tree.find_prefixsum_idx(prefixsums).tolist() == [0, 1, 1, 2, 3, 3]
+        assert tree.find_prefixsum_idx(prefixsums).tolist() == [
+            tree.find_prefixsum_idx(prefixsum) for prefixsum in prefixsums
+        ]
+
 
 if __name__ == "__main__":
     import pytest